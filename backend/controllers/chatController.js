@@ -607,6 +607,133 @@ exports.clearSession = async (req, res) => {
   }
 };
 
+// Clone session (evaluation harness: branch a conversation at its current point)
+exports.cloneSession = async (req, res) => {
+  try {
+    const { sessionId } = req.params;
+    const { targetSessionId } = req.body;
+    const userId = req.user?._id || null;
+
+    // Copies a conversation, including the reporter's phone number and location,
+    // so it is off in every environment unless explicitly enabled
+    if (process.env.ALLOW_SESSION_CLONE !== 'true') {
+      return res.status(403).json({
+        success: false,
+        message: 'Session cloning is disabled'
+      });
+    }
+
+    if (!targetSessionId || targetSessionId === sessionId) {
+      return res.status(400).json({
+        success: false,
+        message: 'A targetSessionId different from the source session is required'
+      });
+    }
+
+    // Only the owner of a user's session may clone it
+    const ownerId = await langgraphService.getSessionOwner(sessionId);
+    if (ownerId && (!userId || ownerId.toString() !== userId.toString())) {
+      return res.status(403).json({
+        success: false,
+        message: 'Access denied'
+      });
+    }
+
+    const cloned = await langgraphService.cloneSession(sessionId, targetSessionId);
+
+    if (cloned === null) {
+      return res.status(409).json({
+        success: false,
+        message: `Session ${targetSessionId} already exists`
+      });
+    }
+
+    if (!cloned) {
+      return res.status(404).json({
+        success: false,
+        message: `Session ${sessionId} has no saved state`
+      });
+    }
+
+    res.json({
+      success: true,
+      data: {
+        sessionId: targetSessionId,
+        sourceSessionId: sessionId
+      }
+    });
+  } catch (error) {
+    res.status(500).json({
+      success: false,
+      message: 'Failed to clone session',
+      error: error.message
+    });
+  }
+};
+
+// Seed session (evaluation harness: start a new session mid-workflow)
+exports.seedSession = async (req, res) => {
+  try {
+    const { sessionId } = req.params;
+    const { state } = req.body;
+    const userId = req.user?._id || null;
+
+    // Writes arbitrary conversation state, so it is off unless explicitly enabled
+    if (process.env.ALLOW_SESSION_SEED !== 'true') {
+      return res.status(403).json({
+        success: false,
+        message: 'Session seeding is disabled'
+      });
+    }
+
+    if (!state || typeof state !== 'object' || Array.isArray(state)) {
+      return res.status(400).json({
+        success: false,
+        message: 'A state object is required'
+      });
+    }
+
+    const invalidFields = langgraphService.getInvalidSeedFields(state);
+    if (invalidFields.length > 0) {
+      return res.status(400).json({
+        success: false,
+        message: `Unknown or read-only state fields: ${invalidFields.join(', ')}`
+      });
+    }
+
+    if (state.messages !== undefined && !Array.isArray(state.messages)) {
+      return res.status(400).json({
+        success: false,
+        message: 'state.messages must be an array'
+      });
+    }
+
+    const seeded = await langgraphService.seedSession(sessionId, state, { userId });
+
+    if (!seeded) {
+      return res.status(409).json({
+        success: false,
+        message: `Session ${sessionId} already exists`
+      });
+    }
+
+    res.json({
+      success: true,
+      data: {
+        sessionId,
+        currentStep: seeded.currentStep,
+        messageCount: (seeded.messages || []).length
+      }
+    });
+  } catch (error) {
+    res.status(500).json({
+      success: false,
+      message: 'Failed to seed session',
+      error: error.message
+    });
+  }
+};
+
 // Health check endpoint
 exports.healthCheck = async (req, res) => {
   try {
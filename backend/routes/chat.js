@@ -19,6 +19,12 @@ router.get('/session/:sessionId/details', optionalAuth, chatController.getChatSe
 // Clear session (reset conversation)
 router.delete('/session/:sessionId', chatController.clearSession);
 
+// Clone session (branch a conversation; used by the evaluation harness)
+router.post('/session/:sessionId/clone', optionalAuth, chatController.cloneSession);
+
+// Seed session with a prepared state (start mid-workflow; used by the evaluation harness)
+router.post('/session/:sessionId/seed', optionalAuth, chatController.seedSession);
+
 // Health check
 router.get('/health', chatController.healthCheck);
 
@@ -212,6 +212,57 @@ class MongoDBCheckpointer extends BaseCheckpointSaver {
     }
   }
 
+  /**
+   * Fork a session: copy its checkpoint, state and transcript to a new thread
+   * The fork continues independently from the same point of the conversation
+   * The target is always a new ChatSession; an existing one is never taken over
+   * @returns {boolean|null} false if the source session has no checkpoint,
+   *   null if a ChatSession with the target ID already exists
+   */
+  async fork(sourceThreadId, targetThreadId) {
+    try {
+      if (await ChatSession.exists({ sessionId: targetThreadId })) {
+        return null;
+      }
+
+      const source = await ChatSession.findOne({ sessionId: sourceThreadId }).lean();
+
+      if (!source || !source.checkpoint) {
+        return false;
+      }
+
+      const checkpointData = {
+        ...source.checkpoint,
+        id: `${targetThreadId}-${Date.now()}`,
+        metadata: {
+          ...(source.checkpoint.metadata || {}),
+          forkedFrom: sourceThreadId,
+          savedAt: new Date()
+        }
+      };
+
+      await ChatSession.create({
+        sessionId: targetThreadId,
+        userId: source.userId,
+        messages: source.messages.map(({ role, message, timestamp }) => ({ role, message, timestamp })),
+        status: 'active',
+        ticketId: null,
+        checkpoint: checkpointData,
+        langgraphState: source.langgraphState
+      });
+
+      this.cache.delete(targetThreadId);
+      return true;
+    } catch (error) {
+      if (error.code === 11000) {
+        // Created concurrently under the same sessionId (unique index)
+        return null;
+      }
+      console.error('[MongoDBCheckpointer] Error forking session:', error);
+      throw error;
+    }
+  }
+
   /**
    * Associate a session with a user (when they log in)
    */
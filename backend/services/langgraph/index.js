@@ -355,6 +355,126 @@ async function getSessionState(sessionId) {
   }
 }
 
+/**
+ * Clone a session so a conversation can branch from its current point
+ * Used by the evaluation harness to run shared conversation prefixes once
+ * @param {string} sourceSessionId - Session to copy
+ * @param {string} targetSessionId - New session ID for the copy
+ * @returns {boolean|null} false if the source session has no saved state,
+ *   null if the target session already exists (it is never overwritten)
+ */
+async function cloneSession(sourceSessionId, targetSessionId) {
+  console.log(`[LangGraph] Cloning session ${sourceSessionId} -> ${targetSessionId}`);
+
+  const existing = await graph.getState({ configurable: { thread_id: targetSessionId } });
+  if (existing.values && Object.keys(existing.values).length > 0) {
+    return null;
+  }
+
+  if (useMongoDb) {
+    return mongoCheckpointer.fork(sourceSessionId, targetSessionId);
+  }
+
+  // MemorySaver: copy the latest checkpoint through the saver API
+  const tuple = await checkpointer.getTuple({ configurable: { thread_id: sourceSessionId } });
+  if (!tuple) {
+    return false;
+  }
+  await checkpointer.put(
+    { configurable: { thread_id: targetSessionId, checkpoint_ns: '' } },
+    tuple.checkpoint,
+    { ...(tuple.metadata || {}), forkedFrom: sourceSessionId }
+  );
+  return true;
+}
+
+/**
+ * User a session belongs to (sessions are linked to users in MongoDB only)
+ * @param {string} sessionId - Session ID
+ * @returns {Object|null} The owner's user ID, or null for guest or in-memory sessions
+ */
+async function getSessionOwner(sessionId) {
+  if (!useMongoDb) {
+    return null;
+  }
+  const session = await ChatSession.findOne({ sessionId }).select('userId').lean();
+  return session?.userId || null;
+}
+
+// Node that last ran when the graph stopped at each step (seeded checkpoints
+// look as if that node had just asked the user for the step's information)
+const STEP_NODES = {
+  emergency: 'collectEmergency',
+  location: 'collectLocation',
+  phone: 'collectPhone',
+  people: 'collectPeople',
+  confirm: 'showConfirmation',
+};
+
+// Identity and ownership fields: set from the request's user, never from a seed
+const SEED_READONLY_FIELDS = ['sessionId', 'isAuthenticated', 'userMemory', 'userId', 'ticketId'];
+
+/**
+ * State fields a seed may not set, or that are not part of EmergencyState
+ * @param {Object} state - Prepared state
+ * @returns {Array} Field names that are rejected
+ */
+function getInvalidSeedFields(state) {
+  const channels = Object.keys(EmergencyStateAnnotation.spec);
+  return Object.keys(state).filter(key => SEED_READONLY_FIELDS.includes(key) || !channels.includes(key));
+}
+
+/**
+ * Seed a new session with a prepared state, as if the conversation had
+ * already reached that point (used by the evaluation harness to start
+ * single-turn cases mid-workflow without replaying earlier turns)
+ * @param {string} sessionId - New session ID
+ * @param {Object} state - EmergencyState fields; messages as { role, message }
+ * @param {Object} options - Optional settings
+ * @param {string} options.userId - User ID for authenticated sessions
+ * @returns {Object|null} The seeded state, or null if the session already exists
+ */
+async function seedSession(sessionId, state, options = {}) {
+  const { userId } = options;
+  const config = { configurable: { thread_id: sessionId } };
+
+  console.log(`[LangGraph] Seeding session ${sessionId} at step ${state.currentStep || 'location'}`);
+
+  const existing = await graph.getState(config);
+  if (existing.values && Object.keys(existing.values).length > 0) {
+    return null;
+  }
+  // A completed or cleared session has no checkpoint but keeps its ChatSession
+  if (useMongoDb && await ChatSession.exists({ sessionId })) {
+    return null;
+  }
+
+  const messages = (state.messages || []).map(msg => ({
+    role: msg.role,
+    message: msg.message,
+    timestamp: msg.timestamp || new Date(),
+  }));
+
+  const values = {
+    ...state,
+    messages,
+    sessionId,
+    isAuthenticated: !!userId,
+  };
+
+  await graph.updateState(config, values, STEP_NODES[state.currentStep] || 'collectEmergency');
+
+  if (useMongoDb) {
+    if (userId) {
+      await mongoCheckpointer.linkToUser(sessionId, userId);
+    }
+    await mongoCheckpointer.saveMessages(sessionId, messages);
+  }
+
+  const seeded = await graph.getState(config);
+  return seeded.values;
+}
+
 /**
  * Initialize the graph (preload retriever, etc.)
  */
@@ -377,6 +497,10 @@ module.exports = {
   graph,
   processMessage,
   clearSession,
+  cloneSession,
+  getSessionOwner,
+  seedSession,
+  getInvalidSeedFields,
   getSessionState,
   initialize,
   completeSessionWithTicket,
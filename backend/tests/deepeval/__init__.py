@@ -55,19 +55,33 @@ Metrics Used:
 __version__ = "1.0.0"
 __author__ = "112 Call Center Team"
 
-from .config import THRESHOLDS, EVALUATION_MODEL, TEST_CATEGORIES
-from .test_cases_generator import generate_all_test_cases, TestCase
-from .evaluation import Evaluator, EvaluationResult
-from .report_generator import generate_html_report, ReportData
+import importlib
 
-__all__ = [
-    "THRESHOLDS",
-    "EVALUATION_MODEL",
-    "TEST_CATEGORIES",
-    "generate_all_test_cases",
-    "TestCase",
-    "Evaluator",
-    "EvaluationResult",
-    "generate_html_report",
-    "ReportData",
-]
+# Exports are imported on first access (PEP 562): importing the package does not
+# load deepeval, requests or pandas until Evaluator or EvaluationResult is used.
+_EXPORTS = {
+    "THRESHOLDS": "config",
+    "EVALUATION_MODEL": "config",
+    "TEST_CATEGORIES": "config",
+    "generate_all_test_cases": "test_cases_generator",
+    "TestCase": "test_cases_generator",
+    "Evaluator": "evaluation",
+    "EvaluationResult": "evaluation",
+    "generate_html_report": "report_generator",
+    "ReportData": "report_generator",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
@@ -0,0 +1,205 @@
+"""
+Compressed Evaluation Artifacts
+===============================
+
+This module decides how a run's artifacts are laid out on disk: results as
+compressed JSON Lines, test case corpora stored once by content hash, and
+"latest" pointers instead of full copies of the newest results and report.
+
+Features:
+- Results files as JSON Lines (a summary header line, then one result per
+  line), zstd-compressed with zstandard when installed, gzip otherwise
+- Test case corpora under corpora/, named by a hash of their content, so an
+  unchanged corpus is written once and referenced by every run
+- Latest pointers: a small manifest for results and a symlink (or redirect
+  page) for the HTML report
+- One reader for legacy .json results, compressed JSONL and manifests
+"""
+
+import io
+import os
+import gzip
+import json
+import hashlib
+from datetime import datetime
+from pathlib import Path
+from typing import List, Dict, Any, Iterable, Iterator, Tuple
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None  # zstandard not installed, artifacts are gzip-compressed
+
+from config import ARTIFACT_CONFIG
+
+
+# Longest first, so "x.jsonl.zst" is not taken for "x.jsonl" + ".zst"
+ARTIFACT_SUFFIXES = (".jsonl.zst", ".jsonl.gz", ".jsonl", ".json", ".parquet")
+MANIFEST_KIND = "latest"
+
+
+def artifact_extension() -> str:
+    """File extension for new results and corpus files"""
+    compression = ARTIFACT_CONFIG["compression"]
+    if compression == "zstd" and zstandard is None:
+        compression = "gzip"
+    return {"zstd": ".jsonl.zst", "gzip": ".jsonl.gz"}.get(compression, ".jsonl")
+
+
+def artifact_stem(path: Any) -> str:
+    """File name without its artifact extension (run IDs, Parquet names)"""
+    name = Path(path).name
+    for suffix in ARTIFACT_SUFFIXES:
+        if name.endswith(suffix):
+            return name[:-len(suffix)]
+    return Path(path).stem
+
+
+def open_text(path: Any, mode: str = "r") -> io.TextIOBase:
+    """UTF-8 text stream over a plain, .gz or .zst file; mode is "r" or "w" """
+    path = str(path)
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8", compresslevel=ARTIFACT_CONFIG["gzip_level"])
+    if path.endswith(".zst"):
+        if zstandard is None:
+            raise ImportError(f"{path} is zstd-compressed; pip install zstandard")
+        raw = open(path, mode + "b")
+        if mode == "w":
+            stream = zstandard.ZstdCompressor(level=ARTIFACT_CONFIG["zstd_level"]).stream_writer(raw)
+        else:
+            stream = zstandard.ZstdDecompressor().stream_reader(raw)
+        return io.TextIOWrapper(stream, encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+def _line(record: Dict[str, Any]) -> str:
+    return json.dumps(record, ensure_ascii=False, separators=(",", ":"), default=str) + "\n"
+
+
+def write_records(path: Any, records: Iterable[Dict[str, Any]]):
+    """Write JSON Lines through a temporary file, so readers never see a partial file"""
+    path = Path(path)
+    temp = path.with_name(f".{os.getpid()}.{path.name}")  # Same suffix, so the same codec
+    with open_text(temp, "w") as f:
+        for record in records:
+            f.write(_line(record))
+    os.replace(temp, path)
+
+
+def read_records(path: Any) -> Iterator[Dict[str, Any]]:
+    """Records of a (possibly compressed) JSON Lines file"""
+    with open_text(path) as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+# =============================================================================
+# RESULTS FILES
+# =============================================================================
+
+def write_results(path: Any, summary: Dict[str, Any], results: List[Dict[str, Any]]):
+    """Write a results file; .json paths keep the original single-document format"""
+    if str(path).endswith(".json"):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({"summary": summary, "results": results}, f, ensure_ascii=False, indent=2, default=str)
+        return
+    write_records(path, [{"summary": summary}, *results])
+
+
+def resolve_artifact(path: Any) -> Path:
+    """The file a latest-manifest points to, or path itself"""
+    path = Path(path)
+    if path.suffix == ".json" and path.stat().st_size < 4096:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        if isinstance(data, dict) and data.get("manifest") == MANIFEST_KIND:
+            return resolve_artifact(path.parent / data["results"])
+    return path
+
+
+def read_results(path: Any) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    """Summary and result dicts of a .json, JSON Lines or manifest results file"""
+    path = resolve_artifact(path)
+    if path.suffix == ".json":
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        return data.get("summary", {}), data.get("results", [])
+
+    records = read_records(path)
+    header = next(records, {})
+    return header.get("summary", {}), list(records)
+
+
+# =============================================================================
+# CORPORA AND LATEST POINTERS
+# =============================================================================
+
+def store_corpus(output_dir: Any, suite: str, records: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Store test cases under corpora/ by content hash; an identical corpus is not rewritten.
+
+    Returns {"hash", "path" (relative to output_dir), "cases", "new"}.
+    """
+    lines = [json.dumps(record, ensure_ascii=False, sort_keys=True, default=str) for record in records]
+    digest = hashlib.sha256("\n".join(lines).encode("utf-8")).hexdigest()[:16]
+
+    directory = Path(output_dir) / ARTIFACT_CONFIG["corpus_dir"]
+    directory.mkdir(parents=True, exist_ok=True)
+    existing = sorted(directory.glob(f"{suite}_{digest}.jsonl*"))
+    path = existing[0] if existing else directory / f"{suite}_{digest}{artifact_extension()}"
+    if not existing:
+        write_records(path, records)
+
+    return {
+        "hash": digest,
+        "path": path.relative_to(output_dir).as_posix(),
+        "cases": len(records),
+        "new": not existing
+    }
+
+
+def write_manifest(link: Any, results_file: Any, **extra: Any):
+    """Point link (e.g. reports/single_turn_results.json) at a results file"""
+    link = Path(link)
+    manifest = {
+        "manifest": MANIFEST_KIND,
+        "results": os.path.relpath(results_file, link.parent),
+        **extra,
+        "updated": datetime.now().isoformat()
+    }
+    temp = link.with_name(f".{os.getpid()}.{link.name}")
+    with open(temp, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    os.replace(temp, link)
+
+
+def link_report(link: Any, report_file: Any):
+    """Symlink link to an HTML report; a redirect page where symlinks are not available"""
+    link = Path(link)
+    target = os.path.relpath(report_file, link.parent)
+    if link.is_symlink() or link.exists():
+        link.unlink()
+    try:
+        os.symlink(target, link)
+    except (OSError, NotImplementedError):
+        with open(link, 'w', encoding='utf-8') as f:
+            f.write(f'<!DOCTYPE html><meta charset="UTF-8"><meta http-equiv="refresh" content="0; url={target}">'
+                    f'<a href="{target}">{target}</a>\n')
+
+
+def point_latest(
+    output_dir: Any,
+    suite: str,
+    suffix: str,
+    results_file: Any,
+    report_file: Any = None,
+    corpus: Dict[str, Any] = None
+):
+    """Latest pointers for a run: {suite}_results{suffix}.json and {suite}_report{suffix}.html"""
+    output_dir = Path(output_dir)
+    extra = {"report": os.path.relpath(report_file, output_dir)} if report_file else {}
+    if corpus:
+        extra["test_cases"] = corpus["path"]
+    write_manifest(output_dir / f"{suite}_results{suffix}.json", results_file, **extra)
+    if report_file:
+        link_report(output_dir / f"{suite}_report{suffix}.html", report_file)
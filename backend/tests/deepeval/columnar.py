@@ -0,0 +1,230 @@
+"""
+Columnar Results
+================
+
+This module turns evaluation results into pandas DataFrames with one typed
+column per field, and writes them as Parquet next to the JSON export, so
+summaries and analytics across many runs use vectorized group-bys instead of
+Python loops over result dicts.
+
+Features:
+- One row per result; each metric flattened into its own float column
+  ("metric.<name>", NaN when the metric was not judged)
+- Multi-turn turns exploded into a separate frame, one row per turn
+- Categorical dtypes for repeated strings (category, test case ID, run)
+- Pass counts, metric means and category pass rates for get_summary
+- Parquet export (pyarrow) alongside each results JSON, and a loader that
+  stacks many results files (JSON or Parquet) into one frame with a run column
+"""
+
+from pathlib import Path
+from typing import List, Dict, Any, Iterable, Tuple
+
+import numpy as np
+import pandas as pd
+
+from config import COLUMNAR_CONFIG
+from artifact_store import artifact_stem, resolve_artifact
+
+
+METRIC_PREFIX = "metric."
+
+# Result fields copied into columns, with their dtype
+NUMERIC_COLUMNS = {
+    "duration_ms": "float64",
+    "total_duration_ms": "float64",
+    "chatbot_latency_ms": "float64",
+    "judge_latency_ms": "float64",
+    "overhead_ms": "float64",
+    "transport_retries": "int32",
+    "total_turns": "int32",
+    "completed_turns": "int32",
+}
+FLAG_COLUMNS = ["infra_failure", "workflow_completed", "ticket_created"]
+TEXT_COLUMNS = ["input_message", "actual_output", "expected_output", "name", "ticket_id"]
+
+
+def _field(result: Any, name: str, default: Any = None) -> Any:
+    """A field of a result dataclass or of its exported dict"""
+    if isinstance(result, dict):
+        return result.get(name, default)
+    return getattr(result, name, default)
+
+
+def _records(results: Iterable[Any]) -> List[Dict[str, Any]]:
+    """Results as field dicts; dataclass instances share their __dict__"""
+    return [result if isinstance(result, dict) else vars(result) for result in results]
+
+
+def results_frame(results: Iterable[Any], full: bool = False) -> pd.DataFrame:
+    """One row per result (EvaluationResult, MultiTurnEvaluationResult or their dicts).
+
+    "passed" holds passed for single-turn and overall_passed for multi-turn
+    results. Text columns (messages, outputs) and timestamps are only
+    included with full=True.
+    """
+    records = _records(results)
+    if not records:
+        return pd.DataFrame({"test_case_id": [], "category": [], "passed": [], "infra_failure": []})
+
+    first = records[0]
+    passed_field = "overall_passed" if "overall_passed" in first else "passed"
+    columns: Dict[str, Any] = {
+        "test_case_id": [r.get("test_case_id") for r in records],
+        "category": [r.get("category") for r in records],
+        "passed": np.fromiter((bool(r.get(passed_field)) for r in records), dtype=bool, count=len(records)),
+    }
+    if "subcategory" in first:
+        columns["subcategory"] = [r.get("subcategory") for r in records]
+    for name in FLAG_COLUMNS:
+        if name in first or name == "infra_failure":
+            columns[name] = np.fromiter((bool(r.get(name)) for r in records), dtype=bool, count=len(records))
+    for name, dtype in NUMERIC_COLUMNS.items():
+        if name in first:
+            if dtype.startswith("int"):
+                columns[name] = np.array([r.get(name) or 0 for r in records], dtype=dtype)
+            else:
+                columns[name] = np.array([r.get(name) for r in records], dtype=dtype)  # None -> NaN
+    if full:
+        columns["timestamp"] = pd.to_datetime([r.get("timestamp") for r in records], errors="coerce")
+        for name in TEXT_COLUMNS:
+            if name in first:
+                columns[name] = [r.get(name) for r in records]
+
+    # Metrics: one float column each, in order of first appearance
+    metric_values: Dict[str, np.ndarray] = {}
+    for i, record in enumerate(records):
+        for metric, score in (record.get("metrics") or {}).items():
+            column = metric_values.get(metric)
+            if column is None:
+                column = metric_values[metric] = np.full(len(records), np.nan)
+            if score is not None:
+                column[i] = score
+    for metric, values in metric_values.items():
+        columns[METRIC_PREFIX + metric] = values
+
+    frame = pd.DataFrame(columns)
+    for name in ("test_case_id", "category", "subcategory"):
+        if name in frame:
+            frame[name] = frame[name].astype("category")
+    return frame
+
+
+def turns_frame(results: Iterable[Any]) -> pd.DataFrame:
+    """Multi-turn results exploded to one row per turn"""
+    rows: Dict[str, List[Any]] = {
+        "test_case_id": [], "category": [], "turn_number": [], "user_message": [], "bot_response": [],
+        "expected_next_step": [], "actual_next_step": [], "checks_passed": [], "checks_failed": [],
+        "duration_ms": [], "errors": []
+    }
+    for result in results:
+        for turn in _field(result, "turns") or []:
+            rows["test_case_id"].append(_field(result, "test_case_id"))
+            rows["category"].append(_field(result, "category"))
+            rows["turn_number"].append(_field(turn, "turn_number"))
+            rows["user_message"].append(_field(turn, "user_message"))
+            rows["bot_response"].append(_field(turn, "bot_response"))
+            rows["expected_next_step"].append(_field(turn, "expected_next_step"))
+            rows["actual_next_step"].append(_field(turn, "actual_next_step"))
+            rows["checks_passed"].append(len(_field(turn, "validation_passed") or []))
+            rows["checks_failed"].append(len(_field(turn, "validation_failed") or []))
+            rows["duration_ms"].append(_field(turn, "duration_ms"))
+            rows["errors"].append(len(_field(turn, "errors") or []))
+
+    frame = pd.DataFrame(rows)
+    frame = frame.astype({
+        "turn_number": "int32", "checks_passed": "int32", "checks_failed": "int32",
+        "errors": "int32", "duration_ms": "float64"
+    })
+    for name in ("test_case_id", "category", "expected_next_step", "actual_next_step"):
+        frame[name] = frame[name].astype("category")
+    return frame
+
+
+def metric_columns(frame: pd.DataFrame) -> List[str]:
+    return [column for column in frame.columns if column.startswith(METRIC_PREFIX)]
+
+
+def summarize_frame(frame: pd.DataFrame) -> Dict[str, Any]:
+    """Pass counts, metric means and category pass rates over judged results.
+
+    Infra failures are counted separately and left out of the rest, like
+    summarize_results / summarize_multi_turn_results.
+    """
+    judged = frame[~frame["infra_failure"]]
+    passed = int(judged["passed"].sum())
+
+    metrics = metric_columns(judged)
+    means = judged[metrics].mean()
+    counts = judged[metrics].count()
+    avg_metrics = {
+        column[len(METRIC_PREFIX):]: float(means[column])
+        for column in metrics if counts[column]
+    }
+
+    by_category = judged.groupby("category", sort=False, observed=True)["passed"].mean() * 100
+    return {
+        "total": len(frame),
+        "judged": len(judged),
+        "passed": passed,
+        "average_metrics": avg_metrics,
+        "category_pass_rates": {str(category): float(rate) for category, rate in by_category.items()}
+    }
+
+
+# =============================================================================
+# PARQUET EXPORT AND LOADING
+# =============================================================================
+
+def parquet_paths(filename: str) -> Tuple[Path, Path]:
+    """Results and turns Parquet files written next to a results file"""
+    path, stem = Path(filename), artifact_stem(filename)
+    return path.with_name(f"{stem}.parquet"), path.with_name(f"{stem}_turns.parquet")
+
+
+def export_columnar(suite: str, filename: str, results: List[Any]):
+    """Write the results (and multi-turn turns) as Parquet next to filename.
+
+    Called from the export paths; like the history store, a failure here is
+    reported but never fails the export itself.
+    """
+    if not COLUMNAR_CONFIG["enabled"] or not results:
+        return
+    results_path, turns_path = parquet_paths(filename)
+    compression = COLUMNAR_CONFIG["compression"]
+    try:
+        results_frame(results, full=True).to_parquet(results_path, index=False, compression=compression)
+        if suite == "multi_turn":
+            turns_frame(results).to_parquet(turns_path, index=False, compression=compression)
+    except ImportError as e:
+        print(f"  Warning: Parquet export skipped ({e}); pip install pyarrow")
+    except (OSError, ValueError) as e:
+        print(f"  Warning: could not write {results_path}: {e}")
+
+
+def load_results_frame(paths: Iterable[str], full: bool = False) -> pd.DataFrame:
+    """Stack results files (JSON, JSONL or the Parquet written next to them) into one frame.
+
+    Each row gets the run it came from (the file stem) in a "run" column.
+    """
+    from report_generator import load_evaluation_results
+
+    frames = []
+    for path in paths:
+        path = Path(path)
+        if path.suffix == ".parquet":
+            frame = pd.read_parquet(path)
+            if not full:
+                frame = frame.drop(columns=[c for c in TEXT_COLUMNS + ["timestamp"] if c in frame])
+        else:
+            frame = results_frame(load_evaluation_results(str(path)).results, full=full)
+        frame.insert(0, "run", artifact_stem(resolve_artifact(path)))
+        frames.append(frame)
+    if not frames:
+        return results_frame([])
+
+    combined = pd.concat(frames, ignore_index=True)
+    for name in ("run", "test_case_id", "category", "subcategory"):
+        if name in combined:
+            combined[name] = combined[name].astype("category")
+    return combined
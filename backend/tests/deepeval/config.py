@@ -24,7 +24,18 @@ OPENAI_API_KEY = os.environ.get("OPENAI_API_KEY", "")
 OPENAI_MODEL = os.environ.get("OPENAI_MODEL", "gpt-4-turbo-preview")
 
 # Evaluation Model Configuration
-EVALUATION_MODEL = "gpt-4o"  # Model used for evaluation metrics
+# Model used for evaluation metrics; "mock" or "mock-<profile>" selects the local mock judge
+EVALUATION_MODEL = os.environ.get("EVALUATION_MODEL", "gpt-4o")
+
+# Judge model pricing in USD per 1M tokens (input, output), for cost estimates
+JUDGE_MODEL_PRICING = {
+    "gpt-4o": (2.50, 10.00),
+    "gpt-4o-mini": (0.15, 0.60),
+    "gpt-4.1": (2.00, 8.00),
+    "gpt-4.1-mini": (0.40, 1.60),
+    "gpt-4-turbo": (10.00, 30.00),
+    "gpt-4-turbo-preview": (10.00, 30.00)
+}
 
 # Thresholds for metrics
 @dataclass
@@ -137,6 +148,177 @@ TEST_CATEGORIES = [
     "error_handling"
 ]
 
+# Multi-turn judge context compaction
+CONTEXT_COMPACTION_CONFIG = {
+    "enabled": True,
+    "max_transcript_chars": 6000,  # Cap on the transcript sent to each judge
+    "head_turns": 1,  # Always keep the opening emergency report
+    "tail_turns": 4,  # Always keep the most recent turns
+    "max_message_chars": 800  # Clip long bot messages in kept turns
+}
+
+# Upper bounds (ms) of latency histogram buckets; values above the last go in an open bucket
+LATENCY_HISTOGRAM_BUCKETS_MS = [250, 500, 1000, 2000, 5000, 10000, 20000, 30000]
+
+# Open-loop load test saturation knee detection
+LOAD_TEST_CONFIG = {
+    "knee_throughput_ratio": 0.9,  # Achieved below 90% of offered request rate
+    "knee_latency_factor": 3.0,  # p99 more than 3x the first step's p99
+    "knee_error_rate": 5.0  # Error rate above 5%
+}
+
+# Mock chatbot server (mock_chatbot_server.py) defaults
+MOCK_CHATBOT_CONFIG = {
+    "host": "127.0.0.1",
+    "port": 5001,
+    "latency": "lognormal",  # none | fixed | uniform | normal | lognormal | exponential
+    "latency_ms": 800,  # Fixed value, mean (normal/exponential) or median (lognormal)
+    "latency_spread": 0.5,  # Half-width ratio (uniform), stddev ratio (normal), sigma (lognormal)
+    "latency_max_ms": 30000,  # Cap on sampled latency
+    "error_rate": 0.0,  # Fraction of /message calls that fail with HTTP 500
+    "seed": None
+}
+
+# Local OpenAI-compatible mock judge (mock_judge_server.py)
+MOCK_JUDGE_CONFIG = {
+    "model_prefix": "mock",  # EVALUATION_MODEL values starting with this use the mock judge
+    "host": "127.0.0.1",
+    "port": 5003,
+    "base_url": os.environ.get("MOCK_JUDGE_URL", "http://127.0.0.1:5003/v1"),
+    "auto_start": True,  # Start an in-process server if base_url is not reachable
+    "profile": "fast",  # Used when EVALUATION_MODEL has no "-<profile>" suffix
+    # Latency profiles: (distribution, latency_ms, spread) as in MOCK_CHATBOT_CONFIG
+    "profiles": {
+        "instant": ("none", 0, 0.0),
+        "fast": ("uniform", 20, 0.5),
+        "realistic": ("lognormal", 1500, 0.6),
+        "slow": ("lognormal", 6000, 0.8)
+    },
+    "default_score": 8,  # GEval 0-10 scale
+    "score_jitter": 1,  # Deterministic +/- jitter derived from a hash of the prompt
+    # First matching rule (regex over the judge prompt) sets score and reason
+    "rules": [
+        {"pattern": r"(?m)(^|Bot: )Error: ", "score": 0, "reason": "The chatbot returned an error instead of a response."},
+        {"pattern": r"hệ thống đang gặp sự cố", "score": 2, "reason": "The chatbot fell back to its generic failure message."},
+        {"pattern": r"PHIẾU KHẨN CẤP TD-", "score": 9, "reason": "The conversation reached ticket creation."}
+    ]
+}
+
+# Stratified sampling for --quick / --max-cases and pass-rate confidence intervals
+SAMPLING_CONFIG = {
+    "seed": 42,
+    "confidence": 0.95
+}
+
+# Bootstrap intervals for pass rates and metric means (same confidence as above)
+BOOTSTRAP_CONFIG = {
+    "resamples": 2000,
+    "seed": 42,
+    "histogram_bins": 10  # Equal-width score bins over [0, 1]
+}
+
+# Adaptive (sequential) single-turn evaluation
+ADAPTIVE_CONFIG = {
+    "target_ci_width": 10.0,  # Stop a category once its interval is narrower (percentage points)
+    "min_cases_per_category": 10,  # Never stop a category before this many cases
+    # Stopping decisions use a stricter level than reporting to offset repeated looks
+    "decision_confidence": 0.99
+}
+
+# Chatbot transport retries and circuit breaker (transport.py)
+TRANSPORT_CONFIG = {
+    "max_retries": 3,  # Retries per message after a transport error
+    "backoff_base_s": 1.0,  # Retry n waits up to base * 2^n seconds (jittered)
+    "backoff_max_s": 30.0,
+    "retry_statuses": [502, 503, 504],  # HTTP statuses treated as transport errors
+    "breaker_failure_threshold": 3,  # Consecutive transport failures that pause the run
+    "health_poll_interval_s": 10,  # /api/chat/health polling while paused
+    "max_pause_s": 1800  # Resume after this long even if still unhealthy; None waits forever
+}
+
+# Hedged single-turn requests and adaptive timeouts (hedging.py)
+HEDGING_CONFIG = {
+    "percentile": 95,  # Hedge a request once it has run longer than this observed percentile
+    "window": 200,  # Recent latencies kept per key
+    "min_samples": 20,  # No hedging or adaptive timeout before this many latencies
+    "timeout_multiplier": 3.0,  # Timeout budget = multiplier x observed p99 ...
+    "min_timeout_s": 10.0,  # ... but never below this, nor above the client's fixed timeout
+    "drain_timeout_s": 5.0  # The report waits at most this long for losing primaries to finish
+}
+
+# SQLite work queue for --worker runs (work_queue.py)
+WORK_QUEUE_CONFIG = {
+    "lease_timeout_s": 300,  # A case is re-queued if its worker stops renewing for this long
+    "heartbeat_s": 60,  # Lease renewal interval while a case is being evaluated
+    "max_attempts": 3,  # Leases per case before it is marked failed
+    "poll_interval_s": 5  # Idle workers re-check for expired leases this often
+}
+
+# Pipelined single-turn evaluation (pipeline.py)
+PIPELINE_CONFIG = {
+    "collect_workers": 4,  # Concurrent chatbot requests
+    "judge_workers": 4,  # Concurrent judges, each with its own metric instances
+    "queue_size": 16,  # Bound on cases waiting between two stages
+    "sample_interval_s": 0.5  # Queue depth sampling interval
+}
+
+# Historical results store (history_store.py)
+HISTORY_CONFIG = {
+    "enabled": True,  # Record exported runs in the output directory's history database
+    "filename": "history.db",
+    "last_runs": 20  # Default window for history queries
+}
+
+# Artifact Storage Configuration
+ARTIFACT_CONFIG = {
+    "compression": "zstd",  # "zstd" (falls back to gzip without zstandard), "gzip" or "none"
+    "zstd_level": 3,
+    "gzip_level": 6,
+    "corpus_dir": "corpora"  # Content-addressed test case corpora, under the output directory
+}
+
+# Columnar Export Configuration
+COLUMNAR_CONFIG = {
+    "enabled": True,  # Write <results>.parquet (and _turns.parquet) next to each results JSON
+    "compression": "zstd"
+}
+
+# Run Comparison Configuration (run_evaluation.py compare)
+COMPARE_CONFIG = {
+    "score_delta": 0.1,  # Report per-case metric changes at least this large
+    "latency_percentile": 95,  # Per-category latency compared at this percentile
+    "latency_regression_pct": 20.0,  # A category regressed when it got this much slower...
+    "latency_min_delta_ms": 50.0  # ...and by at least this many milliseconds
+}
+
+# CLI Startup Benchmark Configuration (startup_benchmark.py)
+STARTUP_CONFIG = {
+    "budget_ms": 200,  # Median wall time allowed for listing and report commands
+    "runs": 7,  # Timed runs per command
+    "top_imports": 15,  # Slowest imports shown by --profile
+    # Modules that listing and report commands must not import
+    "heavy_modules": ["deepeval", "openai", "requests", "aiohttp", "pandas", "numpy", "pyarrow"]
+}
+
+# Synthetic Corpus Configuration (synthetic_corpus.py, run_evaluation.py --load-synthetic)
+SYNTHETIC_CORPUS_CONFIG = {
+    "size": 100000,  # Cases in a synthetic corpus unless --size / --load-synthetic says otherwise
+    "streets": ["Nguyễn Huệ", "Lê Lợi", "Trần Hưng Đạo", "Nguyễn Trãi", "Võ Văn Tần",
+                "Điện Biên Phủ", "Cách Mạng Tháng 8", "Hai Bà Trưng", "Lý Tự Trọng"],
+    "house_numbers": 999,  # House numbers 1..999
+    "wards": 20,  # Phường 1..20
+    "max_people": 30,  # Affected people 2..30
+    "memory_budget_mb": 64  # Peak process memory allowed while exporting a corpus of any size
+}
+
+# Input Deduplication Configuration (dedup.py, run_evaluation.py --dedup)
+DEDUP_CONFIG = {
+    "digits": True,  # Mask digits to 0 (lengths kept); invalid phone prefixes, wards and districts stay unmasked
+    "whitespace": True,  # Collapse whitespace runs and strip
+    "casefold": False,  # Case-insensitive matching (off: casing can change the expected answer)
+    "largest_classes": 10  # Largest equivalence classes listed in the summary and report
+}
+
 # Report Configuration
 REPORT_CONFIG = {
     "title": "112 Call Center Agent - DeepEval Evaluation Report",
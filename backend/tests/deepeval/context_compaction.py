@@ -0,0 +1,256 @@
+"""
+Judge Context Compaction for Multi-Turn Evaluation
+===================================================
+
+This module builds the minimal payload each conversation-level judge needs,
+instead of sending the full serialized MultiTurnTestCase to every metric.
+
+Features:
+- Per-metric context built only from the fields that metric's criteria reference
+- Turn-aware transcript truncation (keeps the opening report and the latest turns)
+- Approximate token accounting of the original vs compacted payload
+"""
+
+import json
+from dataclasses import dataclass, asdict
+from typing import List, Dict, Any, Optional, Iterable
+
+from config import CONTEXT_COMPACTION_CONFIG
+
+
+# =============================================================================
+# METRIC FIELD MAP
+# =============================================================================
+
+# Fields of MultiTurnTestCase / ConversationTurn referenced by each metric's
+# criteria. Metrics that do not list CONTEXT in evaluation_params get no context.
+METRIC_CONTEXT_FIELDS: Dict[str, Dict[str, List[str]]] = {
+    "state_transition": {
+        "case": ["is_authenticated", "should_create_ticket"],
+        "turn": ["expected_next_step"],
+    },
+    "correction_handling": {
+        "case": [],
+        "turn": ["expected_extractions"],
+    },
+    "first_aid_guidance": {
+        "case": ["category", "description"],
+        "turn": ["expected_extractions.emergencyTypes"],
+    },
+}
+
+TRUNCATION_MARKER = "[... {count} turn(s) omitted ...]"
+
+
+@dataclass
+class CompactedPayload:
+    """Judge payload for a single metric with token accounting"""
+    input: str
+    context: Optional[List[str]]
+    baseline_tokens: int
+    compacted_tokens: int
+
+    @property
+    def saved_tokens(self) -> int:
+        return max(self.baseline_tokens - self.compacted_tokens, 0)
+
+
+# =============================================================================
+# HELPERS
+# =============================================================================
+
+def estimate_tokens(text: Optional[str]) -> int:
+    """Approximate token count (~4 characters per token)"""
+    if not text:
+        return 0
+    return max(1, (len(text) + 3) // 4)
+
+
+def _param_names(evaluation_params: Iterable[Any]) -> List[str]:
+    """Normalize LLMTestCaseParams (or plain strings) to their string values"""
+    return [getattr(p, "value", p) for p in evaluation_params or []]
+
+
+def _get_path(data: Any, path: str) -> Any:
+    """Resolve a dotted path on dicts/objects, returning None if missing"""
+    value = data
+    for part in path.split("."):
+        if value is None:
+            return None
+        if isinstance(value, dict):
+            value = value.get(part)
+        else:
+            value = getattr(value, part, None)
+    return value
+
+
+def format_transcript(conversation_log: List[Dict[str, str]]) -> str:
+    """Format a conversation log the same way the judges have always seen it"""
+    return "\n".join([
+        f"{'User' if log['role'] == 'user' else 'Bot'}: {log['message']}"
+        for log in conversation_log
+    ])
+
+
+def _group_turns(conversation_log: List[Dict[str, str]]) -> List[List[Dict[str, str]]]:
+    """Group a flat user/bot log into turns, each starting at a user message"""
+    turns = []
+    for entry in conversation_log:
+        if entry["role"] == "user" or not turns:
+            turns.append([])
+        turns[-1].append(entry)
+    return turns
+
+
+def truncate_transcript(
+    conversation_log: List[Dict[str, str]],
+    max_chars: int = None,
+    head_turns: int = None,
+    tail_turns: int = None,
+    max_message_chars: int = None
+) -> str:
+    """Cap a transcript without splitting turns.
+
+    The first `head_turns` (the emergency report) and the last `tail_turns`
+    are always kept; middle turns are dropped as whole turns until the
+    transcript fits, then overly long bot messages are clipped.
+    """
+    cfg = CONTEXT_COMPACTION_CONFIG
+    max_chars = max_chars if max_chars is not None else cfg["max_transcript_chars"]
+    head_turns = head_turns if head_turns is not None else cfg["head_turns"]
+    tail_turns = tail_turns if tail_turns is not None else cfg["tail_turns"]
+    max_message_chars = max_message_chars if max_message_chars is not None else cfg["max_message_chars"]
+
+    full = format_transcript(conversation_log)
+    if len(full) <= max_chars:
+        return full
+
+    turns = _group_turns(conversation_log)
+    head = turns[:head_turns]
+    middle = turns[head_turns:max(len(turns) - tail_turns, head_turns)]
+    tail = turns[max(len(turns) - tail_turns, head_turns):]
+
+    # Drop middle turns oldest-first until the transcript fits
+    while middle:
+        kept = head + middle + tail
+        if len(format_transcript([e for t in kept for e in t])) <= max_chars:
+            break
+        middle = middle[1:]
+    omitted = len(turns) - len(head) - len(middle) - len(tail)
+
+    def clip(entry: Dict[str, str]) -> Dict[str, str]:
+        message = entry["message"]
+        if entry["role"] != "user" and len(message) > max_message_chars:
+            message = message[:max_message_chars] + "..."
+        return {"role": entry["role"], "message": message}
+
+    lines = [format_transcript([clip(e) for t in head for e in t])]
+    if omitted:
+        lines.append(TRUNCATION_MARKER.format(count=omitted))
+    lines.append(format_transcript([clip(e) for t in middle + tail for e in t]))
+
+    return "\n".join(line for line in lines if line)
+
+
+def build_metric_context(metric_name: str, test_case: Any) -> Optional[str]:
+    """Build the minimal JSON context for a metric from its referenced fields"""
+    fields = METRIC_CONTEXT_FIELDS.get(metric_name)
+    if not fields:
+        return None
+
+    context: Dict[str, Any] = {}
+    for path in fields.get("case", []):
+        value = _get_path(test_case, path)
+        if value is not None:
+            context[path] = value
+
+    turns = []
+    for i, turn in enumerate(test_case.turns):
+        turn_data = {}
+        for path in fields.get("turn", []):
+            value = _get_path(turn, path)
+            if value not in (None, {}, []):
+                turn_data[path.split(".")[-1]] = value
+        if turn_data:
+            turns.append({"turn": i + 1, **turn_data})
+    if turns:
+        context["turns"] = turns
+
+    if not context:
+        return None
+    return json.dumps(context, ensure_ascii=False, separators=(",", ":"))
+
+
+# =============================================================================
+# PAYLOAD BUILDER
+# =============================================================================
+
+def compact_metric_payload(
+    metric_name: str,
+    evaluation_params: Iterable[Any],
+    test_case: Any,
+    conversation_log: List[Dict[str, str]],
+    expected_output: str = "",
+    enabled: bool = None
+) -> CompactedPayload:
+    """Build the judge input/context for one metric and account for its size.
+
+    Only the payload fields the metric actually consumes (per its
+    evaluation_params) are counted, so the savings reflect real judge input.
+    """
+    if enabled is None:
+        enabled = CONTEXT_COMPACTION_CONFIG["enabled"]
+
+    params = _param_names(evaluation_params)
+    uses_context = "context" in params
+    uses_expected = "expected_output" in params
+
+    full_transcript = format_transcript(conversation_log)
+    full_context = json.dumps(asdict(test_case), ensure_ascii=False)
+
+    if enabled:
+        transcript = truncate_transcript(conversation_log)
+        metric_context = build_metric_context(metric_name, test_case) if uses_context else None
+        context = [metric_context] if metric_context else None
+    else:
+        transcript = full_transcript
+        context = [full_context]
+
+    expected_tokens = estimate_tokens(expected_output) if uses_expected else 0
+    baseline_tokens = (
+        estimate_tokens(full_transcript)
+        + expected_tokens
+        + (estimate_tokens(full_context) if uses_context else 0)
+    )
+    compacted_tokens = (
+        estimate_tokens(transcript)
+        + expected_tokens
+        + (estimate_tokens(context[0]) if uses_context and context else 0)
+    )
+
+    return CompactedPayload(
+        input=transcript,
+        context=context,
+        baseline_tokens=baseline_tokens,
+        compacted_tokens=compacted_tokens
+    )
+
+
+def summarize_token_savings(results: Iterable[Any]) -> Dict[str, Dict[str, float]]:
+    """Aggregate per-metric context token usage across evaluation results"""
+    totals: Dict[str, Dict[str, float]] = {}
+    for result in results:
+        for metric_name, usage in (getattr(result, "context_tokens", None) or {}).items():
+            if metric_name not in totals:
+                totals[metric_name] = {"baseline_tokens": 0, "compacted_tokens": 0}
+            totals[metric_name]["baseline_tokens"] += usage.get("baseline_tokens", 0)
+            totals[metric_name]["compacted_tokens"] += usage.get("compacted_tokens", 0)
+
+    for data in totals.values():
+        data["saved_tokens"] = max(data["baseline_tokens"] - data["compacted_tokens"], 0)
+        data["saved_pct"] = (
+            data["saved_tokens"] / data["baseline_tokens"] * 100
+            if data["baseline_tokens"] else 0.0
+        )
+
+    return totals
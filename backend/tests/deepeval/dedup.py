@@ -0,0 +1,172 @@
+"""
+Input Deduplication for 112 Call Center Agent Evaluation
+=========================================================
+
+Templated generators (phone validation, location extraction, authenticated
+user) produce cases whose messages differ only in random digits or spacing.
+Each one still costs a chatbot call and the judge calls. This module groups
+cases into equivalence classes by a hash of their normalised content, so a
+class is evaluated once and its result is fanned out to every member.
+
+Features:
+- Configurable normalisation (DEDUP_CONFIG): digits masked to 0 with number
+  lengths kept, whitespace collapsed, optional case folding
+- Phone numbers keep what decides their validity: a prefix outside
+  VALID_PHONE_PREFIXES stays unmasked
+- Ward and district numbers stay unmasked, so cases expecting different
+  administrative units never share a class
+- The key covers category, subcategory, input message, context, expected
+  output, expected extraction and metadata
+- Fanned-out results name their representative (dedup_of) and carry no judge
+  usage of their own
+- Dedup ratio overall and per category, with the largest classes
+"""
+
+import re
+import json
+import hashlib
+from dataclasses import dataclass, field, replace
+from typing import List, Dict, Any, Iterable
+
+from config import DEDUP_CONFIG, VALID_PHONE_PREFIXES
+
+
+# A numbered ward or district, a domestic (0xx) or international (+84xx) phone
+# number, or any other digit
+DIGIT_OR_PHONE = re.compile(
+    r"(?P<unit>(?<!\w)(?:phường|quận|p\.|q\.)\s*\d+)"
+    r"|(?<!\d)(?P<lead>\+84|0)(?P<prefix>\d{2})(?P<rest>\d{7})(?!\d)"
+    r"|\d",
+    re.IGNORECASE
+)
+WHITESPACE = re.compile(r"\s+")
+VALID_PREFIXES = frozenset(VALID_PHONE_PREFIXES)
+
+
+def _mask_digits(match: re.Match) -> str:
+    """0 for each digit; a phone prefix becomes ## when valid and is kept when not.
+
+    Ward and district numbers (Phường 6, Q.1) are kept: they are part of the
+    location a case expects, unlike house numbers.
+    """
+    if match.group("unit"):
+        return match.group(0)
+    rest = match.group("rest")
+    if rest is None:
+        return "0"
+    prefix = match.group("prefix")
+    if "0" + prefix in VALID_PREFIXES:
+        prefix = "##"  # Any valid prefix, but never equal to an invalid one such as 000
+    return match.group("lead") + prefix + "0" * len(rest)
+
+
+def normalize_text(text: str, normalization: Dict[str, Any] = None) -> str:
+    """Canonical form of text under DEDUP_CONFIG (or the given) normalisation"""
+    normalization = normalization or DEDUP_CONFIG
+    if normalization.get("digits"):
+        text = DIGIT_OR_PHONE.sub(_mask_digits, text)
+    if normalization.get("whitespace"):
+        text = WHITESPACE.sub(" ", text).strip()
+    if normalization.get("casefold"):
+        text = text.casefold()
+    return text
+
+
+def case_key(test_case: Any, normalization: Dict[str, Any] = None) -> str:
+    """Hash of a test case's normalised content; equal keys mean the same expected behaviour"""
+    content = json.dumps(
+        [
+            test_case.category,
+            test_case.subcategory,
+            test_case.input_message,
+            test_case.context,
+            test_case.expected_output,
+            test_case.expected_extraction,
+            test_case.metadata
+        ],
+        ensure_ascii=False, sort_keys=True, default=str
+    )
+    return hashlib.sha256(normalize_text(content, normalization).encode("utf-8")).hexdigest()[:16]
+
+
+@dataclass
+class DedupPlan:
+    """Equivalence classes of a list of test cases; the first member of a class is its representative"""
+    test_cases: List[Any]
+    classes: Dict[str, List[Any]]  # Key -> members, in corpus order
+    keys: Dict[str, str]  # Test case ID -> key
+    normalization: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def representatives(self) -> List[Any]:
+        """One test case per class, in corpus order"""
+        return [members[0] for members in self.classes.values()]
+
+    def fan_out(self, results: Iterable[Any]) -> List[Any]:
+        """Results for every test case, copied from their representative's result.
+
+        Copies keep their own ID, subcategory, input and expected output, and
+        drop judge usage and retries so cost and transport totals count each
+        call once. Cases whose representative has no result (adaptive early
+        stopping) get none.
+        """
+        by_id = {result.test_case_id: result for result in results}
+        fanned = []
+        for test_case in self.test_cases:
+            representative = self.classes[self.keys[test_case.id]][0]
+            result = by_id.get(representative.id)
+            if result is None:
+                continue
+            if test_case is representative:
+                fanned.append(result)
+                continue
+            fanned.append(replace(
+                result,
+                test_case_id=test_case.id,
+                subcategory=test_case.subcategory,
+                input_message=test_case.input_message,
+                expected_output=test_case.expected_output,
+                judge_usage=[],
+                transport_retries=0,
+                dedup_of=representative.id
+            ))
+        return fanned
+
+    def report(self) -> Dict[str, Any]:
+        """Cases, classes and dedup ratio overall and per category, with the largest classes"""
+        by_category: Dict[str, Dict[str, Any]] = {}
+        for members in self.classes.values():
+            stats = by_category.setdefault(members[0].category, {"cases": 0, "classes": 0})
+            stats["cases"] += len(members)
+            stats["classes"] += 1
+        for stats in by_category.values():
+            stats["ratio"] = stats["cases"] / stats["classes"]
+
+        cases, classes = len(self.test_cases), len(self.classes)
+        largest = sorted(self.classes.values(), key=lambda members: -len(members))
+        return {
+            "cases": cases,
+            "classes": classes,
+            "ratio": cases / classes if classes else 1.0,
+            "saved": cases - classes,
+            "saved_pct": (cases - classes) / cases * 100 if cases else 0.0,
+            "normalization": {key: self.normalization.get(key, False) for key in ("digits", "whitespace", "casefold")},
+            "by_category": by_category,
+            "largest": [
+                {"representative": members[0].id, "category": members[0].category, "members": len(members)}
+                for members in largest[:DEDUP_CONFIG["largest_classes"]]
+                if len(members) > 1
+            ]
+        }
+
+
+def plan_dedup(test_cases: List[Any], normalization: Dict[str, Any] = None) -> DedupPlan:
+    """Group test cases into equivalence classes by case_key"""
+    normalization = normalization or DEDUP_CONFIG
+    classes: Dict[str, List[Any]] = {}
+    keys: Dict[str, str] = {}
+    for test_case in test_cases:
+        key = case_key(test_case, normalization)
+        keys[test_case.id] = key
+        classes.setdefault(key, []).append(test_case)
+    return DedupPlan(test_cases=list(test_cases), classes=classes, keys=keys, normalization=normalization)
@@ -22,11 +22,13 @@ Usage:
 import os
 import sys
 import json
+import time
 import asyncio
 import argparse
+import threading
 from datetime import datetime
-from typing import List, Dict, Any, Optional
-from dataclasses import dataclass, asdict
+from typing import List, Dict, Any, Optional, Tuple
+from dataclasses import dataclass, asdict, field, fields
 import requests
 
 # DeepEval imports
@@ -47,27 +49,68 @@ from deepeval.dataset import EvaluationDataset
 
 # Local imports
 from config import (
-    THRESHOLDS, EVALUATION_MODEL, REPORT_CONFIG,
+    THRESHOLDS, EVALUATION_MODEL, REPORT_CONFIG, ADAPTIVE_CONFIG, PIPELINE_CONFIG,
     EMERGENCY_TYPES, TEST_CATEGORIES
 )
 from test_cases_generator import generate_all_test_cases, TestCase
+from judge_usage import create_judge_model, measure_with_usage, summarize_judge_usage
+from latency_stats import summarize_latency
+from transport import CircuitBreaker, InfraFailure, post_message, summarize_transport
+from hedging import LatencyTracker, HedgedSender
+from pipeline import Pipeline, Stage, print_pipeline_report
+from history_store import record_export
+from artifact_store import write_results
+from columnar import results_frame, summarize_frame, export_columnar
+from dedup import plan_dedup
+from sampling import (
+    stratified_sample, stratified_order, sequential_decision, summarize_pass_rate_ci,
+    summarize_bootstrap_ci, summarize_score_histograms
+)
 
 
 # =============================================================================
 # API CLIENT FOR CHATBOT
 # =============================================================================
 
+def build_seed_state(test_case: TestCase) -> Optional[Dict[str, Any]]:
+    """Backend state a mid-workflow case starts from; None if it has none.
+
+    Only cases whose generator sets metadata["seed_state"] are seeded; other
+    cases with context would otherwise land at the default step. The
+    conversation so far comes from the case's context, the extracted fields
+    (step, location, phone, ...) from metadata["seed_state"].
+    """
+    seed_state = test_case.metadata.get("seed_state")
+    if not test_case.context or not seed_state:
+        return None
+    return {
+        **seed_state,
+        "messages": [{"role": msg["role"], "message": msg["message"]} for msg in test_case.context]
+    }
+
+
 class ChatbotClient:
     """Client for interacting with the 112 Call Center chatbot API"""
 
-    def __init__(self, base_url: str = "http://localhost:5000"):
+    def __init__(self, base_url: str = "http://localhost:5000", hedge: bool = False, seed_sessions: bool = True):
         self.base_url = base_url
         self.session_counter = 0
+        self._session_lock = threading.Lock()
+        self.breaker = CircuitBreaker(base_url)
+        self.latency = LatencyTracker()
+        # Only requests on fresh sessions are hedged; see send_message
+        self.hedger = HedgedSender(self.latency) if hedge else None
+        # Switched off if the backend turns out to have no seed endpoint
+        self.seed_sessions = seed_sessions
+        self.seed_stats = {"seeded": 0, "failed": 0}
 
     def generate_session_id(self) -> str:
         """Generate a unique session ID"""
-        self.session_counter += 1
-        return f"eval_session_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{self.session_counter}"
+        # Pipelined runs send from several collect workers at once
+        with self._session_lock:
+            self.session_counter += 1
+            counter = self.session_counter
+        return f"eval_session_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{counter}"
 
     def send_message(
         self,
@@ -76,8 +119,17 @@ class ChatbotClient:
         context: List[Dict] = None,
         user_id: Optional[str] = None
     ) -> Dict[str, Any]:
-        """Send a message to the chatbot and get response"""
+        """Send a message to the chatbot and get response.
+
+        Only transport errors that cannot have reached the session state are
+        retried (see post_message's stateful mode), since a seeded or earlier
+        session state must not receive the message twice; if they persist, or
+        a read timeout leaves its effect unknown, the response carries
+        "infra_error": True. "attempts" is the number of requests made. A
+        request on a fresh session may be hedged (see hedging.py).
+        """
 
+        fresh_session = session_id is None
         if session_id is None:
             session_id = self.generate_session_id()
 
@@ -91,21 +143,76 @@ class ChatbotClient:
         if user_id:
             headers["Authorization"] = f"Bearer {user_id}"
 
+        def send(sid: str):
+            return post_message(
+                f"{self.base_url}/api/chat/message",
+                {**payload, "sessionId": sid},
+                headers,
+                timeout=self.latency.timeout_budget(30),
+                breaker=self.breaker,
+                stateful=True
+            )
+
+        if self.hedger and fresh_session:
+            result, attempts, hedged = self.hedger.send(send, session_id, self.generate_session_id)
+            result["hedged"] = hedged
+        else:
+            start = time.perf_counter()
+            result, attempts = send(session_id)
+            if not result.get("infra_error"):
+                self.latency.add((time.perf_counter() - start) * 1000)
+        result["attempts"] = attempts
+        return result
+
+    def seed_session(self, session_id: str, state: Dict[str, Any]) -> Optional[bool]:
+        """Start a new backend session from a prepared state.
+
+        True on success, False if the backend refused or could not be
+        reached, and None if it has no seed endpoint or has seeding disabled
+        (ALLOW_SESSION_SEED).
+        """
         try:
             response = requests.post(
-                f"{self.base_url}/api/chat/message",
-                json=payload,
-                headers=headers,
-                timeout=30
+                f"{self.base_url}/api/chat/session/{session_id}/seed",
+                json={"state": state},
+                timeout=self.latency.timeout_budget(30)
             )
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            return {
-                "success": False,
-                "error": str(e),
-                "data": {"response": f"Error: {str(e)}"}
-            }
+        except requests.exceptions.RequestException:
+            response = None
+        if response is not None and response.status_code == 200:
+            with self._session_lock:
+                self.seed_stats["seeded"] += 1
+            return True
+        if (response is not None and response.status_code in (404, 405)
+                and "json" not in response.headers.get("Content-Type", "")):
+            # Express answers unknown routes with an HTML 404
+            if self.seed_sessions:
+                self.seed_sessions = False
+                print("  [SEED] Backend has no session seed endpoint; sending context instead")
+            return None
+        if response is not None and response.status_code == 403 and "disabled" in response.text:
+            if self.seed_sessions:
+                self.seed_sessions = False
+                print("  [SEED] Session seeding is disabled (ALLOW_SESSION_SEED); sending context instead")
+            return None
+        with self._session_lock:
+            self.seed_stats["failed"] += 1
+        return False
+
+    def open_session(self, test_case: TestCase) -> Tuple[Optional[str], List[Dict]]:
+        """Session and context to send a test case with.
+
+        A case with conversation context and a seed state gets a session
+        seeded at that point of the workflow, so its message is answered mid-conversation without
+        replaying earlier turns. Otherwise (or if seeding fails) the message
+        goes to a fresh session with the context attached, as before.
+        """
+        state = build_seed_state(test_case) if self.seed_sessions else None
+        if state is not None:
+            session_id = self.generate_session_id()
+            if self.seed_session(session_id, state):
+                return session_id, []
+        return None, test_case.context
 
     def clear_session(self, session_id: str) -> bool:
         """Clear a chat session"""
@@ -126,7 +233,7 @@ class ChatbotClient:
 class EmergencyTypeAccuracyMetric(GEval):
     """Custom metric for emergency type detection accuracy"""
 
-    def __init__(self):
+    def __init__(self, model=EVALUATION_MODEL):
         super().__init__(
             name="Emergency Type Accuracy",
             criteria="""Evaluate if the AI correctly identifies and responds to the emergency type.
@@ -153,7 +260,7 @@ class EmergencyTypeAccuracyMetric(GEval):
                 LLMTestCaseParams.INPUT,
                 LLMTestCaseParams.ACTUAL_OUTPUT
             ],
-            model=EVALUATION_MODEL,
+            model=model,
             threshold=0.6  # Slightly lower threshold for implicit detection
         )
 
@@ -161,7 +268,7 @@ class EmergencyTypeAccuracyMetric(GEval):
 class LocationExtractionMetric(GEval):
     """Custom metric for location extraction quality"""
 
-    def __init__(self):
+    def __init__(self, model=EVALUATION_MODEL):
         super().__init__(
             name="Location Extraction Quality",
             criteria="""Evaluate how well the AI extracts and processes location information.
@@ -183,7 +290,7 @@ class LocationExtractionMetric(GEval):
                 LLMTestCaseParams.ACTUAL_OUTPUT,
                 LLMTestCaseParams.EXPECTED_OUTPUT
             ],
-            model=EVALUATION_MODEL,
+            model=model,
             threshold=THRESHOLDS.g_eval
         )
 
@@ -191,7 +298,7 @@ class LocationExtractionMetric(GEval):
 class PhoneValidationMetric(GEval):
     """Custom metric for Vietnamese phone number validation"""
 
-    def __init__(self):
+    def __init__(self, model=EVALUATION_MODEL):
         super().__init__(
             name="Phone Validation Accuracy",
             criteria="""Evaluate if the AI correctly validates Vietnamese phone numbers.
@@ -213,7 +320,7 @@ class PhoneValidationMetric(GEval):
                 LLMTestCaseParams.INPUT,
                 LLMTestCaseParams.ACTUAL_OUTPUT
             ],
-            model=EVALUATION_MODEL,
+            model=model,
             threshold=THRESHOLDS.g_eval
         )
 
@@ -221,7 +328,7 @@ class PhoneValidationMetric(GEval):
 class ConversationFlowMetric(GEval):
     """Custom metric for conversation flow adherence"""
 
-    def __init__(self):
+    def __init__(self, model=EVALUATION_MODEL):
         super().__init__(
             name="Conversation Flow Quality",
             criteria="""Evaluate if the AI follows the correct conversation flow for emergency calls.
@@ -248,7 +355,7 @@ class ConversationFlowMetric(GEval):
                 LLMTestCaseParams.ACTUAL_OUTPUT,
                 LLMTestCaseParams.CONTEXT
             ],
-            model=EVALUATION_MODEL,
+            model=model,
             threshold=THRESHOLDS.g_eval
         )
 
@@ -256,7 +363,7 @@ class ConversationFlowMetric(GEval):
 class FirstAidGuidanceMetric(GEval):
     """Custom metric for first aid guidance quality"""
 
-    def __init__(self):
+    def __init__(self, model=EVALUATION_MODEL):
         super().__init__(
             name="First Aid Guidance Quality",
             criteria="""Evaluate the quality of first aid guidance provided by the AI.
@@ -279,7 +386,7 @@ class FirstAidGuidanceMetric(GEval):
                 LLMTestCaseParams.ACTUAL_OUTPUT,
                 LLMTestCaseParams.RETRIEVAL_CONTEXT
             ],
-            model=EVALUATION_MODEL,
+            model=model,
             threshold=THRESHOLDS.g_eval
         )
 
@@ -287,7 +394,7 @@ class FirstAidGuidanceMetric(GEval):
 class ConfirmationHandlingMetric(GEval):
     """Custom metric for confirmation handling"""
 
-    def __init__(self):
+    def __init__(self, model=EVALUATION_MODEL):
         super().__init__(
             name="Confirmation Handling",
             criteria="""Evaluate how well the AI handles user confirmations and corrections.
@@ -307,7 +414,7 @@ class ConfirmationHandlingMetric(GEval):
                 LLMTestCaseParams.ACTUAL_OUTPUT,
                 LLMTestCaseParams.CONTEXT
             ],
-            model=EVALUATION_MODEL,
+            model=model,
             threshold=THRESHOLDS.g_eval
         )
 
@@ -315,7 +422,7 @@ class ConfirmationHandlingMetric(GEval):
 class VietnameseLanguageMetric(GEval):
     """Custom metric for Vietnamese language handling"""
 
-    def __init__(self):
+    def __init__(self, model=EVALUATION_MODEL):
         super().__init__(
             name="Vietnamese Language Quality",
             criteria="""Evaluate the AI's Vietnamese language handling.
@@ -336,7 +443,7 @@ class VietnameseLanguageMetric(GEval):
                 LLMTestCaseParams.INPUT,
                 LLMTestCaseParams.ACTUAL_OUTPUT
             ],
-            model=EVALUATION_MODEL,
+            model=model,
             threshold=THRESHOLDS.g_eval
         )
 
@@ -344,7 +451,7 @@ class VietnameseLanguageMetric(GEval):
 class SafetyMetric(GEval):
     """Custom metric for safety and security"""
 
-    def __init__(self):
+    def __init__(self, model=EVALUATION_MODEL):
         super().__init__(
             name="Safety & Security",
             criteria="""Evaluate if the AI handles inputs safely.
@@ -364,7 +471,7 @@ class SafetyMetric(GEval):
                 LLMTestCaseParams.INPUT,
                 LLMTestCaseParams.ACTUAL_OUTPUT
             ],
-            model=EVALUATION_MODEL,
+            model=model,
             threshold=0.9
         )
 
@@ -387,6 +494,94 @@ class EvaluationResult:
     timestamp: str
     duration_ms: float
     errors: List[str]
+    judge_usage: List[Dict[str, Any]] = field(default_factory=list)
+    chatbot_latency_ms: float = 0.0  # /api/chat/message round trip
+    judge_latency_ms: float = 0.0  # Sum of all metric.measure() calls
+    metric_latency_ms: Dict[str, float] = field(default_factory=dict)
+    overhead_ms: float = 0.0  # Harness time outside chatbot and judges
+    infra_failure: bool = False  # Chatbot unreachable after retries; not judged
+    transport_retries: int = 0
+    dedup_of: Optional[str] = None  # Copied from this equivalent case's result (--dedup)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "EvaluationResult":
+        """Rebuild a result from its exported JSON form"""
+        names = {f.name for f in fields(cls)}
+        return cls(**{key: value for key, value in data.items() if key in names})
+
+
+@dataclass
+class CollectedResponse:
+    """Chatbot answer to a single-turn case, captured before judging"""
+    test_case_id: str
+    actual_output: str
+    timestamp: str
+    collect_ms: float  # Wall time of the collect step
+    chatbot_latency_ms: float = 0.0
+    transport_retries: int = 0
+    infra_error: Optional[str] = None  # Set when the chatbot was unreachable
+    error: Optional[str] = None  # Harness error while collecting
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CollectedResponse":
+        names = {f.name for f in fields(cls)}
+        return cls(**{key: value for key, value in data.items() if key in names})
+
+
+def summarize_results(
+    results: List[EvaluationResult],
+    adaptive_report: Dict[str, Dict[str, Any]] = None,
+    circuit_breaker: Dict[str, Any] = None,
+    hedging: Dict[str, Any] = None,
+    pipeline: Dict[str, Any] = None,
+    session_seeding: Dict[str, Any] = None,
+    dedup: Dict[str, Any] = None
+) -> Dict[str, Any]:
+    """Summary statistics for a list of evaluation results.
+
+    Shared by Evaluator.get_summary and by merging shard outputs, so a merged
+    summary is computed exactly like a single-run one. Infra failures (chatbot
+    unreachable) are counted separately and left out of pass rates and scores.
+    Results fanned out by --dedup count towards pass rates and scores, but
+    not towards latency, which is measured once per evaluated case, nor
+    towards confidence intervals: a copy is not an independent sample.
+    """
+
+    if not results:
+        return {}
+
+    all_results = results
+    results = [r for r in all_results if not r.infra_failure]
+    measured = [r for r in all_results if not getattr(r, "dedup_of", None)]
+    frame = results_frame(all_results)
+    judged_frame = frame[~frame["infra_failure"]]
+    independent = [r for r in results if not r.dedup_of]
+    independent_frame = judged_frame if len(independent) == len(results) else results_frame(independent)
+    stats = summarize_frame(frame)
+    total, judged, passed = stats["total"], stats["judged"], stats["passed"]
+    failed = judged - passed
+
+    return {
+        "total_test_cases": total,
+        "passed": passed,
+        "failed": failed,
+        "infra_failures": total - judged,
+        "pass_rate": passed / judged * 100 if judged else 0.0,
+        "average_metrics": stats["average_metrics"],
+        "category_pass_rates": stats["category_pass_rates"],
+        "pass_rate_ci": summarize_pass_rate_ci(independent),
+        "bootstrap_ci": summarize_bootstrap_ci(independent_frame),
+        "score_histograms": summarize_score_histograms(judged_frame),
+        "adaptive": adaptive_report or None,
+        "transport": summarize_transport(all_results, circuit_breaker),
+        "hedging": hedging,
+        "pipeline": pipeline,
+        "session_seeding": session_seeding,
+        "dedup": dedup,
+        "judge_usage": summarize_judge_usage(all_results),
+        "latency": summarize_latency(measured),
+        "evaluation_time": datetime.now().isoformat()
+    }
 
 
 class Evaluator:
@@ -395,48 +590,64 @@ class Evaluator:
     def __init__(
         self,
         chatbot_url: str = "http://localhost:5000",
-        model: str = EVALUATION_MODEL
+        model: str = EVALUATION_MODEL,
+        hedge: bool = False,
+        seed_sessions: bool = True
     ):
-        self.client = ChatbotClient(chatbot_url)
+        self.client = ChatbotClient(chatbot_url, hedge=hedge, seed_sessions=seed_sessions)
         self.model = model
+        self.judge_model = create_judge_model(model)
         self.results: List[EvaluationResult] = []
+        self.adaptive_report: Dict[str, Dict[str, Any]] = {}
+
+        self.pipeline_report: Optional[Dict[str, Any]] = None
+        self.dedup_report: Optional[Dict[str, Any]] = None
+
+        metric_set = self.create_metric_set()
+        self.standard_metrics = metric_set["standard"]
+        self.custom_metrics = metric_set["custom"]
+
+    def create_metric_set(self) -> Dict[str, Dict[str, Any]]:
+        """Fresh standard and custom metric instances sharing the judge model"""
 
         # Initialize standard DeepEval metrics
-        self.standard_metrics = {
+        standard_metrics = {
             "answer_relevancy": AnswerRelevancyMetric(
                 threshold=THRESHOLDS.answer_relevancy,
-                model=model
+                model=self.judge_model
             ),
             "faithfulness": FaithfulnessMetric(
                 threshold=THRESHOLDS.faithfulness,
-                model=model
+                model=self.judge_model
             ),
             "hallucination": HallucinationMetric(
                 threshold=THRESHOLDS.hallucination,
-                model=model
+                model=self.judge_model
             ),
             "toxicity": ToxicityMetric(
                 threshold=THRESHOLDS.toxicity,
-                model=model
+                model=self.judge_model
             ),
             "bias": BiasMetric(
                 threshold=THRESHOLDS.bias,
-                model=model
+                model=self.judge_model
             ),
         }
 
         # Initialize custom metrics
-        self.custom_metrics = {
-            "emergency_type_accuracy": EmergencyTypeAccuracyMetric(),
-            "location_extraction": LocationExtractionMetric(),
-            "phone_validation": PhoneValidationMetric(),
-            "conversation_flow": ConversationFlowMetric(),
-            "first_aid_guidance": FirstAidGuidanceMetric(),
-            "confirmation_handling": ConfirmationHandlingMetric(),
-            "vietnamese_language": VietnameseLanguageMetric(),
-            "safety": SafetyMetric(),
+        custom_metrics = {
+            "emergency_type_accuracy": EmergencyTypeAccuracyMetric(self.judge_model),
+            "location_extraction": LocationExtractionMetric(self.judge_model),
+            "phone_validation": PhoneValidationMetric(self.judge_model),
+            "conversation_flow": ConversationFlowMetric(self.judge_model),
+            "first_aid_guidance": FirstAidGuidanceMetric(self.judge_model),
+            "confirmation_handling": ConfirmationHandlingMetric(self.judge_model),
+            "vietnamese_language": VietnameseLanguageMetric(self.judge_model),
+            "safety": SafetyMetric(self.judge_model),
         }
 
+        return {"standard": standard_metrics, "custom": custom_metrics}
+
     def create_llm_test_case(
         self,
         test_case: TestCase,
@@ -461,43 +672,94 @@ class Evaluator:
             retrieval_context=retrieval_context
         )
 
-    def get_metrics_for_category(self, category: str) -> List:
+    def get_metrics_for_category(self, category: str, metric_set: Dict[str, Dict[str, Any]] = None) -> List:
         """Get relevant metrics for a test category
         
         Simplified to use only 2 core metrics for all categories:
         1. Emergency Type Accuracy - Does the chatbot identify the emergency type correctly?
         2. Answer Relevancy - Is the response relevant to the user's input?
+
+        metric_set defaults to the evaluator's own metric instances.
         """
         
+        custom_metrics = metric_set["custom"] if metric_set else self.custom_metrics
+        standard_metrics = metric_set["standard"] if metric_set else self.standard_metrics
+
         # All categories now use the same 2 core metrics
         return [
-            self.custom_metrics["emergency_type_accuracy"],
-            self.standard_metrics["answer_relevancy"],
+            custom_metrics["emergency_type_accuracy"],
+            standard_metrics["answer_relevancy"],
         ]
 
-    async def evaluate_single_test_case(
-        self,
-        test_case: TestCase,
-        verbose: bool = False
-    ) -> EvaluationResult:
-        """Evaluate a single test case"""
+    def collect_response(self, test_case: TestCase) -> CollectedResponse:
+        """Send a test case to the chatbot and capture its answer (no judging)"""
 
         start_time = datetime.now()
-        errors = []
-        metric_scores = {}
+        start_perf = time.perf_counter()
+        chatbot_latency_ms = 0.0
+        transport_retries = 0
+        infra_error = None
+        error = None
 
         try:
-            # Get response from chatbot
+            chatbot_start = time.perf_counter()
+            session_id, context = self.client.open_session(test_case)
             response = self.client.send_message(
                 message=test_case.input_message,
-                context=test_case.context
+                session_id=session_id,
+                context=context
             )
+            chatbot_latency_ms = (time.perf_counter() - chatbot_start) * 1000
+            transport_retries = response.get("attempts", 1) - 1
 
             if not response.get("success", False):
                 actual_output = response.get("data", {}).get("response", "Error: No response")
             else:
                 actual_output = response.get("data", {}).get("response", "")
 
+            if response.get("infra_error"):
+                # Nothing to judge: the chatbot never answered
+                infra_error = response.get("error", "transport error")
+        except Exception as e:
+            error = str(e)
+            actual_output = f"Error: {str(e)}"
+
+        return CollectedResponse(
+            test_case_id=test_case.id,
+            actual_output=actual_output,
+            timestamp=start_time.isoformat(),
+            collect_ms=(time.perf_counter() - start_perf) * 1000,
+            chatbot_latency_ms=chatbot_latency_ms,
+            transport_retries=transport_retries,
+            infra_error=infra_error,
+            error=error
+        )
+
+    def judge_response(
+        self,
+        test_case: TestCase,
+        collected: CollectedResponse,
+        metric_set: Dict[str, Dict[str, Any]] = None
+    ) -> EvaluationResult:
+        """Score a collected answer with the category's metrics.
+
+        metric_set (from create_metric_set) lets concurrent judges use their
+        own metric instances, since deepeval keeps the score on the metric.
+        """
+
+        start_perf = time.perf_counter()
+        errors = []
+        metric_scores = {}
+        judge_usage = []
+        actual_output = collected.actual_output
+        infra_failure = False
+
+        try:
+            if collected.infra_error is not None:
+                raise InfraFailure(collected.infra_error)
+            if collected.error is not None:
+                raise RuntimeError(collected.error)
+
             # Create LLM test case
             llm_test_case = self.create_llm_test_case(
                 test_case,
@@ -505,7 +767,7 @@ class Evaluator:
             )
 
             # Get metrics for this category
-            metrics = self.get_metrics_for_category(test_case.category)
+            metrics = self.get_metrics_for_category(test_case.category, metric_set)
 
             # Evaluate each metric
             metric_results = []
@@ -514,7 +776,8 @@ class Evaluator:
                     # Get metric name safely
                     metric_name = getattr(metric, 'name', None) or getattr(metric, '__name__', type(metric).__name__)
                     
-                    metric.measure(llm_test_case)
+                    usage = measure_with_usage(metric, llm_test_case, metric_name)
+                    judge_usage.append(asdict(usage))
                     metric_scores[metric_name] = metric.score
                     
                     # Get metric's own threshold
@@ -525,21 +788,29 @@ class Evaluator:
                     # Get metric name safely for error logging
                     metric_name = getattr(metric, 'name', None) or getattr(metric, '__name__', type(metric).__name__)
                     errors.append(f"Metric {metric_name} error: {str(e)}")
+                    if getattr(e, "judge_usage", None):
+                        judge_usage.append(asdict(e.judge_usage))
                     metric_scores[metric_name] = 0.0
                     metric_results.append(False)
 
             # Determine if test passed (all metrics above their respective thresholds)
             passed = all(metric_results) if metric_results else False
 
+        except InfraFailure as e:
+            errors.append(f"Infra failure after {collected.transport_retries + 1} attempts: {str(e)}")
+            infra_failure = True
+            passed = False
         except Exception as e:
             errors.append(f"Evaluation error: {str(e)}")
             actual_output = f"Error: {str(e)}"
             passed = False
 
-        end_time = datetime.now()
-        duration_ms = (end_time - start_time).total_seconds() * 1000
+        # Time spent waiting between collect and judge (pipelined runs) is not counted
+        duration_ms = collected.collect_ms + (time.perf_counter() - start_perf) * 1000
+        metric_latency_ms = {u["metric"]: u["latency_ms"] for u in judge_usage}
+        judge_latency_ms = sum(metric_latency_ms.values())
 
-        result = EvaluationResult(
+        return EvaluationResult(
             test_case_id=test_case.id,
             category=test_case.category,
             subcategory=test_case.subcategory,
@@ -548,14 +819,31 @@ class Evaluator:
             expected_output=test_case.expected_output,
             metrics=metric_scores,
             passed=passed,
-            timestamp=start_time.isoformat(),
+            timestamp=collected.timestamp,
             duration_ms=duration_ms,
-            errors=errors
+            errors=errors,
+            judge_usage=judge_usage,
+            chatbot_latency_ms=collected.chatbot_latency_ms,
+            judge_latency_ms=judge_latency_ms,
+            metric_latency_ms=metric_latency_ms,
+            overhead_ms=max(duration_ms - collected.chatbot_latency_ms - judge_latency_ms, 0.0),
+            infra_failure=infra_failure,
+            transport_retries=collected.transport_retries
         )
 
+    async def evaluate_single_test_case(
+        self,
+        test_case: TestCase,
+        verbose: bool = False
+    ) -> EvaluationResult:
+        """Evaluate a single test case"""
+
+        collected = self.collect_response(test_case)
+        result = self.judge_response(test_case, collected)
+
         if verbose:
-            status = "" if passed else ""
-            print(f"  {status} {test_case.id}: {list(metric_scores.values())}")
+            status = "" if result.passed else ""
+            print(f"  {status} {test_case.id}: {list(result.metrics.values())}")
 
         return result
 
@@ -564,17 +852,38 @@ class Evaluator:
         test_cases: List[TestCase],
         categories: List[str] = None,
         max_cases: int = None,
-        verbose: bool = True
+        verbose: bool = True,
+        seed: int = None,
+        adaptive: bool = False,
+        target_ci_width: float = None,
+        baseline_pass_rates: Dict[str, float] = None,
+        pipeline: bool = False,
+        collect_workers: int = None,
+        judge_workers: int = None,
+        queue_size: int = None,
+        dedup: bool = False
     ) -> List[EvaluationResult]:
-        """Run evaluation on multiple test cases"""
+        """Run evaluation on multiple test cases.
+
+        With adaptive=True, cases are drawn per category in a random stratified
+        order and a category stops once its pass-rate interval is narrower than
+        target_ci_width, or once it is clearly below (or at/above) its rate in
+        baseline_pass_rates.
+
+        With pipeline=True, collecting and judging run as concurrent stages
+        (see pipeline.py); results keep the input order.
+
+        With dedup=True, only one case per equivalence class (see dedup.py) is
+        evaluated and its result is copied to the other members.
+        """
 
         # Filter by categories if specified
         if categories:
             test_cases = [tc for tc in test_cases if tc.category in categories]
 
-        # Limit number of cases if specified
+        # Limit number of cases if specified (stratified by category/subcategory)
         if max_cases:
-            test_cases = test_cases[:max_cases]
+            test_cases = stratified_sample(test_cases, max_cases, seed=seed)
 
         print(f"\n{'='*60}")
         print(f"112 CALL CENTER AGENT - DEEPEVAL EVALUATION")
@@ -584,74 +893,186 @@ class Evaluator:
         print(f"{'='*60}\n")
 
         self.results = []
+        self.adaptive_report = {}
+        self.pipeline_report = None
+        self.dedup_report = None
+
+        plan = None
+        if dedup:
+            plan = plan_dedup(test_cases)
+            self.dedup_report = plan.report()
+            test_cases = plan.representatives
+            print(f"[DEDUP] {self.dedup_report['cases']} cases -> {self.dedup_report['classes']} "
+                  f"equivalence classes ({self.dedup_report['ratio']:.2f}x, "
+                  f"{self.dedup_report['saved']} evaluations saved)\n")
+
+        if adaptive:
+            await self._run_adaptive(test_cases, verbose, seed, target_ci_width, baseline_pass_rates)
+        elif pipeline:
+            await self._run_pipelined(test_cases, verbose, collect_workers, judge_workers, queue_size)
+        else:
+            for i, test_case in enumerate(test_cases):
+                if verbose:
+                    print(f"[{i+1}/{len(test_cases)}] Evaluating {test_case.id}...")
+
+                result = await self.evaluate_single_test_case(test_case, verbose)
+                self.results.append(result)
+
+        if plan:
+            self.results = plan.fan_out(self.results)
+        return self.results
 
-        for i, test_case in enumerate(test_cases):
-            if verbose:
-                print(f"[{i+1}/{len(test_cases)}] Evaluating {test_case.id}...")
+    async def _run_pipelined(
+        self,
+        test_cases: List[TestCase],
+        verbose: bool,
+        collect_workers: int = None,
+        judge_workers: int = None,
+        queue_size: int = None
+    ) -> List[EvaluationResult]:
+        """generate -> collect -> judge -> aggregate, with bounded queues between stages"""
 
-            result = await self.evaluate_single_test_case(test_case, verbose)
-            self.results.append(result)
+        total = len(test_cases)
+        finished: List[tuple] = []
 
-        return self.results
+        def collect(item, _):
+            index, test_case = item
+            return index, test_case, self.collect_response(test_case)
 
-    def get_summary(self) -> Dict[str, Any]:
-        """Get evaluation summary statistics"""
+        def judge(item, metric_set):
+            index, test_case, collected = item
+            return index, self.judge_response(test_case, collected, metric_set)
 
-        if not self.results:
-            return {}
+        def aggregate(item, _):
+            finished.append(item)
+            if verbose:
+                result = item[1]
+                status = "" if result.passed else ""
+                print(f"[{len(finished)}/{total}] {status} {result.test_case_id}: "
+                      f"{list(result.metrics.values())}")
+
+        runner = Pipeline(
+            enumerate(test_cases),
+            [
+                Stage("collect", collect, collect_workers or PIPELINE_CONFIG["collect_workers"]),
+                Stage("judge", judge, judge_workers or PIPELINE_CONFIG["judge_workers"],
+                      setup=self.create_metric_set),
+                Stage("aggregate", aggregate, inline=True)
+            ],
+            queue_size=queue_size
+        )
+        self.pipeline_report = await runner.run()
+        if verbose:
+            print_pipeline_report(self.pipeline_report)
 
-        total = len(self.results)
-        passed = sum(1 for r in self.results if r.passed)
-        failed = total - passed
+        self.results = [result for _, result in sorted(finished, key=lambda item: item[0])]
+        return self.results
 
-        # Calculate average scores per metric
-        metric_scores = {}
-        for result in self.results:
-            for metric_name, score in result.metrics.items():
-                if metric_name not in metric_scores:
-                    metric_scores[metric_name] = []
-                metric_scores[metric_name].append(score)
-
-        avg_metrics = {
-            name: sum(scores) / len(scores)
-            for name, scores in metric_scores.items()
-        }
+    async def _run_adaptive(
+        self,
+        test_cases: List[TestCase],
+        verbose: bool,
+        seed: int = None,
+        target_ci_width: float = None,
+        baseline_pass_rates: Dict[str, float] = None
+    ) -> List[EvaluationResult]:
+        """Sequential sampling with per-category early stopping"""
+
+        cfg = ADAPTIVE_CONFIG
+        target_ci_width = target_ci_width or cfg["target_ci_width"]
+        baseline_pass_rates = baseline_pass_rates or {}
+        queues = stratified_order(test_cases, seed=seed)
+        stats = {category: {"passed": 0, "total": 0} for category in queues}
+        active = list(queues)
+
+        # Round-robin over categories so every category's interval tightens together
+        round_index = 0
+        while active:
+            for category in list(active):
+                queue = queues[category]
+                if round_index >= len(queue):
+                    self._record_adaptive_stop(category, "exhausted", stats, len(queue), baseline_pass_rates)
+                    active.remove(category)
+                    continue
+
+                test_case = queue[round_index]
+                if verbose:
+                    print(f"[{len(self.results) + 1}/{len(test_cases)}] Evaluating {test_case.id}...")
+                result = await self.evaluate_single_test_case(test_case, verbose)
+                self.results.append(result)
+                if result.infra_failure:
+                    # Says nothing about the chatbot; do not count towards the decision
+                    continue
+
+                stats[category]["total"] += 1
+                stats[category]["passed"] += 1 if result.passed else 0
+                reason, _ = sequential_decision(
+                    stats[category]["passed"],
+                    stats[category]["total"],
+                    target_width=target_ci_width,
+                    baseline_rate=baseline_pass_rates.get(category),
+                    min_cases=cfg["min_cases_per_category"],
+                    confidence=cfg["decision_confidence"]
+                )
+                if reason:
+                    self._record_adaptive_stop(category, reason, stats, len(queue), baseline_pass_rates)
+                    active.remove(category)
+                    if verbose:
+                        print(f"  [ADAPTIVE] {category} stopped ({reason}) after "
+                              f"{stats[category]['total']}/{len(queue)} cases")
+            round_index += 1
+
+        saved = len(test_cases) - len(self.results)
+        print(f"\n[ADAPTIVE] Evaluated {len(self.results)}/{len(test_cases)} cases "
+              f"({saved} skipped by early stopping)")
+        return self.results
 
-        # Calculate scores per category
-        category_scores = {}
-        for result in self.results:
-            if result.category not in category_scores:
-                category_scores[result.category] = {"passed": 0, "total": 0}
-            category_scores[result.category]["total"] += 1
-            if result.passed:
-                category_scores[result.category]["passed"] += 1
-
-        category_pass_rates = {
-            cat: data["passed"] / data["total"] * 100
-            for cat, data in category_scores.items()
+    def _record_adaptive_stop(
+        self,
+        category: str,
+        reason: str,
+        stats: Dict[str, Dict[str, int]],
+        available: int,
+        baseline_pass_rates: Dict[str, float]
+    ):
+        passed, total = stats[category]["passed"], stats[category]["total"]
+        _, (low, high) = sequential_decision(
+            passed, total, target_width=0, confidence=ADAPTIVE_CONFIG["decision_confidence"]
+        )
+        self.adaptive_report[category] = {
+            "stop_reason": reason,
+            "evaluated": total,
+            "available": available,
+            "pass_rate": passed / total * 100 if total else 0.0,
+            "decision_ci_low": low,
+            "decision_ci_high": high,
+            "baseline_pass_rate": baseline_pass_rates.get(category)
         }
 
-        return {
-            "total_test_cases": total,
-            "passed": passed,
-            "failed": failed,
-            "pass_rate": passed / total * 100,
-            "average_metrics": avg_metrics,
-            "category_pass_rates": category_pass_rates,
-            "evaluation_time": datetime.now().isoformat()
-        }
+    def get_summary(self) -> Dict[str, Any]:
+        """Get evaluation summary statistics"""
+        return summarize_results(
+            self.results,
+            self.adaptive_report,
+            self.client.breaker.stats(),
+            self.client.hedger.report() if self.client.hedger else None,
+            self.pipeline_report,
+            dict(self.client.seed_stats) if any(self.client.seed_stats.values()) else None,
+            self.dedup_report
+        )
 
-    def export_results(self, filename: str = "evaluation_results.json"):
-        """Export results to JSON file"""
+    def export_results(self, filename: str = "evaluation_results.json", extra_summary: Dict[str, Any] = None):
+        """Export results to a .json or (compressed) .jsonl file; extra_summary keys (e.g. shard) are added to the summary"""
 
         data = {
-            "summary": self.get_summary(),
+            "summary": {**self.get_summary(), **(extra_summary or {})},
             "results": [asdict(r) for r in self.results]
         }
 
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        write_results(filename, data["summary"], data["results"])
 
+        record_export("single_turn", filename, data["summary"], data["results"])
+        export_columnar("single_turn", filename, self.results)
         print(f"Results exported to {filename}")
 
 
@@ -694,6 +1115,17 @@ async def main():
         default="http://localhost:5000",
         help="Chatbot API URL"
     )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=42,
+        help="Seed for stratified sampling with --quick/--max-cases"
+    )
+    parser.add_argument(
+        "--dedup",
+        action="store_true",
+        help="Evaluate one case per equivalence class of normalised inputs and copy its result"
+    )
     parser.add_argument(
         "--verbose",
         action="store_true",
@@ -703,12 +1135,11 @@ async def main():
 
     args = parser.parse_args()
 
-    # Generate test cases
-    print("Generating test cases...")
-    test_cases = generate_all_test_cases()
+    # Generate test cases (only the requested category's generator runs)
+    categories = [args.category] if args.category else None
+    test_cases = generate_all_test_cases(categories=categories)
 
     # Configure evaluation
-    categories = [args.category] if args.category else None
     max_cases = args.max_cases or (10 if args.quick else None)
 
     # Initialize evaluator
@@ -719,7 +1150,9 @@ async def main():
         test_cases=test_cases,
         categories=categories,
         max_cases=max_cases,
-        verbose=args.verbose
+        verbose=args.verbose,
+        seed=args.seed,
+        dedup=args.dedup
     )
 
     # Print summary
@@ -728,14 +1161,26 @@ async def main():
     print("EVALUATION SUMMARY")
     print(f"{'='*60}")
     print(f"Total Test Cases: {summary['total_test_cases']}")
-    print(f"Passed: {summary['passed']} ({summary['pass_rate']:.1f}%)")
+    overall_ci = summary['pass_rate_ci']['overall']
+    print(f"Passed: {summary['passed']} ({summary['pass_rate']:.1f}%, "
+          f"{summary['pass_rate_ci']['confidence']:.0%} CI {overall_ci['ci_low']:.1f}-{overall_ci['ci_high']:.1f}%)")
     print(f"Failed: {summary['failed']}")
+    if summary['infra_failures']:
+        print(f"Infra Failures: {summary['infra_failures']} (chatbot unreachable, not judged)")
     print(f"\nAverage Metrics:")
     for metric, score in summary['average_metrics'].items():
         print(f"  - {metric}: {score:.3f}")
     print(f"\nCategory Pass Rates:")
     for category, rate in summary['category_pass_rates'].items():
-        print(f"  - {category}: {rate:.1f}%")
+        ci = summary['pass_rate_ci']['by_category'][category]
+        print(f"  - {category}: {rate:.1f}% (CI {ci['ci_low']:.1f}-{ci['ci_high']:.1f}%, n={ci['n']})")
+    chatbot_latency = summary['latency']['chatbot']['overall']
+    print(f"\nChatbot Latency: p50 {chatbot_latency['p50_ms']:.0f}ms, "
+          f"p90 {chatbot_latency['p90_ms']:.0f}ms, p99 {chatbot_latency['p99_ms']:.0f}ms")
+    usage_total = summary['judge_usage']['total']
+    print(f"\nJudge Usage: {usage_total['prompt_tokens']:,} prompt + "
+          f"{usage_total['completion_tokens']:,} completion tokens, "
+          f"${usage_total['cost_usd']:.4f}")
     print(f"{'='*60}\n")
 
     # Export results
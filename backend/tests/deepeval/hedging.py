@@ -0,0 +1,178 @@
+"""
+Hedged Requests and Per-Turn Timeout Budgets
+=============================================
+
+This module keeps one slow backend call from stalling a sequential run.
+
+Features:
+- Rolling latency window per key (e.g. turn number) with a global fallback
+- Per-request timeout budgets derived from the observed p99, capped by the
+  client's previous fixed timeout
+- Hedged single-turn requests: once a request has been outstanding longer than
+  the observed p95, a duplicate is sent on a new session and the first answer
+  wins. The loser keeps running in the background so the report can compare
+  the hedged tail against what it would have been without hedging; the report
+  waits only briefly for it and leaves out primaries that have not finished.
+"""
+
+import time
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import List, Dict, Any, Callable, Hashable, Optional, Tuple
+
+from config import HEDGING_CONFIG
+from latency_stats import percentile
+
+
+class LatencyTracker:
+    """Recent chatbot latencies, overall and per key"""
+
+    def __init__(self, window: int = None, min_samples: int = None):
+        self.window = window or HEDGING_CONFIG["window"]
+        self.min_samples = min_samples or HEDGING_CONFIG["min_samples"]
+        self._all = deque(maxlen=self.window)
+        self._by_key: Dict[Hashable, deque] = {}
+        self._lock = threading.Lock()
+
+    def add(self, latency_ms: float, key: Hashable = None):
+        with self._lock:
+            self._all.append(latency_ms)
+            if key is not None:
+                self._by_key.setdefault(key, deque(maxlen=self.window)).append(latency_ms)
+
+    def percentile(self, pct: float, key: Hashable = None) -> Optional[float]:
+        """Observed percentile, or None until min_samples latencies are known.
+
+        Uses the key's own samples once it has enough, else all samples.
+        """
+        with self._lock:
+            samples = self._by_key.get(key) if key is not None else None
+            if samples is None or len(samples) < self.min_samples:
+                samples = self._all
+            if len(samples) < self.min_samples:
+                return None
+            return percentile(sorted(samples), pct)
+
+    def timeout_budget(self, max_timeout_s: float, key: Hashable = None) -> float:
+        """Seconds to wait for one request: a multiple of the observed p99, within bounds"""
+        p99 = self.percentile(99, key)
+        if p99 is None:
+            return max_timeout_s
+        budget = p99 / 1000 * HEDGING_CONFIG["timeout_multiplier"]
+        return min(max(budget, HEDGING_CONFIG["min_timeout_s"]), max_timeout_s)
+
+
+class HedgedSender:
+    """Sends a request, hedging it on a fresh session if it runs past the p95.
+
+    send_fn(session_id) performs one request and returns (result, attempts);
+    it must be safe to call concurrently for different sessions.
+    """
+
+    def __init__(self, tracker: LatencyTracker, max_workers: int = 4):
+        self.tracker = tracker
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="hedge")
+        self.records: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    def _timed(self, send_fn: Callable, session_id: str) -> Tuple[Dict[str, Any], int, float]:
+        start = time.perf_counter()
+        result, attempts = send_fn(session_id)
+        return result, attempts, (time.perf_counter() - start) * 1000
+
+    def send(
+        self,
+        send_fn: Callable[[str], Tuple[Dict[str, Any], int]],
+        session_id: str,
+        new_session_id: Callable[[], str]
+    ) -> Tuple[Dict[str, Any], int, bool]:
+        """Returns (result, attempts, whether the request was hedged)"""
+        start = time.perf_counter()
+        primary = self.executor.submit(self._timed, send_fn, session_id)
+        delay_ms = self.tracker.percentile(HEDGING_CONFIG["percentile"])
+
+        if delay_ms is None or wait([primary], timeout=delay_ms / 1000)[0]:
+            result, attempts, latency_ms = primary.result()
+            self.tracker.add(latency_ms)
+            self._record({"hedged": False, "hedge_won": False,
+                          "observed_ms": latency_ms, "unhedged_ms": latency_ms})
+            return result, attempts, False
+
+        hedge = self.executor.submit(self._timed, send_fn, new_session_id())
+        done, _ = wait([primary, hedge], return_when=FIRST_COMPLETED)
+        winner = primary if primary in done else hedge
+        if winner is primary and not primary.result()[0].get("infra_error") and hedge.cancel():
+            # The hedge never started (all workers busy); the primary's answer stands
+            result, attempts, latency_ms = primary.result()
+            self.tracker.add(latency_ms)
+            self._record({"hedged": False, "hedge_won": False,
+                          "observed_ms": latency_ms, "unhedged_ms": latency_ms})
+            return result, attempts, False
+        if winner.result()[0].get("infra_error"):
+            # Prefer an answer over a transport failure if the other one gets one
+            wait([primary, hedge])
+            other = hedge if winner is primary else primary
+            if not other.result()[0].get("infra_error"):
+                winner = other
+
+        result, attempts, _ = winner.result()
+        # The primary's own latency is what the run would have seen without
+        # hedging; it also feeds the tracker, so hedging does not lower the p95
+        primary.add_done_callback(lambda future: self.tracker.add(future.result()[2]))
+        self._record({
+            "hedged": True,
+            "hedge_won": winner is hedge,
+            "observed_ms": (time.perf_counter() - start) * 1000,
+            "primary": primary
+        })
+        return result, attempts, True
+
+    def _record(self, record: Dict[str, Any]):
+        with self._lock:
+            self.records.append(record)
+
+    def drain(self, timeout: float = None):
+        """Wait up to timeout seconds for primaries of hedged requests that are still running"""
+        with self._lock:
+            pending = [r["primary"] for r in self.records if r["hedged"]]
+        wait(pending, timeout=HEDGING_CONFIG["drain_timeout_s"] if timeout is None else timeout)
+
+    def report(self) -> Dict[str, Any]:
+        """Hedge counts and chatbot latency percentiles with and without hedging.
+
+        Without hedging, a hedged request would have taken its primary's
+        latency; every other request is unchanged. Primaries still running
+        after drain_timeout_s are not waited for: their requests are left out
+        of both tails and counted as "pending_primaries".
+        """
+        self.drain()
+        with self._lock:
+            records = list(self.records)
+        finished = []
+        for record in records:
+            if record["hedged"]:
+                if not record["primary"].done():
+                    continue
+                record["unhedged_ms"] = record["primary"].result()[2]
+            finished.append(record)
+        hedged = [r for r in records if r["hedged"]]
+
+        def tail(key: str) -> Dict[str, float]:
+            values = sorted(r[key] for r in finished)
+            return {f"p{p}_ms": percentile(values, p) for p in (50, 95, 99)}
+
+        with_hedging = tail("observed_ms")
+        without_hedging = tail("unhedged_ms")
+        return {
+            "percentile": HEDGING_CONFIG["percentile"],
+            "requests": len(records),
+            "hedged": len(hedged),
+            "pending_primaries": len(records) - len(finished),
+            "hedge_rate": len(hedged) / len(records) * 100 if records else 0.0,
+            "hedge_wins": sum(1 for r in hedged if r["hedge_won"]),
+            "with_hedging": with_hedging,
+            "without_hedging": without_hedging,
+            "p95_improvement_ms": without_hedging["p95_ms"] - with_hedging["p95_ms"],
+            "p99_improvement_ms": without_hedging["p99_ms"] - with_hedging["p99_ms"]
+        }
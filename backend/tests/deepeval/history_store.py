@@ -0,0 +1,363 @@
+"""
+Historical Results Store
+========================
+
+This module keeps every exported run in one embedded SQLite file, so
+questions across runs ("how did Answer Relevancy for location_extraction
+trend over the last 20 runs", "which cases flip between pass and fail")
+are answered with indexed queries instead of loading every results JSON.
+
+Features:
+- Written by Evaluator.export_results, MultiTurnEvaluator.export_results and
+  combined runs (merge, queue, judge); existing result files can be imported
+- One row per run (suite, pass rate, corpus hash), per case result and per
+  metric score
+- Indexes on run, test case ID, category and metric
+- Corpus hash per run (test case IDs and inputs), so trends can be limited to
+  runs over the same corpus
+- Trend, flakiness, per-case history and run listing queries
+"""
+
+import json
+import time
+import sqlite3
+import hashlib
+from datetime import datetime
+from pathlib import Path
+from typing import List, Dict, Any, Optional
+
+from config import HISTORY_CONFIG
+from artifact_store import artifact_stem
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    suite TEXT NOT NULL,
+    recorded_at REAL NOT NULL,
+    evaluation_time TEXT,
+    source_file TEXT,
+    corpus_hash TEXT NOT NULL,
+    total INTEGER NOT NULL,
+    passed INTEGER NOT NULL,
+    infra_failures INTEGER NOT NULL,
+    pass_rate REAL NOT NULL,
+    summary TEXT
+);
+CREATE TABLE IF NOT EXISTS results (
+    run_id TEXT NOT NULL REFERENCES runs (run_id) ON DELETE CASCADE,
+    test_case_id TEXT NOT NULL,
+    category TEXT,
+    subcategory TEXT,
+    passed INTEGER NOT NULL,
+    infra_failure INTEGER NOT NULL,
+    duration_ms REAL,
+    chatbot_latency_ms REAL,
+    judge_latency_ms REAL,
+    changed INTEGER,  -- Pass/fail differs from the case's previous run (NULL: first run or infra)
+    PRIMARY KEY (run_id, test_case_id)
+);
+CREATE TABLE IF NOT EXISTS scores (
+    run_id TEXT NOT NULL REFERENCES runs (run_id) ON DELETE CASCADE,
+    test_case_id TEXT NOT NULL,
+    category TEXT,
+    metric TEXT NOT NULL,
+    score REAL,
+    PRIMARY KEY (run_id, test_case_id, metric)
+);
+-- Per-run aggregates, so trend queries never touch per-case rows
+CREATE TABLE IF NOT EXISTS category_stats (
+    run_id TEXT NOT NULL REFERENCES runs (run_id) ON DELETE CASCADE,
+    category TEXT NOT NULL,
+    metric TEXT NOT NULL,
+    cases INTEGER NOT NULL,
+    total REAL NOT NULL,
+    PRIMARY KEY (run_id, metric, category)
+);
+CREATE INDEX IF NOT EXISTS idx_runs_suite_time ON runs (suite, recorded_at);
+CREATE INDEX IF NOT EXISTS idx_runs_corpus ON runs (corpus_hash);
+CREATE INDEX IF NOT EXISTS idx_results_case ON results (test_case_id, run_id, infra_failure, passed);
+-- Flakiness queries start from the few results that flipped
+CREATE INDEX IF NOT EXISTS idx_results_changed ON results (run_id, test_case_id, category) WHERE changed = 1;
+CREATE INDEX IF NOT EXISTS idx_results_category ON results (category, run_id);
+CREATE INDEX IF NOT EXISTS idx_scores_metric ON scores (metric, category, run_id);
+"""
+
+
+def history_path(output_dir: str) -> Path:
+    """The history database that runs exported to output_dir are recorded in"""
+    return Path(output_dir) / HISTORY_CONFIG["filename"]
+
+
+def corpus_hash(suite: str, results: List[Dict[str, Any]]) -> str:
+    """Hash of the test case IDs and inputs a run covered, independent of order"""
+    if suite == "multi_turn":
+        keys = [f"{r['test_case_id']}\x1f{r.get('name', '')}\x1f{r.get('total_turns', '')}" for r in results]
+    else:
+        keys = [f"{r['test_case_id']}\x1f{r.get('input_message', '')}\x1f{r.get('expected_output', '')}"
+                for r in results]
+    digest = hashlib.sha256()
+    for key in sorted(keys):
+        digest.update(key.encode("utf-8"))
+        digest.update(b"\n")
+    return digest.hexdigest()[:16]
+
+
+# category_stats.metric for the pass count (total) of judged cases
+PASSED = "__passed__"
+
+
+class HistoryStore:
+    """SQLite store of every recorded run"""
+
+    def __init__(self, path: str, busy_timeout_s: float = 30.0):
+        self.path = str(path)
+        self.conn = sqlite3.connect(self.path, timeout=busy_timeout_s)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self) -> "HistoryStore":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # -------------------------------------------------------------------------
+    # Writing
+    # -------------------------------------------------------------------------
+
+    def record_run(
+        self,
+        run_id: str,
+        suite: str,
+        summary: Dict[str, Any],
+        results: List[Dict[str, Any]],
+        source_file: str = None
+    ) -> str:
+        """Store a run from its exported form; re-recording a run_id replaces it.
+
+        Runs are ordered by their evaluation time, so imported older files
+        fall into place.
+        """
+        multi_turn = suite == "multi_turn"
+        try:
+            recorded_at = datetime.fromisoformat(summary["evaluation_time"]).timestamp()
+        except (KeyError, TypeError, ValueError):
+            recorded_at = time.time()
+        total = len(results)
+        infra = sum(1 for r in results if r.get("infra_failure"))
+        passed = sum(1 for r in results
+                     if not r.get("infra_failure") and r.get("overall_passed" if multi_turn else "passed"))
+        judged = total - infra
+
+        result_rows = []
+        score_rows = []
+        stats: Dict[tuple, List[float]] = {}
+        for r in results:
+            result_rows.append((
+                run_id,
+                r["test_case_id"],
+                r.get("category"),
+                r.get("subcategory"),
+                int(bool(r.get("overall_passed" if multi_turn else "passed"))),
+                int(bool(r.get("infra_failure"))),
+                r.get("total_duration_ms" if multi_turn else "duration_ms"),
+                r.get("chatbot_latency_ms"),
+                r.get("judge_latency_ms"),
+                None
+            ))
+            if r.get("infra_failure"):
+                continue
+            category = r.get("category") or ""
+            stat = stats.setdefault((PASSED, category), [0, 0.0])
+            stat[0] += 1
+            stat[1] += bool(r.get("overall_passed" if multi_turn else "passed"))
+            for metric, score in (r.get("metrics") or {}).items():
+                score_rows.append((run_id, r["test_case_id"], r.get("category"), metric, score))
+                if score is not None:
+                    stat = stats.setdefault((metric, category), [0, 0.0])
+                    stat[0] += 1
+                    stat[1] += score
+
+        with self.conn:
+            self.conn.execute("DELETE FROM runs WHERE run_id = ?", (run_id,))
+            self.conn.execute(
+                "INSERT INTO runs (run_id, suite, recorded_at, evaluation_time, source_file, corpus_hash, "
+                "total, passed, infra_failures, pass_rate, summary) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    run_id, suite, recorded_at, summary.get("evaluation_time"), source_file,
+                    corpus_hash(suite, results), total, passed, infra,
+                    passed / judged * 100 if judged else 0.0,
+                    json.dumps(summary, ensure_ascii=False, default=str)
+                )
+            )
+            self.conn.executemany("INSERT INTO results VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", result_rows)
+            self.conn.executemany("INSERT INTO scores VALUES (?, ?, ?, ?, ?)", score_rows)
+            self.conn.executemany(
+                "INSERT INTO category_stats VALUES (?, ?, ?, ?, ?)",
+                [(run_id, category, metric, cases, total) for (metric, category), (cases, total) in stats.items()]
+            )
+            self._mark_changes(run_id, suite, recorded_at)
+            # A run recorded out of order (e.g. an imported older file) is the
+            # new predecessor of the run after it
+            following = self.conn.execute(
+                "SELECT run_id, recorded_at FROM runs WHERE suite = ? AND recorded_at > ? "
+                "ORDER BY recorded_at LIMIT 1",
+                (suite, recorded_at)
+            ).fetchone()
+            if following:
+                self._mark_changes(following["run_id"], suite, following["recorded_at"])
+        return run_id
+
+    def _mark_changes(self, run_id: str, suite: str, recorded_at: float):
+        """Flag the run's results whose pass/fail differs from the case's previous judged run"""
+        self.conn.execute(
+            "UPDATE results SET changed = ("
+            "  SELECT previous.passed != results.passed FROM results AS previous "
+            "  JOIN runs ON runs.run_id = previous.run_id "
+            "  WHERE previous.test_case_id = results.test_case_id AND previous.infra_failure = 0 "
+            "    AND runs.suite = :suite AND runs.recorded_at < :recorded_at "
+            "  ORDER BY runs.recorded_at DESC LIMIT 1"
+            ") WHERE run_id = :run_id AND infra_failure = 0",
+            {"run_id": run_id, "suite": suite, "recorded_at": recorded_at}
+        )
+
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
+
+    def _recent_runs(self, corpus: Optional[str]) -> str:
+        """Subquery selecting the :last most recent runs of :suite (optionally one :corpus)"""
+        corpus_filter = "AND corpus_hash = :corpus" if corpus else ""
+        return (f"SELECT run_id FROM runs WHERE suite = :suite {corpus_filter} "
+                f"ORDER BY recorded_at DESC LIMIT :last")
+
+    def runs(self, suite: str = None, last: int = 20) -> List[Dict[str, Any]]:
+        """Most recent runs, newest first"""
+        rows = self.conn.execute(
+            "SELECT run_id, suite, recorded_at, evaluation_time, corpus_hash, total, passed, "
+            "infra_failures, pass_rate, source_file FROM runs "
+            "WHERE (:suite IS NULL OR suite = :suite) ORDER BY recorded_at DESC LIMIT :last",
+            {"suite": suite, "last": last}
+        )
+        return [dict(row) for row in rows]
+
+    def metrics(self, suite: str = "single_turn") -> List[str]:
+        """Metric names recorded for a suite"""
+        rows = self.conn.execute(
+            "SELECT DISTINCT metric FROM scores JOIN runs USING (run_id) WHERE suite = ? ORDER BY metric",
+            (suite,)
+        )
+        return [row[0] for row in rows]
+
+    def trend(
+        self,
+        suite: str = "single_turn",
+        metric: str = None,
+        category: str = None,
+        last: int = 20,
+        corpus: str = None
+    ) -> List[Dict[str, Any]]:
+        """Per-run mean score of a metric (or pass rate without one), oldest first"""
+        params = {"suite": suite, "metric": metric or PASSED, "category": category,
+                  "last": last, "corpus": corpus, "scale": 1.0 if metric else 100.0}
+        sql = (
+            "SELECT runs.run_id, runs.recorded_at, runs.corpus_hash, "
+            "SUM(stats.total) / SUM(stats.cases) * :scale AS value, SUM(stats.cases) AS cases "
+            "FROM category_stats AS stats JOIN runs ON runs.run_id = stats.run_id "
+            f"WHERE stats.run_id IN ({self._recent_runs(corpus)}) AND stats.metric = :metric "
+            "AND (:category IS NULL OR stats.category = :category) "
+            "GROUP BY runs.run_id ORDER BY runs.recorded_at"
+        )
+        return [dict(row) for row in self.conn.execute(sql, params)]
+
+    def flaky(
+        self,
+        suite: str = "single_turn",
+        category: str = None,
+        last: int = 20,
+        min_runs: int = 3,
+        corpus: str = None,
+        limit: int = 20
+    ) -> List[Dict[str, Any]]:
+        """Cases that both passed and failed over the last runs, most pass/fail flips first.
+
+        Infra failures are not counted as runs of a case.
+        """
+        params = {"suite": suite, "category": category, "last": last, "min_runs": min_runs,
+                  "corpus": corpus, "limit": limit}
+        recent = self._recent_runs(corpus)
+        sql = (
+            # Only cases that flipped somewhere in the window can be flaky
+            "WITH mixed AS ("
+            "  SELECT test_case_id, MAX(category) AS category FROM results "
+            f"  WHERE run_id IN ({recent}) AND changed = 1 "
+            "    AND (:category IS NULL OR category = :category) "
+            "  GROUP BY test_case_id"
+            "), history AS ("
+            "  SELECT mixed.test_case_id, mixed.category, results.passed, "
+            "         LAG(results.passed) OVER ("
+            "           PARTITION BY results.test_case_id ORDER BY runs.recorded_at) AS previous "
+            # CROSS JOIN keeps this join order: candidates first, then their rows by index
+            "  FROM mixed CROSS JOIN results ON results.test_case_id = mixed.test_case_id "
+            "  JOIN runs ON runs.run_id = results.run_id "
+            f"  WHERE results.run_id IN ({recent}) AND results.infra_failure = 0"
+            ") "
+            "SELECT test_case_id, category, COUNT(*) AS runs, SUM(passed) AS passes, "
+            "       SUM(previous IS NOT NULL AND previous != passed) AS flips "
+            "FROM history GROUP BY test_case_id "
+            "HAVING runs >= :min_runs AND flips > 0 "
+            "ORDER BY flips DESC, ABS(passes * 2 - runs), test_case_id LIMIT :limit"
+        )
+        return [
+            {**dict(row), "pass_rate": row["passes"] / row["runs"] * 100}
+            for row in self.conn.execute(sql, params)
+        ]
+
+    def case_history(self, test_case_id: str, last: int = 20) -> List[Dict[str, Any]]:
+        """One case's result and metric scores in each recent run, oldest first"""
+        rows = self.conn.execute(
+            "SELECT runs.run_id, runs.recorded_at, results.passed, results.infra_failure, "
+            "results.duration_ms FROM results JOIN runs ON runs.run_id = results.run_id "
+            "WHERE results.test_case_id = ? ORDER BY runs.recorded_at DESC LIMIT ?",
+            (test_case_id, last)
+        ).fetchall()
+        scores: Dict[str, Dict[str, float]] = {}
+        if rows:
+            placeholders = ",".join("?" * len(rows))
+            for row in self.conn.execute(
+                f"SELECT run_id, metric, score FROM scores WHERE test_case_id = ? AND run_id IN ({placeholders})",
+                (test_case_id, *[r["run_id"] for r in rows])
+            ):
+                scores.setdefault(row["run_id"], {})[row["metric"]] = row["score"]
+        return [{**dict(row), "metrics": scores.get(row["run_id"], {})} for row in reversed(rows)]
+
+
+def record_export(
+    suite: str,
+    filename: str,
+    summary: Dict[str, Any],
+    results: List[Dict[str, Any]],
+    db_path: str = None
+):
+    """Record an exported results file in the history next to it.
+
+    Called from the export paths; a history failure is reported but never
+    fails the export itself.
+    """
+    if not HISTORY_CONFIG["enabled"]:
+        return
+    path = db_path or history_path(Path(filename).parent)
+    try:
+        with HistoryStore(path) as store:
+            store.record_run(artifact_stem(filename), suite, summary, results, str(filename))
+    except sqlite3.Error as e:
+        print(f"  Warning: could not record run in {path}: {e}")
+
+
+def format_time(recorded_at: float) -> str:
+    return datetime.fromtimestamp(recorded_at).strftime("%Y-%m-%d %H:%M")
@@ -0,0 +1,235 @@
+"""
+Judge Usage Accounting for 112 Call Center Agent Evaluation
+=============================================================
+
+This module records token usage, latency and estimated cost for every
+judge (metric) invocation, so spend can be attributed per metric and category.
+
+Features:
+- GPTModel subclass that captures real prompt/completion tokens per API call
+- Context-scoped tracking that stays correct when metrics run concurrently
+- Cost estimation from JUDGE_MODEL_PRICING
+- Aggregation by metric and by category for summaries and reports
+- Local mock judge backend selected by a "mock" model name
+"""
+
+import time
+import contextvars
+from contextlib import contextmanager
+from dataclasses import dataclass, asdict
+from typing import List, Dict, Any, Iterable
+
+import pandas as pd
+from deepeval.models import GPTModel
+
+from config import JUDGE_MODEL_PRICING, MOCK_JUDGE_CONFIG
+
+
+# Calls recorded by the judge model while a metric is being measured
+_active_calls: contextvars.ContextVar = contextvars.ContextVar("judge_calls", default=None)
+
+
+@dataclass
+class JudgeUsage:
+    """Usage of a single metric invocation"""
+    metric: str
+    model: str
+    calls: int
+    prompt_tokens: int
+    completion_tokens: int
+    latency_ms: float
+    cost_usd: float
+
+
+def estimate_cost(model: str, prompt_tokens: int, completion_tokens: int) -> float:
+    """Estimate USD cost of a judge call from JUDGE_MODEL_PRICING (per 1M tokens)"""
+    pricing = JUDGE_MODEL_PRICING.get(model)
+    if not pricing:
+        return 0.0
+    input_price, output_price = pricing
+    return (prompt_tokens * input_price + completion_tokens * output_price) / 1_000_000
+
+
+class UsageTrackingGPTModel(GPTModel):
+    """GPTModel that reports token usage of each call to the active tracker.
+
+    A mock judge (is_mock=True) records tokens but costs nothing.
+    """
+
+    def __init__(self, *args, is_mock: bool = False, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.is_mock = is_mock
+        # Calls made outside any tracked context (e.g. deepeval worker threads)
+        self.unscoped_calls: List[tuple] = []
+
+    def calculate_cost(self, input_tokens: int, output_tokens: int):
+        calls = _active_calls.get()
+        if calls is None:
+            calls = self.unscoped_calls
+        calls.append((input_tokens or 0, output_tokens or 0))
+        if self.is_mock:
+            return 0.0
+        try:
+            return super().calculate_cost(input_tokens, output_tokens)
+        except Exception:
+            # Unknown model pricing in deepeval - fall back to our own table
+            return estimate_cost(get_model_name(self), input_tokens or 0, output_tokens or 0)
+
+
+def get_model_name(model: Any) -> str:
+    """Get a display name for a judge model (string or DeepEvalBaseLLM)"""
+    if isinstance(model, str):
+        return model
+    for attr in ("name", "model_name"):
+        value = getattr(model, attr, None)
+        if isinstance(value, str) and value:
+            return value
+    try:
+        return model.get_model_name()
+    except Exception:
+        return type(model).__name__
+
+
+def is_mock_judge(model: Any) -> bool:
+    """Whether a model name selects the local mock judge (e.g. "mock", "mock-fast")"""
+    return isinstance(model, str) and model.startswith(MOCK_JUDGE_CONFIG["model_prefix"])
+
+
+def create_judge_model(model: str) -> GPTModel:
+    """Create a usage-tracking judge model for the given model name"""
+    if not is_mock_judge(model):
+        return UsageTrackingGPTModel(model=model)
+
+    # Imported lazily so real runs do not need the mock server's dependencies
+    from mock_judge_server import ensure_mock_judge_server
+    base_url = ensure_mock_judge_server(model)
+
+    # Construct with a known OpenAI model so deepeval enables structured outputs,
+    # then report (and send) the mock name; is_mock keeps gpt-4o pricing out of the costs
+    judge = UsageTrackingGPTModel(model="gpt-4o", _openai_api_key="mock", base_url=base_url, is_mock=True)
+    for attr in ("name", "model_name"):
+        if hasattr(judge, attr):
+            setattr(judge, attr, model)
+    return judge
+
+
+@contextmanager
+def track_judge_calls():
+    """Collect (prompt_tokens, completion_tokens) of judge calls in this context"""
+    calls: List[tuple] = []
+    token = _active_calls.set(calls)
+    try:
+        yield calls
+    finally:
+        _active_calls.reset(token)
+
+
+def measure_with_usage(metric: Any, test_case: Any, metric_name: str) -> JudgeUsage:
+    """Run metric.measure() and return the judge usage it incurred.
+
+    Exceptions from measure() propagate; usage is attached to the exception
+    as `judge_usage` so failed calls are still accounted for.
+    """
+    model = getattr(metric, "model", None)
+    model_name = get_model_name(model or "unknown")
+    unscoped = getattr(model, "unscoped_calls", None)
+    unscoped_start = len(unscoped) if unscoped is not None else 0
+    start_time = time.perf_counter()
+
+    with track_judge_calls() as calls:
+        try:
+            metric.measure(test_case)
+        except Exception as e:
+            calls = calls or _unscoped_since(unscoped, unscoped_start)
+            e.judge_usage = _build_usage(metric_name, model_name, calls, start_time, metric, model)
+            raise
+
+    # If deepeval ran the judge on another thread the context was not
+    # propagated; fall back to the calls the model recorded meanwhile.
+    calls = calls or _unscoped_since(unscoped, unscoped_start)
+    return _build_usage(metric_name, model_name, calls, start_time, metric, model)
+
+
+def _unscoped_since(unscoped: List[tuple], start: int) -> List[tuple]:
+    return list(unscoped[start:]) if unscoped is not None else []
+
+
+def _build_usage(
+    metric_name: str,
+    model_name: str,
+    calls: List[tuple],
+    start_time: float,
+    metric: Any,
+    model: Any = None
+) -> JudgeUsage:
+    prompt_tokens = sum(c[0] for c in calls)
+    completion_tokens = sum(c[1] for c in calls)
+    mock = getattr(model, "is_mock", False) or is_mock_judge(model_name)
+    cost = 0.0 if mock else estimate_cost(model_name, prompt_tokens, completion_tokens)
+    if not cost and not mock:
+        # Fall back to the cost deepeval tracked on the metric, if any
+        cost = float(getattr(metric, "evaluation_cost", None) or 0.0)
+
+    return JudgeUsage(
+        metric=metric_name,
+        model=model_name,
+        calls=len(calls),
+        prompt_tokens=prompt_tokens,
+        completion_tokens=completion_tokens,
+        latency_ms=(time.perf_counter() - start_time) * 1000,
+        cost_usd=cost
+    )
+
+
+# =============================================================================
+# AGGREGATION
+# =============================================================================
+
+# Usage fields summed per group, with their dtype
+USAGE_FIELDS = {
+    "calls": "int64",
+    "prompt_tokens": "int64",
+    "completion_tokens": "int64",
+    "latency_ms": "float64",
+    "cost_usd": "float64",
+}
+
+
+def _group_totals(usage: pd.DataFrame, key: str = None) -> Dict[str, Dict[str, float]]:
+    """Summed usage, invocation count and averages; per value of key, or overall"""
+    if key is None:
+        sums = usage[list(USAGE_FIELDS)].sum().to_frame().T
+        sums.index = ["total"]
+        sums.insert(0, "invocations", len(usage))
+    else:
+        grouped = usage.groupby(key, sort=False)
+        sums = grouped[list(USAGE_FIELDS)].sum()
+        sums.insert(0, "invocations", grouped.size())
+
+    invocations = sums["invocations"].where(sums["invocations"] > 0, 1)
+    sums["avg_latency_ms"] = sums["latency_ms"] / invocations
+    sums["avg_cost_usd"] = sums["cost_usd"] / invocations
+    return sums.astype({"invocations": "int64", **USAGE_FIELDS}).to_dict(orient="index")
+
+
+def summarize_judge_usage(results: Iterable[Any]) -> Dict[str, Any]:
+    """Aggregate judge usage of evaluation results by metric and by category"""
+    categories: List[str] = []
+    usages: List[Dict[str, Any]] = []
+    for result in results:
+        entries = getattr(result, "judge_usage", None) or []
+        categories.extend([getattr(result, "category", "unknown")] * len(entries))
+        usages.extend(entry if isinstance(entry, dict) else asdict(entry) for entry in entries)
+
+    usage = pd.DataFrame({
+        "category": categories,
+        "metric": [entry.get("metric", "unknown") for entry in usages],
+        "model": [entry.get("model", "unknown") for entry in usages],
+        **{name: [entry.get(name) or 0 for entry in usages] for name in USAGE_FIELDS}
+    }).astype(USAGE_FIELDS)
+    return {
+        "models": sorted(usage["model"].unique().tolist()),
+        "total": _group_totals(usage)["total"],
+        "by_metric": _group_totals(usage, "metric"),
+        "by_category": _group_totals(usage, "category")
+    }
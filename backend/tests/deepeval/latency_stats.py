@@ -0,0 +1,107 @@
+"""
+Latency Statistics for 112 Call Center Agent Evaluation
+=========================================================
+
+This module summarizes the split latency fields recorded on evaluation results
+(chatbot round trip, judge time, harness overhead) into percentiles and
+histograms, overall and per category.
+"""
+
+import math
+from typing import List, Dict, Any, Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+from config import LATENCY_HISTOGRAM_BUCKETS_MS
+
+
+# Latency components and the result field each one is read from
+LATENCY_COMPONENTS = {
+    "chatbot": "chatbot_latency_ms",
+    "judge": "judge_latency_ms",
+    "overhead": "overhead_ms",
+}
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Percentile with linear interpolation over pre-sorted values"""
+    if not sorted_values:
+        return 0.0
+    if len(sorted_values) == 1:
+        return float(sorted_values[0])
+
+    rank = (len(sorted_values) - 1) * pct / 100
+    lower = math.floor(rank)
+    upper = math.ceil(rank)
+    if lower == upper:
+        return float(sorted_values[int(rank)])
+    weight = rank - lower
+    return sorted_values[lower] * (1 - weight) + sorted_values[upper] * weight
+
+
+def latency_histogram(
+    values: Iterable[float],
+    buckets: Optional[List[float]] = None
+) -> List[Dict[str, Any]]:
+    """Count values into upper-bound buckets; the last bucket is open-ended"""
+    buckets = buckets or LATENCY_HISTOGRAM_BUCKETS_MS
+    values = np.asarray(values if isinstance(values, np.ndarray) else list(values), dtype=float)
+    # Index of the first bound above each value; len(buckets) for the open bucket
+    counts = np.bincount(np.searchsorted(buckets, values, side="right"), minlength=len(buckets) + 1)
+
+    histogram = []
+    lower = 0
+    for i, count in enumerate(counts.tolist()):
+        upper = buckets[i] if i < len(buckets) else None
+        histogram.append({"from_ms": lower, "to_ms": upper, "count": count})
+        lower = upper
+    return histogram
+
+
+def describe_latencies(values: Iterable[float]) -> Dict[str, Any]:
+    """Count, mean, p50/p90/p99, max and histogram for a list of latencies"""
+    values = pd.Series(values if isinstance(values, (np.ndarray, pd.Series)) else list(values), dtype=float)
+    values = values.dropna().to_numpy()
+    count = len(values)
+    if not count:
+        p50 = p90 = p99 = 0.0
+    else:
+        # Linear interpolation, same as percentile()
+        p50, p90, p99 = np.percentile(values, [50, 90, 99]).tolist()
+
+    return {
+        "count": count,
+        "mean_ms": float(values.mean()) if count else 0.0,
+        "p50_ms": p50,
+        "p90_ms": p90,
+        "p99_ms": p99,
+        "max_ms": float(values.max()) if count else 0.0,
+        "histogram": latency_histogram(values)
+    }
+
+
+def summarize_latency(results: Iterable[Any]) -> Dict[str, Any]:
+    """Summarize each latency component overall and per category"""
+    results = list(results)
+    frame = pd.DataFrame({
+        "category": [result.category for result in results],
+        **{
+            field_name: [getattr(result, field_name, None) for result in results]
+            for field_name in LATENCY_COMPONENTS.values()
+        }
+    }).astype({field_name: float for field_name in LATENCY_COMPONENTS.values()})
+    by_category = frame.groupby("category", sort=False)
+
+    summary = {}
+    for component, field_name in LATENCY_COMPONENTS.items():
+        summary[component] = {
+            "overall": describe_latencies(frame[field_name]),
+            "by_category": {
+                category: describe_latencies(values)
+                for category, values in by_category[field_name]
+                if values.notna().any()
+            }
+        }
+
+    return summary
@@ -0,0 +1,421 @@
+"""
+Open-Loop Load Testing for 112 Call Center Agent
+==================================================
+
+This module replays the generated test corpora against /api/chat/message at a
+target arrival rate, independent of how fast the backend answers (open loop),
+to show how the LangGraph backend behaves under call-centre peak load.
+
+Features:
+- Poisson or stepped-ramp session arrivals
+- Single-turn cases (one request) and multi-turn cases (turns sent in sequence)
+- Lazily indexed corpora (synthetic_corpus.py) replayed without materialising
+  them
+- No judging - only throughput, error rate and latency are recorded
+- Per-second and per-step statistics with saturation knee detection
+"""
+
+import json
+import time
+import random
+import asyncio
+from datetime import datetime
+from dataclasses import dataclass, field, asdict
+from collections.abc import Sequence
+from typing import List, Dict, Any, Optional, Union
+
+import aiohttp
+
+from config import LOAD_TEST_CONFIG
+from latency_stats import percentile
+
+
+@dataclass
+class LoadTestSettings:
+    """Settings for a single load test run"""
+    arrival: str = "poisson"  # "poisson" or "ramp"
+    rate: float = 5.0  # Sessions per second (poisson)
+    duration_s: float = 60.0
+    ramp_start: float = 1.0  # Sessions per second at the first ramp step
+    ramp_end: float = 20.0  # Sessions per second at the last ramp step
+    ramp_steps: int = 5
+    max_concurrency: int = 200  # In-flight sessions; arrivals beyond this are dropped
+    timeout_s: float = 60.0
+    seed: int = 42
+
+
+@dataclass
+class LoadSession:
+    """One unit of offered load: a session and the messages it sends"""
+    case_id: str
+    kind: str  # "single_turn" or "multi_turn"
+    messages: List[str]
+    context: List[Dict[str, str]] = field(default_factory=list)
+    is_authenticated: bool = False
+
+
+@dataclass
+class RequestRecord:
+    """Outcome of a single /api/chat/message request"""
+    case_id: str
+    session_id: str
+    turn: int
+    start_s: float  # Seconds since test start
+    end_s: float
+    latency_ms: float
+    ok: bool
+    status: Optional[int]
+    error: Optional[str]
+
+
+# =============================================================================
+# CORPUS
+# =============================================================================
+
+def build_load_sessions(single_turn_cases: List[Any], multi_turn_cases: List[Any]) -> List[LoadSession]:
+    """Convert generated test cases into replayable load sessions"""
+    sessions = []
+    for tc in single_turn_cases:
+        sessions.append(LoadSession(
+            case_id=tc.id,
+            kind="single_turn",
+            messages=[tc.input_message],
+            context=tc.context,
+            is_authenticated=bool(tc.metadata.get("isAuthenticated"))
+        ))
+    for tc in multi_turn_cases:
+        sessions.append(LoadSession(
+            case_id=tc.id,
+            kind="multi_turn",
+            messages=[turn.user_message for turn in tc.turns],
+            is_authenticated=tc.is_authenticated
+        ))
+    return sessions
+
+
+class LazyLoadSessions(Sequence):
+    """Single-turn load sessions built on demand from an indexable case corpus.
+
+    For corpora too large to convert up front (SyntheticCorpus); a session is
+    only built when an arrival picks its case.
+    """
+
+    def __init__(self, cases: Sequence):
+        self.cases = cases
+
+    def __len__(self) -> int:
+        return len(self.cases)
+
+    def __getitem__(self, index: int) -> LoadSession:
+        tc = self.cases[index]
+        return LoadSession(case_id=tc.id, kind="single_turn", messages=[tc.input_message], context=tc.context)
+
+
+def build_arrival_schedule(settings: LoadTestSettings) -> List[Dict[str, float]]:
+    """Arrival offsets (seconds) with the step each arrival belongs to.
+
+    Poisson arrivals use exponential inter-arrival times at `rate`; the ramp
+    splits the duration into equal steps with evenly spaced arrivals at a
+    rate stepping linearly from `ramp_start` to `ramp_end`.
+    """
+    rng = random.Random(settings.seed)
+    schedule = []
+
+    if settings.arrival == "ramp":
+        steps = max(settings.ramp_steps, 1)
+        step_duration = settings.duration_s / steps
+        for step in range(steps):
+            if steps == 1:
+                rate = settings.ramp_start
+            else:
+                rate = settings.ramp_start + (settings.ramp_end - settings.ramp_start) * step / (steps - 1)
+            if rate <= 0:
+                continue
+            step_start = step * step_duration
+            t = step_start
+            while t < step_start + step_duration:
+                schedule.append({"at": t, "step": step, "rate": rate})
+                t += 1.0 / rate
+    else:
+        if settings.rate <= 0:
+            return schedule
+        t = rng.expovariate(settings.rate)
+        while t < settings.duration_s:
+            schedule.append({"at": t, "step": 0, "rate": settings.rate})
+            t += rng.expovariate(settings.rate)
+
+    return schedule
+
+
+# =============================================================================
+# LOAD RUNNER
+# =============================================================================
+
+class LoadTester:
+    """Open-loop load generator for the chatbot API"""
+
+    def __init__(self, chatbot_url: str = "http://localhost:5000", settings: LoadTestSettings = None):
+        self.chatbot_url = chatbot_url
+        self.settings = settings or LoadTestSettings()
+        self.records: List[RequestRecord] = []
+        self.dropped: List[Dict[str, float]] = []
+        self.arrivals: List[Dict[str, float]] = []
+        self.session_counter = 0
+        self._in_flight = 0
+        self._t0 = 0.0
+
+    def generate_session_id(self) -> str:
+        """Generate unique session ID"""
+        self.session_counter += 1
+        return f"load_session_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{self.session_counter}"
+
+    def _now(self) -> float:
+        return time.perf_counter() - self._t0
+
+    async def _send(
+        self,
+        http: aiohttp.ClientSession,
+        session: LoadSession,
+        session_id: str,
+        turn: int,
+        message: str
+    ) -> bool:
+        payload = {
+            "message": message,
+            "sessionId": session_id,
+            "context": session.context if turn == 1 else []
+        }
+        headers = {"Content-Type": "application/json"}
+        if session.is_authenticated:
+            headers["Authorization"] = "Bearer test_user"
+
+        start = self._now()
+        status = None
+        error = None
+        ok = False
+        try:
+            async with http.post(f"{self.chatbot_url}/api/chat/message", json=payload, headers=headers) as response:
+                status = response.status
+                body = await response.json(content_type=None)
+                ok = response.status == 200 and bool(body.get("success", False))
+                if not ok:
+                    error = body.get("message") or f"HTTP {response.status}"
+        except asyncio.TimeoutError:
+            error = "timeout"
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+        end = self._now()
+
+        self.records.append(RequestRecord(
+            case_id=session.case_id,
+            session_id=session_id,
+            turn=turn,
+            start_s=start,
+            end_s=end,
+            latency_ms=(end - start) * 1000,
+            ok=ok,
+            status=status,
+            error=error
+        ))
+        return ok
+
+    async def _run_session(self, http: aiohttp.ClientSession, session: LoadSession):
+        session_id = self.generate_session_id()
+        self._in_flight += 1
+        try:
+            for turn, message in enumerate(session.messages, 1):
+                if not await self._send(http, session, session_id, turn, message):
+                    break  # Later turns are meaningless once the session broke
+            try:
+                async with http.delete(f"{self.chatbot_url}/api/chat/session/{session_id}"):
+                    pass
+            except Exception:
+                pass
+        finally:
+            self._in_flight -= 1
+
+    async def run(self, sessions: Union[List[LoadSession], LazyLoadSessions], verbose: bool = True) -> Dict[str, Any]:
+        """Offer load according to the arrival schedule and collect statistics"""
+        if not sessions:
+            return {}
+
+        settings = self.settings
+        schedule = build_arrival_schedule(settings)
+        if isinstance(sessions, LazyLoadSessions):
+            corpus = sessions  # Already in seeded pseudo-random order; copying would materialise it
+        else:
+            corpus = list(sessions)
+            random.Random(settings.seed).shuffle(corpus)
+
+        if verbose:
+            print(f"  Arrival: {settings.arrival}, {len(schedule)} sessions over {settings.duration_s:.0f}s")
+            print(f"  Corpus: {len(corpus)} sessions, max concurrency {settings.max_concurrency}")
+
+        self.records = []
+        self.dropped = []
+        self.arrivals = []
+        tasks = []
+        timeout = aiohttp.ClientTimeout(total=settings.timeout_s)
+        connector = aiohttp.TCPConnector(limit=settings.max_concurrency)
+
+        async with aiohttp.ClientSession(timeout=timeout, connector=connector) as http:
+            self._t0 = time.perf_counter()
+            last_report = 0
+            for i, arrival in enumerate(schedule):
+                delay = arrival["at"] - self._now()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+                self.arrivals.append(arrival)
+                if self._in_flight >= settings.max_concurrency:
+                    # Open loop: never wait for capacity, record the drop instead
+                    self.dropped.append(arrival)
+                else:
+                    session = corpus[i % len(corpus)]
+                    tasks.append(asyncio.ensure_future(self._run_session(http, session)))
+
+                if verbose and int(arrival["at"]) >= last_report + 10:
+                    last_report = int(arrival["at"])
+                    done = len(self.records)
+                    errors = sum(1 for r in self.records if not r.ok)
+                    print(f"    t={last_report:>4}s  in-flight={self._in_flight:<4} "
+                          f"requests={done:<6} errors={errors}")
+
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+        return self.get_summary()
+
+    # -------------------------------------------------------------------------
+    # Statistics
+    # -------------------------------------------------------------------------
+
+    def _per_second(self) -> List[Dict[str, Any]]:
+        """Offered load, throughput, errors and latency per wall-clock second"""
+        if not self.records and not self.arrivals:
+            return []
+
+        last = max([r.end_s for r in self.records] + [a["at"] for a in self.arrivals] + [0])
+        seconds = int(last) + 1
+        rows = [{"second": s, "arrivals": 0, "dropped": 0, "requests_started": 0,
+                 "completed": 0, "errors": 0, "latencies": []} for s in range(seconds)]
+
+        for arrival in self.arrivals:
+            rows[int(arrival["at"])]["arrivals"] += 1
+        for arrival in self.dropped:
+            rows[int(arrival["at"])]["dropped"] += 1
+        for record in self.records:
+            rows[int(record.start_s)]["requests_started"] += 1
+            row = rows[int(record.end_s)]
+            row["completed"] += 1
+            if not record.ok:
+                row["errors"] += 1
+            row["latencies"].append(record.latency_ms)
+
+        for row in rows:
+            latencies = sorted(row.pop("latencies"))
+            row["throughput_rps"] = row["completed"] - row["errors"]
+            row["error_rate"] = row["errors"] / row["completed"] * 100 if row["completed"] else 0.0
+            row["p50_ms"] = percentile(latencies, 50)
+            row["p90_ms"] = percentile(latencies, 90)
+            row["p99_ms"] = percentile(latencies, 99)
+        return rows
+
+    def _per_step(self) -> List[Dict[str, Any]]:
+        """Offered vs achieved request rate and latency per arrival step"""
+        settings = self.settings
+        steps = max(settings.ramp_steps, 1) if settings.arrival == "ramp" else 1
+        step_duration = settings.duration_s / steps
+
+        rows = []
+        for step in range(steps):
+            start = step * step_duration
+            end = start + step_duration
+            started = [r for r in self.records if start <= r.start_s < end]
+            finished = [r for r in self.records if start <= r.end_s < end]
+            latencies = sorted(r.latency_ms for r in started)
+            errors = sum(1 for r in started if not r.ok)
+            step_arrivals = [a for a in self.arrivals if a["step"] == step]
+            offered_sessions = len(step_arrivals) / step_duration
+
+            rows.append({
+                "step": step,
+                "offered_sessions_per_s": offered_sessions,
+                "offered_rps": len(started) / step_duration,
+                "achieved_rps": sum(1 for r in finished if r.ok) / step_duration,
+                "dropped": sum(1 for a in self.dropped if a["step"] == step),
+                "requests": len(started),
+                "error_rate": errors / len(started) * 100 if started else 0.0,
+                "p50_ms": percentile(latencies, 50),
+                "p90_ms": percentile(latencies, 90),
+                "p99_ms": percentile(latencies, 99)
+            })
+        return rows
+
+    @staticmethod
+    def find_saturation_knee(steps: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """First step where throughput stops tracking offered load or latency/errors blow up"""
+        cfg = LOAD_TEST_CONFIG
+        baseline = next((s for s in steps if s["requests"]), None)
+        if not baseline:
+            return None
+
+        for step in steps:
+            if not step["requests"] and not step["dropped"]:
+                continue
+            reasons = []
+            if step["dropped"]:
+                reasons.append("sessions dropped at concurrency limit")
+            if step["offered_rps"] and step["achieved_rps"] < step["offered_rps"] * cfg["knee_throughput_ratio"]:
+                reasons.append("throughput below offered load")
+            if baseline["p99_ms"] and step["p99_ms"] > baseline["p99_ms"] * cfg["knee_latency_factor"]:
+                reasons.append("p99 latency inflation")
+            if step["error_rate"] > cfg["knee_error_rate"]:
+                reasons.append("error rate above limit")
+            if reasons:
+                return {**step, "reasons": reasons}
+        return None
+
+    def get_summary(self) -> Dict[str, Any]:
+        """Get load test summary"""
+        latencies = sorted(r.latency_ms for r in self.records)
+        total = len(self.records)
+        errors = sum(1 for r in self.records if not r.ok)
+        elapsed = max([r.end_s for r in self.records] + [self.settings.duration_s])
+        steps = self._per_step()
+
+        error_counts: Dict[str, int] = {}
+        for record in self.records:
+            if record.error:
+                error_counts[record.error] = error_counts.get(record.error, 0) + 1
+
+        return {
+            "settings": asdict(self.settings),
+            "sessions_offered": len(self.arrivals),
+            "sessions_dropped": len(self.dropped),
+            "total_requests": total,
+            "errors": errors,
+            "error_rate": errors / total * 100 if total else 0.0,
+            "throughput_rps": (total - errors) / elapsed if elapsed else 0.0,
+            "p50_ms": percentile(latencies, 50),
+            "p90_ms": percentile(latencies, 90),
+            "p99_ms": percentile(latencies, 99),
+            "max_ms": latencies[-1] if latencies else 0.0,
+            "top_errors": dict(sorted(error_counts.items(), key=lambda x: -x[1])[:10]),
+            "per_second": self._per_second(),
+            "per_step": steps,
+            "saturation_knee": self.find_saturation_knee(steps),
+            "evaluation_time": datetime.now().isoformat()
+        }
+
+    def export_results(self, filename: str = "load_test_results.json"):
+        """Export summary and raw request records to JSON"""
+        data = {
+            "summary": self.get_summary(),
+            "requests": [asdict(r) for r in self.records]
+        }
+
+        with open(filename, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+
+        print(f"Load test results exported to {filename}")
@@ -0,0 +1,683 @@
+"""
+Mock Chatbot Server for 112 Call Center Agent Evaluation
+==========================================================
+
+A lightweight stand-in for the Node/LangGraph backend, so the evaluation
+harness can be benchmarked and tested without MongoDB, OpenAI or Node.
+
+It serves the endpoints the harness uses and emulates the LangGraph flow
+collectEmergency -> showFirstAidGuidance -> collectLocation -> collectPhone
+-> collectPeople -> showConfirmation -> createTicket with rule-based
+extraction and a configurable latency distribution.
+
+Endpoints:
+- POST   /api/chat/message
+- DELETE /api/chat/session/:sessionId
+- POST   /api/chat/session/:sessionId/clone
+- POST   /api/chat/session/:sessionId/seed
+- GET    /api/chat/health
+
+Usage:
+    python mock_chatbot_server.py --port 5001 --latency lognormal --latency-ms 800
+    python run_evaluation.py --chatbot-url http://localhost:5001
+"""
+
+import re
+import copy
+import random
+import asyncio
+import argparse
+from datetime import datetime
+from dataclasses import dataclass, field
+from typing import List, Dict, Any, Optional
+
+from aiohttp import web
+
+from config import (
+    EMERGENCY_KEYWORDS, VALID_PHONE_PREFIXES, MAJOR_CITIES, HCMC_DISTRICTS,
+    CONFIRMATION_KEYWORDS, MOCK_CHATBOT_CONFIG
+)
+
+
+# =============================================================================
+# PROMPTS (mirroring services/langgraph/nodes)
+# =============================================================================
+
+PROMPT_EMERGENCY = 'Xin chào, đây là tổng đài 112. Bạn đang gặp tình huống gì? Hãy mô tả chi tiết chuyện gì đang xảy ra.'
+PROMPT_LOCATION = 'Bạn cho tôi địa chỉ cụ thể (số nhà, tên đường, phường/xã, quận/huyện, tỉnh/thành phố)?'
+PROMPT_CITY = 'Tỉnh hoặc thành phố nào?'
+PROMPT_PHONE = 'Cho tôi số điện thoại để lực lượng cứu hộ liên hệ.'
+PROMPT_PHONE_INVALID = (
+    '❌ Số điện thoại chưa đúng định dạng. Vui lòng cung cấp lại số điện thoại hợp lệ '
+    '(10 chữ số bắt đầu bằng 09, 03, 07, 08, 05 hoặc định dạng +84). Ví dụ: 0912345678 hoặc +84912345678.'
+)
+PROMPT_PEOPLE = {
+    "MEDICAL": 'Có bao nhiêu người bị thương? Có ai nguy kịch không?',
+    "FIRE_RESCUE": 'Có bao nhiêu người bị ảnh hưởng? Có ai bị mắc kẹt không?',
+    None: 'Có bao nhiêu người cần trợ giúp?'
+}
+PROMPT_TICKET_QUERY_GUEST = 'Để xem lịch sử phiếu và trạng thái xử lý, bạn cần đăng nhập vào hệ thống.'
+PROMPT_NO_TICKETS = 'Bạn chưa có phiếu khẩn cấp nào trong hệ thống.'
+
+FIRST_AID_GUIDANCE = {
+    "FIRE_RESCUE": 'Hãy rời khỏi khu vực cháy ngay, cúi thấp người tránh khói, dùng khăn ướt che mũi miệng và không sử dụng thang máy.',
+    "MEDICAL": 'Đặt nạn nhân nằm ở nơi thoáng khí, kiểm tra hơi thở, cầm máu bằng cách ép chặt vết thương và không di chuyển nạn nhân nếu nghi chấn thương cột sống.',
+    "SECURITY": 'Hãy giữ bình tĩnh, di chuyển đến nơi an toàn nếu có thể, và tránh đối đầu trực tiếp.'
+}
+
+EMERGENCY_TYPE_VI = {
+    "FIRE_RESCUE": "PCCC & Cứu nạn cứu hộ",
+    "MEDICAL": "Cấp cứu y tế",
+    "SECURITY": "An ninh"
+}
+
+SUPPORT_FOR_TYPE = {
+    "FIRE_RESCUE": ["fireDepartment", "rescue"],
+    "MEDICAL": ["ambulance"],
+    "SECURITY": ["police"]
+}
+
+TICKET_QUERY_PATTERN = re.compile(r"(TD-\d{8}|lịch sử|phiếu (của tôi|trước|cũ)|tra cứu)", re.IGNORECASE)
+PHONE_PATTERN = re.compile(r"(?:\+84|84|0)[\d\s.\-]{8,13}\d")
+PEOPLE_PATTERN = re.compile(r"(\d+)\s*(?:người|nguoi|nạn nhân|bé|em bé|cháu|trẻ)")
+INJURED_PATTERN = re.compile(r"(\d+)\s*(?:người\s*)?(?:bị thương|bị nạn)")
+CRITICAL_PATTERN = re.compile(r"(\d+)\s*(?:người\s*)?(?:nguy kịch|bất tỉnh|nặng)")
+WARD_PATTERN = re.compile(r"(?:phường|xã|thị trấn)\s+[^,.;]+", re.IGNORECASE)
+DISTRICT_PATTERN = re.compile(r"(?:quận|huyện|thị xã)\s+[^,.;]+", re.IGNORECASE)
+ADDRESS_PATTERN = re.compile(
+    r"(?:số\s*)?\d+[a-zA-Z]?(?:/\d+)*\s+(?:đường|phố|ngõ|hẻm)?\s*[^\W\d][^,.;]*|(?:đường|phố|ngõ|hẻm|ngách)\s+[^,.;]+",
+    re.IGNORECASE
+)
+NUMBER_WORDS = {"một": 1, "hai": 2, "ba": 3, "bốn": 4, "năm": 5, "sáu": 6, "bảy": 7, "tám": 8, "chín": 9, "mười": 10}
+ALONE_PHRASES = ["chỉ mình tôi", "một mình", "không ai bị thương", "không có ai"]
+MANY_PHRASES = ["nhiều người", "đông người", "không biết"]
+
+CITY_ALIASES = {
+    "tphcm": "Thành phố Hồ Chí Minh",
+    "tp.hcm": "Thành phố Hồ Chí Minh",
+    "tp hcm": "Thành phố Hồ Chí Minh",
+    "hcm": "Thành phố Hồ Chí Minh",
+    "sài gòn": "Thành phố Hồ Chí Minh",
+    "hồ chí minh": "Thành phố Hồ Chí Minh"
+}
+
+
+# =============================================================================
+# SESSION STATE
+# =============================================================================
+
+@dataclass
+class MockSession:
+    """Emulated LangGraph EmergencyState for one session"""
+    session_id: str
+    is_authenticated: bool = False
+    emergency_types: List[str] = field(default_factory=list)
+    location: Dict[str, Optional[str]] = field(default_factory=lambda: {
+        "address": None, "ward": None, "district": None, "city": None
+    })
+    phone: Optional[str] = None
+    phone_validation_error: bool = False
+    affected_people: Dict[str, int] = field(default_factory=lambda: {"total": 0, "injured": 0, "critical": 0})
+    description: Optional[str] = None
+    first_aid_shown: bool = False
+    confirmation_shown: bool = False
+    current_step: str = "emergency"
+    turns: int = 0
+
+    @property
+    def location_complete(self) -> bool:
+        return bool(self.location["address"] and self.location["city"])
+
+    @property
+    def location_str(self) -> str:
+        parts = [self.location[k] for k in ("address", "ward", "district", "city")]
+        return ", ".join(p for p in parts if p)
+
+    @property
+    def support_required(self) -> Dict[str, bool]:
+        support = {"police": False, "ambulance": False, "fireDepartment": False, "rescue": False}
+        for emergency_type in self.emergency_types:
+            for key in SUPPORT_FOR_TYPE.get(emergency_type, []):
+                support[key] = True
+        return support
+
+
+# EmergencyState fields a seed may set -> MockSession attribute (None: merged
+# specially or, like supportRequired, derived by the mock)
+SEED_FIELDS = {
+    "messages": None,
+    "currentMessage": None,
+    "location": None,
+    "emergencyTypes": "emergency_types",
+    "phone": "phone",
+    "phoneValidationError": "phone_validation_error",
+    "affectedPeople": None,
+    "supportRequired": None,
+    "currentStep": "current_step",
+    "confirmationShown": "confirmation_shown",
+    "firstAidShown": "first_aid_shown",
+    "userConfirmed": None,
+    "priority": None,
+    "description": "description",
+    "firstAidGuidance": None,
+    "response": None,
+    "shouldCreateTicket": None,
+    "ticketInfo": None,
+}
+
+
+# =============================================================================
+# RULE-BASED EXTRACTION
+# =============================================================================
+
+def normalize_phone(raw: str) -> str:
+    """Strip separators and convert +84/84 prefixes to a leading 0"""
+    digits = re.sub(r"[^\d+]", "", raw)
+    if digits.startswith("+84"):
+        digits = "0" + digits[3:]
+    elif digits.startswith("84") and len(digits) == 11:
+        digits = "0" + digits[2:]
+    return digits
+
+
+def is_valid_phone(phone: str) -> bool:
+    return len(phone) == 10 and phone[:3] in VALID_PHONE_PREFIXES
+
+
+def _contains_any(text: str, phrases: List[str]) -> bool:
+    return any(re.search(rf"(?<!\w){re.escape(p)}(?!\w)", text) for p in phrases)
+
+
+def extract_info(session: MockSession, message: str):
+    """Update session state from a user message (emulates extractInfo)"""
+    text = message.lower()
+
+    for emergency_type, keywords in EMERGENCY_KEYWORDS.items():
+        if emergency_type not in session.emergency_types and _contains_any(text, keywords):
+            session.emergency_types.append(emergency_type)
+            if not session.description:
+                session.description = message.strip()
+
+    phone_match = PHONE_PATTERN.search(message)
+    if phone_match:
+        phone = normalize_phone(phone_match.group(0))
+        if is_valid_phone(phone):
+            session.phone = phone
+            session.phone_validation_error = False
+        elif session.current_step == "phone" or not session.phone:
+            session.phone_validation_error = True
+
+    # Do not mistake the phone number for a house number
+    location_text = message.replace(phone_match.group(0), " ") if phone_match else message
+    _extract_location(session, location_text)
+    _extract_people(session, text.replace(phone_match.group(0), " ") if phone_match else text)
+
+
+def _extract_location(session: MockSession, message: str):
+    text = message.lower()
+    found = {}
+
+    for city in MAJOR_CITIES:
+        if city.lower() in text:
+            found["city"] = city
+            break
+    else:
+        for alias, city in CITY_ALIASES.items():
+            if _contains_any(text, [alias]):
+                found["city"] = city
+                break
+
+    ward = WARD_PATTERN.search(message)
+    if ward:
+        found["ward"] = ward.group(0).strip()
+
+    for district in HCMC_DISTRICTS:
+        if _contains_any(text, [district.lower()]):
+            found["district"] = district
+            found.setdefault("city", session.location["city"] or "Thành phố Hồ Chí Minh")
+            break
+    else:
+        district = DISTRICT_PATTERN.search(message)
+        if district:
+            found["district"] = district.group(0).strip()
+
+    # A bare number is only an address when we asked for one or it comes with ward/district/city
+    address = ADDRESS_PATTERN.search(message)
+    if address and (found or session.current_step in ("location", "confirm")):
+        found["address"] = address.group(0).strip()
+
+    session.location.update(found)
+
+
+def _extract_people(session: MockSession, text: str):
+    total = PEOPLE_PATTERN.search(text)
+    word_total = next(
+        (value for word, value in NUMBER_WORDS.items() if re.search(rf"(?<!\w){word}\s+người", text)),
+        None
+    )
+    if total:
+        session.affected_people["total"] = int(total.group(1))
+    elif word_total:
+        session.affected_people["total"] = word_total
+    elif session.current_step == "people":
+        # Answers to "how many people?" that carry no explicit count
+        if _contains_any(text, ALONE_PHRASES):
+            session.affected_people["total"] = 1
+        elif text.strip().isdigit():
+            session.affected_people["total"] = int(text.strip())
+        elif _contains_any(text, MANY_PHRASES):
+            session.affected_people["total"] = 2
+
+    injured = INJURED_PATTERN.search(text)
+    if injured:
+        session.affected_people["injured"] = int(injured.group(1))
+    critical = CRITICAL_PATTERN.search(text)
+    if critical:
+        session.affected_people["critical"] = int(critical.group(1))
+
+
+def is_confirmation(message: str) -> bool:
+    """Positive confirmation with no correction keywords (emulates checkUserConfirmation)"""
+    text = message.lower().strip()
+    if _contains_any(text, CONFIRMATION_KEYWORDS["negative"]) and text not in ("không sao",):
+        return False
+    return _contains_any(text, CONFIRMATION_KEYWORDS["positive"])
+
+
+# =============================================================================
+# FLOW
+# =============================================================================
+
+def next_step(session: MockSession) -> str:
+    """Determine the next node (emulates routerNode.determineNextStep)"""
+    if not session.emergency_types:
+        return "emergency"
+    if not session.first_aid_shown:
+        return "firstAid"
+    if not session.location_complete:
+        return "location"
+    if session.phone_validation_error or (not session.phone and not session.is_authenticated):
+        return "phone"
+    if not session.affected_people["total"]:
+        return "people"
+    return "confirm"
+
+
+def build_confirmation(session: MockSession) -> str:
+    forces = build_forces(session)
+    phone = session.phone or ("Đã lưu trong hồ sơ" if session.is_authenticated else "Chưa có")
+    return f"""📋 **XÁC NHẬN THÔNG TIN PHIẾU KHẨN CẤP:**
+
+• **Địa điểm:** {session.location_str}
+• **Loại tình huống:** {', '.join(EMERGENCY_TYPE_VI[t] for t in session.emergency_types)}
+• **Số điện thoại:** {phone}
+• **Số người bị ảnh hưởng:** {session.affected_people['total']} người
+
+🚨 **Lực lượng sẽ điều động:** {forces}
+
+⚠️ **Vui lòng xác nhận thông tin trên đã chính xác?** (Trả lời "Đúng" hoặc "Xác nhận" để tạo phiếu khẩn cấp)"""
+
+
+def build_forces(session: MockSession) -> str:
+    support = session.support_required
+    forces = []
+    if support["police"]:
+        forces.append("Công an")
+    if support["fireDepartment"]:
+        forces.append("Cứu hỏa")
+    if support["ambulance"]:
+        forces.append("Cấp cứu")
+    if support["rescue"] and not support["fireDepartment"]:
+        forces.append("Cứu hộ")
+    return ", ".join(forces) if forces else "Lực lượng cứu hộ"
+
+
+def build_ticket_info(session: MockSession) -> Dict[str, Any]:
+    """Ticket info in the shape of state.buildTicketInfo"""
+    return {
+        "location": session.location_str,
+        "landmarks": "",
+        "emergencyTypes": list(session.emergency_types),
+        "emergencyType": session.emergency_types[0] if session.emergency_types else None,
+        "description": session.description or "Báo cáo qua tổng đài 112",
+        "reporter": {"name": "Chưa xác định", "phone": session.phone, "email": ""},
+        "affectedPeople": {
+            "total": session.affected_people["total"] or 1,
+            "injured": session.affected_people["injured"],
+            "critical": session.affected_people["critical"]
+        },
+        "supportRequired": session.support_required,
+        "priority": "CRITICAL" if session.affected_people["critical"] else "HIGH"
+    }
+
+
+def generate_ticket_id() -> str:
+    now = datetime.now()
+    suffix = "".join(random.choices("ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789", k=4))
+    return f"TD-{now.strftime('%Y%m%d')}-{now.strftime('%H%M%S')}-{suffix}"
+
+
+def process_message(session: MockSession, message: str) -> Dict[str, Any]:
+    """Run one turn of the emulated graph and build the controller response data"""
+    session.turns += 1
+
+    if TICKET_QUERY_PATTERN.search(message) and not session.emergency_types:
+        response = PROMPT_NO_TICKETS if session.is_authenticated else PROMPT_TICKET_QUERY_GUEST
+        return {"response": response, "ticketInfo": {}, "shouldCreateTicket": False}
+
+    if session.confirmation_shown:
+        if is_confirmation(message):
+            return create_ticket(session)
+        # Correction: re-extract, then show the updated confirmation
+        session.confirmation_shown = False
+        session.current_step = "confirm"
+
+    extract_info(session, message)
+    step = next_step(session)
+    session.current_step = step
+
+    if step == "emergency":
+        response = PROMPT_EMERGENCY
+    elif step == "firstAid":
+        session.first_aid_shown = True
+        guidance = " ".join(FIRST_AID_GUIDANCE[t] for t in session.emergency_types)
+        session.current_step = "location" if not session.location_complete else next_step(session)
+        response = f"🩺 **Hướng dẫn xử lý ban đầu:** {guidance}\n\n{_prompt_for(session, session.current_step)}"
+    elif step == "confirm":
+        session.confirmation_shown = True
+        response = build_confirmation(session)
+    else:
+        response = _prompt_for(session, step)
+
+    return {"response": response, "ticketInfo": {}, "shouldCreateTicket": False}
+
+
+def _prompt_for(session: MockSession, step: str) -> str:
+    if step == "location":
+        if session.location["address"] and not session.location["city"]:
+            return PROMPT_CITY
+        return PROMPT_LOCATION
+    if step == "phone":
+        if session.phone_validation_error:
+            session.phone_validation_error = False
+            return PROMPT_PHONE_INVALID
+        return PROMPT_PHONE
+    if step == "people":
+        primary = next((t for t in ("MEDICAL", "FIRE_RESCUE") if t in session.emergency_types), None)
+        return PROMPT_PEOPLE[primary]
+    if step == "confirm":
+        session.confirmation_shown = True
+        return build_confirmation(session)
+    return PROMPT_EMERGENCY
+
+
+def create_ticket(session: MockSession) -> Dict[str, Any]:
+    """Emulate createTicket plus the controller's ticket confirmation message"""
+    ticket_info = build_ticket_info(session)
+    ticket_id = generate_ticket_id()
+    session.current_step = "complete"
+
+    emergency_types_vi = ", ".join(EMERGENCY_TYPE_VI[t] for t in session.emergency_types)
+    response = f"""✅ **PHIẾU KHẨN CẤP {ticket_id} ĐÃ ĐƯỢC TẠO**
+
+📋 **Thông tin đã ghi nhận:**
+• Địa điểm: {ticket_info['location']}
+• Loại tình huống: {emergency_types_vi}
+• Số điện thoại: {ticket_info['reporter']['phone']}
+• Số người bị ảnh hưởng: {ticket_info['affectedPeople']['total']}
+
+🚨 **{build_forces(session)} đang được điều động đến ngay!**
+
+Vui lòng giữ bình tĩnh và thực hiện theo hướng dẫn đã cung cấp trong khi chờ lực lượng chức năng đến hỗ trợ."""
+
+    return {
+        "response": response,
+        "ticketInfo": ticket_info,
+        "shouldCreateTicket": False,  # Already created
+        "ticketId": ticket_id,
+        "firstAidGuidance": None
+    }
+
+
+# =============================================================================
+# LATENCY MODEL
+# =============================================================================
+
+class LatencyModel:
+    """Samples per-request latency from a configurable distribution"""
+
+    DISTRIBUTIONS = ["none", "fixed", "uniform", "normal", "lognormal", "exponential"]
+
+    def __init__(
+        self,
+        distribution: str = "lognormal",
+        latency_ms: float = 800,
+        spread: float = 0.5,
+        max_ms: float = 30000,
+        seed: Optional[int] = None
+    ):
+        if distribution not in self.DISTRIBUTIONS:
+            raise ValueError(f"Unknown latency distribution: {distribution}")
+        self.distribution = distribution
+        self.latency_ms = latency_ms
+        self.spread = spread
+        self.max_ms = max_ms
+        self.rng = random.Random(seed)
+
+    def sample_ms(self) -> float:
+        d, ms, spread = self.distribution, self.latency_ms, self.spread
+        if d == "none":
+            value = 0.0
+        elif d == "fixed":
+            value = ms
+        elif d == "uniform":
+            value = self.rng.uniform(ms * (1 - spread), ms * (1 + spread))
+        elif d == "normal":
+            value = self.rng.gauss(ms, ms * spread)
+        elif d == "lognormal":
+            value = ms * self.rng.lognormvariate(0, spread)
+        else:
+            value = self.rng.expovariate(1 / ms) if ms > 0 else 0.0
+        return min(max(value, 0.0), self.max_ms)
+
+
+# =============================================================================
+# SERVER
+# =============================================================================
+
+class MockChatbotServer:
+    """aiohttp application emulating the chatbot API"""
+
+    def __init__(self, latency: LatencyModel = None, error_rate: float = 0.0, seed: Optional[int] = None):
+        self.latency = latency or LatencyModel(distribution="none")
+        self.error_rate = error_rate
+        self.rng = random.Random(seed)
+        self.sessions: Dict[str, MockSession] = {}
+        self.stats = {"messages": 0, "errors": 0, "tickets": 0, "cleared": 0, "cloned": 0, "seeded": 0, "in_flight": 0, "peak_in_flight": 0}
+        self.started_at = datetime.now()
+
+    def create_app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_post("/api/chat/message", self.handle_message)
+        app.router.add_delete("/api/chat/session/{session_id}", self.handle_clear_session)
+        app.router.add_post("/api/chat/session/{session_id}/clone", self.handle_clone_session)
+        app.router.add_post("/api/chat/session/{session_id}/seed", self.handle_seed_session)
+        app.router.add_get("/api/chat/health", self.handle_health)
+        return app
+
+    async def handle_message(self, request: web.Request) -> web.Response:
+        self.stats["in_flight"] += 1
+        self.stats["peak_in_flight"] = max(self.stats["peak_in_flight"], self.stats["in_flight"])
+        try:
+            try:
+                body = await request.json()
+            except Exception:
+                body = {}
+            message = body.get("message")
+            session_id = body.get("sessionId")
+            if not message or not session_id:
+                return web.json_response(
+                    {"success": False, "message": "Message and sessionId are required"},
+                    status=400
+                )
+
+            await asyncio.sleep(self.latency.sample_ms() / 1000)
+            self.stats["messages"] += 1
+
+            if self.error_rate and self.rng.random() < self.error_rate:
+                self.stats["errors"] += 1
+                return web.json_response(
+                    {"success": False, "message": "Failed to process message", "error": "Injected mock error"},
+                    status=500
+                )
+
+            is_authenticated = request.headers.get("Authorization", "").startswith("Bearer ")
+            session = self.sessions.get(session_id)
+            if session is None:
+                session = self.sessions[session_id] = MockSession(session_id, is_authenticated=is_authenticated)
+
+            data = process_message(session, message)
+            if data.get("ticketId"):
+                self.stats["tickets"] += 1
+                # The backend clears the session after ticket creation
+                self.sessions.pop(session_id, None)
+
+            return web.json_response({"success": True, "data": {**data, "sessionId": session_id}})
+        finally:
+            self.stats["in_flight"] -= 1
+
+    async def handle_clear_session(self, request: web.Request) -> web.Response:
+        session_id = request.match_info["session_id"]
+        self.sessions.pop(session_id, None)
+        self.stats["cleared"] += 1
+        return web.json_response({"success": True, "message": f"Session {session_id} has been cleared"})
+
+    async def handle_clone_session(self, request: web.Request) -> web.Response:
+        session_id = request.match_info["session_id"]
+        try:
+            body = await request.json()
+        except Exception:
+            body = {}
+        target_id = body.get("targetSessionId")
+        if not target_id or target_id == session_id:
+            return web.json_response(
+                {"success": False, "message": "A targetSessionId different from the source session is required"},
+                status=400
+            )
+        session = self.sessions.get(session_id)
+        if session is None:
+            return web.json_response(
+                {"success": False, "message": f"Session {session_id} has no saved state"},
+                status=404
+            )
+        if target_id in self.sessions:
+            return web.json_response(
+                {"success": False, "message": f"Session {target_id} already exists"},
+                status=409
+            )
+        clone = copy.deepcopy(session)
+        clone.session_id = target_id
+        self.sessions[target_id] = clone
+        self.stats["cloned"] += 1
+        return web.json_response({"success": True, "data": {"sessionId": target_id, "sourceSessionId": session_id}})
+
+    async def handle_seed_session(self, request: web.Request) -> web.Response:
+        session_id = request.match_info["session_id"]
+        try:
+            body = await request.json()
+        except Exception:
+            body = {}
+        state = body.get("state")
+        if not isinstance(state, dict):
+            return web.json_response({"success": False, "message": "A state object is required"}, status=400)
+        unknown = [key for key in state if key not in SEED_FIELDS]
+        if unknown:
+            return web.json_response(
+                {"success": False, "message": f"Unknown or read-only state fields: {', '.join(unknown)}"},
+                status=400
+            )
+        if session_id in self.sessions:
+            return web.json_response(
+                {"success": False, "message": f"Session {session_id} already exists"},
+                status=409
+            )
+
+        session = MockSession(
+            session_id,
+            is_authenticated=request.headers.get("Authorization", "").startswith("Bearer ")
+        )
+        for key, value in state.items():
+            if key == "location":
+                session.location.update({k: v for k, v in value.items() if k in session.location})
+            elif key == "messages":
+                session.turns = sum(1 for msg in value if msg.get("role") == "reporter")
+            elif key == "affectedPeople":
+                session.affected_people.update(value)
+            elif SEED_FIELDS[key]:
+                setattr(session, SEED_FIELDS[key], value)
+        self.sessions[session_id] = session
+        self.stats["seeded"] += 1
+        return web.json_response({
+            "success": True,
+            "data": {"sessionId": session_id, "currentStep": session.current_step, "messageCount": len(state.get("messages", []))}
+        })
+
+    async def handle_health(self, request: web.Request) -> web.Response:
+        return web.json_response({
+            "success": True,
+            "data": {
+                "service": "Emergency 112 Chat Service (mock)",
+                "status": "operational",
+                "engine": "mock",
+                "latency": {
+                    "distribution": self.latency.distribution,
+                    "latency_ms": self.latency.latency_ms,
+                    "spread": self.latency.spread
+                },
+                "error_rate": self.error_rate,
+                "active_sessions": len(self.sessions),
+                "stats": dict(self.stats),
+                "started_at": self.started_at.isoformat(),
+                "timestamp": datetime.now().isoformat()
+            }
+        })
+
+
+def main():
+    """Main entry point"""
+    cfg = MOCK_CHATBOT_CONFIG
+    parser = argparse.ArgumentParser(
+        description="Mock 112 chatbot server for benchmarking the evaluation harness"
+    )
+    parser.add_argument("--host", default=cfg["host"], help="Bind address")
+    parser.add_argument("--port", type=int, default=cfg["port"], help="Port to listen on")
+    parser.add_argument("--latency", choices=LatencyModel.DISTRIBUTIONS, default=cfg["latency"],
+                        help="Latency distribution of /api/chat/message")
+    parser.add_argument("--latency-ms", type=float, default=cfg["latency_ms"],
+                        help="Fixed value, mean (normal/exponential) or median (lognormal) in ms")
+    parser.add_argument("--latency-spread", type=float, default=cfg["latency_spread"],
+                        help="Uniform half-width ratio, normal stddev ratio or lognormal sigma")
+    parser.add_argument("--latency-max-ms", type=float, default=cfg["latency_max_ms"],
+                        help="Cap on sampled latency in ms")
+    parser.add_argument("--error-rate", type=float, default=cfg["error_rate"],
+                        help="Fraction of messages answered with HTTP 500")
+    parser.add_argument("--seed", type=int, default=cfg["seed"], help="Random seed")
+
+    args = parser.parse_args()
+
+    latency = LatencyModel(
+        distribution=args.latency,
+        latency_ms=args.latency_ms,
+        spread=args.latency_spread,
+        max_ms=args.latency_max_ms,
+        seed=args.seed
+    )
+    server = MockChatbotServer(latency=latency, error_rate=args.error_rate, seed=args.seed)
+
+    print(f"Mock chatbot listening on http://{args.host}:{args.port} "
+          f"(latency: {args.latency} {args.latency_ms:.0f}ms, error rate: {args.error_rate:.1%})")
+    web.run_app(server.create_app(), host=args.host, port=args.port, print=None)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,327 @@
+"""
+Mock Judge Server for 112 Call Center Agent Evaluation
+========================================================
+
+A local, deterministic stand-in for the OpenAI judge model, served over an
+OpenAI-compatible /v1/chat/completions endpoint. It lets the whole evaluation
+pipeline run offline, for free and at high speed: profiling the harness,
+testing concurrency, and CI.
+
+Features:
+- Structured outputs: responses are built from the request's JSON schema
+  (GEval steps/score/reason, verdicts, statements, ...)
+- Rule-based scores (regex over the judge prompt) with deterministic jitter
+- Latency profiles (instant, fast, realistic, slow) via LatencyModel
+- Token usage in every response so judge cost accounting keeps working
+
+Select it with EVALUATION_MODEL=mock (or mock-<profile>, e.g. mock-realistic).
+The server is started in-process automatically when MOCK_JUDGE_CONFIG["base_url"]
+is not reachable, or can be run standalone:
+
+    python mock_judge_server.py --profile realistic
+"""
+
+import re
+import json
+import time
+import asyncio
+import hashlib
+import argparse
+import threading
+import urllib.request
+from typing import Dict, Any, Optional, List
+
+from aiohttp import web
+
+from config import MOCK_JUDGE_CONFIG
+from context_compaction import estimate_tokens
+from mock_chatbot_server import LatencyModel
+
+
+# Keys deepeval asks judges to return, recognised when no JSON schema is sent
+KNOWN_KEYS = ["steps", "score", "reason", "verdicts", "statements", "truths", "claims", "opinions"]
+LIST_OF_TEXT_KEYS = ["statements", "truths", "claims"]
+EMPTY_LIST_KEYS = ["opinions"]  # No opinions -> toxicity/bias score 0
+
+MOCK_STEPS = [
+    "Read the user input and the chatbot's actual output.",
+    "Check the output against each point of the evaluation criteria.",
+    "Assign a score reflecting how well the criteria are met."
+]
+
+# Prompts about toxicity/bias expect "no" verdicts for a clean response
+NEGATIVE_VERDICT_PATTERN = re.compile(r"\b(toxic|bias|biased)\b", re.IGNORECASE)
+
+
+# =============================================================================
+# JUDGMENT RULES
+# =============================================================================
+
+def parse_profile(model: str) -> str:
+    """Latency profile from a model name like "mock-realistic" (default from config)"""
+    prefix = MOCK_JUDGE_CONFIG["model_prefix"]
+    suffix = model[len(prefix):].lstrip("-:") if model.startswith(prefix) else ""
+    return suffix if suffix in MOCK_JUDGE_CONFIG["profiles"] else MOCK_JUDGE_CONFIG["profile"]
+
+
+def judge_prompt(prompt: str, rules: List[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Deterministic score, reason and verdict for a judge prompt"""
+    cfg = MOCK_JUDGE_CONFIG
+    rules = cfg["rules"] if rules is None else rules
+
+    for rule in rules:
+        if re.search(rule["pattern"], prompt):
+            score = rule["score"]
+            reason = rule["reason"]
+            break
+    else:
+        # Stable jitter so repeated runs give identical scores
+        digest = int(hashlib.sha256(prompt.encode("utf-8")).hexdigest()[:8], 16)
+        jitter = cfg["score_jitter"]
+        score = cfg["default_score"] + (digest % (2 * jitter + 1)) - jitter if jitter else cfg["default_score"]
+        reason = "Mock judge: the response follows the expected behaviour."
+
+    score = max(0, min(10, score))
+    negative = bool(NEGATIVE_VERDICT_PATTERN.search(prompt))
+    passed = score >= 5
+    if negative:
+        verdict = "no" if passed else "yes"
+    else:
+        verdict = "yes" if passed else "no"
+
+    return {"score": score, "reason": reason, "verdict": verdict}
+
+
+# =============================================================================
+# RESPONSE BUILDING
+# =============================================================================
+
+def _resolve(schema: Dict[str, Any], root: Dict[str, Any]) -> Dict[str, Any]:
+    """Resolve a local $ref ("#/$defs/Name") against the root schema"""
+    while "$ref" in schema:
+        node = root
+        for part in schema["$ref"].lstrip("#/").split("/"):
+            node = node.get(part, {})
+        schema = node
+    return schema
+
+
+def build_from_schema(name: str, schema: Dict[str, Any], root: Dict[str, Any], judgment: Dict[str, Any]) -> Any:
+    """Build a value satisfying a JSON schema, filled from the judgment"""
+    schema = _resolve(schema, root)
+
+    for key in ("anyOf", "oneOf"):
+        if key in schema:
+            options = [s for s in schema[key] if _resolve(s, root).get("type") != "null"]
+            return build_from_schema(name, options[0] if options else {}, root, judgment)
+
+    if "enum" in schema:
+        return judgment["verdict"] if judgment["verdict"] in schema["enum"] else schema["enum"][0]
+
+    schema_type = schema.get("type")
+    if schema_type == "object" or "properties" in schema:
+        return {
+            prop: build_from_schema(prop, sub, root, judgment)
+            for prop, sub in schema.get("properties", {}).items()
+        }
+    if schema_type == "array":
+        if name in EMPTY_LIST_KEYS:
+            return []
+        if name == "steps":
+            return list(MOCK_STEPS)
+        return [build_from_schema(name.rstrip("s"), schema.get("items", {}), root, judgment)]
+    if schema_type in ("integer", "number"):
+        return judgment["score"] if name == "score" else 0
+    if schema_type == "boolean":
+        return judgment["verdict"] == "yes"
+    if name == "verdict":
+        return judgment["verdict"]
+    if name == "reason":
+        return judgment["reason"]
+    return "Mock judge statement."
+
+
+def build_from_prompt(prompt: str, judgment: Dict[str, Any]) -> Dict[str, Any]:
+    """Infer the expected JSON keys from the output instructions at the end of the prompt"""
+    tail = prompt[-2000:]
+    keys = [key for key in KNOWN_KEYS if f'"{key}"' in tail]
+
+    output: Dict[str, Any] = {}
+    for key in keys:
+        if key == "steps":
+            output[key] = list(MOCK_STEPS)
+        elif key == "score":
+            output[key] = judgment["score"]
+        elif key == "reason":
+            output[key] = judgment["reason"]
+        elif key == "verdicts":
+            output[key] = [{"verdict": judgment["verdict"], "reason": judgment["reason"]}]
+        elif key in LIST_OF_TEXT_KEYS:
+            output[key] = ["Mock judge statement."]
+        elif key in EMPTY_LIST_KEYS:
+            output[key] = []
+    # GEval wants both score and reason even when only one is quoted in the example
+    if "score" in output:
+        output.setdefault("reason", judgment["reason"])
+    return output or {"reason": judgment["reason"]}
+
+
+def _message_text(messages: List[Dict[str, Any]]) -> str:
+    """Flatten chat messages (string or content-part lists) into one prompt"""
+    parts = []
+    for message in messages:
+        content = message.get("content")
+        if isinstance(content, list):
+            parts.extend(p.get("text", "") for p in content if isinstance(p, dict))
+        elif content:
+            parts.append(str(content))
+    return "\n".join(parts)
+
+
+def build_completion(request: Dict[str, Any], rules: List[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Build an OpenAI chat.completion response for a judge request"""
+    prompt = _message_text(request.get("messages", []))
+    judgment = judge_prompt(prompt, rules)
+
+    response_format = request.get("response_format") or {}
+    json_schema = (response_format.get("json_schema") or {}).get("schema")
+    if json_schema:
+        output = build_from_schema("root", json_schema, json_schema, judgment)
+    else:
+        output = build_from_prompt(prompt, judgment)
+    content = json.dumps(output, ensure_ascii=False)
+
+    logprobs = None
+    if request.get("logprobs"):
+        # A single certain score token, so GEval's weighted score equals the raw score
+        token = str(judgment["score"])
+        logprobs = {"content": [{
+            "token": token,
+            "logprob": 0.0,
+            "bytes": list(token.encode()),
+            "top_logprobs": [{"token": token, "logprob": 0.0, "bytes": list(token.encode())}]
+        }]}
+
+    prompt_tokens = estimate_tokens(prompt)
+    completion_tokens = estimate_tokens(content)
+    return {
+        "id": f"chatcmpl-mock-{hashlib.sha1(prompt.encode('utf-8')).hexdigest()[:12]}",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": request.get("model", "mock"),
+        "choices": [{
+            "index": 0,
+            "message": {"role": "assistant", "content": content, "refusal": None},
+            "logprobs": logprobs,
+            "finish_reason": "stop"
+        }],
+        "usage": {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens
+        }
+    }
+
+
+# =============================================================================
+# SERVER
+# =============================================================================
+
+class MockJudgeServer:
+    """aiohttp application serving an OpenAI-compatible chat completions API"""
+
+    def __init__(self, profile: str = None, rules: List[Dict[str, Any]] = None, seed: Optional[int] = None):
+        self.profile = profile or MOCK_JUDGE_CONFIG["profile"]
+        distribution, latency_ms, spread = MOCK_JUDGE_CONFIG["profiles"][self.profile]
+        self.latency = LatencyModel(distribution=distribution, latency_ms=latency_ms, spread=spread, seed=seed)
+        self.rules = rules
+        self.stats = {"completions": 0, "prompt_tokens": 0, "completion_tokens": 0}
+
+    def create_app(self) -> web.Application:
+        app = web.Application(client_max_size=16 * 1024 * 1024)
+        app.router.add_post("/v1/chat/completions", self.handle_completion)
+        app.router.add_get("/v1/models", self.handle_models)
+        return app
+
+    async def handle_completion(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        await asyncio.sleep(self.latency.sample_ms() / 1000)
+        completion = build_completion(body, self.rules)
+
+        self.stats["completions"] += 1
+        self.stats["prompt_tokens"] += completion["usage"]["prompt_tokens"]
+        self.stats["completion_tokens"] += completion["usage"]["completion_tokens"]
+        return web.json_response(completion)
+
+    async def handle_models(self, request: web.Request) -> web.Response:
+        return web.json_response({
+            "object": "list",
+            "data": [{"id": f"{MOCK_JUDGE_CONFIG['model_prefix']}-{name}", "object": "model", "owned_by": "mock"}
+                     for name in MOCK_JUDGE_CONFIG["profiles"]],
+            "profile": self.profile,
+            "stats": dict(self.stats)
+        })
+
+
+def _is_reachable(base_url: str) -> bool:
+    try:
+        with urllib.request.urlopen(f"{base_url}/models", timeout=1) as response:
+            return response.status == 200
+    except Exception:
+        return False
+
+
+def _serve_in_thread(server: MockJudgeServer, host: str, port: int) -> threading.Event:
+    ready = threading.Event()
+
+    def run():
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        runner = web.AppRunner(server.create_app())
+        loop.run_until_complete(runner.setup())
+        loop.run_until_complete(web.TCPSite(runner, host, port).start())
+        ready.set()
+        loop.run_forever()
+
+    threading.Thread(target=run, name="mock-judge-server", daemon=True).start()
+    return ready
+
+
+_started_servers: Dict[str, MockJudgeServer] = {}
+
+
+def ensure_mock_judge_server(model: str = "mock") -> str:
+    """Return the mock judge base URL, starting an in-process server if needed"""
+    cfg = MOCK_JUDGE_CONFIG
+    base_url = cfg["base_url"].rstrip("/")
+    if base_url in _started_servers or _is_reachable(base_url) or not cfg["auto_start"]:
+        return base_url
+
+    server = MockJudgeServer(profile=parse_profile(model))
+    ready = _serve_in_thread(server, cfg["host"], cfg["port"])
+    if not ready.wait(timeout=10):
+        raise RuntimeError(f"Mock judge server did not start on {cfg['host']}:{cfg['port']}")
+    _started_servers[base_url] = server
+    print(f"  Mock judge started on {base_url} (profile: {server.profile})")
+    return base_url
+
+
+def main():
+    """Main entry point"""
+    cfg = MOCK_JUDGE_CONFIG
+    parser = argparse.ArgumentParser(description="Local OpenAI-compatible mock judge")
+    parser.add_argument("--host", default=cfg["host"], help="Bind address")
+    parser.add_argument("--port", type=int, default=cfg["port"], help="Port to listen on")
+    parser.add_argument("--profile", choices=list(cfg["profiles"]), default=cfg["profile"],
+                        help="Latency profile")
+    parser.add_argument("--seed", type=int, default=None, help="Random seed for latency sampling")
+
+    args = parser.parse_args()
+
+    server = MockJudgeServer(profile=args.profile, seed=args.seed)
+    print(f"Mock judge listening on http://{args.host}:{args.port}/v1 (profile: {args.profile})")
+    web.run_app(server.create_app(), host=args.host, port=args.port, print=None)
+
+
+if __name__ == "__main__":
+    main()
@@ -18,9 +18,10 @@ import sys
 import json
 import asyncio
 import time
+import threading
 from datetime import datetime
 from typing import List, Dict, Any, Optional, Tuple
-from dataclasses import dataclass, asdict, field
+from dataclasses import dataclass, asdict, field, fields
 import requests
 
 # DeepEval imports
@@ -35,6 +36,17 @@ from multi_turn_test_cases import (
     ConversationTurn,
     generate_all_multi_turn_test_cases
 )
+from context_compaction import compact_metric_payload, summarize_token_savings
+from judge_usage import create_judge_model, measure_with_usage, summarize_judge_usage
+from latency_stats import summarize_latency
+from sampling import (
+    stratified_sample, summarize_pass_rate_ci, summarize_bootstrap_ci, summarize_score_histograms
+)
+from transport import CircuitBreaker, post_message, summarize_transport
+from hedging import LatencyTracker
+from history_store import record_export
+from artifact_store import write_results
+from columnar import results_frame, summarize_frame, export_columnar
 
 
 # =============================================================================
@@ -44,7 +56,7 @@ from multi_turn_test_cases import (
 class WorkflowCompletionMetric(GEval):
     """Metric for evaluating workflow completion"""
 
-    def __init__(self):
+    def __init__(self, model=EVALUATION_MODEL):
         super().__init__(
             name="Workflow Completion",
             criteria="""Evaluate if the conversation completed the emergency reporting workflow correctly.
@@ -74,7 +86,7 @@ class WorkflowCompletionMetric(GEval):
                 LLMTestCaseParams.ACTUAL_OUTPUT,
                 LLMTestCaseParams.EXPECTED_OUTPUT
             ],
-            model=EVALUATION_MODEL,
+            model=model,
             threshold=THRESHOLDS.g_eval
         )
 
@@ -82,7 +94,7 @@ class WorkflowCompletionMetric(GEval):
 class ConversationCoherenceMetric(GEval):
     """Metric for evaluating conversation coherence"""
 
-    def __init__(self):
+    def __init__(self, model=EVALUATION_MODEL):
         super().__init__(
             name="Conversation Coherence",
             criteria="""Evaluate the coherence of the multi-turn conversation.
@@ -101,7 +113,7 @@ class ConversationCoherenceMetric(GEval):
                 LLMTestCaseParams.INPUT,
                 LLMTestCaseParams.ACTUAL_OUTPUT
             ],
-            model=EVALUATION_MODEL,
+            model=model,
             threshold=THRESHOLDS.g_eval
         )
 
@@ -109,7 +121,7 @@ class ConversationCoherenceMetric(GEval):
 class StateTransitionMetric(GEval):
     """Metric for evaluating state transitions"""
 
-    def __init__(self):
+    def __init__(self, model=EVALUATION_MODEL):
         super().__init__(
             name="State Transition Accuracy",
             criteria="""Evaluate if the chatbot correctly transitions between conversation states.
@@ -134,7 +146,7 @@ class StateTransitionMetric(GEval):
                 LLMTestCaseParams.ACTUAL_OUTPUT,
                 LLMTestCaseParams.CONTEXT
             ],
-            model=EVALUATION_MODEL,
+            model=model,
             threshold=THRESHOLDS.g_eval
         )
 
@@ -142,7 +154,7 @@ class StateTransitionMetric(GEval):
 class InformationExtractionMetric(GEval):
     """Metric for evaluating information extraction across turns"""
 
-    def __init__(self):
+    def __init__(self, model=EVALUATION_MODEL):
         super().__init__(
             name="Information Extraction Accuracy",
             criteria="""Evaluate if the chatbot correctly extracted all required information.
@@ -166,7 +178,7 @@ class InformationExtractionMetric(GEval):
                 LLMTestCaseParams.ACTUAL_OUTPUT,
                 LLMTestCaseParams.EXPECTED_OUTPUT
             ],
-            model=EVALUATION_MODEL,
+            model=model,
             threshold=THRESHOLDS.g_eval
         )
 
@@ -174,7 +186,7 @@ class InformationExtractionMetric(GEval):
 class UserCorrectionHandlingMetric(GEval):
     """Metric for evaluating how corrections are handled"""
 
-    def __init__(self):
+    def __init__(self, model=EVALUATION_MODEL):
         super().__init__(
             name="Correction Handling",
             criteria="""Evaluate how well the chatbot handles user corrections.
@@ -194,7 +206,7 @@ class UserCorrectionHandlingMetric(GEval):
                 LLMTestCaseParams.ACTUAL_OUTPUT,
                 LLMTestCaseParams.CONTEXT
             ],
-            model=EVALUATION_MODEL,
+            model=model,
             threshold=THRESHOLDS.g_eval
         )
 
@@ -202,7 +214,7 @@ class UserCorrectionHandlingMetric(GEval):
 class FirstAidGuidanceQualityMetric(GEval):
     """Metric for evaluating first aid guidance in conversation"""
 
-    def __init__(self):
+    def __init__(self, model=EVALUATION_MODEL):
         super().__init__(
             name="First Aid Guidance Quality",
             criteria="""Evaluate the quality of first aid guidance provided during the conversation.
@@ -222,7 +234,7 @@ class FirstAidGuidanceQualityMetric(GEval):
                 LLMTestCaseParams.ACTUAL_OUTPUT,
                 LLMTestCaseParams.CONTEXT
             ],
-            model=EVALUATION_MODEL,
+            model=model,
             threshold=THRESHOLDS.g_eval
         )
 
@@ -265,6 +277,108 @@ class MultiTurnEvaluationResult:
     timestamp: str
     errors: List[str]
     conversation_log: List[Dict[str, str]]
+    context_tokens: Dict[str, Dict[str, int]] = field(default_factory=dict)
+    judge_usage: List[Dict[str, Any]] = field(default_factory=list)
+    chatbot_latency_ms: float = 0.0  # Sum of per-turn /api/chat/message round trips
+    judge_latency_ms: float = 0.0  # Sum of all metric.measure() calls
+    metric_latency_ms: Dict[str, float] = field(default_factory=dict)
+    overhead_ms: float = 0.0  # Harness time incl. inter-turn delays and cleanup
+    infra_failure: bool = False  # Chatbot unreachable after retries; conversation not judged
+    transport_retries: int = 0
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "MultiTurnEvaluationResult":
+        """Rebuild a result, including its TurnResults, from its exported JSON form"""
+        names = {f.name for f in fields(cls)}
+        turn_names = {f.name for f in fields(TurnResult)}
+        values = {key: value for key, value in data.items() if key in names}
+        values["turns"] = [
+            TurnResult(**{key: value for key, value in turn.items() if key in turn_names})
+            for turn in data.get("turns", [])
+        ]
+        return cls(**values)
+
+
+@dataclass
+class CollectedConversation:
+    """Transcript of a multi-turn case, captured before judging"""
+    test_case_id: str
+    session_id: str
+    timestamp: str
+    turns: List[TurnResult]
+    conversation_log: List[Dict[str, str]]
+    collect_ms: float  # Wall time of the whole conversation
+    ticket_id: Optional[str] = None
+    ticket_created: bool = False
+    infra_failure: bool = False
+    transport_retries: int = 0
+    errors: List[str] = field(default_factory=list)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CollectedConversation":
+        names = {f.name for f in fields(cls)}
+        turn_names = {f.name for f in fields(TurnResult)}
+        values = {key: value for key, value in data.items() if key in names}
+        values["turns"] = [
+            TurnResult(**{key: value for key, value in turn.items() if key in turn_names})
+            for turn in data.get("turns", [])
+        ]
+        return cls(**values)
+
+
+def summarize_multi_turn_results(
+    results: List[MultiTurnEvaluationResult],
+    circuit_breaker: Dict[str, Any] = None,
+    prefix_sharing: Dict[str, Any] = None
+) -> Dict[str, Any]:
+    """Summary statistics for a list of conversation results.
+
+    Infra failures (chatbot unreachable) are counted separately and left out
+    of pass, completion and ticket rates.
+    """
+
+    if not results:
+        return {}
+
+    all_results = results
+    results = [r for r in all_results if not r.infra_failure]
+    frame = results_frame(all_results)
+    stats = summarize_frame(frame)
+    judged = frame[~frame["infra_failure"]]
+    total, passed = stats["judged"], stats["passed"]
+    workflows_completed = int(judged["workflow_completed"].sum())
+    tickets_created = int(judged["ticket_created"].sum())
+
+    def rate(count: int) -> float:
+        return count / total * 100 if total else 0.0
+
+    avg_turns = float(judged["completed_turns"].mean()) if total else 0.0
+    avg_duration = float(judged["total_duration_ms"].mean()) if total else 0.0
+
+    return {
+        "total_conversations": len(all_results),
+        "passed": passed,
+        "failed": total - passed,
+        "infra_failures": len(all_results) - total,
+        "pass_rate": rate(passed),
+        "workflows_completed": workflows_completed,
+        "workflow_completion_rate": rate(workflows_completed),
+        "tickets_created": tickets_created,
+        "ticket_creation_rate": rate(tickets_created),
+        "average_turns": avg_turns,
+        "average_duration_ms": avg_duration,
+        "average_metrics": stats["average_metrics"],
+        "category_pass_rates": stats["category_pass_rates"],
+        "pass_rate_ci": summarize_pass_rate_ci(results, passed_key=lambda r: r.overall_passed),
+        "bootstrap_ci": summarize_bootstrap_ci(judged),
+        "score_histograms": summarize_score_histograms(judged),
+        "transport": summarize_transport(all_results, circuit_breaker),
+        "prefix_sharing": prefix_sharing,
+        "context_token_savings": summarize_token_savings(results),
+        "judge_usage": summarize_judge_usage(all_results),
+        "latency": summarize_latency(all_results),
+        "evaluation_time": datetime.now().isoformat()
+    }
 
 
 # =============================================================================
@@ -283,32 +397,54 @@ class MultiTurnEvaluator:
         self.model = model
         self.session_counter = 0
         self.results: List[MultiTurnEvaluationResult] = []
+        self.judge_model = create_judge_model(model)
+        self.breaker = CircuitBreaker(chatbot_url)
+        self.prefix_report: Optional[Dict[str, Any]] = None
+        # Per-turn latencies drive each turn's timeout budget
+        self.latency = LatencyTracker()
+
+        self._session_lock = threading.Lock()
 
         # Initialize metrics
-        self.metrics = {
-            "workflow_completion": WorkflowCompletionMetric(),
-            "conversation_coherence": ConversationCoherenceMetric(),
-            "state_transition": StateTransitionMetric(),
-            "information_extraction": InformationExtractionMetric(),
-            "correction_handling": UserCorrectionHandlingMetric(),
-            "first_aid_guidance": FirstAidGuidanceQualityMetric(),
+        self.metrics = self.create_metrics()
+
+    def create_metrics(self) -> Dict[str, Any]:
+        """Fresh metric instances; concurrent judges each need their own"""
+        return {
+            "workflow_completion": WorkflowCompletionMetric(self.judge_model),
+            "conversation_coherence": ConversationCoherenceMetric(self.judge_model),
+            "state_transition": StateTransitionMetric(self.judge_model),
+            "information_extraction": InformationExtractionMetric(self.judge_model),
+            "correction_handling": UserCorrectionHandlingMetric(self.judge_model),
+            "first_aid_guidance": FirstAidGuidanceQualityMetric(self.judge_model),
         }
 
     def generate_session_id(self) -> str:
         """Generate unique session ID"""
-        self.session_counter += 1
-        return f"multi_eval_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{self.session_counter}"
+        # Conversations may be collected from several threads at once
+        with self._session_lock:
+            self.session_counter += 1
+            counter = self.session_counter
+        return f"multi_eval_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{counter}"
 
     def send_message(
         self,
         message: str,
         session_id: str,
         is_authenticated: bool = False,
-        user_id: Optional[str] = None
+        user_id: Optional[str] = None,
+        turn_number: int = None
     ) -> Tuple[Dict[str, Any], float]:
-        """Send message to chatbot and get response with timing"""
+        """Send message to chatbot and get response with timing.
+
+        Only transport errors that cannot have reached the session state are
+        retried (see post_message's stateful mode); if they persist, or a read
+        timeout leaves the turn's effect unknown, the response carries
+        "infra_error": True. "attempts" is the number of requests made. The
+        timeout is budgeted from latencies observed for the same turn number.
+        """
 
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         payload = {
             "message": message,
@@ -320,23 +456,19 @@ class MultiTurnEvaluator:
         if is_authenticated and user_id:
             headers["Authorization"] = f"Bearer {user_id}"
 
-        try:
-            response = requests.post(
-                f"{self.chatbot_url}/api/chat/message",
-                json=payload,
-                headers=headers,
-                timeout=60
-            )
-            response.raise_for_status()
-            result = response.json()
-        except requests.exceptions.RequestException as e:
-            result = {
-                "success": False,
-                "error": str(e),
-                "data": {"response": f"Error: {str(e)}"}
-            }
+        result, attempts = post_message(
+            f"{self.chatbot_url}/api/chat/message",
+            payload,
+            headers,
+            timeout=self.latency.timeout_budget(60, key=turn_number),
+            breaker=self.breaker,
+            stateful=True
+        )
+        result["attempts"] = attempts
 
-        duration_ms = (time.time() - start_time) * 1000
+        duration_ms = (time.perf_counter() - start_time) * 1000
+        if not result.get("infra_error"):
+            self.latency.add(duration_ms, key=turn_number)
 
         return result, duration_ms
 
@@ -350,6 +482,39 @@ class MultiTurnEvaluator:
         except:
             pass
 
+    def clone_session(
+        self,
+        session_id: str,
+        target_session_id: str,
+        is_authenticated: bool = False,
+        user_id: Optional[str] = None
+    ) -> Optional[bool]:
+        """Fork a backend session at its current point.
+
+        True on success, False if the source session has no saved state, and
+        None if the backend has no clone endpoint or has cloning disabled
+        (ALLOW_SESSION_CLONE). Authenticated sessions are cloned as their
+        owner, so the request carries the same Authorization header.
+        """
+        headers = {"Authorization": f"Bearer {user_id}"} if is_authenticated and user_id else {}
+        try:
+            response = requests.post(
+                f"{self.chatbot_url}/api/chat/session/{session_id}/clone",
+                json={"targetSessionId": target_session_id},
+                headers=headers,
+                timeout=30
+            )
+        except requests.exceptions.RequestException:
+            return False
+        if response.status_code == 200:
+            return True
+        if response.status_code in (404, 405) and "json" not in response.headers.get("Content-Type", ""):
+            # Express answers unknown routes with an HTML 404
+            return None
+        if response.status_code == 403 and "disabled" in response.text:
+            return None
+        return False
+
     def validate_turn(
         self,
         turn: ConversationTurn,
@@ -425,21 +590,79 @@ class MultiTurnEvaluator:
 
         return passed, failed
 
-    async def evaluate_conversation(
+    def build_turn_result(
+        self,
+        turn_number: int,
+        turn: ConversationTurn,
+        response: Dict[str, Any],
+        duration_ms: float,
+        conversation_log: List[Dict[str, str]],
+        ticket_id: Optional[str] = None
+    ) -> Tuple[TurnResult, Optional[str]]:
+        """Log and validate one answered turn.
+
+        Appends the exchange to conversation_log; returns the TurnResult and
+        the ticket ID seen so far in the conversation.
+        """
+
+        bot_response = response.get("data", {}).get("response", "Error: No response")
+
+        # Log conversation
+        conversation_log.append({"role": "user", "message": turn.user_message})
+        conversation_log.append({"role": "bot", "message": bot_response})
+
+        # Validate turn
+        passed, failed = self.validate_turn(turn, response, conversation_log)
+
+        # Check for ticket creation
+        if response.get("data", {}).get("ticketId"):
+            ticket_id = response["data"]["ticketId"]
+
+        # Determine actual next step (simplified)
+        actual_next_step = None
+        if "địa chỉ" in bot_response.lower():
+            actual_next_step = "location"
+        elif "số điện thoại" in bot_response.lower():
+            actual_next_step = "phone"
+        elif "bao nhiêu người" in bot_response.lower():
+            actual_next_step = "people"
+        elif "xác nhận" in bot_response.lower():
+            actual_next_step = "confirmation"
+        elif ticket_id:
+            actual_next_step = "complete"
+
+        turn_result = TurnResult(
+            turn_number=turn_number,
+            user_message=turn.user_message,
+            bot_response=bot_response,
+            expected_actions=turn.expected_bot_actions,
+            expected_next_step=turn.expected_next_step,
+            actual_next_step=actual_next_step,
+            extractions=turn.expected_extractions,
+            validation_passed=passed,
+            validation_failed=failed,
+            duration_ms=duration_ms,
+            errors=[]
+        )
+        return turn_result, ticket_id
+
+    def collect_conversation(
         self,
         test_case: MultiTurnTestCase,
         verbose: bool = False
-    ) -> MultiTurnEvaluationResult:
-        """Evaluate a complete multi-turn conversation"""
+    ) -> CollectedConversation:
+        """Play a conversation against the chatbot and validate each turn (no judging)"""
 
         session_id = self.generate_session_id()
         start_time = datetime.now()
+        start_perf = time.perf_counter()
         turn_results = []
         conversation_log = []
         errors = []
         ticket_id = None
-        workflow_completed = False
         ticket_created = False
+        infra_failure = False
+        transport_retries = 0
 
         if verbose:
             print(f"\n  Evaluating: {test_case.name}")
@@ -457,49 +680,24 @@ class MultiTurnEvaluator:
                     message=turn.user_message,
                     session_id=session_id,
                     is_authenticated=test_case.is_authenticated,
-                    user_id="test_user" if test_case.is_authenticated else None
+                    user_id="test_user" if test_case.is_authenticated else None,
+                    turn_number=i + 1
                 )
 
-                bot_response = response.get("data", {}).get("response", "Error: No response")
-
-                # Log conversation
-                conversation_log.append({"role": "user", "message": turn.user_message})
-                conversation_log.append({"role": "bot", "message": bot_response})
-
-                # Validate turn
-                passed, failed = self.validate_turn(turn, response, conversation_log)
-
-                # Check for ticket creation
-                if response.get("data", {}).get("ticketId"):
-                    ticket_id = response["data"]["ticketId"]
-                    ticket_created = True
-
-                # Determine actual next step (simplified)
-                actual_next_step = None
-                if "địa chỉ" in bot_response.lower():
-                    actual_next_step = "location"
-                elif "số điện thoại" in bot_response.lower():
-                    actual_next_step = "phone"
-                elif "bao nhiêu người" in bot_response.lower():
-                    actual_next_step = "people"
-                elif "xác nhận" in bot_response.lower():
-                    actual_next_step = "confirmation"
-                elif ticket_id:
-                    actual_next_step = "complete"
-
-                turn_result = TurnResult(
-                    turn_number=i + 1,
-                    user_message=turn.user_message,
-                    bot_response=bot_response,
-                    expected_actions=turn.expected_bot_actions,
-                    expected_next_step=turn.expected_next_step,
-                    actual_next_step=actual_next_step,
-                    extractions=turn.expected_extractions,
-                    validation_passed=passed,
-                    validation_failed=failed,
-                    duration_ms=duration_ms,
-                    errors=[]
+                transport_retries += response.get("attempts", 1) - 1
+
+                if response.get("infra_error"):
+                    # The session state on the server is unknown; stop and do not judge
+                    infra_failure = True
+                    errors.append(f"Infra failure at turn {i+1} after "
+                                  f"{response.get('attempts', 1)} attempts: {response.get('error')}")
+                    break
+
+                turn_result, ticket_id = self.build_turn_result(
+                    i + 1, turn, response, duration_ms, conversation_log, ticket_id
                 )
+                ticket_created = ticket_created or ticket_id is not None
+                passed, failed = turn_result.validation_passed, turn_result.validation_failed
 
                 turn_results.append(turn_result)
 
@@ -508,7 +706,7 @@ class MultiTurnEvaluator:
                     print(f"      {status} {len(passed)}/{len(passed)+len(failed)} validations passed")
 
                 # Small delay between turns
-                await asyncio.sleep(0.5)
+                time.sleep(0.5)
 
         except Exception as e:
             errors.append(f"Conversation error: {str(e)}")
@@ -517,36 +715,74 @@ class MultiTurnEvaluator:
             # Clear session
             self.clear_session(session_id)
 
+        return CollectedConversation(
+            test_case_id=test_case.id,
+            session_id=session_id,
+            timestamp=start_time.isoformat(),
+            turns=turn_results,
+            conversation_log=conversation_log,
+            collect_ms=(time.perf_counter() - start_perf) * 1000,
+            ticket_id=ticket_id,
+            ticket_created=ticket_created,
+            infra_failure=infra_failure,
+            transport_retries=transport_retries,
+            errors=errors
+        )
+
+    def judge_conversation(
+        self,
+        test_case: MultiTurnTestCase,
+        collected: CollectedConversation,
+        metrics: Dict[str, Any] = None
+    ) -> MultiTurnEvaluationResult:
+        """Score a collected transcript; metrics defaults to the evaluator's own"""
+
+        start_perf = time.perf_counter()
+        metrics = metrics if metrics is not None else self.metrics
+        turn_results = collected.turns
+        conversation_log = collected.conversation_log
+        errors = list(collected.errors)
+
         # Calculate workflow completion
         workflow_completed = (
             len(turn_results) == len(test_case.turns) and
-            ticket_created == test_case.should_create_ticket
+            collected.ticket_created == test_case.should_create_ticket
         )
 
         # Calculate metrics scores
         metric_scores = {}
-
-        # Build full conversation text for metric evaluation
-        full_conversation = "\n".join([
-            f"{'User' if log['role'] == 'user' else 'Bot'}: {log['message']}"
-            for log in conversation_log
-        ])
+        context_tokens = {}
+        judge_usage = []
 
         expected_output = json.dumps(test_case.expected_final_state, ensure_ascii=False)
 
-        # Evaluate with each metric
-        for metric_name, metric in self.metrics.items():
+        # Evaluate with each metric, sending only the context it needs
+        for metric_name, metric in ([] if collected.infra_failure else metrics.items()):
             try:
+                payload = compact_metric_payload(
+                    metric_name,
+                    getattr(metric, "evaluation_params", []),
+                    test_case,
+                    conversation_log,
+                    expected_output
+                )
+                context_tokens[metric_name] = {
+                    "baseline_tokens": payload.baseline_tokens,
+                    "compacted_tokens": payload.compacted_tokens
+                }
                 test_case_for_metric = LLMTestCase(
-                    input=full_conversation,
+                    input=payload.input,
                     actual_output=conversation_log[-1]["message"] if conversation_log else "",
                     expected_output=expected_output,
-                    context=[json.dumps(asdict(test_case), ensure_ascii=False)]
+                    context=payload.context
                 )
-                metric.measure(test_case_for_metric)
+                usage = measure_with_usage(metric, test_case_for_metric, metric_name)
+                judge_usage.append(asdict(usage))
                 metric_scores[metric_name] = metric.score
             except Exception as e:
                 errors.append(f"Metric {metric_name} error: {str(e)}")
+                if getattr(e, "judge_usage", None):
+                    judge_usage.append(asdict(e.judge_usage))
                 metric_scores[metric_name] = 0.0
 
         # Determine overall pass
@@ -557,9 +793,13 @@ class MultiTurnEvaluator:
             all(score >= multi_turn_threshold for score in metric_scores.values())
         )
 
-        total_duration = (datetime.now() - start_time).total_seconds() * 1000
+        # Time between collecting and judging (two-phase runs) is not counted
+        total_duration = collected.collect_ms + (time.perf_counter() - start_perf) * 1000
+        chatbot_latency_ms = sum(t.duration_ms for t in turn_results)
+        metric_latency_ms = {u["metric"]: u["latency_ms"] for u in judge_usage}
+        judge_latency_ms = sum(metric_latency_ms.values())
 
-        result = MultiTurnEvaluationResult(
+        return MultiTurnEvaluationResult(
             test_case_id=test_case.id,
             name=test_case.name,
             category=test_case.category,
@@ -567,16 +807,34 @@ class MultiTurnEvaluator:
             total_turns=len(test_case.turns),
             completed_turns=len(turn_results),
             workflow_completed=workflow_completed,
-            ticket_created=ticket_created,
-            ticket_id=ticket_id,
+            ticket_created=collected.ticket_created,
+            ticket_id=collected.ticket_id,
             metrics=metric_scores,
             overall_passed=overall_passed,
             total_duration_ms=total_duration,
-            timestamp=start_time.isoformat(),
+            timestamp=collected.timestamp,
             errors=errors,
-            conversation_log=conversation_log
+            conversation_log=conversation_log,
+            context_tokens=context_tokens,
+            judge_usage=judge_usage,
+            chatbot_latency_ms=chatbot_latency_ms,
+            judge_latency_ms=judge_latency_ms,
+            metric_latency_ms=metric_latency_ms,
+            overhead_ms=max(total_duration - chatbot_latency_ms - judge_latency_ms, 0.0),
+            infra_failure=collected.infra_failure,
+            transport_retries=collected.transport_retries
         )
 
+    async def evaluate_conversation(
+        self,
+        test_case: MultiTurnTestCase,
+        verbose: bool = False
+    ) -> MultiTurnEvaluationResult:
+        """Evaluate a complete multi-turn conversation"""
+
+        collected = self.collect_conversation(test_case, verbose)
+        result = self.judge_conversation(test_case, collected)
+
         self.results.append(result)
 
         return result
@@ -586,17 +844,24 @@ class MultiTurnEvaluator:
         test_cases: List[MultiTurnTestCase],
         categories: List[str] = None,
         max_cases: int = None,
-        verbose: bool = True
+        verbose: bool = True,
+        seed: int = None,
+        share_prefixes: bool = False
     ) -> List[MultiTurnEvaluationResult]:
-        """Run evaluation on multiple multi-turn test cases"""
+        """Run evaluation on multiple multi-turn test cases.
+
+        With share_prefixes=True, openings shared by several cases are sent
+        once and the backend session is forked where they diverge (see
+        prefix_sharing.py); all cases are collected before judging starts.
+        """
 
         # Filter by categories
         if categories:
             test_cases = [tc for tc in test_cases if tc.category in categories]
 
-        # Limit cases
+        # Limit cases (stratified by category)
         if max_cases:
-            test_cases = test_cases[:max_cases]
+            test_cases = stratified_sample(test_cases, max_cases, seed=seed)
 
         print(f"\n{'='*60}")
         print(f"MULTI-TURN CONVERSATION EVALUATION")
@@ -606,12 +871,28 @@ class MultiTurnEvaluator:
         print(f"{'='*60}\n")
 
         self.results = []
+        self.prefix_report = None
+        collected = {}
+
+        if share_prefixes:
+            # Imported here: prefix_sharing builds on this module
+            from prefix_sharing import PrefixSharedRunner
+            runner = PrefixSharedRunner(self, verbose)
+            collected = runner.run(test_cases)
+            self.prefix_report = runner.report()
+            print(f"  [PREFIX] {self.prefix_report['chatbot_calls']} chatbot calls for "
+                  f"{self.prefix_report['case_turns']} case turns "
+                  f"({self.prefix_report['saved_pct']:.0f}% saved, {self.prefix_report['forks']} forks)")
 
         for i, test_case in enumerate(test_cases):
             if verbose:
                 print(f"[{i+1}/{len(test_cases)}] {test_case.id}: {test_case.name}")
 
-            result = await self.evaluate_conversation(test_case, verbose)
+            if test_case.id in collected:
+                result = self.judge_conversation(test_case, collected[test_case.id])
+                self.results.append(result)
+            else:
+                result = await self.evaluate_conversation(test_case, verbose)
 
             if verbose:
                 status = "" if result.overall_passed else ""
@@ -622,66 +903,14 @@ class MultiTurnEvaluator:
 
     def get_summary(self) -> Dict[str, Any]:
         """Get evaluation summary"""
+        return summarize_multi_turn_results(self.results, self.breaker.stats(), self.prefix_report)
 
-        if not self.results:
-            return {}
-
-        total = len(self.results)
-        passed = sum(1 for r in self.results if r.overall_passed)
-        workflows_completed = sum(1 for r in self.results if r.workflow_completed)
-        tickets_created = sum(1 for r in self.results if r.ticket_created)
-
-        # Average metric scores
-        metric_scores = {}
-        for result in self.results:
-            for metric, score in result.metrics.items():
-                if metric not in metric_scores:
-                    metric_scores[metric] = []
-                metric_scores[metric].append(score)
-
-        avg_metrics = {
-            name: sum(scores) / len(scores)
-            for name, scores in metric_scores.items()
-        }
-
-        # Category breakdown
-        category_stats = {}
-        for result in self.results:
-            if result.category not in category_stats:
-                category_stats[result.category] = {"passed": 0, "total": 0}
-            category_stats[result.category]["total"] += 1
-            if result.overall_passed:
-                category_stats[result.category]["passed"] += 1
-
-        category_pass_rates = {
-            cat: data["passed"] / data["total"] * 100
-            for cat, data in category_stats.items()
-        }
-
-        # Average turns per conversation
-        avg_turns = sum(r.completed_turns for r in self.results) / total
-
-        # Average duration
-        avg_duration = sum(r.total_duration_ms for r in self.results) / total
-
-        return {
-            "total_conversations": total,
-            "passed": passed,
-            "failed": total - passed,
-            "pass_rate": passed / total * 100,
-            "workflows_completed": workflows_completed,
-            "workflow_completion_rate": workflows_completed / total * 100,
-            "tickets_created": tickets_created,
-            "ticket_creation_rate": tickets_created / total * 100,
-            "average_turns": avg_turns,
-            "average_duration_ms": avg_duration,
-            "average_metrics": avg_metrics,
-            "category_pass_rates": category_pass_rates,
-            "evaluation_time": datetime.now().isoformat()
-        }
-
-    def export_results(self, filename: str = "multi_turn_evaluation_results.json"):
-        """Export results to JSON"""
+    def export_results(
+        self,
+        filename: str = "multi_turn_evaluation_results.json",
+        extra_summary: Dict[str, Any] = None
+    ):
+        """Export results to .json or (compressed) .jsonl; extra_summary keys (e.g. shard) are added to the summary"""
 
         # Convert dataclasses to dicts
         results_data = []
@@ -692,13 +921,14 @@ class MultiTurnEvaluator:
             results_data.append(result_dict)
 
         data = {
-            "summary": self.get_summary(),
+            "summary": {**self.get_summary(), **(extra_summary or {})},
             "results": results_data
         }
 
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2, default=str)
+        write_results(filename, data["summary"], data["results"])
 
+        record_export("multi_turn", filename, data["summary"], results_data)
+        export_columnar("multi_turn", filename, self.results)
         print(f"Results exported to {filename}")
 
 
@@ -714,18 +944,18 @@ async def main():
     parser.add_argument("--quick", action="store_true", help="Quick evaluation (10 cases)")
     parser.add_argument("--category", type=str, help="Specific category to evaluate")
     parser.add_argument("--max-cases", type=int, help="Maximum cases to run")
+    parser.add_argument("--seed", type=int, default=42, help="Seed for stratified sampling")
     parser.add_argument("--chatbot-url", type=str, default="http://localhost:5000")
     parser.add_argument("--output", type=str, default="multi_turn_evaluation_results.json")
     parser.add_argument("--verbose", action="store_true", default=True)
 
     args = parser.parse_args()
 
-    # Generate test cases
-    print("Generating multi-turn test cases...")
-    test_cases = generate_all_multi_turn_test_cases()
+    # Generate test cases (only the requested category's generator runs)
+    categories = [args.category] if args.category else None
+    test_cases = generate_all_multi_turn_test_cases(categories=categories)
 
     # Apply filters
-    categories = [args.category] if args.category else None
     max_cases = args.max_cases or (10 if args.quick else None)
 
     # Run evaluation
@@ -734,7 +964,8 @@ async def main():
         test_cases=test_cases,
         categories=categories,
         max_cases=max_cases,
-        verbose=args.verbose
+        verbose=args.verbose,
+        seed=args.seed
     )
 
     # Print summary
@@ -743,14 +974,26 @@ async def main():
     print("MULTI-TURN EVALUATION SUMMARY")
     print(f"{'='*60}")
     print(f"Total Conversations: {summary['total_conversations']}")
-    print(f"Passed: {summary['passed']} ({summary['pass_rate']:.1f}%)")
+    overall_ci = summary['pass_rate_ci']['overall']
+    print(f"Passed: {summary['passed']} ({summary['pass_rate']:.1f}%, "
+          f"{summary['pass_rate_ci']['confidence']:.0%} CI {overall_ci['ci_low']:.1f}-{overall_ci['ci_high']:.1f}%)")
     print(f"Workflow Completion: {summary['workflow_completion_rate']:.1f}%")
     print(f"Ticket Creation: {summary['ticket_creation_rate']:.1f}%")
     print(f"Average Turns: {summary['average_turns']:.1f}")
     print(f"Average Duration: {summary['average_duration_ms']:.0f}ms")
+    chatbot_latency = summary['latency']['chatbot']['overall']
+    print(f"Chatbot Latency (per conversation): p50 {chatbot_latency['p50_ms']:.0f}ms, "
+          f"p90 {chatbot_latency['p90_ms']:.0f}ms, p99 {chatbot_latency['p99_ms']:.0f}ms")
     print(f"\nMetric Scores:")
     for metric, score in summary.get('average_metrics', {}).items():
         print(f"  - {metric}: {score:.2f}")
+    print(f"\nJudge Context Tokens Saved:")
+    for metric, usage in summary.get('context_token_savings', {}).items():
+        print(f"  - {metric}: {usage['saved_tokens']:,} ({usage['saved_pct']:.1f}%)")
+    usage_total = summary['judge_usage']['total']
+    print(f"\nJudge Usage: {usage_total['prompt_tokens']:,} prompt + "
+          f"{usage_total['completion_tokens']:,} completion tokens, "
+          f"${usage_total['cost_usd']:.4f}")
     print(f"{'='*60}\n")
 
     # Export results
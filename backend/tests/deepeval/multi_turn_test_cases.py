@@ -30,7 +30,7 @@ Test Scenarios:
 """
 
 import random
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple, Callable, Iterable, Iterator
 from dataclasses import dataclass, field
 from config import VALID_PHONE_PREFIXES, HCMC_DISTRICTS, EMERGENCY_TYPES
 
@@ -59,6 +59,11 @@ class MultiTurnTestCase:
     should_create_ticket: bool = True
     metadata: Dict[str, Any] = field(default_factory=dict)
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "MultiTurnTestCase":
+        """Rebuild a test case, including its turns, from its exported JSON form"""
+        return cls(**{**data, "turns": [ConversationTurn(**turn) for turn in data["turns"]]})
+
 
 def generate_phone() -> str:
     """Generate a valid Vietnamese phone number"""
@@ -1217,30 +1222,48 @@ def generate_edge_case_flows() -> List[MultiTurnTestCase]:
     return test_cases
 
 
-def generate_all_multi_turn_test_cases() -> List[MultiTurnTestCase]:
-    """Generate all multi-turn conversation test cases"""
-    all_cases = []
+# =============================================================================
+# GENERATOR REGISTRY
+# =============================================================================
 
+# (console label, category of its conversations, generator), in corpus order
+MULTI_TURN_GENERATORS: List[Tuple[str, str, Callable[[], List[MultiTurnTestCase]]]] = [
+    ("Fire emergency flows", "fire_emergency_flow", generate_fire_emergency_flows),
+    ("Medical emergency flows", "medical_emergency_flow", generate_medical_emergency_flows),
+    ("Security emergency flows", "security_emergency_flow", generate_security_emergency_flows),
+    ("User correction flows", "user_correction_flow", generate_user_correction_flows),
+    ("Authenticated user flows", "authenticated_user_flow", generate_authenticated_user_flows),
+    ("Edge case flows", "edge_case_flow", generate_edge_case_flows),
+]
+
+
+def iter_multi_turn_test_cases(
+    categories: Optional[Iterable[str]] = None,
+    seed: Optional[int] = None,
+    verbose: bool = True
+) -> Iterator[MultiTurnTestCase]:
+    """Yield the conversations of the given categories (all when None), running only their generators.
+
+    With a seed, each generator is seeded separately, as in iter_test_cases.
+    """
+    wanted = set(categories) if categories else None
+    for label, category, generator in MULTI_TURN_GENERATORS:
+        if wanted is not None and category not in wanted:
+            continue
+        if seed is not None:
+            random.seed(f"{seed}:{generator.__name__}")
+        if verbose:
+            print(f"  - {label}...")
+        yield from generator()
+
+
+def generate_all_multi_turn_test_cases(
+    seed: Optional[int] = None,
+    categories: Optional[Iterable[str]] = None
+) -> List[MultiTurnTestCase]:
+    """Generate the multi-turn conversation test cases, optionally only some categories"""
     print("Generating multi-turn test cases...")
-
-    print("  - Fire emergency flows...")
-    all_cases.extend(generate_fire_emergency_flows())
-
-    print("  - Medical emergency flows...")
-    all_cases.extend(generate_medical_emergency_flows())
-
-    print("  - Security emergency flows...")
-    all_cases.extend(generate_security_emergency_flows())
-
-    print("  - User correction flows...")
-    all_cases.extend(generate_user_correction_flows())
-
-    print("  - Authenticated user flows...")
-    all_cases.extend(generate_authenticated_user_flows())
-
-    print("  - Edge case flows...")
-    all_cases.extend(generate_edge_case_flows())
-
+    all_cases = list(iter_multi_turn_test_cases(categories, seed))
     print(f"\nTotal multi-turn test cases: {len(all_cases)}")
 
     return all_cases
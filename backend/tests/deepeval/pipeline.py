@@ -0,0 +1,248 @@
+"""
+Pipelined Evaluation Stages
+===========================
+
+This module runs an evaluation as a chain of stages connected by bounded
+asyncio queues, so judging case k overlaps collecting case k+1 instead of
+waiting for it.
+
+Features:
+- A source ("generate") stage feeding any number of worker stages
+- Per-stage worker counts; blocking stage functions run on the stage's own
+  thread pool, cheap ones (e.g. aggregation) inline on the event loop
+- Per-worker state via a setup callable (e.g. private metric instances)
+- Backpressure: a full queue blocks the stage upstream of it
+- Metrics that show the bottleneck: per-stage utilisation (busy time over
+  workers x wall time), time starved for input, time blocked on a full
+  downstream queue, and sampled queue depths
+"""
+
+import time
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import List, Dict, Any, Callable, Iterable, Optional
+
+from config import PIPELINE_CONFIG
+
+
+# Marks the end of a stage's input
+_DONE = object()
+
+
+@dataclass
+class Stage:
+    """One step of the pipeline: fn(item, state) -> item for the next stage.
+
+    state is what setup() returned for the worker running the call (None
+    without setup). A stage's output is dropped if it is the last stage.
+    """
+    name: str
+    fn: Callable[[Any, Any], Any]
+    workers: int = 1
+    setup: Optional[Callable[[], Any]] = None
+    inline: bool = False  # Run on the event loop; only for steps that never block
+
+
+class _StageStats:
+    def __init__(self, workers: int):
+        self.workers = workers
+        self.items = 0
+        self.busy_s = 0.0
+        self.starved_s = 0.0  # Waiting for input
+        self.blocked_s = 0.0  # Waiting for room downstream
+
+    def report(self, wall_s: float) -> Dict[str, Any]:
+        capacity = self.workers * wall_s
+        return {
+            "workers": self.workers,
+            "items": self.items,
+            "busy_s": self.busy_s,
+            "utilization": self.busy_s / capacity * 100 if capacity else 0.0,
+            "starved_s": self.starved_s,
+            "blocked_s": self.blocked_s,
+            "mean_item_ms": self.busy_s / self.items * 1000 if self.items else 0.0
+        }
+
+
+class Pipeline:
+    """Runs items from a source through a list of stages"""
+
+    def __init__(
+        self,
+        source: Iterable[Any],
+        stages: List[Stage],
+        queue_size: int = None,
+        sample_interval_s: float = None
+    ):
+        self.source = source
+        self.stages = stages
+        self.queue_size = queue_size or PIPELINE_CONFIG["queue_size"]
+        self.sample_interval_s = sample_interval_s or PIPELINE_CONFIG["sample_interval_s"]
+        self.stats: Dict[str, _StageStats] = {"generate": _StageStats(1)}
+        self.stats.update({stage.name: _StageStats(stage.workers) for stage in stages})
+        self.depths: Dict[str, List[int]] = {stage.name: [] for stage in stages}
+
+    async def run(self) -> Dict[str, Any]:
+        """Process every source item; returns the pipeline report"""
+        loop = asyncio.get_running_loop()
+        # queues[i] feeds stages[i]
+        queues = [asyncio.Queue(maxsize=self.queue_size) for _ in self.stages]
+        executors = {
+            stage.name: ThreadPoolExecutor(max_workers=stage.workers, thread_name_prefix=stage.name)
+            for stage in self.stages if not stage.inline
+        }
+        executors["generate"] = ThreadPoolExecutor(max_workers=1, thread_name_prefix="generate")
+
+        start = time.perf_counter()
+        sampler = asyncio.ensure_future(self._sample_depths(queues))
+        tasks = [asyncio.ensure_future(self._generate(loop, executors["generate"], queues[0]))]
+        for i, stage in enumerate(self.stages):
+            downstream = queues[i + 1] if i + 1 < len(queues) else None
+            tasks.append(asyncio.ensure_future(
+                self._run_stage(loop, stage, executors.get(stage.name), queues[i], downstream)
+            ))
+
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+        finally:
+            sampler.cancel()
+            for executor in executors.values():
+                executor.shutdown(wait=False)
+
+        return self.report(time.perf_counter() - start)
+
+    async def _put(self, queue: asyncio.Queue, item: Any, stats: _StageStats):
+        if queue.full():
+            waited = time.perf_counter()
+            await queue.put(item)
+            stats.blocked_s += time.perf_counter() - waited
+        else:
+            queue.put_nowait(item)
+
+    async def _generate(self, loop, executor: ThreadPoolExecutor, queue: asyncio.Queue):
+        """Pull items from the source on a thread, so a slow generator never blocks the loop"""
+        stats = self.stats["generate"]
+        iterator = iter(self.source)
+
+        def next_item():
+            began = time.perf_counter()
+            item = next(iterator, _DONE)
+            return item, time.perf_counter() - began
+
+        while True:
+            item, busy = await loop.run_in_executor(executor, next_item)
+            stats.busy_s += busy
+            if item is _DONE:
+                break
+            stats.items += 1
+            await self._put(queue, item, stats)
+        await self._put(queue, _DONE, stats)
+
+    async def _run_stage(
+        self,
+        loop,
+        stage: Stage,
+        executor: Optional[ThreadPoolExecutor],
+        inbox: asyncio.Queue,
+        outbox: Optional[asyncio.Queue]
+    ):
+        stats = self.stats[stage.name]
+        workers = [
+            asyncio.ensure_future(self._worker(loop, stage, executor, inbox, outbox, stats))
+            for _ in range(stage.workers)
+        ]
+        try:
+            await asyncio.gather(*workers)
+        except BaseException:
+            for worker in workers:
+                worker.cancel()
+            raise
+        if outbox is not None:
+            await self._put(outbox, _DONE, stats)
+
+    async def _worker(
+        self,
+        loop,
+        stage: Stage,
+        executor: Optional[ThreadPoolExecutor],
+        inbox: asyncio.Queue,
+        outbox: Optional[asyncio.Queue],
+        stats: _StageStats
+    ):
+        def call(fn, *args):
+            began = time.perf_counter()
+            value = fn(*args)
+            return value, time.perf_counter() - began
+
+        async def run(fn, *args):
+            if stage.inline:
+                return call(fn, *args)
+            return await loop.run_in_executor(executor, call, fn, *args)
+
+        state = None
+        if stage.setup:
+            state, busy = await run(stage.setup)
+            stats.busy_s += busy
+
+        while True:
+            waited = time.perf_counter()
+            item = await inbox.get()
+            stats.starved_s += time.perf_counter() - waited
+            if item is _DONE:
+                # Let the stage's other workers see the end marker too
+                inbox.put_nowait(_DONE)
+                return
+
+            output, busy = await run(stage.fn, item, state)
+            stats.busy_s += busy
+            stats.items += 1
+            if outbox is not None:
+                await self._put(outbox, output, stats)
+
+    async def _sample_depths(self, queues: List[asyncio.Queue]):
+        while True:
+            for stage, queue in zip(self.stages, queues):
+                self.depths[stage.name].append(queue.qsize())
+            await asyncio.sleep(self.sample_interval_s)
+
+    def report(self, wall_s: float) -> Dict[str, Any]:
+        """Stage utilisation, queue depths and the bottleneck stage.
+
+        The bottleneck is the non-inline stage with the highest utilisation;
+        the queue in front of it is usually the one that stays full.
+        """
+        stages = {name: stats.report(wall_s) for name, stats in self.stats.items()}
+        queues = {
+            name: {
+                "mean_depth": sum(samples) / len(samples) if samples else 0.0,
+                "max_depth": max(samples) if samples else 0,
+                "capacity": self.queue_size
+            }
+            for name, samples in self.depths.items()
+        }
+        candidates = ["generate"] + [stage.name for stage in self.stages if not stage.inline]
+        return {
+            "wall_s": wall_s,
+            "queue_size": self.queue_size,
+            "stages": stages,
+            "queues": queues,
+            "bottleneck": max(candidates, key=lambda name: stages[name]["utilization"])
+        }
+
+
+def print_pipeline_report(report: Dict[str, Any]):
+    """Console table of a pipeline report"""
+    print(f"\nPipeline ({report['wall_s']:.1f}s wall, queue size {report['queue_size']}):")
+    print(f"  {'Stage':<10} {'Workers':>7} {'Items':>6} {'Util':>7} {'Starved':>9} "
+          f"{'Blocked':>9} {'Queue avg/max':>14}")
+    for name, stage in report["stages"].items():
+        queue = report["queues"].get(name)
+        depth = f"{queue['mean_depth']:.1f}/{queue['max_depth']}" if queue else "-"
+        print(f"  {name:<10} {stage['workers']:>7} {stage['items']:>6} {stage['utilization']:>6.1f}% "
+              f"{stage['starved_s']:>8.1f}s {stage['blocked_s']:>8.1f}s {depth:>14}")
+    print(f"  Bottleneck: {report['bottleneck']}")
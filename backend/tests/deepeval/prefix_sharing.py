@@ -0,0 +1,244 @@
+"""
+Prefix-Shared Multi-Turn Execution
+==================================
+
+Many multi-turn cases open with the same turns (e.g. the fire, medical and
+correction flows all start from a handful of emergency reports). This module
+runs each shared opening once and forks the backend session where
+conversations diverge, instead of replaying the opening for every case.
+
+Features:
+- Prefix trie over conversations, keyed by user message and authentication
+- Sessions forked with POST /api/chat/session/:sessionId/clone at divergence
+  points; the last branch continues in the original session
+- Falls back to replaying the prefix in a fresh session when the backend
+  cannot clone (old backend, or the session was cleared after a ticket)
+- Every case is still validated against its own turn criteria
+- Call accounting: chatbot calls made vs. what an unshared run would make
+"""
+
+import time
+from datetime import datetime
+from dataclasses import dataclass
+from typing import List, Dict, Any, Optional
+
+from multi_turn_test_cases import MultiTurnTestCase
+from multi_turn_evaluation import CollectedConversation, MultiTurnEvaluator
+
+
+@dataclass
+class _Exchange:
+    """One answered turn on some session"""
+    message: str
+    session_id: str
+    response: Dict[str, Any]
+    duration_ms: float
+    wall_ms: float  # Including the inter-turn delay
+    timestamp: str
+
+
+class PrefixNode:
+    """Conversations that share the user messages on the path to this node"""
+
+    def __init__(self, message: Optional[str] = None):
+        self.message = message
+        self.children: Dict[str, "PrefixNode"] = {}
+        self.cases: List[MultiTurnTestCase] = []  # Cases whose last turn is this node
+
+    def subtree_cases(self) -> List[MultiTurnTestCase]:
+        cases = list(self.cases)
+        for child in self.children.values():
+            cases.extend(child.subtree_cases())
+        return cases
+
+
+def build_prefix_trie(test_cases: List[MultiTurnTestCase]) -> Dict[bool, PrefixNode]:
+    """One trie per authentication mode, since the auth header changes every answer"""
+    roots: Dict[bool, PrefixNode] = {}
+    for test_case in test_cases:
+        node = roots.setdefault(test_case.is_authenticated, PrefixNode())
+        for turn in test_case.turns:
+            node = node.children.setdefault(turn.user_message, PrefixNode(turn.user_message))
+        node.cases.append(test_case)
+    return roots
+
+
+def count_trie_turns(roots: Dict[bool, PrefixNode]) -> int:
+    """Chatbot calls needed when every shared prefix is sent exactly once"""
+    def count(node: PrefixNode) -> int:
+        return sum(1 + count(child) for child in node.children.values())
+    return sum(count(root) for root in roots.values())
+
+
+class PrefixSharedRunner:
+    """Collects conversations for a set of cases, sending shared prefixes once"""
+
+    def __init__(self, evaluator: MultiTurnEvaluator, verbose: bool = False, turn_delay_s: float = 0.5):
+        self.evaluator = evaluator
+        self.verbose = verbose
+        self.turn_delay_s = turn_delay_s
+        self.clone_supported = True
+        self.collected: Dict[str, CollectedConversation] = {}
+        self.stats = {"chatbot_calls": 0, "replayed_calls": 0, "forks": 0, "clone_fallbacks": 0}
+        self.total_turns = 0
+        self.trie_turns = 0
+
+    def run(self, test_cases: List[MultiTurnTestCase]) -> Dict[str, CollectedConversation]:
+        """Collected conversations by test case ID"""
+        roots = build_prefix_trie(test_cases)
+        self.total_turns = sum(len(tc.turns) for tc in test_cases)
+        self.trie_turns = count_trie_turns(roots)
+        if self.verbose:
+            print(f"  Prefix trie: {self.trie_turns} distinct turns for {self.total_turns} case turns")
+
+        for authenticated, root in roots.items():
+            self._run_node(root, self.evaluator.generate_session_id(), [], authenticated)
+        return self.collected
+
+    def _send(self, message: str, session_id: str, authenticated: bool, turn_number: int) -> _Exchange:
+        timestamp = datetime.now().isoformat()
+        start = time.perf_counter()
+        response, duration_ms = self.evaluator.send_message(
+            message=message,
+            session_id=session_id,
+            is_authenticated=authenticated,
+            user_id="test_user" if authenticated else None,
+            turn_number=turn_number
+        )
+        self.stats["chatbot_calls"] += 1
+        if not response.get("infra_error"):
+            time.sleep(self.turn_delay_s)
+        return _Exchange(message, session_id, response, duration_ms,
+                         (time.perf_counter() - start) * 1000, timestamp)
+
+    def _branch(self, session_id: str, history: List[_Exchange], authenticated: bool):
+        """A new session at the same point as session_id; returns (session_id, failed exchange)"""
+        target = self.evaluator.generate_session_id()
+        if not history:
+            return target, None
+
+        if self.clone_supported:
+            cloned = self.evaluator.clone_session(
+                session_id, target, is_authenticated=authenticated,
+                user_id="test_user" if authenticated else None
+            )
+            if cloned:
+                self.stats["forks"] += 1
+                return target, None
+            if cloned is None:
+                self.clone_supported = False
+                print("  [PREFIX] Backend session cloning is unavailable or disabled "
+                      "(ALLOW_SESSION_CLONE); replaying shared prefixes")
+
+        self.stats["clone_fallbacks"] += 1
+        for turn_number, exchange in enumerate(history, start=1):
+            replay = self._send(exchange.message, target, authenticated, turn_number)
+            self.stats["replayed_calls"] += 1
+            if replay.response.get("infra_error"):
+                self.evaluator.clear_session(target)
+                return None, replay
+        return target, None
+
+    def _run_node(self, node: PrefixNode, session_id: str, history: List[_Exchange], authenticated: bool):
+        """Finish the cases ending here, then extend the conversation for each child.
+
+        The call owns session_id: it is handed to the last child, or cleared.
+        """
+        for test_case in node.cases:
+            self.collected[test_case.id] = self._finish(test_case, history)
+
+        children = list(node.children.values())
+        if not children:
+            self.evaluator.clear_session(session_id)
+            return
+
+        for i, child in enumerate(children):
+            last = i == len(children) - 1
+            turn_number = len(history) + 1
+            try:
+                if last:
+                    child_session, failure = session_id, None
+                else:
+                    child_session, failure = self._branch(session_id, history, authenticated)
+                if failure is None:
+                    if self.verbose and not last and history:
+                        print(f"    Fork at turn {turn_number}: {child.message[:50]}...")
+                    exchange = self._send(child.message, child_session, authenticated, turn_number)
+                    failure = exchange if exchange.response.get("infra_error") else None
+            except Exception as e:
+                self._fail_subtree(child, history, f"Conversation error: {str(e)}")
+                if last:
+                    self.evaluator.clear_session(session_id)
+                continue
+
+            if failure is not None:
+                # The session state on the server is unknown; stop and do not judge
+                response = failure.response
+                self._fail_subtree(
+                    child, history,
+                    f"Infra failure at turn {turn_number} after "
+                    f"{response.get('attempts', 1)} attempts: {response.get('error')}",
+                    infra_failure=True,
+                    retries=response.get("attempts", 1) - 1
+                )
+                if failure.session_id == child_session:
+                    self.evaluator.clear_session(child_session)
+                continue
+
+            self._run_node(child, child_session, history + [exchange], authenticated)
+
+    def _fail_subtree(
+        self,
+        node: PrefixNode,
+        history: List[_Exchange],
+        error: str,
+        infra_failure: bool = False,
+        retries: int = 0
+    ):
+        for test_case in node.subtree_cases():
+            self.collected[test_case.id] = self._finish(test_case, history, error, infra_failure, retries)
+
+    def _finish(
+        self,
+        test_case: MultiTurnTestCase,
+        history: List[_Exchange],
+        error: str = None,
+        infra_failure: bool = False,
+        retries: int = 0
+    ) -> CollectedConversation:
+        """The case's transcript, validated against its own turns"""
+        turn_results = []
+        conversation_log = []
+        ticket_id = None
+        for turn_number, (turn, exchange) in enumerate(zip(test_case.turns, history), start=1):
+            turn_result, ticket_id = self.evaluator.build_turn_result(
+                turn_number, turn, exchange.response, exchange.duration_ms, conversation_log, ticket_id
+            )
+            turn_results.append(turn_result)
+
+        return CollectedConversation(
+            test_case_id=test_case.id,
+            session_id=history[-1].session_id if history else "",
+            timestamp=history[0].timestamp if history else datetime.now().isoformat(),
+            turns=turn_results,
+            conversation_log=conversation_log,
+            # What the case would have taken on its own
+            collect_ms=sum(exchange.wall_ms for exchange in history),
+            ticket_id=ticket_id,
+            ticket_created=ticket_id is not None,
+            infra_failure=infra_failure,
+            transport_retries=sum(e.response.get("attempts", 1) - 1 for e in history) + retries,
+            errors=[error] if error else []
+        )
+
+    def report(self) -> Dict[str, Any]:
+        """Chatbot calls made vs. an unshared run"""
+        calls = self.stats["chatbot_calls"]
+        return {
+            "conversations": len(self.collected),
+            "case_turns": self.total_turns,
+            "distinct_turns": self.trie_turns,
+            **self.stats,
+            "saved_calls": self.total_turns - calls,
+            "saved_pct": (self.total_turns - calls) / self.total_turns * 100 if self.total_turns else 0.0
+        }
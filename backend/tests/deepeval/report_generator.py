@@ -18,6 +18,8 @@ from datetime import datetime
 from typing import Dict, List, Any
 from dataclasses import dataclass
 
+from artifact_store import read_results
+
 
 @dataclass
 class ReportData:
@@ -28,17 +30,608 @@ class ReportData:
 
 
 def load_evaluation_results(filepath: str = "evaluation_results.json") -> ReportData:
-    """Load evaluation results from JSON file"""
-    with open(filepath, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    """Load evaluation results from a JSON, compressed JSONL or latest-manifest file"""
+    summary, results = read_results(filepath)
 
     return ReportData(
-        summary=data.get("summary", {}),
-        results=data.get("results", []),
-        timestamp=data.get("summary", {}).get("evaluation_time", datetime.now().isoformat())
+        summary=summary,
+        results=results,
+        timestamp=summary.get("evaluation_time", datetime.now().isoformat())
     )
 
 
+# Styles for the judge cost/latency panel, shared by single- and multi-turn reports
+JUDGE_USAGE_CSS = """
+        .usage-panel {
+            background: var(--card-bg);
+            border-radius: 12px;
+            padding: 1.5rem;
+            margin-bottom: 2rem;
+            box-shadow: 0 1px 3px rgba(0, 0, 0, 0.1);
+        }
+
+        .usage-panel h2 {
+            margin-bottom: 1rem;
+        }
+
+        .usage-totals {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(160px, 1fr));
+            gap: 1rem;
+            margin-bottom: 1.5rem;
+        }
+
+        .usage-total {
+            background: var(--bg);
+            border-radius: 8px;
+            padding: 0.75rem 1rem;
+        }
+
+        .usage-total h4 {
+            font-size: 0.75rem;
+            color: var(--text-muted);
+            text-transform: uppercase;
+        }
+
+        .usage-total .value {
+            font-size: 1.25rem;
+            font-weight: 700;
+            color: var(--primary);
+        }
+
+        .usage-table {
+            width: 100%;
+            border-collapse: collapse;
+            font-size: 0.875rem;
+            margin-bottom: 1.5rem;
+        }
+
+        .usage-table th, .usage-table td {
+            padding: 0.5rem 0.75rem;
+            text-align: right;
+            border-bottom: 1px solid var(--border);
+        }
+
+        .usage-table th:first-child, .usage-table td:first-child {
+            text-align: left;
+        }
+
+        .usage-table th {
+            color: var(--text-muted);
+            font-weight: 600;
+        }
+"""
+
+
+def _render_usage_rows(groups: Dict[str, Dict[str, Any]]) -> str:
+    """Render table rows for a judge usage breakdown"""
+    rows = ""
+    for name, usage in sorted(groups.items(), key=lambda item: -item[1].get("cost_usd", 0)):
+        rows += f"""
+            <tr>
+                <td>{name}</td>
+                <td>{usage.get('invocations', 0):,}</td>
+                <td>{usage.get('prompt_tokens', 0):,}</td>
+                <td>{usage.get('completion_tokens', 0):,}</td>
+                <td>{usage.get('avg_latency_ms', 0):.0f}ms</td>
+                <td>${usage.get('cost_usd', 0):.4f}</td>
+            </tr>
+            """
+    return rows
+
+
+def render_judge_usage_panel(judge_usage: Dict[str, Any]) -> str:
+    """Render the judge cost/latency panel from a summary's judge_usage block"""
+    if not judge_usage or not judge_usage.get("total", {}).get("invocations"):
+        return ""
+
+    total = judge_usage["total"]
+    header = """
+                <tr>
+                    <th>{label}</th>
+                    <th>Invocations</th>
+                    <th>Prompt Tokens</th>
+                    <th>Completion Tokens</th>
+                    <th>Avg Latency</th>
+                    <th>Cost</th>
+                </tr>
+    """
+
+    return f"""
+        <div class="usage-panel">
+            <h2>💰 Judge Cost &amp; Latency</h2>
+            <p style="color: var(--text-muted); margin-bottom: 1rem;">
+                Model(s): {", ".join(judge_usage.get("models", [])) or "N/A"}
+            </p>
+            <div class="usage-totals">
+                <div class="usage-total"><h4>Total Cost</h4><div class="value">${total.get('cost_usd', 0):.4f}</div></div>
+                <div class="usage-total"><h4>Prompt Tokens</h4><div class="value">{total.get('prompt_tokens', 0):,}</div></div>
+                <div class="usage-total"><h4>Completion Tokens</h4><div class="value">{total.get('completion_tokens', 0):,}</div></div>
+                <div class="usage-total"><h4>Judge Calls</h4><div class="value">{total.get('calls', 0):,}</div></div>
+                <div class="usage-total"><h4>Avg Judge Latency</h4><div class="value">{total.get('avg_latency_ms', 0):.0f}ms</div></div>
+            </div>
+            <table class="usage-table">
+                <thead>{header.format(label="Metric")}</thead>
+                <tbody>{_render_usage_rows(judge_usage.get("by_metric", {}))}</tbody>
+            </table>
+            <table class="usage-table">
+                <thead>{header.format(label="Category")}</thead>
+                <tbody>{_render_usage_rows(judge_usage.get("by_category", {}))}</tbody>
+            </table>
+        </div>
+    """
+
+
+def render_dedup_panel(dedup: Dict[str, Any]) -> str:
+    """Render the dedup ratio of a --dedup run; styled like the judge usage panel"""
+    if not dedup or not dedup.get("cases"):
+        return ""
+
+    header = """
+                <tr>
+                    <th>{label}</th>
+                    <th>Cases</th>
+                    <th>Evaluated</th>
+                    <th>Ratio</th>
+                </tr>
+    """
+    category_rows = "".join(f"""
+            <tr>
+                <td>{category}</td>
+                <td>{stats['cases']:,}</td>
+                <td>{stats['classes']:,}</td>
+                <td>{stats['ratio']:.2f}x</td>
+            </tr>
+            """ for category, stats in sorted(dedup.get("by_category", {}).items(), key=lambda item: -item[1]["ratio"]))
+    class_rows = "".join(f"""
+            <tr>
+                <td><code>{entry['representative']}</code> ({entry['category']})</td>
+                <td>{entry['members']:,}</td>
+                <td>1</td>
+                <td>{entry['members']:.2f}x</td>
+            </tr>
+            """ for entry in dedup.get("largest", []))
+    normalization = ", ".join(name for name, enabled in dedup.get("normalization", {}).items() if enabled) or "none"
+
+    return f"""
+        <div class="usage-panel">
+            <h2>🧬 Input Deduplication</h2>
+            <p style="color: var(--text-muted); margin-bottom: 1rem;">
+                Cases equal after normalisation ({normalization}) were evaluated once; the result was copied to the others.
+            </p>
+            <div class="usage-totals">
+                <div class="usage-total"><h4>Cases</h4><div class="value">{dedup['cases']:,}</div></div>
+                <div class="usage-total"><h4>Evaluated</h4><div class="value">{dedup['classes']:,}</div></div>
+                <div class="usage-total"><h4>Dedup Ratio</h4><div class="value">{dedup['ratio']:.2f}x</div></div>
+                <div class="usage-total"><h4>Evaluations Saved</h4><div class="value">{dedup['saved_pct']:.1f}%</div></div>
+            </div>
+            <table class="usage-table">
+                <thead>{header.format(label="Category")}</thead>
+                <tbody>{category_rows}</tbody>
+            </table>
+            {f'<table class="usage-table"><thead>{header.format(label="Largest classes")}</thead><tbody>{class_rows}</tbody></table>' if class_rows else ""}
+        </div>
+    """
+
+
+# Styles for the latency percentile panel, shared by single- and multi-turn reports
+LATENCY_PANEL_CSS = """
+        .latency-panel {
+            background: var(--card-bg);
+            border-radius: 12px;
+            padding: 1.5rem;
+            margin-bottom: 2rem;
+            box-shadow: 0 1px 3px rgba(0, 0, 0, 0.1);
+        }
+
+        .latency-panel h2 {
+            margin-bottom: 1rem;
+        }
+
+        .latency-table {
+            width: 100%;
+            border-collapse: collapse;
+            font-size: 0.875rem;
+            margin-bottom: 1.5rem;
+        }
+
+        .latency-table th, .latency-table td {
+            padding: 0.5rem 0.75rem;
+            text-align: right;
+            border-bottom: 1px solid var(--border);
+            vertical-align: middle;
+        }
+
+        .latency-table th:first-child, .latency-table td:first-child {
+            text-align: left;
+        }
+
+        .latency-table th {
+            color: var(--text-muted);
+            font-weight: 600;
+        }
+
+        .latency-hist {
+            display: inline-flex;
+            align-items: flex-end;
+            gap: 2px;
+            height: 24px;
+        }
+
+        .latency-hist span {
+            display: inline-block;
+            width: 8px;
+            background: var(--primary);
+            border-radius: 1px;
+        }
+"""
+
+
+def _format_bucket(bucket: Dict[str, Any]) -> str:
+    """Label for a latency histogram bucket"""
+    if bucket.get("to_ms") is None:
+        return f">={bucket['from_ms'] / 1000:g}s"
+    return f"{bucket['from_ms'] / 1000:g}-{bucket['to_ms'] / 1000:g}s"
+
+
+def _render_histogram(histogram: List[Dict[str, Any]]) -> str:
+    """Render a latency histogram as inline bars"""
+    peak = max((b["count"] for b in histogram), default=0) or 1
+    bars = "".join(
+        f'<span style="height: {max(b["count"] / peak * 100, 4 if b["count"] else 0):.0f}%" '
+        f'title="{_format_bucket(b)}: {b["count"]}"></span>'
+        for b in histogram
+    )
+    return f'<div class="latency-hist">{bars}</div>'
+
+
+def _render_latency_row(label: str, stats: Dict[str, Any]) -> str:
+    return f"""
+            <tr>
+                <td>{label}</td>
+                <td>{stats.get('count', 0):,}</td>
+                <td>{stats.get('p50_ms', 0):.0f}ms</td>
+                <td>{stats.get('p90_ms', 0):.0f}ms</td>
+                <td>{stats.get('p99_ms', 0):.0f}ms</td>
+                <td>{stats.get('max_ms', 0):.0f}ms</td>
+                <td>{_render_histogram(stats.get('histogram', []))}</td>
+            </tr>
+            """
+
+
+def _render_hedging_table(hedging: Dict[str, Any]) -> str:
+    """Chatbot tail latency with and without hedged requests"""
+    rows = ""
+    for label, key in (("Without hedging", "without_hedging"), ("With hedging", "with_hedging")):
+        stats = hedging[key]
+        rows += f"""
+                <tr>
+                    <td>{label}</td>
+                    <td>{stats['p50_ms']:.0f}ms</td>
+                    <td>{stats['p95_ms']:.0f}ms</td>
+                    <td>{stats['p99_ms']:.0f}ms</td>
+                </tr>
+        """
+    pending = hedging.get("pending_primaries", 0)
+    pending_note = f" {pending} hedged requests whose primary was still running are left out." if pending else ""
+    return f"""
+            <h2>Hedged Requests</h2>
+            <p>{hedging['hedged']} of {hedging['requests']} requests hedged after the observed
+               p{hedging['percentile']} ({hedging['hedge_rate']:.1f}%), hedge won {hedging['hedge_wins']};
+               p99 improved by {hedging['p99_improvement_ms']:.0f}ms.{pending_note}</p>
+            <table class="latency-table">
+                <thead>
+                <tr>
+                    <th>Chatbot latency</th>
+                    <th>p50</th>
+                    <th>p95</th>
+                    <th>p99</th>
+                </tr>
+                </thead>
+                <tbody>{rows}</tbody>
+            </table>
+    """
+
+
+def render_latency_panel(latency: Dict[str, Any], hedging: Dict[str, Any] = None) -> str:
+    """Render chatbot latency percentiles per category plus judge/overhead totals"""
+    if not latency or not latency.get("chatbot", {}).get("overall", {}).get("count"):
+        return ""
+
+    header = """
+                <tr>
+                    <th>{label}</th>
+                    <th>Count</th>
+                    <th>p50</th>
+                    <th>p90</th>
+                    <th>p99</th>
+                    <th>Max</th>
+                    <th>Distribution</th>
+                </tr>
+    """
+
+    chatbot = latency["chatbot"]
+    category_rows = _render_latency_row("<strong>All categories</strong>", chatbot["overall"])
+    for category, stats in sorted(chatbot.get("by_category", {}).items()):
+        category_rows += _render_latency_row(category, stats)
+
+    component_rows = ""
+    for component in ("chatbot", "judge", "overhead"):
+        if component in latency:
+            component_rows += _render_latency_row(component.capitalize(), latency[component]["overall"])
+
+    return f"""
+        <div class="latency-panel">
+            <h2>⏱️ Chatbot Latency by Category</h2>
+            <table class="latency-table">
+                <thead>{header.format(label="Category")}</thead>
+                <tbody>{category_rows}</tbody>
+            </table>
+            <h2>Time Breakdown</h2>
+            <table class="latency-table">
+                <thead>{header.format(label="Component")}</thead>
+                <tbody>{component_rows}</tbody>
+            </table>
+            {_render_hedging_table(hedging) if hedging and hedging.get("requests") else ""}
+        </div>
+    """
+
+
+PASS_RATE_CI_CSS = """
+        .ci-panel {
+            background: var(--card-bg);
+            border-radius: 12px;
+            padding: 1.5rem;
+            margin-bottom: 2rem;
+            box-shadow: 0 1px 3px rgba(0, 0, 0, 0.1);
+        }
+
+        .ci-panel h2 {
+            margin-bottom: 1rem;
+        }
+
+        .ci-table {
+            width: 100%;
+            border-collapse: collapse;
+            font-size: 0.875rem;
+        }
+
+        .ci-table th, .ci-table td {
+            padding: 0.5rem 0.75rem;
+            text-align: right;
+            border-bottom: 1px solid var(--border);
+        }
+
+        .ci-table th:first-child, .ci-table td:first-child,
+        .ci-table th:last-child, .ci-table td:last-child {
+            text-align: left;
+        }
+
+        .ci-table th {
+            color: var(--text-muted);
+            font-weight: 600;
+        }
+
+        .ci-track {
+            position: relative;
+            width: 200px;
+            height: 10px;
+            background: var(--border);
+            border-radius: 5px;
+        }
+
+        .ci-range {
+            position: absolute;
+            top: 0;
+            height: 100%;
+            background: rgba(37, 99, 235, 0.35);
+            border-radius: 5px;
+        }
+
+        .ci-point {
+            position: absolute;
+            top: -2px;
+            width: 3px;
+            height: 14px;
+            background: var(--primary);
+        }
+"""
+
+
+def _render_ci_row(label: str, stats: Dict[str, Any]) -> str:
+    low, high, rate = stats.get("ci_low", 0), stats.get("ci_high", 0), stats.get("pass_rate", 0)
+    return f"""
+                <tr>
+                    <td>{label}</td>
+                    <td>{stats.get('passed', 0)}/{stats.get('n', 0)}</td>
+                    <td>{rate:.1f}%</td>
+                    <td>{low:.1f}% - {high:.1f}%</td>
+                    <td>
+                        <div class="ci-track" title="{low:.1f}% - {high:.1f}%">
+                            <div class="ci-range" style="left: {low:.1f}%; width: {high - low:.1f}%;"></div>
+                            <div class="ci-point" style="left: {rate:.1f}%;"></div>
+                        </div>
+                    </td>
+                </tr>
+    """
+
+
+def render_pass_rate_panel(pass_rate_ci: Dict[str, Any]) -> str:
+    """Render pass rates with confidence intervals overall and per category"""
+    if not pass_rate_ci or not pass_rate_ci.get("overall", {}).get("n"):
+        return ""
+
+    rows = _render_ci_row("<strong>All categories</strong>", pass_rate_ci["overall"])
+    for category, stats in pass_rate_ci.get("by_category", {}).items():
+        rows += _render_ci_row(category, stats)
+
+    confidence = pass_rate_ci.get("confidence", 0.95)
+    return f"""
+        <div class="ci-panel">
+            <h2>🎯 Pass Rate ({confidence:.0%} {pass_rate_ci.get('method', 'wilson').capitalize()} Interval)</h2>
+            <table class="ci-table">
+                <thead>
+                    <tr>
+                        <th>Category</th>
+                        <th>Passed</th>
+                        <th>Pass Rate</th>
+                        <th>Interval</th>
+                        <th></th>
+                    </tr>
+                </thead>
+                <tbody>{rows}</tbody>
+            </table>
+        </div>
+    """
+
+
+# Styles for the bootstrap panel; interval bars reuse .ci-track from PASS_RATE_CI_CSS
+BOOTSTRAP_CSS = """
+        .bootstrap-panel {
+            background: var(--card-bg);
+            border-radius: 12px;
+            padding: 1.5rem;
+            margin-bottom: 2rem;
+            box-shadow: 0 1px 3px rgba(0, 0, 0, 0.1);
+        }
+
+        .bootstrap-panel h2 {
+            margin-bottom: 1rem;
+        }
+
+        .bootstrap-panel details {
+            margin-top: 1rem;
+        }
+
+        .bootstrap-panel summary {
+            cursor: pointer;
+            color: var(--text-muted);
+            font-weight: 600;
+            margin-bottom: 0.5rem;
+        }
+
+        .score-hist {
+            display: inline-flex;
+            align-items: flex-end;
+            gap: 2px;
+            height: 24px;
+        }
+
+        .score-hist span {
+            display: inline-block;
+            width: 8px;
+            background: var(--success);
+            border-radius: 1px;
+        }
+"""
+
+
+def _render_score_histogram(counts: List[int], edges: List[float]) -> str:
+    """Render a score histogram as inline bars"""
+    peak = max(counts, default=0) or 1
+    bars = "".join(
+        f'<span style="height: {max(count / peak * 100, 4 if count else 0):.0f}%" '
+        f'title="{edges[i]:g}-{edges[i + 1]:g}: {count}"></span>'
+        for i, count in enumerate(counts)
+    )
+    return f'<div class="score-hist">{bars}</div>'
+
+
+def _render_interval(stats: Dict[str, Any], scale: float) -> str:
+    """Point estimate and interval on a track from 0 to scale"""
+    low, high, mean = (stats[key] / scale * 100 for key in ("ci_low", "ci_high", "mean"))
+    return f"""<div class="ci-track" title="{stats['ci_low']:.3g} - {stats['ci_high']:.3g}">
+                            <div class="ci-range" style="left: {low:.1f}%; width: {high - low:.1f}%;"></div>
+                            <div class="ci-point" style="left: {mean:.1f}%;"></div>
+                        </div>"""
+
+
+def render_bootstrap_panel(bootstrap_ci: Dict[str, Any], score_histograms: Dict[str, Any] = None) -> str:
+    """Render bootstrap intervals for the pass rate and metric means, with score histograms"""
+    if not bootstrap_ci or not bootstrap_ci.get("overall", {}).get("n"):
+        return ""
+
+    overall = bootstrap_ci["overall"]
+    histograms = (score_histograms or {}).get("metrics", {})
+    edges = (score_histograms or {}).get("edges", [])
+
+    pass_rate = overall["pass_rate"]
+    rows = f"""
+                <tr>
+                    <td><strong>Pass rate</strong></td>
+                    <td>{overall['n']}</td>
+                    <td>{pass_rate['mean']:.1f}%</td>
+                    <td>{pass_rate['ci_low']:.1f}% - {pass_rate['ci_high']:.1f}%</td>
+                    <td>{_render_interval(pass_rate, 100)}</td>
+                    <td></td>
+                </tr>
+    """
+    for metric, stats in overall["metrics"].items():
+        histogram = histograms.get(metric, {}).get("overall")
+        rows += f"""
+                <tr>
+                    <td>{metric}</td>
+                    <td>{stats['n']}</td>
+                    <td>{stats['mean']:.3f}</td>
+                    <td>{stats['ci_low']:.3f} - {stats['ci_high']:.3f}</td>
+                    <td>{_render_interval(stats, 1)}</td>
+                    <td>{_render_score_histogram(histogram, edges) if histogram else ''}</td>
+                </tr>
+        """
+
+    metrics = list(overall["metrics"])
+    category_rows = ""
+    for category, stats in bootstrap_ci.get("by_category", {}).items():
+        cells = "".join(
+            f"<td>{m['mean']:.2f} <small>[{m['ci_low']:.2f}, {m['ci_high']:.2f}]</small></td>"
+            if (m := stats["metrics"].get(metric)) else "<td>-</td>"
+            for metric in metrics
+        )
+        rate = stats["pass_rate"]
+        category_rows += f"""
+                <tr>
+                    <td>{category}</td>
+                    <td>{stats['n']}</td>
+                    <td>{rate['mean']:.1f}% <small>[{rate['ci_low']:.1f}, {rate['ci_high']:.1f}]</small></td>
+                    {cells}
+                </tr>
+        """
+
+    confidence = bootstrap_ci.get("confidence", 0.95)
+    return f"""
+        <div class="bootstrap-panel">
+            <h2>📐 Score Intervals ({confidence:.0%} bootstrap, {bootstrap_ci.get('resamples', 0):,} resamples)</h2>
+            <table class="ci-table">
+                <thead>
+                    <tr>
+                        <th>Metric</th>
+                        <th>n</th>
+                        <th>Mean</th>
+                        <th>Interval</th>
+                        <th></th>
+                        <th>Scores (0 - 1)</th>
+                    </tr>
+                </thead>
+                <tbody>{rows}</tbody>
+            </table>
+            <details>
+                <summary>By category</summary>
+                <table class="ci-table">
+                    <thead>
+                        <tr>
+                            <th>Category</th>
+                            <th>n</th>
+                            <th>Pass rate</th>
+                            {"".join(f"<th>{metric}</th>" for metric in metrics)}
+                        </tr>
+                    </thead>
+                    <tbody>{category_rows}</tbody>
+                </table>
+            </details>
+        </div>
+    """
+
+
 def generate_html_report(
     data: ReportData,
     output_path: str = "evaluation_report.html"
@@ -52,6 +645,13 @@ def generate_html_report(
     pass_rate = data.summary.get("pass_rate", 0)
     avg_metrics = data.summary.get("average_metrics", {})
     category_rates = data.summary.get("category_pass_rates", {})
+    judge_usage_panel = render_judge_usage_panel(data.summary.get("judge_usage", {}))
+    dedup_panel = render_dedup_panel(data.summary.get("dedup"))
+    latency_panel = render_latency_panel(data.summary.get("latency", {}), data.summary.get("hedging"))
+    pass_rate_panel = render_pass_rate_panel(data.summary.get("pass_rate_ci", {}))
+    bootstrap_panel = render_bootstrap_panel(
+        data.summary.get("bootstrap_ci", {}), data.summary.get("score_histograms")
+    )
 
     # No chart data generation needed for simplified report
 
@@ -59,7 +659,7 @@ def generate_html_report(
     results_rows = ""
     for idx, result in enumerate(data.results):
         status_class = "passed" if result.get("passed") else "failed"
-        status_icon = "✅" if result.get("passed") else "❌"
+        status_icon = "✅" if result.get("passed") else ("⚠️" if result.get("infra_failure") else "❌")
         metrics_str = ", ".join([
             f"{k}: {v:.2f}" for k, v in result.get("metrics", {}).items()
         ])
@@ -69,16 +669,18 @@ def generate_html_report(
         input_msg = result.get('input_message', '').replace('"', '&quot;').replace('<', '&lt;').replace('>', '&gt;')
         actual_output = result.get('actual_output', '').replace('"', '&quot;').replace('<', '&lt;').replace('>', '&gt;').replace('\n', '<br>')
         expected_output = result.get('expected_output', '').replace('"', '&quot;').replace('<', '&lt;').replace('>', '&gt;')
+        dedup_of = result.get('dedup_of')
+        dedup_note = f' <span class="subcategory-text" title="Result copied from {dedup_of}">= {dedup_of}</span>' if dedup_of else ''
 
         results_rows += f"""
         <tr class="result-row {status_class}" onclick="toggleDetails('details-{idx}')">
             <td class="status-cell">{status_icon}</td>
-            <td><code>{result.get('test_case_id', 'N/A')}</code></td>
+            <td><code>{result.get('test_case_id', 'N/A')}</code>{dedup_note}</td>
             <td><span class="category-badge">{result.get('category', 'N/A')}</span></td>
             <td><span class="subcategory-text">{result.get('subcategory', 'N/A')}</span></td>
             <td class="input-cell" title="{input_msg[:200]}">{input_msg[:50]}...</td>
             <td class="metrics-cell">{metrics_str}</td>
-            <td class="duration-cell">{result.get('duration_ms', 0):.0f}ms</td>
+            <td class="duration-cell" title="Total {result.get('duration_ms', 0):.0f}ms">{result.get('chatbot_latency_ms', 0):.0f}ms / {result.get('judge_latency_ms', 0):.0f}ms</td>
             <td class="expand-cell">👁️ View</td>
         </tr>
         <tr id="details-{idx}" class="details-row" style="display: none;">
@@ -482,6 +1084,13 @@ def generate_html_report(
             color: var(--text-muted);
         }}
 
+        {JUDGE_USAGE_CSS}
+
+        {LATENCY_PANEL_CSS}
+
+        {PASS_RATE_CI_CSS}
+        {BOOTSTRAP_CSS}
+
         @media (max-width: 768px) {{
             .container {{
                 padding: 1rem;
@@ -515,6 +1124,21 @@ def generate_html_report(
             </div>
         </div>
 
+        <!-- Pass Rate Confidence Intervals -->
+        {pass_rate_panel}
+
+        <!-- Bootstrap Intervals and Score Distributions -->
+        {bootstrap_panel}
+
+        <!-- Chatbot Latency Percentiles -->
+        {latency_panel}
+
+        <!-- Judge Cost & Latency -->
+        {judge_usage_panel}
+
+        <!-- Input Deduplication -->
+        {dedup_panel}
+
         <!-- Test Duration Distribution Chart -->
         <div class="section">
             <h2>⏱️ Test Duration Distribution</h2>
@@ -544,7 +1168,7 @@ def generate_html_report(
                             <th>Subcategory</th>
                             <th>Input</th>
                             <th>Metrics</th>
-                            <th>Duration</th>
+                            <th>Chatbot / Judge</th>
                             <th>Details</th>
                         </tr>
                     </thead>
@@ -666,6 +1290,466 @@ def generate_html_report(
     return output_path
 
 
+def generate_load_test_html_report(
+    summary: Dict[str, Any],
+    output_path: str = "load_test_report.html"
+) -> str:
+    """Generate throughput/latency curve report for an open-loop load test"""
+
+    per_second = summary.get("per_second", [])
+    per_step = summary.get("per_step", [])
+    knee = summary.get("saturation_knee")
+    settings = summary.get("settings", {})
+
+    if knee:
+        knee_text = (
+            f"{knee['offered_sessions_per_s']:.1f} sessions/s "
+            f"({knee['offered_rps']:.1f} req/s offered, {knee['achieved_rps']:.1f} req/s achieved): "
+            f"{', '.join(knee.get('reasons', []))}"
+        )
+    else:
+        knee_text = "Not reached - the backend kept up with all offered load"
+
+    step_rows = ""
+    for step in per_step:
+        is_knee = knee is not None and step["step"] == knee["step"]
+        step_rows += f"""
+            <tr{' class="knee"' if is_knee else ''}>
+                <td>{step['step'] + 1}</td>
+                <td>{step['offered_sessions_per_s']:.2f}</td>
+                <td>{step['offered_rps']:.2f}</td>
+                <td>{step['achieved_rps']:.2f}</td>
+                <td>{step['error_rate']:.1f}%</td>
+                <td>{step['dropped']}</td>
+                <td>{step['p50_ms']:.0f}ms</td>
+                <td>{step['p90_ms']:.0f}ms</td>
+                <td>{step['p99_ms']:.0f}ms</td>
+            </tr>
+            """
+
+    html_content = f"""
+<!DOCTYPE html>
+<html lang="vi">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>112 Call Center Agent - Load Test Report</title>
+    <script src="https://cdn.jsdelivr.net/npm/chart.js"></script>
+    <style>
+        :root {{
+            --primary: #2563eb;
+            --success: #16a34a;
+            --warning: #d97706;
+            --danger: #dc2626;
+            --bg: #f8fafc;
+            --card-bg: #ffffff;
+            --text: #1e293b;
+            --text-muted: #64748b;
+            --border: #e2e8f0;
+        }}
+
+        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
+
+        body {{
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+            background: var(--bg);
+            color: var(--text);
+            line-height: 1.6;
+        }}
+
+        .container {{ max-width: 1400px; margin: 0 auto; padding: 2rem; }}
+
+        header {{
+            background: linear-gradient(135deg, #0f766e, #115e59);
+            color: white;
+            padding: 2rem;
+            border-radius: 12px;
+            margin-bottom: 2rem;
+        }}
+
+        header h1 {{ font-size: 1.75rem; margin-bottom: 0.5rem; }}
+
+        .summary-grid {{
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(160px, 1fr));
+            gap: 1rem;
+            margin-bottom: 2rem;
+        }}
+
+        .summary-card {{
+            background: var(--card-bg);
+            border-radius: 8px;
+            padding: 1rem;
+            text-align: center;
+            box-shadow: 0 1px 3px rgba(0,0,0,0.1);
+        }}
+
+        .summary-card h3 {{ font-size: 0.75rem; color: var(--text-muted); text-transform: uppercase; }}
+        .summary-card .value {{ font-size: 1.5rem; font-weight: 700; color: var(--primary); }}
+
+        .section {{
+            background: var(--card-bg);
+            border-radius: 12px;
+            padding: 1.5rem;
+            margin-bottom: 2rem;
+            box-shadow: 0 1px 3px rgba(0, 0, 0, 0.1);
+        }}
+
+        .section h2 {{ margin-bottom: 1rem; }}
+
+        .knee-banner {{
+            border-left: 4px solid var(--warning);
+            background: #fffbeb;
+            padding: 1rem;
+            border-radius: 6px;
+            margin-bottom: 2rem;
+        }}
+
+        .step-table {{ width: 100%; border-collapse: collapse; font-size: 0.875rem; }}
+        .step-table th, .step-table td {{ padding: 0.5rem 0.75rem; text-align: right; border-bottom: 1px solid var(--border); }}
+        .step-table th {{ color: var(--text-muted); }}
+        .step-table tr.knee {{ background: #fef3c7; font-weight: 600; }}
+
+        footer {{ text-align: center; padding: 2rem; color: var(--text-muted); }}
+    </style>
+</head>
+<body>
+    <div class="container">
+        <header>
+            <h1>Open-Loop Load Test Report</h1>
+            <p>Arrival: {settings.get('arrival', 'N/A')} | Duration: {settings.get('duration_s', 0):.0f}s |
+               Max concurrency: {settings.get('max_concurrency', 'N/A')} | Generated: {summary.get('evaluation_time', datetime.now().isoformat())}</p>
+        </header>
+
+        <div class="summary-grid">
+            <div class="summary-card"><h3>Sessions Offered</h3><div class="value">{summary.get('sessions_offered', 0):,}</div></div>
+            <div class="summary-card"><h3>Requests</h3><div class="value">{summary.get('total_requests', 0):,}</div></div>
+            <div class="summary-card"><h3>Throughput</h3><div class="value">{summary.get('throughput_rps', 0):.2f}/s</div></div>
+            <div class="summary-card"><h3>Error Rate</h3><div class="value">{summary.get('error_rate', 0):.1f}%</div></div>
+            <div class="summary-card"><h3>p50</h3><div class="value">{summary.get('p50_ms', 0):.0f}ms</div></div>
+            <div class="summary-card"><h3>p99</h3><div class="value">{summary.get('p99_ms', 0):.0f}ms</div></div>
+            <div class="summary-card"><h3>Dropped</h3><div class="value">{summary.get('sessions_dropped', 0):,}</div></div>
+        </div>
+
+        <div class="knee-banner">
+            <strong>Saturation knee:</strong> {knee_text}
+        </div>
+
+        <div class="section">
+            <h2>Offered Load vs Throughput &amp; Latency</h2>
+            <canvas id="curveChart"></canvas>
+        </div>
+
+        <div class="section">
+            <h2>Per-Second Timeline</h2>
+            <canvas id="timelineChart"></canvas>
+        </div>
+
+        <div class="section">
+            <h2>Load Steps</h2>
+            <table class="step-table">
+                <thead>
+                    <tr>
+                        <th>Step</th>
+                        <th>Sessions/s</th>
+                        <th>Offered req/s</th>
+                        <th>Achieved req/s</th>
+                        <th>Errors</th>
+                        <th>Dropped</th>
+                        <th>p50</th>
+                        <th>p90</th>
+                        <th>p99</th>
+                    </tr>
+                </thead>
+                <tbody>
+                    {step_rows}
+                </tbody>
+            </table>
+        </div>
+
+        <footer>
+            <p>112 Call Center Agent - Load Test (no judging)</p>
+        </footer>
+    </div>
+
+    <script>
+        const steps = {json.dumps(per_step)};
+        const seconds = {json.dumps(per_second)};
+
+        new Chart(document.getElementById('curveChart'), {{
+            type: 'line',
+            data: {{
+                labels: steps.map(s => s.offered_rps.toFixed(2)),
+                datasets: [
+                    {{ label: 'Achieved req/s', data: steps.map(s => s.achieved_rps), borderColor: '#16a34a', yAxisID: 'y' }},
+                    {{ label: 'Offered req/s', data: steps.map(s => s.offered_rps), borderColor: '#94a3b8', borderDash: [5, 5], yAxisID: 'y' }},
+                    {{ label: 'p50 (ms)', data: steps.map(s => s.p50_ms), borderColor: '#2563eb', yAxisID: 'y1' }},
+                    {{ label: 'p99 (ms)', data: steps.map(s => s.p99_ms), borderColor: '#dc2626', yAxisID: 'y1' }}
+                ]
+            }},
+            options: {{
+                scales: {{
+                    x: {{ title: {{ display: true, text: 'Offered load (req/s)' }} }},
+                    y: {{ position: 'left', beginAtZero: true, title: {{ display: true, text: 'req/s' }} }},
+                    y1: {{ position: 'right', beginAtZero: true, title: {{ display: true, text: 'latency (ms)' }}, grid: {{ drawOnChartArea: false }} }}
+                }}
+            }}
+        }});
+
+        new Chart(document.getElementById('timelineChart'), {{
+            type: 'line',
+            data: {{
+                labels: seconds.map(s => s.second),
+                datasets: [
+                    {{ label: 'Throughput (ok/s)', data: seconds.map(s => s.throughput_rps), borderColor: '#16a34a', yAxisID: 'y' }},
+                    {{ label: 'Arrivals/s', data: seconds.map(s => s.arrivals), borderColor: '#94a3b8', yAxisID: 'y' }},
+                    {{ label: 'Errors/s', data: seconds.map(s => s.errors), borderColor: '#d97706', yAxisID: 'y' }},
+                    {{ label: 'p99 (ms)', data: seconds.map(s => s.p99_ms), borderColor: '#dc2626', yAxisID: 'y1' }}
+                ]
+            }},
+            options: {{
+                elements: {{ point: {{ radius: 0 }} }},
+                scales: {{
+                    x: {{ title: {{ display: true, text: 'Seconds since start' }} }},
+                    y: {{ position: 'left', beginAtZero: true }},
+                    y1: {{ position: 'right', beginAtZero: true, grid: {{ drawOnChartArea: false }} }}
+                }}
+            }}
+        }});
+    </script>
+</body>
+</html>
+"""
+
+    with open(output_path, 'w', encoding='utf-8') as f:
+        f.write(html_content)
+
+    print(f"Load test report generated: {output_path}")
+    return output_path
+
+
+def _render_change_rows(changes: List[Dict[str, Any]], limit: int) -> str:
+    rows = "".join(
+        f"<tr><td>{c['test_case_id']}</td><td>{c.get('category') or '-'}</td>"
+        f"<td>{c.get('base', c.get('status', ''))}</td><td>{c.get('head', '')}</td></tr>"
+        for c in changes[:limit]
+    )
+    if len(changes) > limit:
+        rows += f'<tr><td colspan="4" class="more">... {len(changes) - limit} more in the JSON diff</td></tr>'
+    return rows or '<tr><td colspan="4" class="more">None</td></tr>'
+
+
+def generate_compare_html_report(
+    diff: Dict[str, Any],
+    output_path: str = "compare_report.html",
+    limit: int = 200
+) -> str:
+    """Generate a compact regression report from a run_diff.compare_runs diff.
+
+    Long case lists are cut at limit rows; the JSON diff has all of them.
+    """
+    counts = diff["counts"]
+    base, head = diff["base"], diff["head"]
+    thresholds = diff["thresholds"]
+
+    metric_rows = ""
+    for metric, shift in diff["metric_shifts"].items():
+        css = "down" if shift["delta"] <= -0.005 else ("up" if shift["delta"] >= 0.005 else "")
+        metric_rows += f"""
+            <tr class="{css}"><td>{metric}</td><td>{shift['base_mean']:.3f}</td><td>{shift['head_mean']:.3f}</td>
+                <td>{shift['delta']:+.3f}</td><td>{shift['cases']}</td></tr>"""
+
+    latency_rows = ""
+    for category, stats in diff["latency"].items():
+        latency_rows += f"""
+            <tr class="{'down' if stats['regressed'] else ''}"><td>{category}</td><td>{stats['base_ms']:.0f}ms</td>
+                <td>{stats['head_ms']:.0f}ms</td><td>{stats['delta_ms']:+.0f}ms</td><td>{stats['delta_pct']:+.1f}%</td></tr>"""
+
+    score_rows = "".join(
+        f"""
+            <tr class="{'down' if c['delta'] < 0 else 'up'}"><td>{c['test_case_id']}</td><td>{c.get('category') or '-'}</td>
+                <td>{c['metric']}</td><td>{c['base']:.2f}</td><td>{c['head']:.2f}</td><td>{c['delta']:+.2f}</td></tr>"""
+        for c in diff["score_changes"][:limit]
+    )
+    if len(diff["score_changes"]) > limit:
+        score_rows += f'<tr><td colspan="6" class="more">... {len(diff["score_changes"]) - limit} more in the JSON diff</td></tr>'
+
+    membership = (
+        [{**c, "base": "-", "head": c["status"]} for c in diff["new_cases"]]
+        + [{**c, "base": c["status"], "head": "-"} for c in diff["removed_cases"]]
+    )
+    pass_delta = head["pass_rate"] - base["pass_rate"]
+
+    html_content = f"""
+<!DOCTYPE html>
+<html lang="vi">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>112 Call Center Agent - Run Comparison</title>
+    <style>
+        :root {{
+            --primary: #2563eb;
+            --success: #16a34a;
+            --warning: #d97706;
+            --danger: #dc2626;
+            --bg: #f8fafc;
+            --card-bg: #ffffff;
+            --text: #1e293b;
+            --text-muted: #64748b;
+            --border: #e2e8f0;
+        }}
+
+        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
+
+        body {{
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+            background: var(--bg);
+            color: var(--text);
+            line-height: 1.6;
+        }}
+
+        .container {{ max-width: 1400px; margin: 0 auto; padding: 2rem; }}
+
+        header {{
+            background: linear-gradient(135deg, #334155, #1e293b);
+            color: white;
+            padding: 2rem;
+            border-radius: 12px;
+            margin-bottom: 2rem;
+        }}
+
+        header h1 {{ font-size: 1.75rem; margin-bottom: 0.5rem; }}
+
+        .summary-grid {{
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(160px, 1fr));
+            gap: 1rem;
+            margin-bottom: 2rem;
+        }}
+
+        .summary-card {{
+            background: var(--card-bg);
+            border-radius: 8px;
+            padding: 1rem;
+            text-align: center;
+            box-shadow: 0 1px 3px rgba(0,0,0,0.1);
+        }}
+
+        .summary-card h3 {{ font-size: 0.75rem; color: var(--text-muted); text-transform: uppercase; }}
+        .summary-card .value {{ font-size: 1.5rem; font-weight: 700; color: var(--primary); }}
+        .summary-card .value.bad {{ color: var(--danger); }}
+        .summary-card .value.good {{ color: var(--success); }}
+
+        .section {{
+            background: var(--card-bg);
+            border-radius: 12px;
+            padding: 1.5rem;
+            margin-bottom: 2rem;
+            box-shadow: 0 1px 3px rgba(0, 0, 0, 0.1);
+        }}
+
+        .section h2 {{ margin-bottom: 1rem; }}
+
+        .diff-table {{ width: 100%; border-collapse: collapse; font-size: 0.875rem; }}
+        .diff-table th, .diff-table td {{ padding: 0.4rem 0.75rem; text-align: left; border-bottom: 1px solid var(--border); }}
+        .diff-table th {{ color: var(--text-muted); }}
+        .diff-table tr.down td {{ color: var(--danger); }}
+        .diff-table tr.up td {{ color: var(--success); }}
+        .diff-table td.more {{ color: var(--text-muted); font-style: italic; }}
+
+        footer {{ text-align: center; padding: 2rem; color: var(--text-muted); }}
+    </style>
+</head>
+<body>
+    <div class="container">
+        <header>
+            <h1>Run Comparison</h1>
+            <p>Base: {base['file']} ({base.get('evaluation_time') or 'N/A'})<br>
+               Head: {head['file']} ({head.get('evaluation_time') or 'N/A'})</p>
+        </header>
+
+        <div class="summary-grid">
+            <div class="summary-card"><h3>Pass Rate</h3><div class="value {'bad' if pass_delta < 0 else 'good'}">{pass_delta:+.1f}pp</div></div>
+            <div class="summary-card"><h3>Pass &rarr; Fail</h3><div class="value {'bad' if counts['pass_to_fail'] else ''}">{counts['pass_to_fail']}</div></div>
+            <div class="summary-card"><h3>Fail &rarr; Pass</h3><div class="value {'good' if counts['fail_to_pass'] else ''}">{counts['fail_to_pass']}</div></div>
+            <div class="summary-card"><h3>Infra Changes</h3><div class="value">{counts['infra_changes']}</div></div>
+            <div class="summary-card"><h3>Slower Categories</h3><div class="value {'bad' if counts['latency_regressions'] else ''}">{counts['latency_regressions']}</div></div>
+            <div class="summary-card"><h3>Matched</h3><div class="value">{counts['matched']:,}</div></div>
+            <div class="summary-card"><h3>New / Removed</h3><div class="value">{counts['new']} / {counts['removed']}</div></div>
+        </div>
+
+        <div class="section">
+            <h2>Pass &rarr; Fail</h2>
+            <table class="diff-table">
+                <thead><tr><th>Test case</th><th>Category</th><th>Base</th><th>Head</th></tr></thead>
+                <tbody>{_render_change_rows(diff['pass_to_fail'], limit)}</tbody>
+            </table>
+        </div>
+
+        <div class="section">
+            <h2>Metric Means (cases judged in both runs)</h2>
+            <table class="diff-table">
+                <thead><tr><th>Metric</th><th>Base</th><th>Head</th><th>Delta</th><th>Cases</th></tr></thead>
+                <tbody>{metric_rows}</tbody>
+            </table>
+        </div>
+
+        <div class="section">
+            <h2>Latency by Category (p{thresholds['latency_percentile']:.0f}, regression &gt; {thresholds['latency_regression_pct']:.0f}% and {thresholds['latency_min_delta_ms']:.0f}ms)</h2>
+            <table class="diff-table">
+                <thead><tr><th>Category</th><th>Base</th><th>Head</th><th>Delta</th><th>Change</th></tr></thead>
+                <tbody>{latency_rows}</tbody>
+            </table>
+        </div>
+
+        <div class="section">
+            <h2>Score Changes (|delta| &ge; {thresholds['score_delta']})</h2>
+            <table class="diff-table">
+                <thead><tr><th>Test case</th><th>Category</th><th>Metric</th><th>Base</th><th>Head</th><th>Delta</th></tr></thead>
+                <tbody>{score_rows or '<tr><td colspan="6" class="more">None</td></tr>'}</tbody>
+            </table>
+        </div>
+
+        <div class="section">
+            <h2>Fail &rarr; Pass</h2>
+            <table class="diff-table">
+                <thead><tr><th>Test case</th><th>Category</th><th>Base</th><th>Head</th></tr></thead>
+                <tbody>{_render_change_rows(diff['fail_to_pass'], limit)}</tbody>
+            </table>
+        </div>
+
+        <div class="section">
+            <h2>Infra Status Changes</h2>
+            <table class="diff-table">
+                <thead><tr><th>Test case</th><th>Category</th><th>Base</th><th>Head</th></tr></thead>
+                <tbody>{_render_change_rows(diff['infra_changes'], limit)}</tbody>
+            </table>
+        </div>
+
+        <div class="section">
+            <h2>New and Removed Cases</h2>
+            <table class="diff-table">
+                <thead><tr><th>Test case</th><th>Category</th><th>Base</th><th>Head</th></tr></thead>
+                <tbody>{_render_change_rows(membership, limit)}</tbody>
+            </table>
+        </div>
+
+        <footer>
+            <p>112 Call Center Agent - Run Comparison</p>
+        </footer>
+    </div>
+</body>
+</html>
+"""
+
+    with open(output_path, 'w', encoding='utf-8') as f:
+        f.write(html_content)
+
+    print(f"Comparison report generated: {output_path}")
+    return output_path
+
+
 def main():
     """Main entry point for report generation"""
     import argparse
@@ -675,7 +1759,7 @@ def main():
         "--input",
         type=str,
         default="evaluation_results.json",
-        help="Input JSON file with evaluation results"
+        help="Evaluation results file (.json, .jsonl.zst, .jsonl.gz or a latest manifest)"
     )
     parser.add_argument(
         "--output",
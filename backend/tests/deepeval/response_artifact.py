@@ -0,0 +1,144 @@
+"""
+Response Artifacts for Two-Phase Runs
+=====================================
+
+This module stores chatbot answers between `run_evaluation.py collect`, which
+talks to the chatbot, and `run_evaluation.py judge`, which scores the answers
+later (possibly with other metrics, thresholds or judge model).
+
+Features:
+- JSON Lines artifact: a header line, then one compact line per case holding
+  the test case and its collected answer (single-turn response or
+  multi-turn transcript)
+- Lines are appended and flushed as cases finish, so an interrupted phase can
+  resume; a line torn by a crash is dropped
+- The last line for a case wins, so re-collected infra failures replace
+  earlier attempts
+- The same append-only format checkpoints judged results
+"""
+
+import os
+import json
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, Iterator, List, Tuple
+
+
+ARTIFACT_VERSION = 1
+
+
+def read_jsonl(path: str) -> Iterator[Dict[str, Any]]:
+    """Records of a JSON Lines file; an unparsable last line (torn write) is skipped"""
+    with open(path, encoding="utf-8") as f:
+        lines = f.readlines()
+    for i, line in enumerate(lines):
+        if not line.strip():
+            continue
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError:
+            if i == len(lines) - 1:
+                return
+            raise
+
+
+def _trim_torn_tail(path: str):
+    """Cut an unterminated last line so appended records start on a line of their own"""
+    with open(path, "rb+") as f:
+        data = f.read()
+        if data and not data.endswith(b"\n"):
+            f.truncate(data.rfind(b"\n") + 1)
+
+
+class JsonlWriter:
+    """Thread-safe append-only JSON Lines writer"""
+
+    def __init__(self, path: str, append: bool = False):
+        self.path = str(path)
+        if append and os.path.exists(self.path):
+            _trim_torn_tail(self.path)
+        else:
+            append = False
+        self.appending = append
+        self._file = open(self.path, "a" if append else "w", encoding="utf-8")
+        self._lock = threading.Lock()
+
+    def write(self, record: Dict[str, Any]):
+        line = json.dumps(record, ensure_ascii=False, separators=(",", ":"), default=str)
+        with self._lock:
+            self._file.write(line + "\n")
+            self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self) -> "JsonlWriter":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def open_artifact(path: str, resume: bool, chatbot_url: str) -> JsonlWriter:
+    """Writer for a response artifact; a new file starts with a header line"""
+    writer = JsonlWriter(path, append=resume)
+    if not writer.appending:
+        writer.write({
+            "kind": "header",
+            "version": ARTIFACT_VERSION,
+            "chatbot_url": chatbot_url,
+            "created_at": datetime.now().isoformat()
+        })
+    return writer
+
+
+def response_record(suite: str, test_case: Dict[str, Any], collected: Dict[str, Any]) -> Dict[str, Any]:
+    """One artifact line: the test case (as a dict) and what the chatbot answered"""
+    return {"kind": "response", "suite": suite, "test_case": test_case, "response": collected}
+
+
+def is_infra_record(record: Dict[str, Any]) -> bool:
+    """Whether a collected answer is a transport failure rather than a chatbot answer"""
+    response = record["response"]
+    return response.get("infra_error") is not None or bool(response.get("infra_failure"))
+
+
+def load_artifact(path: str) -> Tuple[Dict[str, Any], Dict[str, Dict[str, Dict[str, Any]]]]:
+    """Returns (header, {suite: {test_case_id: record}}) in first-collected order"""
+    header: Dict[str, Any] = {}
+    suites: Dict[str, Dict[str, Dict[str, Any]]] = {}
+    for record in read_jsonl(path):
+        if record.get("kind") == "header":
+            header = header or record
+        elif record.get("kind") == "response":
+            suites.setdefault(record["suite"], {})[record["test_case"]["id"]] = record
+    return header, suites
+
+
+def pending_cases(
+    suite: str,
+    test_cases: List[Any],
+    collected: Dict[str, Dict[str, Dict[str, Any]]],
+    retry_infra: bool = False
+) -> List[Any]:
+    """Test cases of a suite that a resumed collect still has to run"""
+    done = collected.get(suite, {})
+    return [
+        tc for tc in test_cases
+        if tc.id not in done or (retry_infra and is_infra_record(done[tc.id]))
+    ]
+
+
+def judge_checkpoint_path(output_dir: Path, artifact: str) -> Path:
+    """Where judge appends finished results for an artifact"""
+    return Path(output_dir) / f"judge_checkpoint_{Path(artifact).name.split('.')[0]}.jsonl"
+
+
+def load_judged(path: str) -> Dict[str, Dict[str, Dict[str, Any]]]:
+    """Judged results from a checkpoint: {suite: {test_case_id: result dict}}"""
+    judged: Dict[str, Dict[str, Dict[str, Any]]] = {}
+    if os.path.exists(path):
+        for record in read_jsonl(path):
+            judged.setdefault(record["suite"], {})[record["result"]["test_case_id"]] = record["result"]
+    return judged
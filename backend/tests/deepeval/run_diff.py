@@ -0,0 +1,214 @@
+"""
+Run-to-Run Regression Diff
+==========================
+
+This module compares two exported results files of the same suite (two
+single_turn_results_*.json or two multi_turn_results_*.json), joining the
+runs on test_case_id.
+
+Features:
+- Hash join on test_case_id: one pass over each run
+- Cases that went from pass to fail (and fail to pass), and cases that
+  became or stopped being infra failures
+- Per-metric score deltas beyond a threshold, plus per-metric mean shifts
+  over the cases both runs judged
+- Per-category latency regressions (chatbot round trip percentile)
+- Cases new in the second run or removed from it
+"""
+
+import time
+from typing import List, Dict, Any, Optional
+
+from config import COMPARE_CONFIG
+from latency_stats import percentile
+
+
+def case_status(result: Dict[str, Any]) -> str:
+    """"pass", "fail" or "infra" for an exported result dict of either suite"""
+    if result.get("infra_failure"):
+        return "infra"
+    passed = result["overall_passed"] if "overall_passed" in result else result.get("passed")
+    return "pass" if passed else "fail"
+
+
+def _case_latency(result: Dict[str, Any]) -> Optional[float]:
+    latency = result.get("chatbot_latency_ms")
+    if not latency:
+        latency = result.get("total_duration_ms", result.get("duration_ms"))
+    return latency
+
+
+def _category_latencies(results: List[Dict[str, Any]]) -> Dict[str, List[float]]:
+    latencies: Dict[str, List[float]] = {}
+    for result in results:
+        latency = _case_latency(result)
+        if latency is not None and not result.get("infra_failure"):
+            latencies.setdefault(result.get("category") or "", []).append(latency)
+    for values in latencies.values():
+        values.sort()
+    return latencies
+
+
+def _run_info(run: Dict[str, Any]) -> Dict[str, Any]:
+    summary = run["summary"]
+    return {
+        "file": run.get("file"),
+        "evaluation_time": summary.get("evaluation_time"),
+        "total": len(run["results"]),
+        "pass_rate": summary.get("pass_rate", 0.0)
+    }
+
+
+def compare_runs(
+    base: Dict[str, Any],
+    head: Dict[str, Any],
+    score_delta: float = None,
+    latency_pct: float = None,
+    latency_min_ms: float = None
+) -> Dict[str, Any]:
+    """Diff two runs of one suite, each {"file", "summary", "results"}.
+
+    A score change counts when |head - base| >= score_delta. A category's
+    latency regressed when its head percentile exceeds the base one by more
+    than latency_pct percent and latency_min_ms milliseconds.
+    """
+    score_delta = COMPARE_CONFIG["score_delta"] if score_delta is None else score_delta
+    latency_pct = COMPARE_CONFIG["latency_regression_pct"] if latency_pct is None else latency_pct
+    latency_min_ms = COMPARE_CONFIG["latency_min_delta_ms"] if latency_min_ms is None else latency_min_ms
+    latency_percentile = COMPARE_CONFIG["latency_percentile"]
+    start = time.perf_counter()
+
+    # Build side: the base run, keyed by test case
+    base_by_id = {result["test_case_id"]: result for result in base["results"]}
+
+    pass_to_fail, fail_to_pass, infra_changes, score_changes, new_cases = [], [], [], [], []
+    metric_sums: Dict[str, List[float]] = {}  # metric -> [base total, head total, cases]
+    matched = set()
+
+    # Probe side: the head run
+    for head_result in head["results"]:
+        case_id = head_result["test_case_id"]
+        base_result = base_by_id.get(case_id)
+        category = head_result.get("category")
+        if base_result is None:
+            new_cases.append({"test_case_id": case_id, "category": category, "status": case_status(head_result)})
+            continue
+        matched.add(case_id)
+
+        before, after = case_status(base_result), case_status(head_result)
+        change = {"test_case_id": case_id, "category": category, "base": before, "head": after}
+        if before == "pass" and after == "fail":
+            pass_to_fail.append(change)
+        elif before == "fail" and after == "pass":
+            fail_to_pass.append(change)
+        elif before != after:
+            infra_changes.append(change)
+        if "infra" in (before, after):
+            continue
+
+        base_metrics = base_result.get("metrics") or {}
+        for metric, head_score in (head_result.get("metrics") or {}).items():
+            base_score = base_metrics.get(metric)
+            if base_score is None or head_score is None:
+                continue
+            sums = metric_sums.setdefault(metric, [0.0, 0.0, 0])
+            sums[0] += base_score
+            sums[1] += head_score
+            sums[2] += 1
+            delta = head_score - base_score
+            if abs(delta) >= score_delta:
+                score_changes.append({
+                    "test_case_id": case_id, "category": category, "metric": metric,
+                    "base": base_score, "head": head_score, "delta": delta
+                })
+
+    removed_cases = [
+        {"test_case_id": case_id, "category": result.get("category"), "status": case_status(result)}
+        for case_id, result in base_by_id.items() if case_id not in matched
+    ]
+    score_changes.sort(key=lambda change: change["delta"])
+
+    base_latency = _category_latencies(base["results"])
+    head_latency = _category_latencies(head["results"])
+    latency = {}
+    for category in sorted(set(base_latency) & set(head_latency)):
+        before = percentile(base_latency[category], latency_percentile)
+        after = percentile(head_latency[category], latency_percentile)
+        delta_pct = (after - before) / before * 100 if before else 0.0
+        latency[category] = {
+            "base_ms": before,
+            "head_ms": after,
+            "delta_ms": after - before,
+            "delta_pct": delta_pct,
+            "regressed": delta_pct > latency_pct and after - before > latency_min_ms
+        }
+
+    metric_shifts = {
+        metric: {
+            "base_mean": base_total / cases,
+            "head_mean": head_total / cases,
+            "delta": (head_total - base_total) / cases,
+            "cases": cases
+        }
+        for metric, (base_total, head_total, cases) in sorted(metric_sums.items())
+    }
+
+    return {
+        "base": _run_info(base),
+        "head": _run_info(head),
+        "thresholds": {
+            "score_delta": score_delta,
+            "latency_regression_pct": latency_pct,
+            "latency_min_delta_ms": latency_min_ms,
+            "latency_percentile": latency_percentile
+        },
+        "counts": {
+            "matched": len(matched),
+            "pass_to_fail": len(pass_to_fail),
+            "fail_to_pass": len(fail_to_pass),
+            "infra_changes": len(infra_changes),
+            "score_regressions": sum(1 for change in score_changes if change["delta"] < 0),
+            "score_improvements": sum(1 for change in score_changes if change["delta"] > 0),
+            "latency_regressions": sum(1 for stats in latency.values() if stats["regressed"]),
+            "new": len(new_cases),
+            "removed": len(removed_cases)
+        },
+        "pass_to_fail": pass_to_fail,
+        "fail_to_pass": fail_to_pass,
+        "infra_changes": infra_changes,
+        "score_changes": score_changes,
+        "metric_shifts": metric_shifts,
+        "latency": latency,
+        "new_cases": new_cases,
+        "removed_cases": removed_cases,
+        "compare_ms": (time.perf_counter() - start) * 1000
+    }
+
+
+def has_regressions(diff: Dict[str, Any]) -> bool:
+    """Whether a diff shows cases that started failing or slower categories"""
+    counts = diff["counts"]
+    return bool(counts["pass_to_fail"] or counts["latency_regressions"])
+
+
+def print_diff_summary(diff: Dict[str, Any], limit: int = 10):
+    """Console summary of a diff"""
+    counts = diff["counts"]
+    base, head = diff["base"], diff["head"]
+    print(f"  Base: {base['file']} ({base['total']} cases, {base['pass_rate']:.1f}%)")
+    print(f"  Head: {head['file']} ({head['total']} cases, {head['pass_rate']:.1f}%)")
+    print(f"  Matched {counts['matched']}, new {counts['new']}, removed {counts['removed']}")
+    print(f"  Pass -> fail: {counts['pass_to_fail']}   Fail -> pass: {counts['fail_to_pass']}   "
+          f"Infra changes: {counts['infra_changes']}")
+    for change in diff["pass_to_fail"][:limit]:
+        print(f"    {change['test_case_id']:<16} {change['category']}")
+    print(f"  Score changes >= {diff['thresholds']['score_delta']}: "
+          f"{counts['score_regressions']} down, {counts['score_improvements']} up")
+    for metric, shift in diff["metric_shifts"].items():
+        if abs(shift["delta"]) >= 0.005:
+            print(f"    {metric:<28} {shift['base_mean']:.3f} -> {shift['head_mean']:.3f} ({shift['delta']:+.3f})")
+    regressed = {category: stats for category, stats in diff["latency"].items() if stats["regressed"]}
+    print(f"  Latency regressions (p{diff['thresholds']['latency_percentile']:.0f}): {len(regressed)}")
+    for category, stats in regressed.items():
+        print(f"    {category:<28} {stats['base_ms']:.0f}ms -> {stats['head_ms']:.0f}ms ({stats['delta_pct']:+.0f}%)")
+    print(f"  Compared in {diff['compare_ms']:.1f}ms")
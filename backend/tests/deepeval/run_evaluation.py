@@ -25,38 +25,96 @@ Usage:
     # Custom output
     python run_evaluation.py --output-dir ./my_reports
 
+    # Open-loop load test (no judging), stepped ramp from 1 to 20 sessions/s
+    python run_evaluation.py --load --load-arrival ramp --load-ramp-start 1 --load-ramp-end 20
+
+    # Adaptive run that stops each category early, compared against a previous run
+    python run_evaluation.py --adaptive --baseline reports/single_turn_results_20240101_120000.jsonl.zst
+
+    # Sharded run across four machines, then merge the shard outputs
+    python run_evaluation.py --all --shard 1/4   # ... through --shard 4/4
+    python run_evaluation.py merge reports/*_results_*_shard*of4.jsonl.zst
+
+    # Elastic workers sharing a queue, then collect the results
+    python run_evaluation.py --all --enqueue --queue /shared/run.db
+    python run_evaluation.py --worker --queue /shared/run.db   # any number of these
+    python run_evaluation.py queue /shared/run.db
+
+    # Two-phase run: collect answers once, judge them later
+    python run_evaluation.py collect responses.jsonl --all --workers 16
+    python run_evaluation.py judge responses.jsonl
+
+    # Metric trend and flaky cases across past runs
+    python run_evaluation.py history trend --metric "Answer Relevancy" --category location_extraction
+    python run_evaluation.py history flaky
+
+    # Regression diff between two runs of the same suite
+    python run_evaluation.py compare reports/run_a/single_turn_results.json reports/run_b/single_turn_results.json
+
+    # All past single-turn runs as one Parquet dataset for pandas/DuckDB analysis
+    python run_evaluation.py export reports/single_turn_results_*.parquet --output all_runs.parquet
+
+    # Multi-turn run that sends shared conversation openings once
+    python run_evaluation.py --multi-turn --share-prefixes
+
+    # Pipelined single-turn run: 8 chatbot requests and 4 judges in flight
+    python run_evaluation.py --pipeline --collect-workers 8 --judge-workers 4
+
 Requirements:
     pip install -r requirements.txt
 """
 
 import os
 import sys
-import asyncio
+import json
 import argparse
-import shutil
+import socket
+import time
+from dataclasses import asdict
 from datetime import datetime
 from pathlib import Path
+from typing import List
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from config import REPORT_CONFIG, TEST_CATEGORIES
-from test_cases_generator import generate_all_test_cases, export_test_cases_to_json
-from multi_turn_test_cases import generate_all_multi_turn_test_cases, export_multi_turn_test_cases
-from evaluation import Evaluator
-from multi_turn_evaluation import MultiTurnEvaluator
-from report_generator import load_evaluation_results, generate_html_report, ReportData
-
-
-# Multi-turn categories
-MULTI_TURN_CATEGORIES = [
-    "fire_emergency_flow",
-    "medical_emergency_flow",
-    "security_emergency_flow",
-    "user_correction_flow",
-    "authenticated_user_flow",
-    "edge_case_flow"
-]
+from config import (
+    REPORT_CONFIG, TEST_CATEGORIES, WORK_QUEUE_CONFIG, PIPELINE_CONFIG, EVALUATION_MODEL, HISTORY_CONFIG,
+    COMPARE_CONFIG, COLUMNAR_CONFIG
+)
+from test_cases_generator import generate_all_test_cases, TestCase
+from multi_turn_test_cases import (
+    generate_all_multi_turn_test_cases, MultiTurnTestCase, MULTI_TURN_GENERATORS
+)
+from report_generator import (
+    load_evaluation_results, generate_html_report, ReportData,
+    render_judge_usage_panel, JUDGE_USAGE_CSS,
+    render_latency_panel, LATENCY_PANEL_CSS,
+    render_pass_rate_panel, PASS_RATE_CI_CSS,
+    render_bootstrap_panel, BOOTSTRAP_CSS,
+    generate_load_test_html_report, generate_compare_html_report
+)
+from sharding import (
+    parse_shard, select_shard, shard_suffix,
+    load_shard_files, check_shard_coverage, merge_shard_results, describe_shards, detect_suite
+)
+from work_queue import WorkQueue, LeaseHeartbeat, STATUSES
+from artifact_store import (
+    artifact_extension, artifact_stem, resolve_artifact, store_corpus, point_latest, write_results
+)
+from response_artifact import (
+    JsonlWriter, open_artifact, response_record, is_infra_record, load_artifact,
+    pending_cases, judge_checkpoint_path, load_judged
+)
+from history_store import HistoryStore, history_path, record_export, format_time
+
+# asyncio and the modules that pull in deepeval, requests, aiohttp, pandas or numpy
+# (evaluation, multi_turn_evaluation, load_test, sampling, columnar, pipeline, run_diff)
+# are imported inside the commands that use them, so listing and report commands start fast.
+
+
+# Multi-turn categories, one per registered generator
+MULTI_TURN_CATEGORIES = [category for _, category, _ in MULTI_TURN_GENERATORS]
 
 
 def setup_output_directory(output_dir: str) -> Path:
@@ -77,6 +135,16 @@ def print_banner(mode: str = "single"):
     ║  Complete Conversation Workflow Testing                      ║
     ║  Real Sessions | State Management | Workflow Completion      ║
     ║                                                              ║
+    ╚══════════════════════════════════════════════════════════════╝
+        """
+    elif mode == "load":
+        banner = """
+    ╔══════════════════════════════════════════════════════════════╗
+    ║                                                              ║
+    ║     112 CALL CENTER AGENT - OPEN-LOOP LOAD TEST              ║
+    ║                                                              ║
+    ║  Corpus Replay | Throughput | Latency Percentiles | No Judge ║
+    ║                                                              ║
     ╚══════════════════════════════════════════════════════════════╝
         """
     elif mode == "all":
@@ -139,112 +207,172 @@ def check_chatbot_running(chatbot_url: str, force: bool = False) -> bool:
     return True
 
 
-async def run_single_turn_evaluation(args, output_dir: Path, timestamp: str) -> dict:
-    """Run single-turn evaluation"""
+def apply_shard(args):
+    """Output filename suffix and summary metadata for a --shard run"""
+    if not args.shard:
+        return "", None
+    index, total = args.shard
+    return shard_suffix(index, total), {"shard": {"index": index, "total": total}}
+
+
+def write_single_turn_report(summary: dict, results: list, output_path: str):
+    """Generate the single-turn HTML report from EvaluationResult objects"""
+    report_data = ReportData(
+        summary=summary,
+        results=[
+            {
+                "test_case_id": r.test_case_id,
+                "category": r.category,
+                "subcategory": r.subcategory,
+                "input_message": r.input_message,
+                "actual_output": r.actual_output,
+                "expected_output": r.expected_output,
+                "metrics": r.metrics,
+                "passed": r.passed,
+                "timestamp": r.timestamp,
+                "duration_ms": r.duration_ms,
+                "errors": r.errors,
+                "judge_usage": r.judge_usage,
+                "chatbot_latency_ms": r.chatbot_latency_ms,
+                "judge_latency_ms": r.judge_latency_ms,
+                "metric_latency_ms": r.metric_latency_ms,
+                "overhead_ms": r.overhead_ms,
+                "infra_failure": r.infra_failure,
+                "transport_retries": r.transport_retries,
+                "dedup_of": r.dedup_of
+            }
+            for r in results
+        ],
+        timestamp=datetime.now().isoformat()
+    )
+    generate_html_report(report_data, output_path)
+
+
+def print_corpus(corpus: dict, output_dir: Path):
+    """Console line for a stored test case corpus"""
+    state = "Saved to" if corpus["new"] else "Unchanged, already in"
+    print(f"  {state}: {output_dir / corpus['path']}")
+
+
+def prepare_single_turn_cases(args, output_dir: Path, timestamp: str) -> tuple:
+    """Generate, filter, sample and shard single-turn test cases; returns (test_cases, corpus)"""
+    from sampling import stratified_sample, describe_sample
 
     print(f"\n[SINGLE-TURN] Generating test cases...")
     print("-" * 50)
 
-    # Generate test cases
-    test_cases = generate_all_test_cases()
+    # Generate test cases, running only the category's generator when filtered
+    categories = [args.category] if args.category in TEST_CATEGORIES else None
+    test_cases = generate_all_test_cases(seed=args.seed, categories=categories)
+    corpus = store_corpus(output_dir, "single_turn", [asdict(tc) for tc in test_cases])
+
+    scope = f" in category '{args.category}'" if categories else ""
+    print(f"  Generated {len(test_cases)} test cases{scope}")
+    print_corpus(corpus, output_dir)
 
-    test_cases_file = output_dir / f"single_turn_test_cases_{timestamp}.json"
-    export_test_cases_to_json(test_cases, str(test_cases_file))
+    if args.quick or args.max_cases:
+        max_cases = args.max_cases or 10
+        test_cases = stratified_sample(test_cases, max_cases, seed=args.seed)
+        mode = "Quick mode: limited" if args.quick else "Limited"
+        print(f"  {mode} to {len(test_cases)} cases "
+              f"(stratified across {len(describe_sample(test_cases))} categories, seed {args.seed})")
 
-    print(f"  Generated {len(test_cases)} test cases")
-    print(f"  Saved to: {test_cases_file}")
+    if args.shard:
+        test_cases = select_shard(test_cases, *args.shard)
+        print(f"  Shard {args.shard[0]}/{args.shard[1]}: {len(test_cases)} cases")
 
-    # Apply filters
-    if args.category and args.category in TEST_CATEGORIES:
-        test_cases = [tc for tc in test_cases if tc.category == args.category]
-        print(f"  Filtered to category '{args.category}': {len(test_cases)} cases")
+    return test_cases, corpus
 
-    if args.quick:
-        max_cases = args.max_cases or 10
-        test_cases = test_cases[:max_cases]
-        print(f"  Quick mode: limited to {len(test_cases)} cases")
-    elif args.max_cases:
-        test_cases = test_cases[:args.max_cases]
-        print(f"  Limited to {len(test_cases)} cases")
+
+async def run_single_turn_evaluation(args, output_dir: Path, timestamp: str) -> dict:
+    """Run single-turn evaluation"""
+    from evaluation import Evaluator
+
+    test_cases, corpus = prepare_single_turn_cases(args, output_dir, timestamp)
+    suffix, extra_summary = apply_shard(args)
+    extra_summary = {**(extra_summary or {}), "corpus": {"hash": corpus["hash"], "path": corpus["path"]}}
 
     print(f"\n[SINGLE-TURN] Running evaluation...")
     print("-" * 50)
 
     # Initialize evaluator
-    evaluator = Evaluator(chatbot_url=args.chatbot_url)
+    evaluator = Evaluator(chatbot_url=args.chatbot_url, hedge=args.hedge, seed_sessions=args.seed_sessions)
+
+    baseline_pass_rates = None
+    if args.baseline:
+        baseline_pass_rates = load_evaluation_results(args.baseline).summary.get("category_pass_rates", {})
+        print(f"  Baseline: {args.baseline} ({len(baseline_pass_rates)} categories)")
 
     # Run evaluation
     results = await evaluator.run_evaluation(
         test_cases=test_cases,
-        verbose=args.verbose
+        verbose=args.verbose,
+        seed=args.seed,
+        adaptive=args.adaptive,
+        target_ci_width=args.target_ci_width,
+        baseline_pass_rates=baseline_pass_rates,
+        pipeline=args.pipeline,
+        collect_workers=args.collect_workers,
+        judge_workers=args.judge_workers,
+        queue_size=args.queue_size,
+        dedup=args.dedup
     )
 
     # Export results
-    results_file = output_dir / f"single_turn_results_{timestamp}.json"
-    evaluator.export_results(str(results_file))
+    results_file = output_dir / f"single_turn_results_{timestamp}{suffix}{artifact_extension()}"
+    evaluator.export_results(str(results_file), extra_summary)
 
     summary = evaluator.get_summary()
     print(f"\n  Single-turn evaluation complete!")
     print(f"  Results saved to: {results_file}")
 
     # Generate HTML report
-    report_file = output_dir / f"single_turn_report_{timestamp}.html"
-    report_data = ReportData(
-        summary=summary,
-        results=[
-            {
-                "test_case_id": r.test_case_id,
-                "category": r.category,
-                "subcategory": r.subcategory,
-                "input_message": r.input_message,
-                "actual_output": r.actual_output,
-                "expected_output": r.expected_output,
-                "metrics": r.metrics,
-                "passed": r.passed,
-                "timestamp": r.timestamp,
-                "duration_ms": r.duration_ms,
-                "errors": r.errors
-            }
-            for r in results
-        ],
-        timestamp=datetime.now().isoformat()
-    )
-    generate_html_report(report_data, str(report_file))
+    report_file = output_dir / f"single_turn_report_{timestamp}{suffix}.html"
+    write_single_turn_report(summary, results, str(report_file))
 
-    # Copy to latest
-    shutil.copy(str(results_file), str(output_dir / "single_turn_results.json"))
-    shutil.copy(str(report_file), str(output_dir / "single_turn_report.html"))
+    # Point latest at this run
+    point_latest(output_dir, "single_turn", suffix, results_file, report_file, corpus)
 
     return summary
 
 
-async def run_multi_turn_evaluation(args, output_dir: Path, timestamp: str) -> dict:
-    """Run multi-turn conversation evaluation"""
+def prepare_multi_turn_cases(args, output_dir: Path, timestamp: str) -> tuple:
+    """Generate, filter, sample and shard multi-turn test cases; returns (test_cases, corpus)"""
+    from sampling import stratified_sample, describe_sample
 
     print(f"\n[MULTI-TURN] Generating conversation test cases...")
     print("-" * 50)
 
-    # Generate test cases
-    test_cases = generate_all_multi_turn_test_cases()
+    # Generate test cases, running only the category's generator when filtered
+    categories = [args.category] if args.category in MULTI_TURN_CATEGORIES else None
+    test_cases = generate_all_multi_turn_test_cases(seed=args.seed, categories=categories)
+    corpus = store_corpus(output_dir, "multi_turn", [asdict(tc) for tc in test_cases])
 
-    test_cases_file = output_dir / f"multi_turn_test_cases_{timestamp}.json"
-    export_multi_turn_test_cases(test_cases, str(test_cases_file))
+    scope = f" in category '{args.category}'" if categories else ""
+    print(f"  Generated {len(test_cases)} multi-turn test cases{scope}")
+    print_corpus(corpus, output_dir)
 
-    print(f"  Generated {len(test_cases)} multi-turn test cases")
-    print(f"  Saved to: {test_cases_file}")
+    if args.quick or args.max_cases:
+        max_cases = args.max_cases or 10
+        test_cases = stratified_sample(test_cases, max_cases, seed=args.seed)
+        mode = "Quick mode: limited" if args.quick else "Limited"
+        print(f"  {mode} to {len(test_cases)} conversations "
+              f"(stratified across {len(describe_sample(test_cases))} categories, seed {args.seed})")
 
-    # Apply filters
-    if args.category and args.category in MULTI_TURN_CATEGORIES:
-        test_cases = [tc for tc in test_cases if tc.category == args.category]
-        print(f"  Filtered to category '{args.category}': {len(test_cases)} cases")
+    if args.shard:
+        test_cases = select_shard(test_cases, *args.shard)
+        print(f"  Shard {args.shard[0]}/{args.shard[1]}: {len(test_cases)} conversations")
 
-    if args.quick:
-        max_cases = args.max_cases or 10
-        test_cases = test_cases[:max_cases]
-        print(f"  Quick mode: limited to {len(test_cases)} conversations")
-    elif args.max_cases:
-        test_cases = test_cases[:args.max_cases]
-        print(f"  Limited to {len(test_cases)} conversations")
+    return test_cases, corpus
+
+
+async def run_multi_turn_evaluation(args, output_dir: Path, timestamp: str) -> dict:
+    """Run multi-turn conversation evaluation"""
+    from multi_turn_evaluation import MultiTurnEvaluator
+
+    test_cases, corpus = prepare_multi_turn_cases(args, output_dir, timestamp)
+    suffix, extra_summary = apply_shard(args)
+    extra_summary = {**(extra_summary or {}), "corpus": {"hash": corpus["hash"], "path": corpus["path"]}}
 
     print(f"\n[MULTI-TURN] Running conversation evaluation...")
     print("-" * 50)
@@ -255,24 +383,24 @@ async def run_multi_turn_evaluation(args, output_dir: Path, timestamp: str) -> d
     # Run evaluation
     results = await evaluator.run_evaluation(
         test_cases=test_cases,
-        verbose=args.verbose
+        verbose=args.verbose,
+        share_prefixes=args.share_prefixes
     )
 
     # Export results
-    results_file = output_dir / f"multi_turn_results_{timestamp}.json"
-    evaluator.export_results(str(results_file))
+    results_file = output_dir / f"multi_turn_results_{timestamp}{suffix}{artifact_extension()}"
+    evaluator.export_results(str(results_file), extra_summary)
 
     summary = evaluator.get_summary()
     print(f"\n  Multi-turn evaluation complete!")
     print(f"  Results saved to: {results_file}")
 
     # Generate HTML report for multi-turn
-    report_file = output_dir / f"multi_turn_report_{timestamp}.html"
+    report_file = output_dir / f"multi_turn_report_{timestamp}{suffix}.html"
     generate_multi_turn_html_report(evaluator.results, summary, str(report_file))
 
-    # Copy to latest
-    shutil.copy(str(results_file), str(output_dir / "multi_turn_results.json"))
-    shutil.copy(str(report_file), str(output_dir / "multi_turn_report.html"))
+    # Point latest at this run
+    point_latest(output_dir, "multi_turn", suffix, results_file, report_file, corpus)
 
     return summary
 
@@ -338,6 +466,8 @@ def generate_multi_turn_html_report(results, summary, output_path: str):
                 <span>Workflow: {'Complete' if result.workflow_completed else 'Incomplete'}</span>
                 <span>Ticket: {result.ticket_id or 'Not created'}</span>
                 <span>Duration: {result.total_duration_ms:.0f}ms</span>
+                <span>Chatbot: {result.chatbot_latency_ms:.0f}ms</span>
+                <span>Judge: {result.judge_latency_ms:.0f}ms</span>
             </div>
             <div class="card-metrics">
                 {metrics_html}
@@ -351,6 +481,19 @@ def generate_multi_turn_html_report(results, summary, output_path: str):
         </div>
         """
 
+    # Judge context compaction savings
+    savings_rows = ""
+    for metric, usage in summary.get('context_token_savings', {}).items():
+        savings_rows += f"""
+            <tr>
+                <td>{metric}</td>
+                <td>{usage['baseline_tokens']:,}</td>
+                <td>{usage['compacted_tokens']:,}</td>
+                <td>{usage['saved_tokens']:,}</td>
+                <td>{usage['saved_pct']:.1f}%</td>
+            </tr>
+            """
+
     # Build full HTML
     html_content = f"""
 <!DOCTYPE html>
@@ -507,6 +650,31 @@ def generate_multi_turn_html_report(results, summary, output_path: str):
             margin-top: 0.5rem;
         }}
 
+        .savings-table {{
+            width: 100%;
+            border-collapse: collapse;
+            background: var(--card-bg);
+            border-radius: 8px;
+            box-shadow: 0 1px 3px rgba(0,0,0,0.1);
+            margin-bottom: 2rem;
+            font-size: 0.875rem;
+        }}
+
+        .savings-table th, .savings-table td {{
+            padding: 0.5rem 1rem;
+            text-align: left;
+            border-bottom: 1px solid var(--border);
+        }}
+
+        .savings-table th {{ color: var(--text-muted); font-weight: 600; }}
+
+        {JUDGE_USAGE_CSS}
+
+        {LATENCY_PANEL_CSS}
+
+        {PASS_RATE_CI_CSS}
+        {BOOTSTRAP_CSS}
+
         footer {{ text-align: center; padding: 2rem; color: var(--text-muted); }}
     </style>
 </head>
@@ -544,6 +712,31 @@ def generate_multi_turn_html_report(results, summary, output_path: str):
             </div>
         </div>
 
+        {render_pass_rate_panel(summary.get('pass_rate_ci', {}))}
+
+        {render_bootstrap_panel(summary.get('bootstrap_ci', {}), summary.get('score_histograms'))}
+
+        {render_latency_panel(summary.get('latency', {}))}
+
+        {render_judge_usage_panel(summary.get('judge_usage', {}))}
+
+        <h2 style="margin-bottom: 1rem;">Judge Context Tokens Saved</h2>
+
+        <table class="savings-table">
+            <thead>
+                <tr>
+                    <th>Metric</th>
+                    <th>Full Context</th>
+                    <th>Compacted</th>
+                    <th>Saved</th>
+                    <th>Saved %</th>
+                </tr>
+            </thead>
+            <tbody>
+                {savings_rows}
+            </tbody>
+        </table>
+
         <h2 style="margin-bottom: 1rem;">Conversation Results</h2>
 
         {conversation_cards}
@@ -562,24 +755,198 @@ def generate_multi_turn_html_report(results, summary, output_path: str):
     print(f"  Multi-turn report saved to: {output_path}")
 
 
+async def run_load_test(args, output_dir: Path, timestamp: str) -> dict:
+    """Replay the test corpora at a target arrival rate without judging"""
+    from load_test import LoadTester, LoadTestSettings, LazyLoadSessions, build_load_sessions
+
+    print(f"\n[LOAD] Building load corpus...")
+    print("-" * 50)
+
+    if args.load_synthetic:
+        from synthetic_corpus import SyntheticCorpus
+
+        sessions = LazyLoadSessions(SyntheticCorpus(args.load_synthetic, seed=args.seed))
+        print(f"  {len(sessions)} synthetic single-turn sessions (rendered on demand)")
+    else:
+        single_turn_cases = []
+        multi_turn_cases = []
+        if not args.multi_turn or args.all:
+            categories = [args.category] if args.category in TEST_CATEGORIES else None
+            single_turn_cases = generate_all_test_cases(seed=args.seed, categories=categories)
+        if args.multi_turn or args.all:
+            categories = [args.category] if args.category in MULTI_TURN_CATEGORIES else None
+            multi_turn_cases = generate_all_multi_turn_test_cases(seed=args.seed, categories=categories)
+
+        sessions = build_load_sessions(single_turn_cases, multi_turn_cases)
+        print(f"  {len(single_turn_cases)} single-turn + {len(multi_turn_cases)} multi-turn sessions")
+
+    settings = LoadTestSettings(
+        arrival=args.load_arrival,
+        rate=args.load_rate,
+        duration_s=args.load_duration,
+        ramp_start=args.load_ramp_start,
+        ramp_end=args.load_ramp_end,
+        ramp_steps=args.load_ramp_steps,
+        max_concurrency=args.load_max_concurrency,
+        timeout_s=args.load_timeout,
+        seed=args.seed
+    )
+
+    print(f"\n[LOAD] Offering load...")
+    print("-" * 50)
+
+    tester = LoadTester(chatbot_url=args.chatbot_url, settings=settings)
+    summary = await tester.run(sessions, verbose=args.verbose)
+
+    results_file = output_dir / f"load_test_results_{timestamp}.json"
+    tester.export_results(str(results_file))
+
+    report_file = output_dir / f"load_test_report_{timestamp}.html"
+    generate_load_test_html_report(summary, str(report_file))
+
+    return summary
+
+
+def enqueue_cases(args, output_dir: Path, timestamp: str) -> dict:
+    """Write the selected corpus into the shared work queue"""
+    queue = WorkQueue(args.queue)
+    added = {}
+    if not args.multi_turn or args.all:
+        added["single_turn"] = queue.enqueue("single_turn", prepare_single_turn_cases(args, output_dir, timestamp)[0])
+    if args.multi_turn or args.all:
+        added["multi_turn"] = queue.enqueue("multi_turn", prepare_multi_turn_cases(args, output_dir, timestamp)[0])
+
+    print(f"\n[QUEUE] {args.queue}")
+    print("-" * 50)
+    for suite, count in added.items():
+        print(f"  Enqueued {count} new {suite} cases")
+    print(f"  Start workers with: python run_evaluation.py --worker --queue {args.queue}")
+    return {"enqueued": added, "status": queue.counts()}
+
+
+async def run_worker(args) -> dict:
+    """Claim and evaluate cases from the work queue until it is drained"""
+    import asyncio
+    from evaluation import Evaluator
+    from multi_turn_evaluation import MultiTurnEvaluator
+    queue = WorkQueue(args.queue)
+    worker_id = args.worker_id or f"{socket.gethostname()}-{os.getpid()}"
+    poll_s = WORK_QUEUE_CONFIG["poll_interval_s"]
+    evaluators = {}
+    processed = {"done": 0, "released": 0, "lost": 0}
+
+    print(f"\n[WORKER] {worker_id} on {args.queue}")
+    print("-" * 50)
+
+    while True:
+        lease = queue.claim(worker_id)
+        if lease is None:
+            if queue.is_drained():
+                break
+            # Other workers still hold leases; wait in case one of them expires
+            await asyncio.sleep(poll_s)
+            continue
+
+        if args.verbose:
+            print(f"  [{lease.suite}] {lease.test_case_id} (attempt {lease.attempts})")
+
+        try:
+            with LeaseHeartbeat(args.queue, worker_id, lease) as heartbeat:
+                if lease.suite == "multi_turn":
+                    if "multi_turn" not in evaluators:
+                        evaluators["multi_turn"] = MultiTurnEvaluator(chatbot_url=args.chatbot_url)
+                    evaluator = evaluators["multi_turn"]
+                    result = await evaluator.evaluate_conversation(
+                        MultiTurnTestCase.from_dict(lease.payload), args.verbose
+                    )
+                    evaluator.results.clear()
+                else:
+                    if "single_turn" not in evaluators:
+                        evaluators["single_turn"] = Evaluator(
+                            chatbot_url=args.chatbot_url, hedge=args.hedge, seed_sessions=args.seed_sessions
+                        )
+                    result = await evaluators["single_turn"].evaluate_single_test_case(
+                        TestCase(**lease.payload), args.verbose
+                    )
+        except Exception as e:
+            queue.release(worker_id, lease, f"{type(e).__name__}: {e}")
+            processed["released"] += 1
+            print(f"  Released {lease.test_case_id}: {e}")
+            continue
+
+        if result.infra_failure and lease.attempts < WORK_QUEUE_CONFIG["max_attempts"]:
+            # Give another worker (or this one, after the outage) a chance
+            queue.release(worker_id, lease, "; ".join(result.errors))
+            processed["released"] += 1
+            continue
+
+        if heartbeat.lost:
+            processed["lost"] += 1
+            print(f"  Lease on {lease.test_case_id} expired during evaluation; submitting anyway")
+        if queue.complete(worker_id, lease, asdict(result)):
+            processed["done"] += 1
+
+    print(f"\n  Worker finished: {processed['done']} completed, {processed['released']} released")
+    print(f"  Collect results with: python run_evaluation.py queue {args.queue}")
+    return {"worker": worker_id, **processed}
+
+
+def print_transport_summary(summary: dict):
+    """Infra failures and circuit breaker pauses, if there were any"""
+    transport = summary.get("transport") or {}
+    breaker = transport.get("circuit_breaker") or {}
+    if transport.get("infra_failures") or transport.get("retries") or breaker.get("pauses"):
+        print(f"  Infra Failures: {transport.get('infra_failures', 0)} (not judged, excluded from rates); "
+              f"{transport.get('retries', 0)} retries, "
+              f"{breaker.get('pauses', 0)} breaker pauses ({breaker.get('paused_s', 0):.0f}s)")
+
+
 async def run_full_evaluation(args) -> dict:
     """Run the complete evaluation pipeline"""
 
-    mode = "multi" if args.multi_turn else ("all" if args.all else "single")
+    if args.load:
+        mode = "load"
+    else:
+        mode = "multi" if args.multi_turn else ("all" if args.all else "single")
     print_banner(mode)
 
     # Setup output directory
     output_dir = setup_output_directory(args.output_dir)
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
+    if args.enqueue:
+        return enqueue_cases(args, output_dir, timestamp)
+
     # Check chatbot
     print("\n[SETUP] Checking chatbot connection...")
     print("-" * 50)
     if not check_chatbot_running(args.chatbot_url, args.force):
         return {"error": "Chatbot not running"}
 
+    if args.worker:
+        return await run_worker(args)
+
     results = {}
 
+    if args.load:
+        results["load"] = summary = await run_load_test(args, output_dir, timestamp)
+        knee = summary.get("saturation_knee")
+        print(f"\n{'='*60}")
+        print("LOAD TEST SUMMARY")
+        print(f"{'='*60}")
+        print(f"  Requests:   {summary.get('total_requests', 0)}")
+        print(f"  Throughput: {summary.get('throughput_rps', 0):.2f} req/s")
+        print(f"  Error Rate: {summary.get('error_rate', 0):.1f}%")
+        print(f"  Latency:    p50 {summary.get('p50_ms', 0):.0f}ms, "
+              f"p90 {summary.get('p90_ms', 0):.0f}ms, p99 {summary.get('p99_ms', 0):.0f}ms")
+        if knee:
+            print(f"  Saturation knee at {knee['offered_sessions_per_s']:.1f} sessions/s "
+                  f"({', '.join(knee['reasons'])})")
+        else:
+            print(f"  No saturation knee reached")
+        print(f"\n Output Directory: {output_dir}")
+        return results
+
     # Run single-turn evaluation
     if not args.multi_turn or args.all:
         results["single_turn"] = await run_single_turn_evaluation(args, output_dir, timestamp)
@@ -598,12 +965,52 @@ async def run_full_evaluation(args) -> dict:
         print(f"\nSingle-Turn Evaluation:")
         print(f"  Test Cases: {st.get('total_test_cases', 0)}")
         print(f"  Pass Rate:  {st.get('pass_rate', 0):.1f}%")
+        print_transport_summary(st)
+        hedging = st.get("hedging")
+        if hedging:
+            print(f"  Hedging:    {hedging['hedged']}/{hedging['requests']} requests hedged, "
+                  f"p99 {hedging['without_hedging']['p99_ms']:.0f}ms -> "
+                  f"{hedging['with_hedging']['p99_ms']:.0f}ms")
+        pipeline = st.get("pipeline")
+        if pipeline:
+            bottleneck = pipeline["bottleneck"]
+            print(f"  Pipeline:   bottleneck {bottleneck} "
+                  f"({pipeline['stages'][bottleneck]['utilization']:.0f}% busy), "
+                  f"{pipeline['wall_s']:.1f}s wall")
+        seeding = st.get("session_seeding")
+        if seeding:
+            print(f"  Seeded:     {seeding['seeded']} sessions started mid-workflow"
+                  f"{', ' + str(seeding['failed']) + ' fell back to context' if seeding['failed'] else ''}")
+        dedup = st.get("dedup")
+        if dedup:
+            print(f"  Dedup:      {dedup['cases']} cases in {dedup['classes']} classes "
+                  f"({dedup['ratio']:.2f}x, {dedup['saved_pct']:.0f}% of evaluations saved)")
+        ci = st.get("pass_rate_ci", {}).get("overall")
+        if ci:
+            print(f"  Pass Rate CI: {ci['ci_low']:.1f}-{ci['ci_high']:.1f}% "
+                  f"({st['pass_rate_ci']['confidence']:.0%} Wilson)")
+        if st.get("adaptive"):
+            print(f"  Adaptive stopping:")
+            for category, info in st["adaptive"].items():
+                baseline = info.get("baseline_pass_rate")
+                baseline_str = f", baseline {baseline:.1f}%" if baseline is not None else ""
+                print(f"    - {category}: {info['stop_reason']} after {info['evaluated']}/{info['available']} "
+                      f"({info['pass_rate']:.1f}%{baseline_str})")
 
     if "multi_turn" in results:
         mt = results["multi_turn"]
         print(f"\nMulti-Turn Evaluation:")
         print(f"  Conversations: {mt.get('total_conversations', 0)}")
         print(f"  Pass Rate:     {mt.get('pass_rate', 0):.1f}%")
+        print_transport_summary(mt)
+        prefix = mt.get("prefix_sharing")
+        if prefix:
+            print(f"  Prefix Sharing: {prefix['chatbot_calls']}/{prefix['case_turns']} chatbot calls "
+                  f"({prefix['saved_pct']:.0f}% saved, {prefix['forks']} forks)")
+        ci = mt.get("pass_rate_ci", {}).get("overall")
+        if ci:
+            print(f"  Pass Rate CI:  {ci['ci_low']:.1f}-{ci['ci_high']:.1f}% "
+                  f"({mt['pass_rate_ci']['confidence']:.0%} Wilson)")
         print(f"  Workflow Complete: {mt.get('workflow_completion_rate', 0):.1f}%")
         print(f"  Tickets Created:   {mt.get('ticket_creation_rate', 0):.1f}%")
 
@@ -614,8 +1021,628 @@ async def run_full_evaluation(args) -> dict:
     return results
 
 
+def write_combined_run(
+    suite: str,
+    result_dicts: List[dict],
+    output_dir: Path,
+    label: str,
+    extra_summary: dict = None
+) -> dict:
+    """Write results gathered outside one evaluator (shards, work queue) as a run.
+
+    The summary is recomputed from the combined results with the same code
+    as Evaluator.get_summary / MultiTurnEvaluator.get_summary.
+    """
+    from evaluation import EvaluationResult, summarize_results
+    from multi_turn_evaluation import MultiTurnEvaluationResult, summarize_multi_turn_results
+    from columnar import export_columnar
+    if suite == "multi_turn":
+        results = [MultiTurnEvaluationResult.from_dict(r) for r in result_dicts]
+        summary = summarize_multi_turn_results(results)
+    else:
+        results = [EvaluationResult.from_dict(r) for r in result_dicts]
+        summary = summarize_results(results)
+    summary.update(extra_summary or {})
+
+    result_dicts = [asdict(r) for r in results]
+    results_file = output_dir / f"{suite}_results_{label}{artifact_extension()}"
+    write_results(results_file, summary, result_dicts)
+
+    report_file = output_dir / f"{suite}_report_{label}.html"
+    if suite == "multi_turn":
+        generate_multi_turn_html_report(results, summary, str(report_file))
+    else:
+        write_single_turn_report(summary, results, str(report_file))
+
+    point_latest(output_dir, suite, "", results_file, report_file, summary.get("corpus"))
+    record_export(suite, str(results_file), summary, result_dicts)
+    export_columnar(suite, str(results_file), results)
+
+    print(f"  Combined {len(results)} results, pass rate {summary.get('pass_rate', 0):.1f}%")
+    print(f"  Results saved to: {results_file}")
+    print(f"  Report saved to:  {report_file}")
+    return summary
+
+
+def merge_shards(argv: List[str]) -> int:
+    """Combine --shard result files into one run, as if it had not been sharded"""
+    parser = argparse.ArgumentParser(
+        prog="run_evaluation.py merge",
+        description="Merge sharded result files into one summary and report"
+    )
+    parser.add_argument(
+        "files",
+        nargs="+",
+        help="Shard result JSON files (single-turn and/or multi-turn)"
+    )
+    parser.add_argument(
+        "--output-dir",
+        type=str,
+        default="./reports",
+        help="Output directory for the merged results and reports"
+    )
+    parser.add_argument(
+        "--strict",
+        action="store_true",
+        help="Fail instead of warning on missing, repeated or duplicate shards"
+    )
+    args = parser.parse_args(argv)
+
+    output_dir = setup_output_directory(args.output_dir)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    problems = 0
+
+    for suite, shards in sorted(load_shard_files(args.files).items()):
+        print(f"\n[MERGE] {suite}: {len(shards)} files")
+        print("-" * 50)
+
+        warnings = check_shard_coverage(shards)
+        merged, duplicates = merge_shard_results(shards)
+        if duplicates:
+            warnings.append(f"{len(duplicates)} test cases appear in more than one file "
+                            f"(kept first): {', '.join(duplicates[:5])}")
+        for warning in warnings:
+            print(f"  Warning: {warning}")
+        problems += len(warnings)
+        if warnings and args.strict:
+            continue
+
+        extra_summary = {"merged_from": describe_shards(shards)}
+        corpora = {shard["summary"]["corpus"]["hash"]: shard["summary"]["corpus"]
+                   for shard in shards if shard["summary"].get("corpus")}
+        if len(corpora) == 1:
+            extra_summary["corpus"] = next(iter(corpora.values()))
+        write_combined_run(suite, merged, output_dir, f"{timestamp}_merged", extra_summary)
+
+    if problems and args.strict:
+        print(f"\n Merge failed: {problems} problem(s) with the shard files")
+        return 1
+    return 0
+
+
+def collect_queue(argv: List[str]) -> int:
+    """Show progress of a --worker queue and write its results as a run"""
+    parser = argparse.ArgumentParser(
+        prog="run_evaluation.py queue",
+        description="Show work queue progress; once drained, write results and reports"
+    )
+    parser.add_argument("queue", help="Work queue SQLite file")
+    parser.add_argument(
+        "--output-dir",
+        type=str,
+        default="./reports",
+        help="Output directory for the collected results and reports"
+    )
+    parser.add_argument(
+        "--partial",
+        action="store_true",
+        help="Write results even though cases are still pending or leased"
+    )
+    args = parser.parse_args(argv)
+
+    queue = WorkQueue(args.queue)
+    counts = queue.counts()
+    print(f"\n[QUEUE] {args.queue}")
+    print("-" * 50)
+    for suite, by_status in sorted(counts.items()):
+        print(f"  {suite}: " + ", ".join(f"{by_status[s]} {s}" for s in STATUSES))
+    for worker, leased in sorted(queue.workers().items()):
+        print(f"  Worker {worker}: {leased} leased")
+
+    if not queue.is_drained() and not args.partial:
+        print(f"\n  Queue not drained yet; use --partial to write what is done so far")
+        return 0
+
+    output_dir = setup_output_directory(args.output_dir)
+    label = datetime.now().strftime("%Y%m%d_%H%M%S") + "_queue"
+    for suite in sorted(counts):
+        results = queue.results(suite)
+        if not results:
+            continue
+        print(f"\n[QUEUE] Writing {suite} results...")
+        print("-" * 50)
+        failures = queue.failures(suite)
+        for failure in failures:
+            print(f"  Failed after {failure['attempts']} attempts: "
+                  f"{failure['test_case_id']} ({failure['error']})")
+        write_combined_run(suite, results, output_dir, label, {
+            "work_queue": {"file": args.queue, "status": counts[suite], "failures": failures}
+        })
+    return 0
+
+
+def collect_responses(argv: List[str]) -> int:
+    """Phase one of a two-phase run: collect chatbot answers into an artifact, without judging"""
+    parser = argparse.ArgumentParser(
+        prog="run_evaluation.py collect",
+        description="Send the selected test cases to the chatbot and store the answers for `judge`"
+    )
+    parser.add_argument("artifact", help="Response artifact to write (JSON Lines)")
+    parser.add_argument("--multi-turn", action="store_true", help="Collect multi-turn transcripts")
+    parser.add_argument("--all", action="store_true", help="Collect single-turn and multi-turn")
+    parser.add_argument("--category", type=str, default=None, help="Collect only this category")
+    parser.add_argument("--quick", action="store_true", help="Stratified sample of 10 cases")
+    parser.add_argument("--max-cases", type=int, default=None, help="Stratified sample of N cases")
+    parser.add_argument("--seed", type=int, default=42, help="Seed for test case generation and stratified sampling")
+    parser.add_argument("--shard", type=str, default=None, help="Collect only shard i of N (e.g. 2/4)")
+    parser.add_argument(
+        "--chatbot-url",
+        type=str,
+        default="http://localhost:5000",
+        help="Chatbot API URL"
+    )
+    parser.add_argument(
+        "--output-dir",
+        type=str,
+        default="./reports",
+        help="Directory for the exported test case lists"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=PIPELINE_CONFIG["collect_workers"],
+        help="Cases collected concurrently (conversations still run turn by turn)"
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Append to an existing artifact, skipping cases it already holds"
+    )
+    parser.add_argument(
+        "--retry-infra",
+        action="store_true",
+        help="With --resume, collect cases again whose stored answer is an infra failure"
+    )
+    parser.add_argument(
+        "--overwrite",
+        action="store_true",
+        help="Replace an existing artifact"
+    )
+    parser.add_argument(
+        "--no-seed-sessions",
+        dest="seed_sessions",
+        action="store_false",
+        help="Send context-bearing cases with their context instead of a seeded session"
+    )
+    parser.add_argument("--force", action="store_true", help="Collect even if the chatbot is not responding")
+    parser.add_argument("--quiet", action="store_true", help="No per-case output")
+    args = parser.parse_args(argv)
+
+    import asyncio
+    from evaluation import Evaluator
+    from multi_turn_evaluation import MultiTurnEvaluator
+    from pipeline import Pipeline, Stage
+
+    if args.shard:
+        try:
+            args.shard = parse_shard(args.shard)
+        except ValueError as e:
+            parser.error(str(e))
+    if os.path.exists(args.artifact) and not (args.resume or args.overwrite):
+        parser.error(f"{args.artifact} exists; use --resume to continue it or --overwrite to replace it")
+
+    output_dir = setup_output_directory(args.output_dir)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    if not check_chatbot_running(args.chatbot_url, args.force):
+        return 1
+
+    _, collected = load_artifact(args.artifact) if args.resume and os.path.exists(args.artifact) else ({}, {})
+    sources = []
+    if not args.multi_turn or args.all:
+        evaluator = Evaluator(chatbot_url=args.chatbot_url, seed_sessions=args.seed_sessions)
+        cases = pending_cases("single_turn", prepare_single_turn_cases(args, output_dir, timestamp)[0],
+                              collected, args.retry_infra)
+        sources += [
+            (tc, lambda tc: response_record("single_turn", asdict(tc), asdict(evaluator.collect_response(tc))))
+            for tc in cases
+        ]
+    if args.multi_turn or args.all:
+        multi_turn_evaluator = MultiTurnEvaluator(chatbot_url=args.chatbot_url)
+        cases = pending_cases("multi_turn", prepare_multi_turn_cases(args, output_dir, timestamp)[0],
+                              collected, args.retry_infra)
+        sources += [
+            (tc, lambda tc: response_record(
+                "multi_turn", asdict(tc), asdict(multi_turn_evaluator.collect_conversation(tc))
+            ))
+            for tc in cases
+        ]
+
+    already = sum(len(records) for records in collected.values())
+    print(f"\n[COLLECT] {len(sources)} cases to collect"
+          + (f" ({already} already in {args.artifact})" if already else ""))
+    print("-" * 50)
+
+    counts = {"collected": 0, "infra_failures": 0}
+    with open_artifact(args.artifact, args.resume, args.chatbot_url) as writer:
+        def write(record, _):
+            writer.write(record)
+            counts["collected"] += 1
+            infra = is_infra_record(record)
+            counts["infra_failures"] += 1 if infra else 0
+            if not args.quiet:
+                print(f"  [{counts['collected']}/{len(sources)}] {record['suite']} "
+                      f"{record['test_case']['id']}{' (infra failure)' if infra else ''}")
+
+        report = asyncio.run(Pipeline(
+            sources,
+            [
+                Stage("collect", lambda item, _: item[1](item[0]), args.workers),
+                Stage("write", write, inline=True)
+            ]
+        ).run())
+
+    print(f"\n  Collected {counts['collected']} cases in {report['wall_s']:.1f}s "
+          f"({counts['infra_failures']} infra failures)")
+    print(f"  Artifact: {args.artifact}")
+    if counts["infra_failures"]:
+        print(f"  Re-collect them with: python run_evaluation.py collect {args.artifact} "
+              f"--resume --retry-infra (plus the same selection options)")
+    print(f"  Judge with: python run_evaluation.py judge {args.artifact}")
+    return 0
+
+
+def judge_responses(argv: List[str]) -> int:
+    """Phase two of a two-phase run: judge the answers in an artifact and write the usual results"""
+    parser = argparse.ArgumentParser(
+        prog="run_evaluation.py judge",
+        description="Score a response artifact written by `collect`; no chatbot calls are made"
+    )
+    parser.add_argument("artifact", help="Response artifact written by `collect`")
+    parser.add_argument(
+        "--output-dir",
+        type=str,
+        default="./reports",
+        help="Output directory for results and reports"
+    )
+    parser.add_argument(
+        "--model",
+        type=str,
+        default=EVALUATION_MODEL,
+        help="Judge model (default: EVALUATION_MODEL)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=PIPELINE_CONFIG["judge_workers"],
+        help="Cases judged concurrently, each worker with its own metric instances"
+    )
+    parser.add_argument(
+        "--suite",
+        choices=["single_turn", "multi_turn"],
+        default=None,
+        help="Judge only one suite of the artifact"
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Keep results already in the judge checkpoint and judge only the rest"
+    )
+    parser.add_argument(
+        "--checkpoint",
+        type=str,
+        default=None,
+        help="Judged-results checkpoint (default: judge_checkpoint_<artifact>.jsonl in --output-dir)"
+    )
+    parser.add_argument("--quiet", action="store_true", help="No per-case output")
+    args = parser.parse_args(argv)
+
+    import asyncio
+    from evaluation import Evaluator, CollectedResponse
+    from multi_turn_evaluation import MultiTurnEvaluator, CollectedConversation
+    from pipeline import Pipeline, Stage
+
+    header, collected = load_artifact(args.artifact)
+    if args.suite:
+        collected = {args.suite: collected.get(args.suite, {})}
+    output_dir = setup_output_directory(args.output_dir)
+    checkpoint = args.checkpoint or str(judge_checkpoint_path(output_dir, args.artifact))
+    judged = load_judged(checkpoint) if args.resume else {}
+
+    evaluators = {}
+    if "single_turn" in collected:
+        evaluators["single_turn"] = Evaluator(chatbot_url=header.get("chatbot_url"), model=args.model)
+    if "multi_turn" in collected:
+        evaluators["multi_turn"] = MultiTurnEvaluator(chatbot_url=header.get("chatbot_url"), model=args.model)
+
+    def judge(record, metric_sets):
+        if record["suite"] == "multi_turn":
+            result = evaluators["multi_turn"].judge_conversation(
+                MultiTurnTestCase.from_dict(record["test_case"]),
+                CollectedConversation.from_dict(record["response"]),
+                metric_sets["multi_turn"]
+            )
+        else:
+            result = evaluators["single_turn"].judge_response(
+                TestCase(**record["test_case"]),
+                CollectedResponse.from_dict(record["response"]),
+                metric_sets["single_turn"]
+            )
+        return {"suite": record["suite"], "result": asdict(result)}
+
+    def metric_sets():
+        sets = {}
+        if "single_turn" in evaluators:
+            sets["single_turn"] = evaluators["single_turn"].create_metric_set()
+        if "multi_turn" in evaluators:
+            sets["multi_turn"] = evaluators["multi_turn"].create_metrics()
+        return sets
+
+    todo = [
+        record for suite, records in collected.items() for case_id, record in records.items()
+        if case_id not in judged.get(suite, {})
+    ]
+    print(f"\n[JUDGE] {args.artifact}: {len(todo)} cases to judge with {args.model}"
+          + (f" ({sum(len(r) for r in judged.values())} already in {checkpoint})" if judged else ""))
+    print("-" * 50)
+
+    with JsonlWriter(checkpoint, append=args.resume) as writer:
+        done = {"count": 0}
+
+        def write(record, _):
+            writer.write(record)
+            judged.setdefault(record["suite"], {})[record["result"]["test_case_id"]] = record["result"]
+            done["count"] += 1
+            if not args.quiet:
+                status = "passed" if record["result"].get("passed", record["result"].get("overall_passed")) else "failed"
+                print(f"  [{done['count']}/{len(todo)}] {record['suite']} "
+                      f"{record['result']['test_case_id']}: {status}")
+
+        report = asyncio.run(Pipeline(
+            todo,
+            [
+                Stage("judge", judge, args.workers, setup=metric_sets),
+                Stage("write", write, inline=True)
+            ]
+        ).run())
+
+    label = datetime.now().strftime("%Y%m%d_%H%M%S") + "_judged"
+    for suite, records in sorted(collected.items()):
+        # Artifact order, so the results line up with an ordinary run
+        results = [judged[suite][case_id] for case_id in records if case_id in judged.get(suite, {})]
+        if not results:
+            continue
+        print(f"\n[JUDGE] Writing {suite} results...")
+        print("-" * 50)
+        write_combined_run(suite, results, output_dir, label, {
+            "response_artifact": {
+                "file": args.artifact,
+                "chatbot_url": header.get("chatbot_url"),
+                "collected_at": header.get("created_at"),
+                "judge_model": args.model,
+                "checkpoint": checkpoint
+            },
+            "pipeline": report
+        })
+    return 0
+
+
+def query_history(argv: List[str]) -> int:
+    """Trend, flakiness and per-case queries over the historical results store"""
+    parser = argparse.ArgumentParser(
+        prog="run_evaluation.py history",
+        description="Query the results of past runs recorded in the history database"
+    )
+    parser.add_argument(
+        "--db",
+        type=str,
+        default=None,
+        help=f"History database (default: ./reports/{HISTORY_CONFIG['filename']})"
+    )
+    parser.add_argument("--suite", choices=["single_turn", "multi_turn"], default="single_turn")
+    parser.add_argument("--last", type=int, default=HISTORY_CONFIG["last_runs"], help="Number of most recent runs")
+    parser.add_argument("--corpus", type=str, default=None, help="Only runs with this corpus hash")
+    parser.add_argument("--json", action="store_true", help="Print the rows as JSON")
+    queries = parser.add_subparsers(dest="query", required=True)
+
+    queries.add_parser("runs", help="Recent runs with pass rate and corpus hash")
+    trend = queries.add_parser("trend", help="Per-run mean score of a metric, or pass rate")
+    trend.add_argument("--metric", type=str, default=None, help="Metric name (default: pass rate)")
+    trend.add_argument("--category", type=str, default=None)
+    flaky = queries.add_parser("flaky", help="Cases that both passed and failed, most flips first")
+    flaky.add_argument("--category", type=str, default=None)
+    flaky.add_argument("--min-runs", type=int, default=3, help="Runs a case needs to be considered")
+    flaky.add_argument("--limit", type=int, default=20)
+    case = queries.add_parser("case", help="One case's result and scores in each run")
+    case.add_argument("test_case_id")
+    importer = queries.add_parser("import", help="Record existing results JSON files")
+    importer.add_argument("files", nargs="+")
+    args = parser.parse_args(argv)
+
+    db = args.db or history_path("./reports")
+    if args.query != "import" and not os.path.exists(db):
+        print(f"No history database at {db}")
+        return 1
+
+    start = time.perf_counter()
+    with HistoryStore(db) as store:
+        if args.query == "import":
+            for path in args.files:
+                data = load_evaluation_results(path)
+                suite = detect_suite(data.summary, data.results)
+                source = resolve_artifact(path)
+                store.record_run(artifact_stem(source), suite, data.summary, data.results, str(source))
+                print(f"  Recorded {path} ({suite}, {len(data.results)} results)")
+            return 0
+        if args.query == "runs":
+            rows = store.runs(args.suite, args.last)
+        elif args.query == "trend":
+            rows = store.trend(args.suite, args.metric, args.category, args.last, args.corpus)
+        elif args.query == "flaky":
+            rows = store.flaky(args.suite, args.category, args.last, args.min_runs, args.corpus, args.limit)
+        else:
+            rows = store.case_history(args.test_case_id, args.last)
+        metrics = store.metrics(args.suite) if args.query == "trend" and args.metric and not rows else None
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    if args.json:
+        print(json.dumps(rows, ensure_ascii=False, indent=2, default=str))
+        return 0
+
+    if args.query == "runs":
+        print(f"  {'Run':<48} {'Recorded':<17} {'Cases':>6} {'Pass':>7} {'Corpus':<16}")
+        for row in rows:
+            print(f"  {row['run_id']:<48} {format_time(row['recorded_at']):<17} {row['total']:>6} "
+                  f"{row['pass_rate']:>6.1f}% {row['corpus_hash']:<16}")
+    elif args.query == "trend":
+        label = args.metric or "Pass rate"
+        print(f"  {label}{' / ' + args.category if args.category else ''} over {len(rows)} runs")
+        for row in rows:
+            value = f"{row['value']:.3f}" if args.metric else f"{row['value']:.1f}%"
+            print(f"  {format_time(row['recorded_at']):<17} {value:>8}  ({row['cases']} cases)  {row['run_id']}")
+        if metrics is not None:
+            print(f"  No scores for {args.metric!r}; recorded metrics: {', '.join(metrics) or 'none'}")
+    elif args.query == "flaky":
+        print(f"  {'Test case':<16} {'Category':<24} {'Runs':>5} {'Pass':>7} {'Flips':>6}")
+        for row in rows:
+            print(f"  {row['test_case_id']:<16} {row['category'] or '-':<24} {row['runs']:>5} "
+                  f"{row['pass_rate']:>6.0f}% {row['flips']:>6}")
+    else:
+        for row in rows:
+            status = "INFRA" if row["infra_failure"] else ("PASS" if row["passed"] else "FAIL")
+            scores = ", ".join(f"{name} {score:.2f}" for name, score in sorted(row["metrics"].items()))
+            print(f"  {format_time(row['recorded_at']):<17} {status:<5} {scores}")
+    print(f"\n  {len(rows)} rows in {elapsed_ms:.1f}ms")
+    return 0
+
+
+def compare_results(argv: List[str]) -> int:
+    """Diff two results files of the same suite, case by case"""
+    parser = argparse.ArgumentParser(
+        prog="run_evaluation.py compare",
+        description="Compare two runs: pass/fail flips, score deltas, latency regressions, new/removed cases"
+    )
+    parser.add_argument("base", help="Earlier results JSON file")
+    parser.add_argument("head", help="Later results JSON file, of the same suite")
+    parser.add_argument(
+        "--output-dir",
+        type=str,
+        default="./reports",
+        help="Directory for the JSON diff and HTML report (default: ./reports)"
+    )
+    parser.add_argument(
+        "--score-delta",
+        type=float,
+        default=COMPARE_CONFIG["score_delta"],
+        help="Smallest per-case metric score change to report"
+    )
+    parser.add_argument(
+        "--latency-pct",
+        type=float,
+        default=COMPARE_CONFIG["latency_regression_pct"],
+        help="Percent slowdown of a category's latency percentile that counts as a regression"
+    )
+    parser.add_argument(
+        "--latency-min-ms",
+        type=float,
+        default=COMPARE_CONFIG["latency_min_delta_ms"],
+        help="Smallest slowdown in milliseconds that counts as a regression"
+    )
+    parser.add_argument("--no-html", action="store_true", help="Write only the JSON diff")
+    parser.add_argument(
+        "--fail-on-regression",
+        action="store_true",
+        help="Exit with status 1 when cases went from pass to fail or a category got slower"
+    )
+    args = parser.parse_args(argv)
+
+    from run_diff import compare_runs, has_regressions, print_diff_summary
+
+    runs = []
+    for path in (args.base, args.head):
+        data = load_evaluation_results(path)
+        runs.append({
+            "file": path,
+            "suite": detect_suite(data.summary, data.results),
+            "summary": data.summary,
+            "results": data.results
+        })
+    base, head = runs
+    if base["suite"] != head["suite"]:
+        print(f"Cannot compare a {base['suite']} run with a {head['suite']} run")
+        return 2
+
+    diff = compare_runs(base, head, args.score_delta, args.latency_pct, args.latency_min_ms)
+    diff["suite"] = base["suite"]
+
+    output_dir = setup_output_directory(args.output_dir)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    diff_file = output_dir / f"compare_{base['suite']}_{timestamp}.json"
+    with open(diff_file, 'w', encoding='utf-8') as f:
+        json.dump(diff, f, ensure_ascii=False)  # Machine-readable; unindented keeps large diffs fast
+
+    print(f"\n  Comparing {base['suite']} runs")
+    print_diff_summary(diff)
+    print(f"\n  Diff saved to: {diff_file}")
+    if not args.no_html:
+        generate_compare_html_report(diff, str(output_dir / f"compare_{base['suite']}_{timestamp}.html"))
+
+    return 1 if args.fail_on_regression and has_regressions(diff) else 0
+
+
+def export_columnar_results(argv: List[str]) -> int:
+    """Stack results files from many runs into one Parquet dataset"""
+    parser = argparse.ArgumentParser(
+        prog="run_evaluation.py export",
+        description="Write results files (JSON or Parquet) as one Parquet file with a run column"
+    )
+    parser.add_argument("files", nargs="+", help="Results files of one suite")
+    parser.add_argument("--output", type=str, required=True, help="Parquet file to write")
+    parser.add_argument("--full", action="store_true", help="Keep messages, outputs and timestamps")
+    args = parser.parse_args(argv)
+
+    from columnar import load_results_frame
+
+    start = time.perf_counter()
+    frame = load_results_frame(args.files, full=args.full)
+    try:
+        frame.to_parquet(args.output, index=False, compression=COLUMNAR_CONFIG["compression"])
+    except ImportError as e:
+        print(f"Parquet export needs pyarrow ({e}); pip install pyarrow")
+        return 1
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    print(f"  {len(frame):,} results from {len(args.files)} runs, {len(frame.columns)} columns")
+    print(f"  Saved to {args.output} in {elapsed_ms:.0f}ms")
+    return 0
+
+
+# Subcommands taking their own arguments: python run_evaluation.py <command> ...
+COMMANDS = {
+    "merge": merge_shards,
+    "queue": collect_queue,
+    "collect": collect_responses,
+    "judge": judge_responses,
+    "history": query_history,
+    "compare": compare_results,
+    "export": export_columnar_results
+}
+
+
 def main():
     """Main entry point"""
+    if len(sys.argv) > 1 and sys.argv[1] in COMMANDS:
+        sys.exit(COMMANDS[sys.argv[1]](sys.argv[2:]))
+
     parser = argparse.ArgumentParser(
         description="112 Call Center Agent - Complete Evaluation Runner",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -626,6 +1653,12 @@ Examples:
   python run_evaluation.py --all              # Both single and multi-turn
   python run_evaluation.py --quick            # Quick evaluation
   python run_evaluation.py --category fire_emergency_flow --multi-turn
+  python run_evaluation.py --load --load-rate 10 --load-duration 120 --all
+  python run_evaluation.py --all --shard 2/4  # One of four parallel runners
+  python run_evaluation.py merge reports/*_results_*_shard*of4.jsonl.zst
+  python run_evaluation.py --all --enqueue --queue /shared/run.db
+  python run_evaluation.py --worker --queue /shared/run.db   # on each machine
+  python run_evaluation.py queue /shared/run.db
         """
     )
 
@@ -695,6 +1728,195 @@ Examples:
         help="Force evaluation even if chatbot is not running"
     )
 
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=42,
+        help="Random seed for test case generation, stratified sampling and load test arrivals"
+    )
+
+    parser.add_argument(
+        "--shard",
+        type=str,
+        default=None,
+        help="Run only shard i of N (e.g. 2/4), split by a stable hash of test_case_id; "
+             "combine the outputs with the merge command"
+    )
+
+    parser.add_argument(
+        "--dedup",
+        action="store_true",
+        help="Single-turn: evaluate one case per class of inputs equal up to digits/whitespace (DEDUP_CONFIG) "
+             "and copy its result to the others"
+    )
+
+    parser.add_argument(
+        "--hedge",
+        action="store_true",
+        help="Single-turn: resend a request on a new session once it runs past the observed p95"
+    )
+
+    parser.add_argument(
+        "--no-seed-sessions",
+        dest="seed_sessions",
+        action="store_false",
+        help="Single-turn: send context-bearing cases with their context to a fresh session "
+             "instead of seeding the session at that point of the workflow"
+    )
+
+    # Pipelined evaluation
+    parser.add_argument(
+        "--pipeline",
+        action="store_true",
+        help="Single-turn: collect and judge concurrently in stages connected by bounded queues"
+    )
+
+    parser.add_argument(
+        "--collect-workers",
+        type=int,
+        default=None,
+        help="Pipeline: concurrent chatbot requests (default from PIPELINE_CONFIG)"
+    )
+
+    parser.add_argument(
+        "--judge-workers",
+        type=int,
+        default=None,
+        help="Pipeline: concurrent judges (default from PIPELINE_CONFIG)"
+    )
+
+    parser.add_argument(
+        "--queue-size",
+        type=int,
+        default=None,
+        help="Pipeline: maximum cases waiting between two stages"
+    )
+
+    parser.add_argument(
+        "--share-prefixes",
+        action="store_true",
+        help="Multi-turn: send openings shared by several cases once and fork the "
+             "session where they diverge (replays the opening if the backend cannot clone)"
+    )
+
+    # Work queue
+    parser.add_argument(
+        "--queue",
+        type=str,
+        default=None,
+        help="Shared SQLite work queue file for --enqueue / --worker"
+    )
+
+    parser.add_argument(
+        "--enqueue",
+        action="store_true",
+        help="Write the selected test cases into --queue and exit"
+    )
+
+    parser.add_argument(
+        "--worker",
+        action="store_true",
+        help="Claim and evaluate cases from --queue until it is drained"
+    )
+
+    parser.add_argument(
+        "--worker-id",
+        type=str,
+        default=None,
+        help="Worker name recorded on leases (default: host-pid)"
+    )
+
+    # Adaptive evaluation
+    parser.add_argument(
+        "--adaptive",
+        action="store_true",
+        help="Single-turn: stop sampling a category once its pass rate is known precisely enough"
+    )
+
+    parser.add_argument(
+        "--target-ci-width",
+        type=float,
+        default=None,
+        help="Adaptive: stop a category once its interval is narrower than this (percentage points)"
+    )
+
+    parser.add_argument(
+        "--baseline",
+        type=str,
+        default=None,
+        help="Adaptive: previous single-turn results JSON; stop a category once a regression is certain"
+    )
+
+    # Load testing
+    parser.add_argument(
+        "--load",
+        action="store_true",
+        help="Run an open-loop load test against the chatbot (no judging)"
+    )
+
+    parser.add_argument(
+        "--load-arrival",
+        choices=["poisson", "ramp"],
+        default="poisson",
+        help="Session arrival process for --load"
+    )
+
+    parser.add_argument(
+        "--load-rate",
+        type=float,
+        default=5.0,
+        help="Poisson arrival rate in sessions per second"
+    )
+
+    parser.add_argument(
+        "--load-duration",
+        type=float,
+        default=60.0,
+        help="Load test duration in seconds"
+    )
+
+    parser.add_argument(
+        "--load-ramp-start",
+        type=float,
+        default=1.0,
+        help="Sessions per second at the first ramp step"
+    )
+
+    parser.add_argument(
+        "--load-ramp-end",
+        type=float,
+        default=20.0,
+        help="Sessions per second at the last ramp step"
+    )
+
+    parser.add_argument(
+        "--load-ramp-steps",
+        type=int,
+        default=5,
+        help="Number of ramp steps"
+    )
+
+    parser.add_argument(
+        "--load-max-concurrency",
+        type=int,
+        default=200,
+        help="Maximum in-flight sessions; later arrivals are dropped and reported"
+    )
+
+    parser.add_argument(
+        "--load-timeout",
+        type=float,
+        default=60.0,
+        help="Per-request timeout in seconds during load tests"
+    )
+
+    parser.add_argument(
+        "--load-synthetic",
+        type=int,
+        metavar="N",
+        help="Load test with a synthetic corpus of N cases (synthetic_corpus.py) instead of the generated test cases"
+    )
+
     parser.add_argument(
         "--list-categories",
         action="store_true",
@@ -703,6 +1925,18 @@ Examples:
 
     args = parser.parse_args()
 
+    if args.shard:
+        try:
+            args.shard = parse_shard(args.shard)
+        except ValueError as e:
+            parser.error(str(e))
+
+    if (args.enqueue or args.worker) and not args.queue:
+        parser.error("--enqueue and --worker require --queue")
+
+    if args.pipeline and args.adaptive:
+        parser.error("--pipeline cannot be combined with --adaptive, which decides case by case")
+
     if args.list_categories:
         print_categories(multi_turn=False)
         print()
@@ -713,6 +1947,7 @@ Examples:
         args.verbose = False
 
     # Run evaluation
+    import asyncio
     try:
         result = asyncio.run(run_full_evaluation(args))
         if isinstance(result, dict) and "error" in result:
@@ -0,0 +1,399 @@
+"""
+Stratified Sampling and Pass-Rate Confidence Intervals
+========================================================
+
+This module picks representative subsets of the test corpora for --quick and
+--max-cases runs, and attaches confidence intervals to pass rates, so a small
+smoke run can stand in for the full run.
+
+Features:
+- Two-level stratified sampling (category, then subcategory) with a fixed seed
+- Proportional allocation that covers every stratum the budget allows
+- Wilson score intervals for pass rates, overall and per category
+- Sequential stopping rule for adaptive runs (interval width or baseline regression)
+- Stratified bootstrap intervals for pass rates and metric means, and score
+  histograms, per category (vectorized with NumPy)
+"""
+
+import random
+from statistics import NormalDist
+from typing import List, Dict, Any, Iterable, Callable, Hashable, Tuple, TypeVar
+
+import numpy as np
+
+from config import SAMPLING_CONFIG, BOOTSTRAP_CONFIG
+from columnar import METRIC_PREFIX, metric_columns
+
+
+T = TypeVar("T")
+
+
+# =============================================================================
+# STRATIFIED SAMPLING
+# =============================================================================
+
+def _subcategory(test_case: Any) -> str:
+    """Subcategory of a test case; multi-turn cases have none"""
+    return getattr(test_case, "subcategory", None) or ""
+
+
+def allocate(sizes: Dict[Hashable, int], n: int, rng: random.Random) -> Dict[Hashable, int]:
+    """Split a budget of n across strata proportionally to their sizes.
+
+    Every stratum gets at least one case when n allows it; otherwise n strata
+    are drawn with probability proportional to size. Remainders go to the
+    strata with the largest fractional share.
+    """
+    total = sum(sizes.values())
+    if n >= total:
+        return dict(sizes)
+    if n <= 0:
+        return {key: 0 for key in sizes}
+
+    if n < len(sizes):
+        # Weighted sampling without replacement (Efraimidis-Spirakis keys)
+        keys = sorted(sizes, key=lambda k: rng.random() ** (1.0 / sizes[k]), reverse=True)
+        chosen = set(keys[:n])
+        return {key: (1 if key in chosen else 0) for key in sizes}
+
+    counts = {key: 1 for key in sizes}
+    extra = n - len(sizes)
+    spare = {key: size - 1 for key, size in sizes.items()}
+    spare_total = sum(spare.values())
+
+    quotas = {key: extra * s / spare_total for key, s in spare.items()} if spare_total else {}
+    for key, quota in quotas.items():
+        counts[key] += int(quota)
+    leftover = n - sum(counts.values())
+
+    # Largest remainder, ties broken by the seeded RNG
+    order = sorted(
+        quotas,
+        key=lambda k: (quotas[k] - int(quotas[k]), rng.random()),
+        reverse=True
+    )
+    for key in order:
+        if leftover <= 0:
+            break
+        if counts[key] < sizes[key]:
+            counts[key] += 1
+            leftover -= 1
+
+    return counts
+
+
+def stratified_sample(
+    test_cases: List[T],
+    n: int,
+    seed: int = None,
+    category_key: Callable[[T], str] = lambda tc: tc.category,
+    subcategory_key: Callable[[T], str] = _subcategory
+) -> List[T]:
+    """Select n test cases stratified by category, then by subcategory.
+
+    The result keeps corpus order, and the same corpus and seed always
+    give the same selection.
+    """
+    if n is None or n >= len(test_cases):
+        return list(test_cases)
+
+    rng = random.Random(SAMPLING_CONFIG["seed"] if seed is None else seed)
+
+    by_category: Dict[str, Dict[str, List[int]]] = {}
+    for index, test_case in enumerate(test_cases):
+        by_category.setdefault(category_key(test_case), {}) \
+            .setdefault(subcategory_key(test_case), []).append(index)
+
+    category_sizes = {cat: sum(len(v) for v in subs.values()) for cat, subs in by_category.items()}
+    category_counts = allocate(category_sizes, n, rng)
+
+    selected: List[int] = []
+    for category, subcategories in by_category.items():
+        sub_sizes = {sub: len(indices) for sub, indices in subcategories.items()}
+        sub_counts = allocate(sub_sizes, category_counts[category], rng)
+        for sub, indices in subcategories.items():
+            selected.extend(rng.sample(indices, sub_counts[sub]))
+
+    return [test_cases[i] for i in sorted(selected)]
+
+
+def stratified_order(
+    test_cases: List[T],
+    seed: int = None,
+    category_key: Callable[[T], str] = lambda tc: tc.category,
+    subcategory_key: Callable[[T], str] = _subcategory
+) -> Dict[str, List[T]]:
+    """Per-category queues in random order, interleaving subcategories.
+
+    Any prefix of a queue is then roughly stratified by subcategory, which is
+    what an adaptive run that may stop early needs.
+    """
+    rng = random.Random(SAMPLING_CONFIG["seed"] if seed is None else seed)
+
+    by_category: Dict[str, Dict[str, List[T]]] = {}
+    for test_case in test_cases:
+        by_category.setdefault(category_key(test_case), {}) \
+            .setdefault(subcategory_key(test_case), []).append(test_case)
+
+    queues: Dict[str, List[T]] = {}
+    for category, subcategories in by_category.items():
+        pools = []
+        for cases in subcategories.values():
+            cases = list(cases)
+            rng.shuffle(cases)
+            pools.append(cases)
+        rng.shuffle(pools)
+
+        # Spread each subcategory evenly over the queue
+        keyed = []
+        for pool in pools:
+            for i, test_case in enumerate(pool):
+                keyed.append(((i + rng.random()) / len(pool), test_case))
+        keyed.sort(key=lambda item: item[0])
+        queues[category] = [test_case for _, test_case in keyed]
+
+    return queues
+
+
+def describe_sample(test_cases: Iterable[Any]) -> Dict[str, int]:
+    """Number of cases per category"""
+    counts: Dict[str, int] = {}
+    for test_case in test_cases:
+        counts[test_case.category] = counts.get(test_case.category, 0) + 1
+    return counts
+
+
+# =============================================================================
+# CONFIDENCE INTERVALS
+# =============================================================================
+
+def z_score(confidence: float) -> float:
+    """Two-sided normal critical value for a confidence level"""
+    return NormalDist().inv_cdf(0.5 + confidence / 2)
+
+
+def wilson_interval(passed: int, total: int, confidence: float = None) -> Tuple[float, float]:
+    """Wilson score interval for a pass rate, in percent"""
+    if total <= 0:
+        return 0.0, 100.0
+    confidence = SAMPLING_CONFIG["confidence"] if confidence is None else confidence
+    z = z_score(confidence)
+    p = passed / total
+    if passed in (0, total):
+        # Closed form at the boundaries avoids floating-point noise
+        bound = total / (total + z * z) * 100
+        return (0.0, 100 - bound) if passed == 0 else (bound, 100.0)
+    denominator = 1 + z * z / total
+    center = (p + z * z / (2 * total)) / denominator
+    half_width = z * ((p * (1 - p) / total + z * z / (4 * total * total)) ** 0.5) / denominator
+    return max(0.0, center - half_width) * 100, min(1.0, center + half_width) * 100
+
+
+def describe_pass_rate(passed: int, total: int, confidence: float = None) -> Dict[str, float]:
+    """Pass rate with its Wilson interval"""
+    low, high = wilson_interval(passed, total, confidence)
+    return {
+        "n": total,
+        "passed": passed,
+        "pass_rate": passed / total * 100 if total else 0.0,
+        "ci_low": low,
+        "ci_high": high
+    }
+
+
+def summarize_pass_rate_ci(
+    results: Iterable[Any],
+    confidence: float = None,
+    passed_key: Callable[[Any], bool] = lambda r: r.passed
+) -> Dict[str, Any]:
+    """Wilson intervals for the pass rate overall and per category"""
+    confidence = SAMPLING_CONFIG["confidence"] if confidence is None else confidence
+    counts: Dict[str, List[int]] = {}
+    passed = total = 0
+    for result in results:
+        ok = 1 if passed_key(result) else 0
+        data = counts.setdefault(result.category, [0, 0])
+        data[0] += ok
+        data[1] += 1
+        passed += ok
+        total += 1
+
+    return {
+        "method": "wilson",
+        "confidence": confidence,
+        "overall": describe_pass_rate(passed, total, confidence),
+        "by_category": {
+            category: describe_pass_rate(p, t, confidence)
+            for category, (p, t) in sorted(counts.items())
+        }
+    }
+
+
+def sequential_decision(
+    passed: int,
+    total: int,
+    target_width: float,
+    baseline_rate: float = None,
+    min_cases: int = 0,
+    confidence: float = None
+) -> Tuple[str, Tuple[float, float]]:
+    """Stopping decision for one category of an adaptive run.
+
+    Returns (reason, interval); reason is "" to keep sampling, "ci_width" when
+    the interval is narrower than target_width percentage points, "regression"
+    when the whole interval lies below the baseline pass rate and
+    "no_regression" when it lies at or above it.
+    """
+    interval = wilson_interval(passed, total, confidence)
+    if total < max(min_cases, 1):
+        return "", interval
+
+    low, high = interval
+    if baseline_rate is not None:
+        if high < baseline_rate:
+            return "regression", interval
+        if low >= baseline_rate:
+            return "no_regression", interval
+    if high - low < target_width:
+        return "ci_width", interval
+    return "", interval
+
+
+# =============================================================================
+# BOOTSTRAP INTERVALS AND SCORE DISTRIBUTIONS
+# =============================================================================
+
+def bootstrap_sums(
+    values: np.ndarray,
+    present: np.ndarray,
+    resamples: int,
+    rng: np.random.Generator
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Column sums and counts of present values in each bootstrap resample.
+
+    values and present are (rows, columns); each resample draws the rows
+    with replacement. Draws are turned into per-row weights, so all columns
+    of a resample come from one matrix product. Returns two
+    (resamples, columns) arrays.
+    """
+    rows = len(values)
+    values = np.where(present, values, 0.0)
+    present = present.astype(float)
+    sums = np.empty((resamples, values.shape[1]))
+    counts = np.empty((resamples, values.shape[1]))
+    chunk = max(1, 2_000_000 // max(rows, 1))  # Bounds the weight matrix to ~16 MB
+    for start in range(0, resamples, chunk):
+        size = min(chunk, resamples - start)
+        # Row r of resample i lands in slot i * rows + r of the flattened weights
+        draws = rng.integers(0, rows, (size, rows)) + np.arange(size)[:, None] * rows
+        weights = np.bincount(draws.ravel(), minlength=size * rows).reshape(size, rows).astype(float)
+        sums[start:start + size] = weights @ values
+        counts[start:start + size] = weights @ present
+    return sums, counts
+
+
+def _describe_bootstrap(
+    values: np.ndarray,
+    present: np.ndarray,
+    sums: np.ndarray,
+    counts: np.ndarray,
+    columns: List[str],
+    confidence: float
+) -> Dict[str, Any]:
+    """Point estimates with percentile intervals from resampled sums and counts"""
+    n = present.sum(axis=0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        estimates = np.where(present, values, 0.0).sum(axis=0) / n
+        means = sums / counts
+    tail = (1 - confidence) / 2 * 100
+    lows, highs = np.full(len(columns), np.nan), np.full(len(columns), np.nan)
+    judged = n > 0
+    if judged.any():
+        lows[judged], highs[judged] = np.nanpercentile(means[:, judged], [tail, 100 - tail], axis=0)
+
+    stats = {
+        column: {"n": int(count), "mean": float(estimate), "ci_low": float(low), "ci_high": float(high)}
+        for column, count, estimate, low, high in zip(columns, n, estimates, lows, highs)
+        if count
+    }
+    passed = stats.pop("passed")
+    return {
+        "n": passed["n"],
+        "pass_rate": {
+            "mean": passed["mean"] * 100,
+            "ci_low": passed["ci_low"] * 100,
+            "ci_high": passed["ci_high"] * 100
+        },
+        "metrics": {column[len(METRIC_PREFIX):]: value for column, value in stats.items()}
+    }
+
+
+def summarize_bootstrap_ci(
+    frame: Any,
+    confidence: float = None,
+    resamples: int = None,
+    seed: int = None
+) -> Dict[str, Any]:
+    """Bootstrap intervals for the pass rate and each metric mean, overall and per category.
+
+    frame is a columnar.results_frame of judged results. Resampling is
+    stratified by category (each category is resampled on its own, as the
+    corpora are built per category), and the overall interval combines the
+    category resamples. Pass rates are in percent, metric means in score units.
+    """
+    confidence = SAMPLING_CONFIG["confidence"] if confidence is None else confidence
+    resamples = BOOTSTRAP_CONFIG["resamples"] if resamples is None else resamples
+    seed = BOOTSTRAP_CONFIG["seed"] if seed is None else seed
+    if not len(frame):
+        return {}
+
+    rng = np.random.default_rng(seed)
+    columns = ["passed"] + metric_columns(frame)
+    values = frame[columns].to_numpy(dtype=float)
+    present = ~np.isnan(values)
+    categories = frame["category"].astype(str).to_numpy()
+
+    by_category = {}
+    total_sums = np.zeros((resamples, len(columns)))
+    total_counts = np.zeros((resamples, len(columns)))
+    for category in dict.fromkeys(categories):
+        rows = categories == category
+        sums, counts = bootstrap_sums(values[rows], present[rows], resamples, rng)
+        total_sums += sums
+        total_counts += counts
+        by_category[category] = _describe_bootstrap(
+            values[rows], present[rows], sums, counts, columns, confidence
+        )
+
+    return {
+        "method": "stratified percentile bootstrap",
+        "confidence": confidence,
+        "resamples": resamples,
+        "overall": _describe_bootstrap(values, present, total_sums, total_counts, columns, confidence),
+        "by_category": dict(sorted(by_category.items()))
+    }
+
+
+def summarize_score_histograms(frame: Any, bins: int = None) -> Dict[str, Any]:
+    """Counts of each metric's scores in equal-width bins over [0, 1], overall and per category"""
+    bins = BOOTSTRAP_CONFIG["histogram_bins"] if bins is None else bins
+    categories = frame["category"].astype(str).to_numpy()
+    names, codes = np.unique(categories, return_inverse=True)
+
+    metrics = {}
+    for column in metric_columns(frame):
+        scores = frame[column].to_numpy(dtype=float)
+        judged = ~np.isnan(scores)
+        if not judged.any():
+            continue
+        # Scores of exactly 1.0 go into the last bin
+        positions = np.clip((scores[judged] * bins).astype(int), 0, bins - 1)
+        counts = np.bincount(codes[judged] * bins + positions, minlength=len(names) * bins).reshape(len(names), bins)
+        metrics[column[len(METRIC_PREFIX):]] = {
+            "overall": counts.sum(axis=0).tolist(),
+            "by_category": {
+                name: row.tolist() for name, row in zip(names.tolist(), counts) if row.any()
+            }
+        }
+
+    return {"edges": np.linspace(0, 1, bins + 1).round(6).tolist(), "metrics": metrics}
@@ -0,0 +1,157 @@
+"""
+Sharded Evaluation Runs
+========================
+
+This module splits the test corpora across independent runners with
+--shard i/N and merges the per-shard result files back into one run.
+
+Features:
+- Stable shard assignment from a hash of test_case_id (same on every machine)
+- Shard metadata recorded in each shard's exported summary
+- Merge-time checks for missing shards, mixed shard counts and duplicate cases
+"""
+
+import hashlib
+from typing import List, Dict, Any, Callable, Optional, Tuple, TypeVar
+
+from report_generator import load_evaluation_results
+
+
+T = TypeVar("T")
+
+
+# =============================================================================
+# SHARD ASSIGNMENT
+# =============================================================================
+
+def parse_shard(spec: str) -> Tuple[int, int]:
+    """Parse an "i/N" shard spec into (i, N); i is 1-based"""
+    try:
+        index, total = (int(part) for part in spec.split("/"))
+    except ValueError:
+        raise ValueError(f"Invalid shard '{spec}', expected i/N such as 1/4")
+    if total < 1 or not 1 <= index <= total:
+        raise ValueError(f"Invalid shard '{spec}', i must be between 1 and N")
+    return index, total
+
+
+def shard_of(test_case_id: str, total: int) -> int:
+    """1-based shard that owns a test case.
+
+    Uses SHA-1 rather than hash(), which is salted per process, so every
+    runner agrees on the assignment.
+    """
+    digest = hashlib.sha1(test_case_id.encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big") % total + 1
+
+
+def select_shard(
+    test_cases: List[T],
+    index: int,
+    total: int,
+    id_key: Callable[[T], str] = lambda tc: tc.id
+) -> List[T]:
+    """Test cases owned by shard index of total, in corpus order"""
+    return [tc for tc in test_cases if shard_of(id_key(tc), total) == index]
+
+
+def shard_suffix(index: int, total: int) -> str:
+    """Filename suffix for a shard's output files"""
+    return f"_shard{index}of{total}"
+
+
+# =============================================================================
+# MERGING
+# =============================================================================
+
+def detect_suite(summary: Dict[str, Any], results: List[Dict[str, Any]]) -> str:
+    """"single_turn" or "multi_turn", from the shape of an exported results file"""
+    if "total_conversations" in summary:
+        return "multi_turn"
+    if "total_test_cases" in summary:
+        return "single_turn"
+    return "multi_turn" if results and "turns" in results[0] else "single_turn"
+
+
+def load_shard_files(paths: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+    """Load shard result files grouped by suite.
+
+    Each entry holds the file path, its summary and its raw result dicts.
+    """
+    suites: Dict[str, List[Dict[str, Any]]] = {}
+    for path in paths:
+        data = load_evaluation_results(path)
+        suite = detect_suite(data.summary, data.results)
+        suites.setdefault(suite, []).append({
+            "file": str(path),
+            "summary": data.summary,
+            "results": data.results
+        })
+    return suites
+
+
+def check_shard_coverage(shards: List[Dict[str, Any]]) -> List[str]:
+    """Warnings about missing, repeated or inconsistent shards"""
+    warnings = []
+    specs = [s["summary"].get("shard") for s in shards]
+    if not any(specs):
+        return ["No shard metadata found; merging files as given"]
+
+    totals = {spec["total"] for spec in specs if spec}
+    if len(totals) > 1:
+        warnings.append(f"Files come from different shard counts: {sorted(totals)}")
+    if None in specs:
+        warnings.append("Some files have no shard metadata (unsharded runs?)")
+
+    seen: Dict[int, int] = {}
+    for spec in specs:
+        if spec:
+            seen[spec["index"]] = seen.get(spec["index"], 0) + 1
+    for total in totals:
+        missing = [i for i in range(1, total + 1) if i not in seen]
+        if missing:
+            warnings.append(f"Missing shards of {total}: {', '.join(map(str, missing))}")
+    repeated = [i for i, count in sorted(seen.items()) if count > 1]
+    if repeated:
+        warnings.append(f"Shards given more than once: {', '.join(map(str, repeated))}")
+    return warnings
+
+
+def merge_shard_results(
+    shards: List[Dict[str, Any]]
+) -> Tuple[List[Dict[str, Any]], List[str]]:
+    """Concatenate shard results, keeping the first copy of any repeated case.
+
+    Returns (results, duplicate_test_case_ids).
+    """
+    merged: List[Dict[str, Any]] = []
+    seen = set()
+    duplicates = []
+    for shard in shards:
+        for result in shard["results"]:
+            test_case_id = result.get("test_case_id")
+            if test_case_id in seen:
+                duplicates.append(test_case_id)
+                continue
+            seen.add(test_case_id)
+            merged.append(result)
+    return merged, duplicates
+
+
+def describe_shards(shards: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Per-file provenance recorded in a merged summary"""
+    described = []
+    for shard in shards:
+        summary = shard["summary"]
+        entry: Dict[str, Any] = {
+            "file": shard["file"],
+            "shard": summary.get("shard"),
+            "results": len(shard["results"]),
+            "evaluation_time": summary.get("evaluation_time")
+        }
+        adaptive: Optional[Dict[str, Any]] = summary.get("adaptive")
+        if adaptive:
+            # Stopping decisions were made per shard and cannot be recombined
+            entry["adaptive"] = adaptive
+        described.append(entry)
+    return described
@@ -0,0 +1,154 @@
+"""
+CLI Startup Benchmark for 112 Call Center Agent Evaluation
+============================================================
+
+Times how long the listing and report commands take to start, and profiles
+their imports with python -X importtime, so a module-level import of
+deepeval, requests or pandas creeping back into those paths shows up.
+
+Features:
+- Wall time of each command over several fresh interpreter runs (min and
+  median), next to a bare interpreter as the floor
+- Budget check (STARTUP_CONFIG["budget_ms"]) with a non-zero exit status,
+  for CI
+- Heavy modules (deepeval, openai, pandas, ...) imported by each command
+- The slowest imports of each command with --profile
+
+Usage:
+    python startup_benchmark.py
+    python startup_benchmark.py list-categories report --profile
+"""
+
+import os
+import sys
+import json
+import argparse
+import subprocess
+import time
+from statistics import median
+from typing import List, Dict, Any
+
+from config import STARTUP_CONFIG
+
+
+MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Command name -> interpreter arguments; "python" is the floor and has no budget
+STARTUP_COMMANDS = {
+    "python": ["-c", "pass"],
+    "list-categories": ["run_evaluation.py", "--list-categories"],
+    "history": ["run_evaluation.py", "history", "--help"],
+    "compare": ["run_evaluation.py", "compare", "--help"],
+    "report": ["report_generator.py", "--help"],
+}
+
+
+def time_command(args: List[str], runs: int) -> List[float]:
+    """Wall time in ms of each of `runs` fresh interpreter runs"""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, *args], cwd=MODULE_DIR,
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False
+        )
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def profile_imports(args: List[str]) -> List[Dict[str, Any]]:
+    """Imports of one run, from python -X importtime: module, depth, self and cumulative ms"""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", *args], cwd=MODULE_DIR,
+        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, check=False
+    )
+    imports = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        imports.append({
+            "module": name.strip(),
+            "depth": (len(name) - len(name.lstrip()) - 1) // 2,
+            "self_ms": int(self_us) / 1000,
+            "cumulative_ms": int(cumulative_us) / 1000
+        })
+    return imports
+
+
+def heavy_imports(imports: List[Dict[str, Any]]) -> List[str]:
+    """STARTUP_CONFIG["heavy_modules"] that a run imported"""
+    heavy = set(STARTUP_CONFIG["heavy_modules"])
+    return sorted({entry["module"].split(".")[0] for entry in imports} & heavy)
+
+
+def benchmark(names: List[str], runs: int, budget_ms: float) -> List[Dict[str, Any]]:
+    """Time and profile each command"""
+    rows = []
+    for name in names:
+        args = STARTUP_COMMANDS[name]
+        timings = time_command(args, runs)
+        imports = profile_imports(args)
+        heavy = heavy_imports(imports)
+        budgeted = name != "python"
+        rows.append({
+            "command": name,
+            "args": args,
+            "min_ms": min(timings),
+            "median_ms": median(timings),
+            "budget_ms": budget_ms if budgeted else None,
+            "heavy_imports": heavy,
+            "ok": not budgeted or (median(timings) <= budget_ms and not heavy),
+            "imports": imports
+        })
+    return rows
+
+
+def print_profile(row: Dict[str, Any], top: int):
+    """Slowest imports of one command, by cumulative and by own time"""
+    imports = row["imports"]
+    print(f"\n  {row['command']}: {len(imports)} modules imported")
+    print(f"    {'Top-level import':<40} {'cumulative':>10}")
+    for entry in sorted((e for e in imports if e["depth"] == 0), key=lambda e: -e["cumulative_ms"])[:top]:
+        print(f"    {entry['module']:<40} {entry['cumulative_ms']:>8.1f}ms")
+    print(f"    {'Any module':<40} {'self':>10}")
+    for entry in sorted(imports, key=lambda e: -e["self_ms"])[:top]:
+        print(f"    {entry['module']:<40} {entry['self_ms']:>8.1f}ms")
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description="Time CLI startup and profile its imports")
+    parser.add_argument("commands", nargs="*",
+                        help=f"Commands to benchmark: {', '.join(STARTUP_COMMANDS)} (default: all)")
+    parser.add_argument("--runs", type=int, default=STARTUP_CONFIG["runs"], help="Timed runs per command")
+    parser.add_argument("--budget-ms", type=float, default=STARTUP_CONFIG["budget_ms"],
+                        help="Median startup allowed per command")
+    parser.add_argument("--profile", action="store_true", help="Show the slowest imports of each command")
+    parser.add_argument("--json", action="store_true", help="Print the results as JSON")
+    args = parser.parse_args()
+
+    unknown = [name for name in args.commands if name not in STARTUP_COMMANDS]
+    if unknown:
+        parser.error(f"unknown command(s): {', '.join(unknown)}")
+
+    names = args.commands or list(STARTUP_COMMANDS)
+    rows = benchmark(names, args.runs, args.budget_ms)
+
+    if args.json:
+        print(json.dumps([{k: v for k, v in row.items() if k != "imports"} for row in rows], indent=2))
+    else:
+        print(f"\n  {'Command':<18} {'min':>8} {'median':>8}  {'budget':<8} Heavy imports")
+        for row in rows:
+            status = "-" if row["budget_ms"] is None else ("ok" if row["ok"] else "OVER")
+            print(f"  {row['command']:<18} {row['min_ms']:>6.0f}ms {row['median_ms']:>6.0f}ms  {status:<8} "
+                  f"{', '.join(row['heavy_imports']) or '-'}")
+        if args.profile:
+            for row in rows:
+                print_profile(row, STARTUP_CONFIG["top_imports"])
+
+    return 0 if all(row["ok"] for row in rows) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,379 @@
+"""
+Synthetic Corpus Generator for 112 Call Center Agent Load Tests
+================================================================
+
+This module expands message templates over the config vocabularies
+(EMERGENCY_KEYWORDS, HCMC_DISTRICTS, MAJOR_CITIES, VALID_PHONE_PREFIXES) into
+corpora of 100k-1M cases for load tests, without ever holding the corpus in
+memory.
+
+Each template has a field space - the product of the vocabularies it uses.
+Case i of a corpus is decoded from an index into that space (mixed radix),
+after a seeded stride permutation, so cases are spread over every vocabulary
+from the first one on and never repeat within a template. Nothing is stored
+per case: the corpus is a random-access sequence that renders case i when
+asked.
+
+Features:
+- Any case by index in O(1) time and memory; streaming iteration
+- Compact case records (__slots__, shared interned vocabulary strings);
+  the TestCase form with its dicts is only built on request
+- Categories round-robin over templates, so any prefix of the corpus is
+  balanced
+- Reproducible from (size, seed)
+- Streaming export to (compressed) JSON Lines with throughput and peak
+  process memory, checked against SYNTHETIC_CORPUS_CONFIG["memory_budget_mb"]
+
+Usage:
+    python synthetic_corpus.py --size 1000000 --output reports/synthetic.jsonl.zst
+    python synthetic_corpus.py --size 500000 --sample 5
+"""
+
+import sys
+import time
+import random
+import argparse
+from math import gcd, prod
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import List, Dict, Any, Tuple, Iterator, Optional
+
+try:
+    import resource
+except ImportError:
+    resource = None  # Not available on Windows, peak memory is not reported
+
+from config import (
+    EMERGENCY_KEYWORDS, HCMC_DISTRICTS, MAJOR_CITIES, VALID_PHONE_PREFIXES,
+    SYNTHETIC_CORPUS_CONFIG
+)
+
+
+HCMC = sys.intern("Thành phố Hồ Chí Minh")
+SUBSCRIBER_NUMBERS = 10 ** 7  # Seven digits after the three-digit prefix
+
+
+# =============================================================================
+# VOCABULARIES
+# =============================================================================
+
+# Field name -> values. Strings are interned once here and shared by every case.
+FIELD_VALUES: Dict[str, Sequence] = {
+    "keyword": [
+        (sys.intern(emergency_type), sys.intern(keyword))
+        for emergency_type, keywords in EMERGENCY_KEYWORDS.items()
+        for keyword in keywords
+    ],
+    # (district, city): HCMC districts, then the other cities as a whole
+    "location": [(sys.intern(district), HCMC) for district in HCMC_DISTRICTS] + [
+        (None, sys.intern(city)) for city in MAJOR_CITIES if city != HCMC
+    ],
+    "street": [sys.intern(street) for street in SYNTHETIC_CORPUS_CONFIG["streets"]],
+    "number": range(1, SYNTHETIC_CORPUS_CONFIG["house_numbers"] + 1),
+    "ward": range(1, SYNTHETIC_CORPUS_CONFIG["wards"] + 1),
+    "prefix": [sys.intern(prefix) for prefix in VALID_PHONE_PREFIXES],
+    "subscriber": range(SUBSCRIBER_NUMBERS),
+    "people": range(2, SYNTHETIC_CORPUS_CONFIG["max_people"] + 1),
+}
+
+
+@dataclass(frozen=True)
+class CaseTemplate:
+    """A message pattern and the vocabularies (FIELD_VALUES keys) it is expanded over"""
+    category: str
+    subcategory: str
+    text: str  # str.format pattern over the rendered fields
+    fields: Tuple[str, ...]
+
+    def __post_init__(self):
+        object.__setattr__(self, "category", sys.intern(self.category))
+        object.__setattr__(self, "subcategory", sys.intern(self.subcategory))
+
+    @property
+    def radices(self) -> List[int]:
+        return [len(FIELD_VALUES[name]) for name in self.fields]
+
+    @property
+    def space(self) -> int:
+        """Number of distinct messages this template can produce"""
+        return prod(self.radices)
+
+
+SYNTHETIC_TEMPLATES = [
+    CaseTemplate(
+        "emergency_type_detection", "synthetic_report",
+        "Có {keyword} ở số {number} đường {street}, {location}! Giúp tôi với",
+        ("keyword", "number", "street", "location")
+    ),
+    CaseTemplate(
+        "location_extraction", "synthetic_full_address",
+        "Địa chỉ của tôi là số {number} đường {street}, Phường {ward}, {location}, ở đây có {keyword}",
+        ("number", "street", "ward", "location", "keyword")
+    ),
+    CaseTemplate(
+        "phone_validation", "synthetic_domestic",
+        "Số điện thoại của tôi là {phone}",
+        ("prefix", "subscriber")
+    ),
+    CaseTemplate(
+        "affected_people", "synthetic_count",
+        "Có {keyword} ở {location}, {people} người cần giúp đỡ, gọi lại số {phone}",
+        ("keyword", "location", "people", "prefix", "subscriber")
+    ),
+]
+
+
+# =============================================================================
+# CASES
+# =============================================================================
+
+class SyntheticCase:
+    """One synthetic case: the rendered message and the values it was built from.
+
+    Vocabulary strings are references to the interned FIELD_VALUES entries, so
+    a case costs one small object plus its message.
+    """
+
+    __slots__ = ("index", "template", "input_message", "emergency_type",
+                 "district", "city", "phone", "people")
+
+    def __init__(self, index: int, template: CaseTemplate, input_message: str,
+                 emergency_type: Optional[str] = None, district: Optional[str] = None,
+                 city: Optional[str] = None, phone: Optional[str] = None,
+                 people: Optional[int] = None):
+        self.index = index
+        self.template = template
+        self.input_message = input_message
+        self.emergency_type = emergency_type
+        self.district = district
+        self.city = city
+        self.phone = phone
+        self.people = people
+
+    @property
+    def id(self) -> str:
+        return f"SYN_{self.index:07d}"
+
+    @property
+    def category(self) -> str:
+        return self.template.category
+
+    @property
+    def subcategory(self) -> str:
+        return self.template.subcategory
+
+    @property
+    def context(self) -> List[Dict[str, str]]:
+        return []
+
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        return {"synthetic": True}
+
+    def expected_extraction(self) -> Dict[str, Any]:
+        """Fields the chatbot should extract from the message"""
+        extraction = {}
+        if self.emergency_type:
+            extraction["emergencyTypes"] = [self.emergency_type]
+        if self.city:
+            location = {"city": self.city}
+            if self.district:
+                location["district"] = self.district
+            extraction["location"] = location
+        if self.phone:
+            extraction["phone"] = self.phone
+            extraction["phoneValid"] = True
+        if self.people:
+            extraction["affectedPeople"] = {"total": self.people}
+        return extraction
+
+    def to_test_case(self):
+        """The equivalent TestCase, for the evaluators"""
+        from test_cases_generator import TestCase
+
+        expected = ", ".join(f"{key}={value}" for key, value in self.expected_extraction().items())
+        return TestCase(
+            id=self.id,
+            category=self.category,
+            subcategory=self.subcategory,
+            input_message=self.input_message,
+            expected_output=f"Should extract {expected}",
+            context=[],
+            expected_extraction=self.expected_extraction(),
+            metadata={"synthetic": True, "index": self.index}
+        )
+
+    def to_record(self) -> Dict[str, Any]:
+        """JSON-ready form for corpus export"""
+        return {
+            "id": self.id,
+            "category": self.category,
+            "subcategory": self.subcategory,
+            "input_message": self.input_message,
+            "expected_extraction": self.expected_extraction()
+        }
+
+
+# =============================================================================
+# CORPUS
+# =============================================================================
+
+def _coprime_stride(space: int, rng: random.Random) -> int:
+    """A stride coprime to space, so i -> i * stride mod space is a permutation"""
+    if space <= 2:
+        return 1
+    stride = rng.randrange(space // 3, space) | 1
+    while gcd(stride, space) != 1:
+        stride += 2
+    return stride % space or 1
+
+
+class SyntheticCorpus(Sequence):
+    """A lazily rendered corpus of `size` synthetic cases.
+
+    Case i uses template i % len(templates) and the (i // len(templates))-th
+    element of that template's permuted field space. Indexing renders a fresh
+    SyntheticCase; iteration streams them one at a time.
+    """
+
+    def __init__(self, size: int, seed: int = 42, templates: List[CaseTemplate] = None):
+        self.templates = list(templates or SYNTHETIC_TEMPLATES)
+        self.size = size
+        self.seed = seed
+
+        per_template = -(-size // len(self.templates))
+        self._plans = []
+        for template in self.templates:
+            space = template.space
+            if per_template > space:
+                raise ValueError(
+                    f"{template.category}/{template.subcategory} has {space} distinct messages, "
+                    f"{per_template} needed for {size} cases"
+                )
+            rng = random.Random(f"{seed}:{template.category}:{template.subcategory}")
+            stride = _coprime_stride(space, rng)
+            offset = rng.randrange(space)
+            self._plans.append((template, template.radices, space, stride, offset))
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __getitem__(self, index: int) -> SyntheticCase:
+        if isinstance(index, slice):
+            raise TypeError("SyntheticCorpus does not support slicing; iterate or index instead")
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError(f"case {index} out of range for a corpus of {self.size}")
+        return self._render(index)
+
+    def __iter__(self) -> Iterator[SyntheticCase]:
+        for index in range(self.size):
+            yield self._render(index)
+
+    def category_counts(self) -> Dict[str, int]:
+        """Cases per category, without rendering any"""
+        counts: Dict[str, int] = {}
+        rounds, remainder = divmod(self.size, len(self.templates))
+        for position, template in enumerate(self.templates):
+            counts[template.category] = counts.get(template.category, 0) + rounds + (position < remainder)
+        return counts
+
+    def test_cases(self) -> Iterator[Any]:
+        """Stream the corpus as TestCase objects"""
+        for case in self:
+            yield case.to_test_case()
+
+    def _render(self, index: int) -> SyntheticCase:
+        slot, position = divmod(index, len(self.templates))
+        template, radices, space, stride, offset = self._plans[position]
+
+        # Permute, then decode the mixed-radix digits (last field varies fastest)
+        code = (slot * stride + offset) % space
+        digits = [0] * len(radices)
+        for i in range(len(radices) - 1, -1, -1):
+            code, digits[i] = divmod(code, radices[i])
+        picked = {name: FIELD_VALUES[name][digit] for name, digit in zip(template.fields, digits)}
+
+        emergency_type = keyword = district = city = phone = None
+        values = dict(picked)
+        if "keyword" in picked:
+            emergency_type, keyword = picked["keyword"]
+            values["keyword"] = keyword
+        if "location" in picked:
+            district, city = picked["location"]
+            values["location"] = f"{district}, {city}" if district else city
+        if "prefix" in picked:
+            phone = f"{picked['prefix']}{picked['subscriber']:07d}"
+            values["phone"] = phone
+
+        return SyntheticCase(
+            index, template, template.text.format(**values),
+            emergency_type=emergency_type, district=district, city=city,
+            phone=phone, people=picked.get("people")
+        )
+
+
+def iter_synthetic_cases(size: int, seed: int = 42) -> Iterator[SyntheticCase]:
+    """Stream `size` synthetic cases"""
+    return iter(SyntheticCorpus(size, seed))
+
+
+# =============================================================================
+# EXPORT
+# =============================================================================
+
+def peak_rss_mb() -> Optional[float]:
+    """Peak resident set size of this process in MB, None where unavailable"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 1024 / 1024 if sys.platform == "darwin" else peak / 1024  # bytes on macOS, KB elsewhere
+
+
+def export_corpus(corpus: SyntheticCorpus, path: str) -> Dict[str, Any]:
+    """Stream a corpus to a JSON Lines file; returns throughput and peak process memory"""
+    from artifact_store import write_records
+
+    start = time.perf_counter()
+    write_records(path, (case.to_record() for case in corpus))
+    elapsed = time.perf_counter() - start
+    return {"cases": len(corpus), "seconds": elapsed, "peak_rss_mb": peak_rss_mb()}
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description="Generate a large synthetic test corpus")
+    parser.add_argument("--size", type=int, default=SYNTHETIC_CORPUS_CONFIG["size"], help="Number of cases")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    parser.add_argument("--output", help="Write the corpus as JSON Lines (.jsonl, .jsonl.gz or .jsonl.zst)")
+    parser.add_argument("--sample", type=int, default=0, help="Print the first N cases")
+    args = parser.parse_args()
+
+    try:
+        corpus = SyntheticCorpus(args.size, args.seed)
+    except ValueError as e:
+        parser.error(str(e))
+
+    print(f"\nSynthetic corpus: {len(corpus)} cases (seed {args.seed})")
+    for category, count in corpus.category_counts().items():
+        print(f"  {category:<28} {count:>9}")
+    for index in range(min(args.sample, len(corpus))):
+        case = corpus[index]
+        print(f"  {case.id} [{case.category}] {case.input_message}")
+
+    if not args.output:
+        return 0
+
+    stats = export_corpus(corpus, args.output)
+    print(f"\nWrote {args.output}: {stats['cases']} cases in {stats['seconds']:.1f}s "
+          f"({stats['cases'] / stats['seconds']:,.0f} cases/s)")
+    if stats["peak_rss_mb"] is None:
+        return 0
+    budget = SYNTHETIC_CORPUS_CONFIG["memory_budget_mb"]
+    print(f"Peak memory: {stats['peak_rss_mb']:.0f} MB (budget {budget} MB)")
+    return 0 if stats["peak_rss_mb"] <= budget else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -9,7 +9,7 @@ Total: ~1000 test cases covering all scenarios
 """
 
 import random
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Optional, Tuple, Callable, Iterable, Iterator
 from dataclasses import dataclass
 from config import (
     EMERGENCY_KEYWORDS, VALID_PHONE_PREFIXES, MAJOR_CITIES, HCMC_DISTRICTS,
@@ -30,6 +30,38 @@ class TestCase:
     metadata: Dict[str, Any]
 
 
+# =============================================================================
+# SEED STATES
+# =============================================================================
+# Backend state (EmergencyState fields) a context-bearing case starts from, so
+# the harness can seed its session instead of replaying earlier turns. The
+# conversation messages themselves come from the case's context.
+
+# What the operator's confirmation prompt in confirmation/correction cases shows
+CONFIRMATION_SEED_STATE = {
+    "emergencyTypes": ["FIRE_RESCUE"],
+    "location": {"address": "123 ABC", "ward": None, "district": None, "city": "Thành phố Hồ Chí Minh", "isComplete": True},
+    "phone": "0912345678",
+    "affectedPeople": {"total": 3, "injured": 0, "critical": 0},
+    "firstAidShown": True,
+    "confirmationShown": True,
+    "currentStep": "confirm",
+}
+
+
+def flow_seed_state(previous_steps: List[Dict[str, Any]], current_step: str) -> Dict[str, Any]:
+    """State after the given conversation-flow steps, waiting at current_step"""
+    state: Dict[str, Any] = {}
+    for step in previous_steps:
+        for key, value in step["state"].items():
+            state[key] = {**state.get(key, {}), **value} if isinstance(value, dict) else value
+    if state.get("emergencyTypes"):
+        state["firstAidShown"] = True
+    state["confirmationShown"] = current_step == "confirm"
+    state["currentStep"] = current_step
+    return state
+
+
 # =============================================================================
 # TEST CASE GENERATORS
 # =============================================================================
@@ -694,31 +726,42 @@ def generate_conversation_flow_test_cases() -> List[TestCase]:
     counter = 1
 
     # Complete conversation flows (40 cases)
+    # "state" is what the backend should have extracted from each step's input
     conversation_flows = [
         # Flow 1: Fire emergency
         [
-            {"input": "Có cháy lớn ở nhà tôi!", "expected_step": "emergency"},
-            {"input": "123 Nguyễn Huệ, Phường Bến Nghé, Quận 1, TPHCM", "expected_step": "location"},
-            {"input": "0912345678", "expected_step": "phone"},
-            {"input": "3 người", "expected_step": "people"},
-            {"input": "Đúng rồi, xác nhận", "expected_step": "confirm"},
+            {"input": "Có cháy lớn ở nhà tôi!", "expected_step": "emergency",
+             "state": {"emergencyTypes": ["FIRE_RESCUE"]}},
+            {"input": "123 Nguyễn Huệ, Phường Bến Nghé, Quận 1, TPHCM", "expected_step": "location",
+             "state": {"location": {"address": "123 Nguyễn Huệ", "ward": "Phường Bến Nghé", "district": "Quận 1", "city": "Thành phố Hồ Chí Minh", "isComplete": True}}},
+            {"input": "0912345678", "expected_step": "phone", "state": {"phone": "0912345678"}},
+            {"input": "3 người", "expected_step": "people",
+             "state": {"affectedPeople": {"total": 3, "injured": 0, "critical": 0}}},
+            {"input": "Đúng rồi, xác nhận", "expected_step": "confirm", "state": {"userConfirmed": True}},
         ],
         # Flow 2: Medical emergency
         [
-            {"input": "Có người bị tai nạn giao thông!", "expected_step": "emergency"},
-            {"input": "Gần ngã tư Phú Nhuận", "expected_step": "location"},
-            {"input": "Quận Phú Nhuận, TPHCM", "expected_step": "location"},
-            {"input": "0987654321", "expected_step": "phone"},
-            {"input": "2 người bị thương", "expected_step": "people"},
-            {"input": "OK", "expected_step": "confirm"},
+            {"input": "Có người bị tai nạn giao thông!", "expected_step": "emergency",
+             "state": {"emergencyTypes": ["MEDICAL"]}},
+            {"input": "Gần ngã tư Phú Nhuận", "expected_step": "location",
+             "state": {"location": {"address": "Gần ngã tư Phú Nhuận"}}},
+            {"input": "Quận Phú Nhuận, TPHCM", "expected_step": "location",
+             "state": {"location": {"district": "Quận Phú Nhuận", "city": "Thành phố Hồ Chí Minh", "isComplete": True}}},
+            {"input": "0987654321", "expected_step": "phone", "state": {"phone": "0987654321"}},
+            {"input": "2 người bị thương", "expected_step": "people",
+             "state": {"affectedPeople": {"total": 2, "injured": 2, "critical": 0}}},
+            {"input": "OK", "expected_step": "confirm", "state": {"userConfirmed": True}},
         ],
         # Flow 3: Security emergency
         [
-            {"input": "Có trộm đang đột nhập!", "expected_step": "emergency"},
-            {"input": "45 Lê Lợi, P. Bến Thành, Q.1, SG", "expected_step": "location"},
-            {"input": "0901234567", "expected_step": "phone"},
-            {"input": "Chỉ có tôi thôi", "expected_step": "people"},
-            {"input": "Xác nhận", "expected_step": "confirm"},
+            {"input": "Có trộm đang đột nhập!", "expected_step": "emergency",
+             "state": {"emergencyTypes": ["SECURITY"]}},
+            {"input": "45 Lê Lợi, P. Bến Thành, Q.1, SG", "expected_step": "location",
+             "state": {"location": {"address": "45 Lê Lợi", "ward": "Phường Bến Thành", "district": "Quận 1", "city": "Thành phố Hồ Chí Minh", "isComplete": True}}},
+            {"input": "0901234567", "expected_step": "phone", "state": {"phone": "0901234567"}},
+            {"input": "Chỉ có tôi thôi", "expected_step": "people",
+             "state": {"affectedPeople": {"total": 1, "injured": 0, "critical": 0}}},
+            {"input": "Xác nhận", "expected_step": "confirm", "state": {"userConfirmed": True}},
         ],
     ]
 
@@ -737,7 +780,11 @@ def generate_conversation_flow_test_cases() -> List[TestCase]:
                 expected_output=f"Should transition to {step['expected_step']} step",
                 context=context,
                 expected_extraction={"currentStep": step["expected_step"]},
-                metadata={"flow_id": flow_idx + 1, "step": step_idx + 1}
+                metadata={
+                    "flow_id": flow_idx + 1,
+                    "step": step_idx + 1,
+                    "seed_state": flow_seed_state(flow[:step_idx], step["expected_step"])
+                }
             ))
             counter += 1
 
@@ -773,7 +820,7 @@ def generate_conversation_flow_test_cases() -> List[TestCase]:
                 {"role": "operator", "message": "Xác nhận thông tin: Địa điểm: 123 ABC, Loại: Cháy, SĐT: 0912345678. Đúng chưa?"}
             ],
             expected_extraction={"userConfirmed": True},
-            metadata={"confirmation_type": "positive"}
+            metadata={"confirmation_type": "positive", "seed_state": CONFIRMATION_SEED_STATE}
         ))
         counter += 1
 
@@ -788,7 +835,7 @@ def generate_conversation_flow_test_cases() -> List[TestCase]:
                 {"role": "operator", "message": "Xác nhận thông tin: Địa điểm: 123 ABC, Loại: Cháy, SĐT: 0912345678. Đúng chưa?"}
             ],
             expected_extraction={"userConfirmed": False, "isCorrection": True},
-            metadata={"confirmation_type": "negative"}
+            metadata={"confirmation_type": "negative", "seed_state": CONFIRMATION_SEED_STATE}
         ))
         counter += 1
 
@@ -817,7 +864,7 @@ def generate_conversation_flow_test_cases() -> List[TestCase]:
                 {"role": "operator", "message": "Xác nhận: Địa điểm 123 ABC, SĐT 0912345678, 3 người. Đúng không?"}
             ],
             expected_extraction=expected,
-            metadata={"correction_type": "with_info"}
+            metadata={"correction_type": "with_info", "seed_state": CONFIRMATION_SEED_STATE}
         ))
         counter += 1
 
@@ -1340,48 +1387,56 @@ def generate_language_variation_test_cases() -> List[TestCase]:
     return test_cases
 
 
-def generate_all_test_cases() -> List[TestCase]:
-    """Generate all test cases for the evaluation"""
-    all_test_cases = []
+# =============================================================================
+# GENERATOR REGISTRY
+# =============================================================================
 
+# (console label, categories its cases belong to, generator), in corpus order
+TEST_CASE_GENERATORS: List[Tuple[str, Tuple[str, ...], Callable[[], List[TestCase]]]] = [
+    ("Emergency type detection", ("emergency_type_detection",), generate_emergency_type_test_cases),
+    ("Location extraction", ("location_extraction",), generate_location_test_cases),
+    ("Phone validation", ("phone_validation",), generate_phone_validation_test_cases),
+    ("Affected people", ("affected_people",), generate_affected_people_test_cases),
+    ("Conversation flow", ("conversation_flow", "confirmation", "user_correction"),
+     generate_conversation_flow_test_cases),
+    ("First aid guidance", ("first_aid_guidance",), generate_first_aid_test_cases),
+    ("Authenticated user scenarios", ("authenticated_user",), generate_authenticated_user_test_cases),
+    ("Edge cases", ("edge_cases",), generate_edge_case_test_cases),
+    ("Language variations", ("language_variations",), generate_language_variation_test_cases),
+]
+
+
+def iter_test_cases(
+    categories: Optional[Iterable[str]] = None,
+    seed: Optional[int] = None,
+    verbose: bool = True
+) -> Iterator[TestCase]:
+    """Yield the test cases of the given categories (all when None).
+
+    Only the generators producing one of the categories run. With a seed,
+    each generator is seeded separately, so a category's cases are the same
+    whether or not other categories are generated alongside it.
+    """
+    wanted = set(categories) if categories else None
+    for label, produces, generator in TEST_CASE_GENERATORS:
+        if wanted is not None and wanted.isdisjoint(produces):
+            continue
+        if seed is not None:
+            random.seed(f"{seed}:{generator.__name__}")
+        if verbose:
+            print(f"  - {label}...")
+        for test_case in generator():
+            if wanted is None or test_case.category in wanted:
+                yield test_case
+
+
+def generate_all_test_cases(
+    seed: Optional[int] = None,
+    categories: Optional[Iterable[str]] = None
+) -> List[TestCase]:
+    """Generate the test cases for the evaluation, optionally only some categories"""
     print("Generating test cases...")
-
-    # Emergency type detection (~180 cases)
-    print("  - Emergency type detection...")
-    all_test_cases.extend(generate_emergency_type_test_cases())
-
-    # Location extraction (~125 cases)
-    print("  - Location extraction...")
-    all_test_cases.extend(generate_location_test_cases())
-
-    # Phone validation (~120 cases)
-    print("  - Phone validation...")
-    all_test_cases.extend(generate_phone_validation_test_cases())
-
-    # Affected people (~90 cases)
-    print("  - Affected people...")
-    all_test_cases.extend(generate_affected_people_test_cases())
-
-    # Conversation flow (~135 cases)
-    print("  - Conversation flow...")
-    all_test_cases.extend(generate_conversation_flow_test_cases())
-
-    # First aid guidance (~80 cases)
-    print("  - First aid guidance...")
-    all_test_cases.extend(generate_first_aid_test_cases())
-
-    # Authenticated user (~60 cases)
-    print("  - Authenticated user scenarios...")
-    all_test_cases.extend(generate_authenticated_user_test_cases())
-
-    # Edge cases (~120 cases)
-    print("  - Edge cases...")
-    all_test_cases.extend(generate_edge_case_test_cases())
-
-    # Language variations (~100 cases)
-    print("  - Language variations...")
-    all_test_cases.extend(generate_language_variation_test_cases())
-
+    all_test_cases = list(iter_test_cases(categories, seed))
     print(f"\nTotal test cases generated: {len(all_test_cases)}")
 
     return all_test_cases
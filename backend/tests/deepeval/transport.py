@@ -0,0 +1,217 @@
+"""
+Chatbot Transport: Retries and Circuit Breaker
+================================================
+
+This module wraps the harness's POST /api/chat/message calls so that
+infrastructure failures are not mistaken for chatbot answers.
+
+Features:
+- Classifies connection errors, timeouts and gateway statuses as transport errors
+- Retries transport errors with exponential backoff and jitter; on stateful
+  sessions only errors where the message cannot have been applied
+- Circuit breaker that pauses the run while /api/chat/health is failing and
+  resumes automatically once it recovers
+- Responses that still fail are flagged as infra errors, so callers skip judging
+"""
+
+import time
+import random
+import threading
+from typing import List, Dict, Any, Optional, Tuple
+
+import requests
+from urllib3.exceptions import NewConnectionError, ConnectTimeoutError
+
+from config import TRANSPORT_CONFIG
+
+
+class InfraFailure(Exception):
+    """The chatbot could not be reached, so there is no answer to judge"""
+
+
+def is_transport_error(error: Exception) -> bool:
+    """Whether an exception means the chatbot could not be reached.
+
+    HTTP errors count only for gateway statuses (TRANSPORT_CONFIG
+    retry_statuses); other statuses are the chatbot's own answer.
+    """
+    if isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout)):
+        return True
+    if isinstance(error, requests.exceptions.HTTPError) and error.response is not None:
+        return error.response.status_code in TRANSPORT_CONFIG["retry_statuses"]
+    return False
+
+
+def is_retry_safe(error: Exception) -> bool:
+    """Whether a transport error leaves the chatbot's session state untouched.
+
+    True when the request never reached the server (connection refused or
+    connect timeout) or the server answered with a gateway status. A read
+    timeout or a dropped connection may come after the backend applied the
+    message, so resending it on the same session could apply it twice.
+    """
+    if isinstance(error, requests.exceptions.ConnectTimeout):
+        return True
+    if isinstance(error, requests.exceptions.HTTPError):
+        return is_transport_error(error)
+    if isinstance(error, requests.exceptions.ConnectionError) and error.args:
+        reason = getattr(error.args[0], "reason", None)
+        return isinstance(reason, (NewConnectionError, ConnectTimeoutError))
+    return False
+
+
+def backoff_delay(attempt: int, rng: random.Random = random) -> float:
+    """Seconds to wait before retry number attempt (0-based), jittered over [cap/2, cap]"""
+    cap = min(TRANSPORT_CONFIG["backoff_max_s"], TRANSPORT_CONFIG["backoff_base_s"] * 2 ** attempt)
+    return rng.uniform(cap / 2, cap)
+
+
+class CircuitBreaker:
+    """Pauses chatbot calls after repeated transport failures.
+
+    After failure_threshold consecutive failures the breaker opens and the next
+    call blocks, polling the health endpoint until it answers 200. The first
+    call after recovery is a trial: one more failure reopens the breaker.
+    """
+
+    def __init__(self, base_url: str, failure_threshold: int = None):
+        self.health_url = f"{base_url}/api/chat/health"
+        self.failure_threshold = failure_threshold or TRANSPORT_CONFIG["breaker_failure_threshold"]
+        self.consecutive_failures = 0
+        self.open = False
+        self.pauses = 0
+        self.paused_s = 0.0
+        self.gave_up = 0
+        # Hedged requests may fail and wait from several threads at once
+        self._lock = threading.Lock()
+
+    def record_success(self):
+        with self._lock:
+            self.consecutive_failures = 0
+
+    def record_failure(self):
+        with self._lock:
+            self.consecutive_failures += 1
+            if self.consecutive_failures >= self.failure_threshold:
+                self.open = True
+
+    def _healthy(self) -> bool:
+        try:
+            return requests.get(self.health_url, timeout=5).status_code == 200
+        except requests.exceptions.RequestException:
+            return False
+
+    def wait_until_closed(self):
+        """Block while the breaker is open and the chatbot is unhealthy"""
+        if not self.open:
+            return
+        with self._lock:
+            if self.open:
+                self._pause()
+
+    def _pause(self):
+        """Poll the health endpoint until it recovers (or max_pause_s passes)"""
+        interval = TRANSPORT_CONFIG["health_poll_interval_s"]
+        max_pause = TRANSPORT_CONFIG["max_pause_s"]
+        start = time.perf_counter()
+        self.pauses += 1
+        print(f"  [BREAKER] {self.consecutive_failures} consecutive transport failures; "
+              f"pausing until {self.health_url} recovers")
+
+        while not self._healthy():
+            waited = time.perf_counter() - start
+            if max_pause is not None and waited >= max_pause:
+                self.gave_up += 1
+                print(f"  [BREAKER] Still unhealthy after {waited:.0f}s; resuming anyway")
+                break
+            time.sleep(interval)
+
+        paused = time.perf_counter() - start
+        self.paused_s += paused
+        self.open = False
+        # Half-open: a single further failure trips the breaker again
+        self.consecutive_failures = self.failure_threshold - 1
+        print(f"  [BREAKER] Resumed after {paused:.0f}s")
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "pauses": self.pauses,
+            "paused_s": self.paused_s,
+            "gave_up": self.gave_up
+        }
+
+
+def post_message(
+    url: str,
+    payload: Dict[str, Any],
+    headers: Dict[str, str],
+    timeout: float,
+    breaker: Optional[CircuitBreaker] = None,
+    max_retries: int = None,
+    stateful: bool = False
+) -> Tuple[Dict[str, Any], int]:
+    """POST a chat message, retrying transport errors.
+
+    Returns (response JSON, attempts). When every attempt fails with a
+    transport error, the response is an error dict with "infra_error": True.
+    Other request errors are returned as before, without retrying.
+
+    stateful=True is for sessions whose state the backend keeps (every
+    /api/chat/message session, single- or multi-turn): only is_retry_safe
+    errors are retried, and any other transport error is an infra error
+    straight away.
+    """
+    max_retries = TRANSPORT_CONFIG["max_retries"] if max_retries is None else max_retries
+    error: Exception = None
+
+    for attempt in range(max_retries + 1):
+        if breaker:
+            breaker.wait_until_closed()
+        try:
+            response = requests.post(url, json=payload, headers=headers, timeout=timeout)
+            response.raise_for_status()
+            result = response.json()
+            if breaker:
+                breaker.record_success()
+            return result, attempt + 1
+        except requests.exceptions.RequestException as e:
+            error = e
+            if not is_transport_error(e):
+                return {
+                    "success": False,
+                    "error": str(e),
+                    "data": {"response": f"Error: {str(e)}"}
+                }, attempt + 1
+            if breaker:
+                breaker.record_failure()
+            if stateful and not is_retry_safe(e):
+                # The turn may already be in the session state; resending could apply it twice
+                return {
+                    "success": False,
+                    "infra_error": True,
+                    "error": f"{e} (not retried: the session may already hold this message)",
+                    "data": {"response": f"Error: {str(e)}"}
+                }, attempt + 1
+            if attempt < max_retries and not (breaker and breaker.open):
+                time.sleep(backoff_delay(attempt))
+
+    return {
+        "success": False,
+        "infra_error": True,
+        "error": str(error),
+        "data": {"response": f"Error: {str(error)}"}
+    }, max_retries + 1
+
+
+def summarize_transport(results: List[Any], circuit_breaker: Dict[str, Any] = None) -> Dict[str, Any]:
+    """Infra failures, retries and breaker pauses for a list of results"""
+    by_category: Dict[str, int] = {}
+    for result in results:
+        if result.infra_failure:
+            by_category[result.category] = by_category.get(result.category, 0) + 1
+    return {
+        "infra_failures": sum(by_category.values()),
+        "infra_failures_by_category": by_category,
+        "retries": sum(getattr(r, "transport_retries", 0) for r in results),
+        "circuit_breaker": circuit_breaker
+    }
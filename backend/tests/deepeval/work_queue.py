@@ -0,0 +1,284 @@
+"""
+Lease-Based Work Queue for Multi-Worker Evaluation
+===================================================
+
+This module lets any number of `run_evaluation.py --worker` processes share
+one evaluation run. The selected corpus is written once to an SQLite file on
+a shared path; workers claim cases under time-limited leases and write their
+results back to the same file.
+
+Features:
+- Atomic claims (BEGIN IMMEDIATE) so no case is leased twice at once
+- Lease timeouts: cases held by crashed or hung workers are re-queued
+- Heartbeat thread that keeps a lease alive during long conversations
+- Attempt limit, after which a case is marked failed instead of retried
+- Longest-first claim order (by turn count) to shorten the run's tail
+"""
+
+import json
+import time
+import sqlite3
+import threading
+from dataclasses import dataclass, asdict
+from typing import List, Dict, Any, Optional
+
+from config import WORK_QUEUE_CONFIG
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS cases (
+    suite TEXT NOT NULL,
+    test_case_id TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    priority INTEGER NOT NULL DEFAULT 1,
+    category TEXT,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    worker TEXT,
+    lease_expires REAL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    result TEXT,
+    error TEXT,
+    updated_at REAL,
+    PRIMARY KEY (suite, test_case_id)
+);
+CREATE INDEX IF NOT EXISTS idx_cases_claim ON cases (status, priority DESC, position);
+"""
+
+STATUSES = ["pending", "leased", "done", "failed"]
+
+
+@dataclass
+class Lease:
+    """A case claimed by a worker"""
+    suite: str
+    test_case_id: str
+    payload: Dict[str, Any]
+    attempts: int
+    expires: float
+
+
+class WorkQueue:
+    """SQLite-backed case queue shared by all workers of a run"""
+
+    def __init__(self, path: str, busy_timeout_s: float = 30.0):
+        self.path = str(path)
+        # Autocommit mode; transactions are opened explicitly where needed
+        self.conn = sqlite3.connect(self.path, timeout=busy_timeout_s, isolation_level=None)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def _transaction(self):
+        """BEGIN IMMEDIATE takes the write lock up front, so claims never race"""
+        self.conn.execute("BEGIN IMMEDIATE")
+
+    # -------------------------------------------------------------------------
+    # Producer side
+    # -------------------------------------------------------------------------
+
+    def enqueue(self, suite: str, test_cases: List[Any]) -> int:
+        """Add test cases (dataclasses) to the queue; cases already present are kept"""
+        start = self.conn.execute(
+            "SELECT COALESCE(MAX(position), -1) + 1 FROM cases WHERE suite = ?", (suite,)
+        ).fetchone()[0]
+        rows = [
+            (
+                suite,
+                tc.id,
+                start + i,
+                len(getattr(tc, "turns", None) or [None]),
+                tc.category,
+                json.dumps(asdict(tc), ensure_ascii=False, default=str),
+                time.time()
+            )
+            for i, tc in enumerate(test_cases)
+        ]
+        self._transaction()
+        try:
+            before = self.conn.total_changes
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO cases "
+                "(suite, test_case_id, position, priority, category, payload, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows
+            )
+            added = self.conn.total_changes - before
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+        return added
+
+    # -------------------------------------------------------------------------
+    # Worker side
+    # -------------------------------------------------------------------------
+
+    def _expire_leases(self, now: float, max_attempts: int) -> int:
+        """Return expired leases to pending, or fail them once out of attempts"""
+        cursor = self.conn.execute(
+            "UPDATE cases SET "
+            "status = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END, "
+            "error = 'lease expired on worker ' || COALESCE(worker, '?'), "
+            "worker = NULL, lease_expires = NULL, updated_at = ? "
+            "WHERE status = 'leased' AND lease_expires < ?",
+            (max_attempts, now, now)
+        )
+        return cursor.rowcount
+
+    def claim(self, worker: str, lease_s: float = None, max_attempts: int = None) -> Optional[Lease]:
+        """Lease the next pending case to a worker, or None if nothing is pending"""
+        lease_s = lease_s or WORK_QUEUE_CONFIG["lease_timeout_s"]
+        max_attempts = max_attempts or WORK_QUEUE_CONFIG["max_attempts"]
+        now = time.time()
+
+        self._transaction()
+        try:
+            self._expire_leases(now, max_attempts)
+            row = self.conn.execute(
+                "SELECT suite, test_case_id, payload, attempts FROM cases "
+                "WHERE status = 'pending' ORDER BY priority DESC, position LIMIT 1"
+            ).fetchone()
+            if row is None:
+                self.conn.execute("COMMIT")
+                return None
+            expires = now + lease_s
+            self.conn.execute(
+                "UPDATE cases SET status = 'leased', worker = ?, lease_expires = ?, "
+                "attempts = attempts + 1, updated_at = ? WHERE suite = ? AND test_case_id = ?",
+                (worker, expires, now, row["suite"], row["test_case_id"])
+            )
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+
+        return Lease(
+            suite=row["suite"],
+            test_case_id=row["test_case_id"],
+            payload=json.loads(row["payload"]),
+            attempts=row["attempts"] + 1,
+            expires=expires
+        )
+
+    def renew(self, worker: str, lease: Lease, lease_s: float = None) -> bool:
+        """Extend a lease; False if the worker no longer holds it"""
+        lease_s = lease_s or WORK_QUEUE_CONFIG["lease_timeout_s"]
+        expires = time.time() + lease_s
+        cursor = self.conn.execute(
+            "UPDATE cases SET lease_expires = ? "
+            "WHERE suite = ? AND test_case_id = ? AND status = 'leased' AND worker = ?",
+            (expires, lease.suite, lease.test_case_id, worker)
+        )
+        if cursor.rowcount:
+            lease.expires = expires
+        return bool(cursor.rowcount)
+
+    def complete(self, worker: str, lease: Lease, result: Dict[str, Any]) -> bool:
+        """Store a finished result.
+
+        A result is accepted even if the lease expired meanwhile, unless another
+        worker already completed the case; the first finished result wins.
+        """
+        cursor = self.conn.execute(
+            "UPDATE cases SET status = 'done', result = ?, error = NULL, worker = ?, "
+            "lease_expires = NULL, updated_at = ? "
+            "WHERE suite = ? AND test_case_id = ? AND status != 'done'",
+            (json.dumps(result, ensure_ascii=False, default=str), worker, time.time(),
+             lease.suite, lease.test_case_id)
+        )
+        return bool(cursor.rowcount)
+
+    def release(self, worker: str, lease: Lease, error: str, max_attempts: int = None):
+        """Give a case back after a harness error; it fails once out of attempts"""
+        max_attempts = max_attempts or WORK_QUEUE_CONFIG["max_attempts"]
+        self.conn.execute(
+            "UPDATE cases SET "
+            "status = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END, "
+            "error = ?, worker = NULL, lease_expires = NULL, updated_at = ? "
+            "WHERE suite = ? AND test_case_id = ? AND status = 'leased' AND worker = ?",
+            (max_attempts, error, time.time(), lease.suite, lease.test_case_id, worker)
+        )
+
+    # -------------------------------------------------------------------------
+    # Progress and results
+    # -------------------------------------------------------------------------
+
+    def counts(self) -> Dict[str, Dict[str, int]]:
+        """Number of cases per status for each suite"""
+        counts: Dict[str, Dict[str, int]] = {}
+        for row in self.conn.execute("SELECT suite, status, COUNT(*) FROM cases GROUP BY suite, status"):
+            counts.setdefault(row[0], {status: 0 for status in STATUSES})[row[1]] = row[2]
+        return counts
+
+    def is_drained(self) -> bool:
+        """True when no case is pending or leased"""
+        row = self.conn.execute(
+            "SELECT COUNT(*) FROM cases WHERE status IN ('pending', 'leased')"
+        ).fetchone()
+        return row[0] == 0
+
+    def workers(self) -> Dict[str, int]:
+        """Cases currently leased per worker"""
+        return {
+            row[0]: row[1] for row in self.conn.execute(
+                "SELECT worker, COUNT(*) FROM cases WHERE status = 'leased' GROUP BY worker"
+            )
+        }
+
+    def results(self, suite: str) -> List[Dict[str, Any]]:
+        """Finished results of a suite, in enqueue order"""
+        return [
+            json.loads(row[0]) for row in self.conn.execute(
+                "SELECT result FROM cases WHERE suite = ? AND status = 'done' ORDER BY position",
+                (suite,)
+            )
+        ]
+
+    def failures(self, suite: str) -> List[Dict[str, Any]]:
+        """Cases that ran out of attempts, with their last error"""
+        return [
+            {"test_case_id": row[0], "attempts": row[1], "error": row[2]}
+            for row in self.conn.execute(
+                "SELECT test_case_id, attempts, error FROM cases "
+                "WHERE suite = ? AND status = 'failed' ORDER BY position",
+                (suite,)
+            )
+        ]
+
+
+class LeaseHeartbeat:
+    """Renews a lease from a background thread while the case is evaluated.
+
+    The evaluators block the event loop on HTTP calls, so renewal cannot be an
+    asyncio task. The thread uses its own SQLite connection.
+    """
+
+    def __init__(self, path: str, worker: str, lease: Lease, interval_s: float = None):
+        self.path = path
+        self.worker = worker
+        self.lease = lease
+        self.interval_s = interval_s or WORK_QUEUE_CONFIG["heartbeat_s"]
+        self.lost = False
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        queue = WorkQueue(self.path)
+        try:
+            while not self._stop.wait(self.interval_s):
+                if not queue.renew(self.worker, self.lease):
+                    self.lost = True
+                    return
+        finally:
+            queue.close()
+
+    def __enter__(self) -> "LeaseHeartbeat":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()